@@ -0,0 +1,48 @@
+"""add_scraping_job_lease
+
+Revision ID: 0170941aa12d
+Revises: 6a017959a425
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0170941aa12d"
+down_revision: Union[str, Sequence[str], None] = "6a017959a425"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE = "scraping_jobs"
+COLUMN = "claimed_at"
+INDEX = "ix_scraping_jobs_claimed_at"
+
+
+def upgrade() -> None:
+    """Add the worker lease column and the index the lease expiry query uses."""
+    inspector = sa.inspect(op.get_bind())
+    # Fresh databases get the table, column included, from the models
+    if not inspector.has_table(TABLE):
+        return
+
+    if COLUMN not in {column["name"] for column in inspector.get_columns(TABLE)}:
+        op.add_column(TABLE, sa.Column(COLUMN, sa.DateTime(timezone=True), nullable=True))
+    if INDEX not in {index["name"] for index in inspector.get_indexes(TABLE)}:
+        op.create_index(INDEX, TABLE, [COLUMN])
+
+
+def downgrade() -> None:
+    """Drop the worker lease column and its index."""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(TABLE):
+        return
+
+    if INDEX in {index["name"] for index in inspector.get_indexes(TABLE)}:
+        op.drop_index(INDEX, table_name=TABLE)
+    if COLUMN in {column["name"] for column in inspector.get_columns(TABLE)}:
+        op.drop_column(TABLE, COLUMN)
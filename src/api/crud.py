@@ -1,14 +1,19 @@
 """CRUD operations for API endpoints using async SQLAlchemy 2.0."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select
+import structlog
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ..constants import CONSTANTS
+from ..database import queries
 from ..database.models import Batch, ContentResult, JobPriority, JobStatus, ScrapingJob
 from .schemas import BatchCreate, JobCreate, JobUpdate
 
+logger = structlog.get_logger(__name__)
+
 
 class JobCRUD:
     """CRUD operations for scraping jobs."""
@@ -206,6 +211,134 @@ class JobCRUD:
         await db.refresh(job)
         return job
 
+    @staticmethod
+    async def claim_pending_jobs(
+        db: AsyncSession, limit: int, lease_seconds: float = CONSTANTS.WORKER_LEASE_SECONDS
+    ) -> list[ScrapingJob]:
+        """Claim pending jobs for a worker and mark them as running.
+
+        Rows are locked with ``FOR UPDATE SKIP LOCKED`` so concurrent workers
+        never claim the same job. Each claim takes a lease the worker keeps
+        renewing; RUNNING jobs whose lease has expired belong to a worker that
+        died and are claimed again, unless that leaves the job out of retries,
+        in which case it is marked FAILED with error type ``LeaseExpired``.
+        Batches owning a claimed job are moved to RUNNING the first time one of
+        their jobs is picked up.
+
+        Args:
+            db: Database session
+            limit: Maximum number of jobs to claim
+            lease_seconds: Age after which a RUNNING job's lease counts as expired
+
+        Returns:
+            Claimed jobs ordered by priority and creation time
+        """
+        now = datetime.now(UTC)
+        result = await db.execute(
+            queries.pending_jobs_query(
+                limit, lease_expired_before=now - timedelta(seconds=lease_seconds)
+            ).with_for_update(skip_locked=True)
+        )
+        jobs = list(result.scalars().all())
+        if not jobs:
+            return jobs
+
+        claimed = []
+        for job in jobs:
+            if job.status == JobStatus.RUNNING:
+                # Its worker stopped renewing the lease - count the lost run as a retry
+                if not await JobCRUD._record_lost_run(db, job, "LeaseExpired", now):
+                    continue
+                logger.warning(
+                    "Reclaiming job with expired lease", job_id=job.id, claimed_at=job.claimed_at
+                )
+            job.status = JobStatus.RUNNING
+            job.started_at = now
+            job.claimed_at = now
+            claimed.append(job)
+        jobs = claimed
+
+        batch_ids = {job.batch_id for job in jobs if job.batch_id is not None}
+        if batch_ids:
+            await db.execute(
+                update(Batch)
+                .where(Batch.id.in_(batch_ids), Batch.status == JobStatus.PENDING)
+                .values(status=JobStatus.RUNNING, started_at=now)
+            )
+
+        await db.flush()
+        return jobs
+
+    @staticmethod
+    async def requeue_job(db: AsyncSession, job_id: int, error_type: str) -> JobStatus | None:
+        """Hand a job whose run was lost back to the queue.
+
+        Args:
+            db: Database session
+            job_id: Job ID
+            error_type: Why the run was lost, recorded if the job runs out of retries
+
+        Returns:
+            PENDING if the job was requeued, FAILED if it had no retries left,
+            None if not found
+        """
+        job = await JobCRUD.get_job(db, job_id)
+        if not job:
+            return None
+
+        if await JobCRUD._record_lost_run(db, job, error_type, datetime.now(UTC)):
+            job.status = JobStatus.PENDING
+            job.claimed_at = None
+        await db.flush()
+        return job.status
+
+    @staticmethod
+    async def _record_lost_run(
+        db: AsyncSession, job: ScrapingJob, error_type: str, now: datetime
+    ) -> bool:
+        """Count a run that ended without an outcome as a retry.
+
+        A job that keeps losing its run (e.g. by crashing its worker) is marked
+        FAILED once it is out of retries instead of being handed out again.
+
+        Returns:
+            True if the job has retries left
+        """
+        job.retry_count += 1
+        if job.retry_count < job.max_retries:
+            return True
+
+        logger.error(
+            "Failing job that lost its run too often",
+            job_id=job.id,
+            retry_count=job.retry_count,
+            error_type=error_type,
+        )
+        job.status = JobStatus.FAILED
+        job.error_type = error_type
+        job.error_message = f"Run lost {job.retry_count} times without the job finishing"
+        job.completed_at = now
+        job.success = False
+        if job.batch_id is not None:
+            await BatchCRUD.record_job_outcome(db, job.batch_id, JobStatus.FAILED)
+        return False
+
+    @staticmethod
+    async def renew_leases(db: AsyncSession, job_ids: list[int]) -> None:
+        """Renew the worker lease on jobs that are still running.
+
+        Args:
+            db: Database session
+            job_ids: IDs of the jobs the worker is converting
+        """
+        if not job_ids:
+            return
+        await db.execute(
+            update(ScrapingJob)
+            .where(ScrapingJob.id.in_(job_ids), ScrapingJob.status == JobStatus.RUNNING)
+            .values(claimed_at=datetime.now(UTC))
+        )
+
 
 class BatchCRUD:
     """CRUD operations for batches."""
@@ -300,6 +433,37 @@ class BatchCRUD:
 
         return list(batches), total
 
+    @staticmethod
+    async def record_job_outcome(db: AsyncSession, batch_id: int, status: JobStatus) -> None:
+        """Count a finished job against its batch and complete the batch when done.
+
+        Counters are incremented in place instead of re-aggregating every job
+        in the batch.
+
+        Args:
+            db: Database session
+            batch_id: Batch the job belongs to
+            status: Final status of the job
+        """
+        counter = {
+            JobStatus.COMPLETED: Batch.completed_jobs,
+            JobStatus.FAILED: Batch.failed_jobs,
+            JobStatus.SKIPPED: Batch.skipped_jobs,
+        }.get(status)
+        if counter is None:
+            return
+
+        await db.execute(update(Batch).where(Batch.id == batch_id).values({counter: counter + 1}))
+        await db.execute(
+            update(Batch)
+            .where(
+                Batch.id == batch_id,
+                Batch.status == JobStatus.RUNNING,
+                Batch.completed_jobs + Batch.failed_jobs + Batch.skipped_jobs >= Batch.total_jobs,
+            )
+            .values(status=JobStatus.COMPLETED, completed_at=datetime.now(UTC))
+        )
+
 
 class ContentResultCRUD:
     """CRUD operations for content results."""
@@ -9,6 +9,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from ...batch.processor import BatchConfig, BatchProcessor
 from ...config.rate_limits import rate_limits
+from ...constants import CONSTANTS
 from ...database.models import JobStatus
 from ..crud import BatchCRUD, JobCRUD
 from ..dependencies import DBSession, async_session
@@ -101,7 +102,11 @@ async def create_batch(
     background_tasks: BackgroundTasks,
     db: DBSession,
 ) -> BatchResponse:
-    """Create a new batch with multiple jobs and start background processing.
+    """Create a new batch with multiple jobs and queue it for processing.
+
+    In the default ``queue`` execution mode the batch jobs are left PENDING for
+    the standalone worker; ``inline`` mode processes the batch as a background
+    task in this process.
 
     Args:
         batch_data: Batch creation data
@@ -121,7 +126,7 @@ async def create_batch(
         # Add background task to execute the batch processing (skip in test environment)
         import os
 
-        if os.getenv("TESTING") != "true":
+        if CONSTANTS.JOB_EXECUTION_MODE == "inline" and os.getenv("TESTING") != "true":
             background_tasks.add_task(
                 execute_batch_processing,
                 batch.id,
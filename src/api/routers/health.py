@@ -11,6 +11,7 @@ from ...auth.models import StatusResponse
 from ...monitoring.health import health_checker
 from ...monitoring.metrics import metrics_collector
 from ...monitoring.observability import observability_manager
+from ...utils.retry import circuit_breakers
 from ..dependencies import DBSession
 from ..schemas import HealthCheckResponse, MetricsResponse
 
@@ -81,6 +82,8 @@ async def health_check(db: DBSession) -> HealthCheckResponse:
             database=database_status,
             cache=cache_status,
             monitoring=monitoring_status,
+            # Scraped hosts failing fast - reported, but they don't degrade this service
+            circuit_breakers=circuit_breakers.get_statistics(),
         )
 
         # Return appropriate HTTP status
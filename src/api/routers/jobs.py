@@ -8,6 +8,7 @@ from slowapi.util import get_remote_address
 from sqlalchemy.exc import SQLAlchemyError
 
 from ...config.rate_limits import rate_limits
+from ...constants import CONSTANTS
 from ...core.config import config as default_config
 from ...core.converter import AsyncWordPressConverter
 from ...database.models import JobStatus
@@ -90,7 +91,11 @@ async def create_job(
     background_tasks: BackgroundTasks,
     db: DBSession,
 ) -> JobResponse:
-    """Create a new scraping job and start background conversion.
+    """Create a new scraping job and queue it for conversion.
+
+    In the default ``queue`` execution mode the job is left PENDING for the
+    standalone worker (``python -m src.worker``); ``inline`` mode runs the
+    conversion as a background task in this process.
 
     Args:
         job_data: Job creation data
@@ -107,10 +112,11 @@ async def create_job(
         # Create the job record first
         job = await JobCRUD.create_job(db, job_data)
 
-        # Add background task to execute the conversion
-        background_tasks.add_task(
-            execute_conversion_job, job.id, str(job_data.url), job.output_directory
-        )
+        # Queue mode: the PENDING row is the queue entry, the worker picks it up
+        if CONSTANTS.JOB_EXECUTION_MODE == "inline":
+            background_tasks.add_task(
+                execute_conversion_job, job.id, str(job_data.url), job.output_directory
+            )
 
         return JobResponse.model_validate(job)
     except SQLAlchemyError as e:
@@ -165,6 +165,7 @@ class HealthCheckResponse(BaseModel):
     database: dict[str, Any]
     cache: dict[str, Any]
     monitoring: dict[str, Any]
+    circuit_breakers: dict[str, Any] = Field(default_factory=dict)
 
 
 # Metrics schemas
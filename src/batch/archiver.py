@@ -0,0 +1,127 @@
+"""Archive creation for batch job output.
+
+These functions are synchronous and self-contained so they can run in a
+thread or process pool without blocking the event loop.
+"""
+
+import shutil
+import tarfile
+import zipfile
+from pathlib import Path
+
+ARCHIVE_SUFFIXES: dict[str, str] = {
+    "zip": ".zip",
+    "tar": ".tar",
+    "tar.gz": ".tar.gz",
+    "tar.zst": ".tar.zst",
+}
+
+# Formats that are already compressed - deflating them again only costs CPU
+PRECOMPRESSED_SUFFIXES = frozenset(
+    {
+        ".jpg",
+        ".jpeg",
+        ".png",
+        ".gif",
+        ".webp",
+        ".avif",
+        ".heic",
+        ".mp3",
+        ".mp4",
+        ".webm",
+        ".woff",
+        ".woff2",
+        ".zip",
+        ".gz",
+        ".zst",
+    }
+)
+
+
+def archive_suffix(archive_format: str) -> str:
+    """Get the file suffix for an archive format.
+
+    Args:
+        archive_format: One of zip, tar, tar.gz, tar.zst
+
+    Returns:
+        Suffix including the leading dot
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    try:
+        return ARCHIVE_SUFFIXES[archive_format]
+    except KeyError:
+        supported = ", ".join(ARCHIVE_SUFFIXES)
+        raise ValueError(
+            f"Unsupported archive format: {archive_format} (supported: {supported})"
+        ) from None
+
+
+def build_archive(
+    source_dir: Path,
+    archive_path: Path,
+    archive_format: str = "zip",
+    compression_level: int = 6,
+    remove_source: bool = False,
+) -> int:
+    """Archive a directory, streaming files into the archive one at a time.
+
+    ZIP archives store already-compressed files (images, fonts, video) without
+    deflating them and deflate everything else at ``compression_level``.
+
+    Args:
+        source_dir: Directory to archive
+        archive_path: Destination archive file
+        archive_format: One of zip, tar, tar.gz, tar.zst
+        compression_level: zlib level (0-9) for zip/tar.gz, zstd level for tar.zst
+        remove_source: Delete the source directory once the archive is written
+
+    Returns:
+        Size of the created archive in bytes
+
+    Raises:
+        ValueError: If the format is unsupported or its dependency is missing
+    """
+    archive_suffix(archive_format)  # Validate before touching the filesystem
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    files = sorted(path for path in source_dir.rglob("*") if path.is_file())
+
+    if archive_format == "zip":
+        with zipfile.ZipFile(archive_path, "w") as zip_file:
+            for file_path in files:
+                if file_path.suffix.lower() in PRECOMPRESSED_SUFFIXES:
+                    zip_file.write(file_path, file_path.relative_to(source_dir), zipfile.ZIP_STORED)
+                else:
+                    zip_file.write(
+                        file_path,
+                        file_path.relative_to(source_dir),
+                        zipfile.ZIP_DEFLATED,
+                        compresslevel=compression_level,
+                    )
+    elif archive_format == "tar.zst":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ValueError("tar.zst archives require the 'zstandard' package") from e
+
+        compressor = zstandard.ZstdCompressor(level=compression_level)
+        with (
+            open(archive_path, "wb") as raw,
+            compressor.stream_writer(raw) as writer,
+            tarfile.open(fileobj=writer, mode="w|") as tar,
+        ):
+            for file_path in files:
+                tar.add(file_path, arcname=str(file_path.relative_to(source_dir)))
+    else:
+        mode = "w:gz" if archive_format == "tar.gz" else "w"
+        kwargs = {"compresslevel": compression_level} if archive_format == "tar.gz" else {}
+        with tarfile.open(archive_path, mode, **kwargs) as tar:  # type: ignore[call-overload]
+            for file_path in files:
+                tar.add(file_path, arcname=str(file_path.relative_to(source_dir)))
+
+    if remove_source:
+        shutil.rmtree(source_dir)
+
+    return archive_path.stat().st_size
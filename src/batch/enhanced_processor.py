@@ -1,7 +1,9 @@
 """Enhanced batch processor with advanced features for Phase 4B."""
 
 import asyncio
-import json
+import time
+from collections.abc import AsyncIterator, Callable, Collection
+from contextlib import aclosing, nullcontext
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
@@ -10,9 +12,23 @@ from typing import Any
 
 import structlog
 
+from src.batch import journal as journal_states
+from src.batch.journal import CheckpointJournal, journal_path
+from src.batch.scheduler import DomainScheduler
+from src.batch.status_writer import JobStatusWriter
+from src.constants import CONSTANTS
 from src.core.exceptions import BatchProcessingError
+from src.database.async_service import AsyncDatabaseService, call_service
 from src.database.models import JobStatus
 from src.database.service import DatabaseService
+from src.utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    DomainConcurrencyLimiter,
+    bounded_as_completed,
+)
+from src.utils.deadline import deadline_scope, stage_budget
+from src.utils.retry import domain_hold_time, retry_budget
+from src.utils.url import domain_key
 
 logger = structlog.get_logger(__name__)
 
@@ -27,6 +43,11 @@ class Priority(Enum):
     DEFERRED = 5
 
 
+def _priority_named(name: str) -> Priority:
+    """Priority stored under a (case-insensitive) name, NORMAL if unknown."""
+    return Priority.__members__.get(str(name).upper(), Priority.NORMAL)
+
+
 @dataclass
 class ProcessingResult:
     """Result of processing a single URL."""
@@ -65,7 +86,17 @@ class BatchConfig:
     rate_limit_per_second: int | None = None
     priority_queue: bool = True
     save_checkpoints: bool = True
-    checkpoint_interval: int = 10  # Save progress every N jobs
+    checkpoint_interval: int = 10  # Sync and maybe compact the checkpoint journal every N jobs
+    lookahead: int = CONSTANTS.BATCH_LOOKAHEAD  # Jobs admitted beyond max_concurrent
+    db_flush_jobs: int = CONSTANTS.BATCH_DB_FLUSH_JOBS  # Flush status writes every N transitions
+    db_flush_interval_ms: int = CONSTANTS.BATCH_DB_FLUSH_INTERVAL_MS  # ...or every T milliseconds
+    adaptive_concurrency: bool = CONSTANTS.BATCH_ADAPTIVE_CONCURRENCY  # AIMD limit per domain
+    min_concurrent: int = CONSTANTS.BATCH_MIN_CONCURRENT  # Floor for the adaptive limits
+    adaptive_max_concurrent: int = CONSTANTS.BATCH_ADAPTIVE_MAX_CONCURRENT  # 0 = max_concurrent
+    target_p95_seconds: float | None = None  # Adaptive latency target, defaults to timeout / 2
+    per_domain_concurrency: int = CONSTANTS.BATCH_PER_DOMAIN_CONCURRENCY  # 0 = uncapped
+    domain_concurrency: dict[str, int] = field(default_factory=dict)  # Per-domain overrides
+    domain_weights: dict[str, int] = field(default_factory=dict)  # Jobs per round-robin turn
 
     def validate(self) -> bool:
         """Validate configuration settings."""
@@ -77,6 +108,28 @@ class BatchConfig:
             raise ValueError("retry_attempts cannot be negative")
         if self.retry_delay < 0:
             raise ValueError("retry_delay cannot be negative")
+        if self.lookahead < 0:
+            raise ValueError("lookahead cannot be negative")
+        if self.db_flush_jobs <= 0:
+            raise ValueError("db_flush_jobs must be positive")
+        if self.db_flush_interval_ms < 0:
+            raise ValueError("db_flush_interval_ms cannot be negative")
+        if self.min_concurrent <= 0:
+            raise ValueError("min_concurrent must be positive")
+        if self.min_concurrent > self.max_concurrent:
+            raise ValueError("min_concurrent cannot exceed max_concurrent")
+        if self.adaptive_max_concurrent < 0:
+            raise ValueError("adaptive_max_concurrent cannot be negative")
+        if 0 < self.adaptive_max_concurrent < self.max_concurrent:
+            raise ValueError("adaptive_max_concurrent cannot be below max_concurrent")
+        if self.target_p95_seconds is not None and self.target_p95_seconds <= 0:
+            raise ValueError("target_p95_seconds must be positive")
+        if self.per_domain_concurrency < 0:
+            raise ValueError("per_domain_concurrency cannot be negative")
+        if any(limit <= 0 for limit in self.domain_concurrency.values()):
+            raise ValueError("domain_concurrency limits must be positive")
+        if any(weight <= 0 for weight in self.domain_weights.values()):
+            raise ValueError("domain_weights must be positive")
         return True
 
 
@@ -86,14 +139,15 @@ class BatchProcessor:
     def __init__(
         self,
         config: BatchConfig,
-        database_service: DatabaseService,
+        database_service: DatabaseService | AsyncDatabaseService,
         converter: Any,  # AsyncWordPressConverter
     ):
         """Initialize the enhanced batch processor.
 
         Args:
             config: Batch processing configuration
-            database_service: Database service for persistence
+            database_service: Database service for persistence; synchronous
+                services are called from a worker thread so they never block the loop
             converter: Converter for processing URLs
         """
         self.config = config
@@ -102,9 +156,25 @@ class BatchProcessor:
         self.active_tasks: set[asyncio.Task] = set()
         self.completed_count = 0
         self.failed_count = 0
-        self.semaphore = asyncio.Semaphore(config.max_concurrent)
+        ceiling = config.max_concurrent
+        self.domain_limiter: DomainConcurrencyLimiter | None = None
+        if config.adaptive_concurrency:
+            # Every domain starts at max_concurrent and converges to what it sustains
+            ceiling = max(ceiling, config.adaptive_max_concurrent)
+            self.domain_limiter = DomainConcurrencyLimiter(
+                initial_limit=config.max_concurrent,
+                min_limit=config.min_concurrent,
+                max_limit=ceiling,
+                target_p95=config.target_p95_seconds or config.timeout_seconds / 2,
+            )
+        # URLs converting at once across all domains
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial_limit=ceiling, min_limit=ceiling, max_limit=ceiling
+        )
         self.rate_limiter: asyncio.Semaphore | None = None
         self.cancelled = False
+        self.status_writer: JobStatusWriter | None = None
+        self.journal: CheckpointJournal | None = None
 
         if config.rate_limit_per_second:
             self.rate_limiter = asyncio.Semaphore(config.rate_limit_per_second)
@@ -112,10 +182,18 @@ class BatchProcessor:
         logger.info(
             "Initialized enhanced batch processor",
             max_concurrent=config.max_concurrent,
+            adaptive=self.domain_limiter is not None,
             timeout=config.timeout_seconds,
             retry_attempts=config.retry_attempts,
         )
 
+    @staticmethod
+    def _publish_concurrency_limit(limit: int) -> None:
+        """Export the effective concurrency limit as a metric."""
+        from src.monitoring.metrics import metrics_collector
+
+        metrics_collector.set_batch_concurrency_limit(limit)
+
     async def process_single_url(
         self, url: str, priority: Priority = Priority.NORMAL
     ) -> ProcessingResult:
@@ -130,6 +208,7 @@ class BatchProcessor:
         """
         retries = 0
         last_error = None
+        limiter = self.domain_limiter.for_domain(domain_key(url)) if self.domain_limiter else None
 
         while retries <= self.config.retry_attempts:
             try:
@@ -138,11 +217,22 @@ class BatchProcessor:
                     async with self.rate_limiter:
                         await asyncio.sleep(1.0 / self.config.rate_limit_per_second)
 
-                # Process the URL with timeout
-                async with self.semaphore:
-                    result = await asyncio.wait_for(
-                        self.converter.process_url(url), timeout=self.config.timeout_seconds
-                    )
+                # Process the URL with timeout; its stages see a deadline just inside it
+                # Each attempt's latency and outcome tunes its domain's adaptive limit
+                async with self.concurrency, limiter or nullcontext():
+                    started = time.monotonic()
+                    try:
+                        with deadline_scope(stage_budget(self.config.timeout_seconds)):
+                            result = await asyncio.wait_for(
+                                self.converter.process_url(url),
+                                timeout=self.config.timeout_seconds,
+                            )
+                    except Exception as e:
+                        if limiter is not None:
+                            limiter.record(time.monotonic() - started, e)
+                        raise
+                    if limiter is not None:
+                        limiter.record(time.monotonic() - started)
 
                 return ProcessingResult(success=True, url=url, data=result, retries=retries)
 
@@ -156,6 +246,14 @@ class BatchProcessor:
 
             retries += 1
             if retries <= self.config.retry_attempts:
+                # Retries share the domain's budget with the fetch-level retries
+                if not retry_budget.try_retry(url):
+                    logger.warning(
+                        "Not retrying URL - domain retry budget exhausted",
+                        url=url,
+                        domain=domain_key(url),
+                    )
+                    break
                 await asyncio.sleep(self.config.retry_delay * retries)
 
         return ProcessingResult(success=False, url=url, error=last_error, retries=retries - 1)
@@ -177,65 +275,42 @@ class BatchProcessor:
             return BatchResults(total=0)
 
         # Create batch in database
-        batch = self.database_service.create_batch(
+        batch = await call_service(
+            self.database_service.create_batch,
             name=batch_name,
             total_jobs=len(urls),
             max_concurrent=self.config.max_concurrent,
             output_base_directory=str(self.config.output_directory),
         )
 
-        # Reset counters
-        self.completed_count = 0
-        self.failed_count = 0
-        self.cancelled = False
-
-        results = BatchResults(total=len(urls))
-        start_time = datetime.now(UTC)
-
         # Sort URLs by priority if provided
         if priorities:
             sorted_urls = sorted(urls, key=lambda u: priorities.get(u, Priority.NORMAL).value)
         else:
             sorted_urls = urls
 
-        # Process URLs concurrently
-        tasks = []
-        for url in sorted_urls:
-            if self.cancelled:
-                break
-
-            priority = priorities.get(url, Priority.NORMAL) if priorities else Priority.NORMAL
-            task = asyncio.create_task(self._process_with_tracking(url, batch.id, priority))
-            tasks.append(task)
-            self.active_tasks.add(task)
-            task.add_done_callback(self.active_tasks.discard)
-
-        # Wait for all tasks to complete
-        processed = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Compile results
-        for i, result in enumerate(processed):
-            if isinstance(result, Exception):
-                results.failed.append(sorted_urls[i])
-                if not self.config.continue_on_error:
-                    raise BatchProcessingError(f"Batch processing failed: {result}")
-            elif isinstance(result, ProcessingResult):
-                if result.success:
-                    results.successful.append(result.url)
-                else:
-                    results.failed.append(result.url)
-                    if not self.config.continue_on_error:
-                        raise BatchProcessingError(f"Batch processing failed: {result.error}")
+        def priority_of(url: str) -> Priority:
+            return priorities.get(url, Priority.NORMAL) if priorities else Priority.NORMAL
 
-        # Calculate duration
-        end_time = datetime.now(UTC)
-        results.duration = (end_time - start_time).total_seconds()
+        # Create every job up front with multi-row INSERTs instead of one round trip per URL
+        priority_names = [priority_of(url).name.lower() for url in sorted_urls]
+        job_ids = await call_service(
+            self.database_service.create_jobs_bulk,
+            sorted_urls,
+            output_directory=str(self.config.output_directory),
+            batch_id=batch.id,
+            priorities=priority_names,
+        )
 
-        # Update batch progress (the database service doesn't have update_batch_status method)
-        self.database_service.update_batch_progress(batch.id)
+        # Every URL is journaled as pending up front so resume knows the exact remaining set
+        if self.config.save_checkpoints:
+            self.journal = CheckpointJournal(self.checkpoint_path(batch.id))
+            self.journal.register(sorted_urls, job_ids, priority_names)
 
-        # Generate statistics
-        results.statistics = self.get_statistics()
+        results = BatchResults(total=len(urls))
+        await self._run_batch(
+            batch.id, list(zip(sorted_urls, job_ids, strict=True)), priority_of, results
+        )
 
         logger.info(
             "Batch processing complete",
@@ -248,47 +323,161 @@ class BatchProcessor:
 
         return results
 
+    async def _run_batch(
+        self,
+        batch_id: int,
+        jobs: list[tuple[str, int]],
+        priority_of: Callable[[str], Priority],
+        results: BatchResults,
+        completed_before: int = 0,
+    ) -> None:
+        """Run existing jobs of a batch and fold their outcomes into ``results``.
+
+        The caller opens ``self.journal`` (if checkpointing) before calling;
+        it is checkpointed and closed here.
+
+        Args:
+            batch_id: Batch the jobs belong to
+            jobs: ``(url, job_id)`` pairs in processing order
+            priority_of: Priority of a URL
+            results: Results to fill in
+            completed_before: Jobs of the batch that finished in an earlier run
+        """
+        # Reset counters
+        self.completed_count = completed_before
+        self.failed_count = 0
+        self._publish_concurrency_limit(self.concurrency.limit)
+        self.cancelled = False
+        start_time = datetime.now(UTC)
+
+        # Domains take turns within each priority level so one slow site cannot hold every slot
+        scheduler = DomainScheduler(
+            jobs,
+            lambda job: domain_key(job[0]),
+            per_domain_limit=self.config.per_domain_concurrency,
+            domain_limits=self.config.domain_concurrency,
+            domain_weights=self.config.domain_weights,
+            rank=lambda job: priority_of(job[0]).value,
+            hold=domain_hold_time,
+            adaptive_limit=self.domain_limiter.limit if self.domain_limiter else None,
+        )
+
+        async def pending_jobs() -> AsyncIterator[tuple[str, int]]:
+            async for job in scheduler:
+                if self.cancelled:
+                    scheduler.release(job)
+                    return
+                yield job
+
+        async def track(job: tuple[str, int]) -> ProcessingResult:
+            url, job_id = job
+            try:
+                return await self._process_with_tracking(url, batch_id, priority_of(url), job_id)
+            finally:
+                scheduler.release(job)
+
+        # Status transitions and batch counters are buffered and flushed in bulk
+        self.status_writer = JobStatusWriter(
+            self.database_service,
+            flush_every=self.config.db_flush_jobs,
+            flush_interval=self.config.db_flush_interval_ms / 1000,
+        )
+        await self.status_writer.start()
+
+        # Producer/consumer: tasks are created lazily so at most the concurrency limit plus
+        # lookahead exist at any time, and results are folded in as they complete
+        max_in_flight = self.concurrency.limit + self.config.lookahead
+        try:
+            async with aclosing(
+                bounded_as_completed(pending_jobs(), track, max_in_flight, self.active_tasks)
+            ) as completed:
+                async for (url, _), result in completed:
+                    if isinstance(result, BaseException):
+                        results.failed.append(url)
+                        if not self.config.continue_on_error:
+                            raise BatchProcessingError(f"Batch processing failed: {result}")
+                    elif result.success:
+                        results.successful.append(result.url)
+                    else:
+                        results.failed.append(result.url)
+                        if not self.config.continue_on_error:
+                            raise BatchProcessingError(f"Batch processing failed: {result.error}")
+        finally:
+            writer, self.status_writer = self.status_writer, None
+            await writer.close()
+            if self.journal is not None:
+                await self._save_checkpoint(batch_id)
+                self.journal.close()
+                self.journal = None
+
+        # Calculate duration
+        end_time = datetime.now(UTC)
+        results.duration = (end_time - start_time).total_seconds()
+
+        # Reconcile batch counters once against the job table
+        await call_service(self.database_service.update_batch_progress, batch_id)
+
+        # Generate statistics
+        results.statistics = self.get_statistics()
+
     async def _process_with_tracking(
-        self, url: str, batch_id: int, priority: Priority
+        self, url: str, batch_id: int, priority: Priority, job_id: int | None = None
     ) -> ProcessingResult:
         """Process a URL with progress tracking.
 
+        Inside ``process_batch`` status changes go through the shared buffered
+        writer; when called on its own they are written immediately.
+
         Args:
             url: URL to process
             batch_id: Batch ID for tracking
             priority: Processing priority
+            job_id: Existing job ID, a new job is created when omitted
 
         Returns:
             ProcessingResult
         """
-        # Create job in database
-        job = self.database_service.create_job(
-            url=url,
-            output_directory=str(self.config.output_directory),
-            batch_id=batch_id,
-            priority=priority.name.lower(),
-        )
+        if job_id is None:
+            job = await call_service(
+                self.database_service.create_job,
+                url=url,
+                output_directory=str(self.config.output_directory),
+                batch_id=batch_id,
+                priority=priority.name.lower(),
+            )
+            job_id = job.id
+
+        standalone = self.status_writer is None
+        writer = self.status_writer or JobStatusWriter(self.database_service, flush_interval=0)
 
         # Update job status to running
-        self.database_service.update_job_status(job.id, JobStatus.RUNNING)
+        await writer.record(job_id, JobStatus.RUNNING)
+        if standalone:
+            await writer.flush(raise_errors=True)
+        if self.journal is not None:
+            self.journal.record(url, journal_states.RUNNING, job_id=job_id)
 
         # Process the URL
         result = await self.process_single_url(url, priority)
 
-        # Update job status based on result
+        # Update job status and batch counters based on result
         if result.success:
             self.completed_count += 1
-            self.database_service.update_job_status(
-                job.id, JobStatus.COMPLETED, duration=result.duration
+            await writer.record(
+                job_id, JobStatus.COMPLETED, batch_id=batch_id, duration=result.duration
             )
         else:
             self.failed_count += 1
-            self.database_service.update_job_status(
-                job.id, JobStatus.FAILED, error_message=result.error
+            await writer.record(
+                job_id, JobStatus.FAILED, batch_id=batch_id, error_message=result.error
             )
-
-        # Update batch progress
-        self.database_service.update_batch_progress(batch_id)
+        if standalone:
+            await writer.close()
+        if self.journal is not None:
+            if result.success:
+                self.journal.record(url, journal_states.COMPLETED, job_id=job_id)
+            else:
+                self.journal.record(url, journal_states.FAILED, job_id=job_id, error=result.error)
 
         # Save checkpoint if configured
         if (
@@ -299,67 +488,156 @@ class BatchProcessor:
 
         return result
 
-    async def resume_batch(self, batch_id: int) -> BatchResults:
-        """Resume an interrupted batch.
+    def checkpoint_path(self, batch_id: int) -> Path:
+        """Location of a batch's checkpoint journal.
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            Path of the NDJSON journal
+        """
+        return journal_path(self.config.output_directory, batch_id)
+
+    async def resume_batch(
+        self, batch_id: int, job_ids: Collection[int] | None = None
+    ) -> BatchResults:
+        """Resume an interrupted batch in place.
+
+        The batch keeps its ID and its job rows: unfinished jobs are run again
+        under the same job IDs and their transitions are appended to the same
+        checkpoint journal. When the batch has a journal it is replayed to find
+        the exact set of URLs that were pending, running or failed; otherwise
+        the database is queried for them.
 
         Args:
             batch_id: ID of the batch to resume
+            job_ids: Only resume these jobs of the batch
 
         Returns:
             BatchResults for the resumed processing
         """
-        batch = self.database_service.get_batch(batch_id)
+        batch = await call_service(self.database_service.get_batch, batch_id)
         if not batch:
             raise ValueError(f"Batch {batch_id} not found")
 
-        # Get pending and failed jobs for this batch
-        with self.database_service.get_session() as session:
-            from sqlalchemy import select
-
-            from src.database.models import ScrapingJob
-
-            stmt = select(ScrapingJob).where(
-                ScrapingJob.batch_id == batch_id,
-                ScrapingJob.status.in_([JobStatus.PENDING, JobStatus.FAILED]),
+        path = self.checkpoint_path(batch_id)
+        journal = CheckpointJournal(path) if path.exists() else None
+        if journal is not None:
+            remaining = journal.state.remaining_jobs()
+            completed_before = journal.state.state_counts().get(journal_states.COMPLETED, 0)
+            source = "journal"
+        else:
+            remaining = []
+            completed_before = batch.completed_jobs or 0
+            source = "database"
+
+        priorities: dict[str, Priority] = {}
+        if journal is not None:
+            for url, _ in remaining:
+                name = journal.state.entries[url].get("priority")
+                if name is not None:
+                    priorities[url] = _priority_named(name)
+
+        # Jobs the journal lacks an ID or priority for (or every job, without a
+        # journal) map back to their existing rows; nothing is recreated
+        if journal is None or any(
+            job_id is None or url not in priorities for url, job_id in remaining
+        ):
+            jobs = await call_service(
+                self.database_service.get_batch_jobs,
+                batch_id,
+                [JobStatus.PENDING, JobStatus.RUNNING, JobStatus.FAILED],
             )
-            jobs = session.execute(stmt).scalars().all()
-            pending_urls = [job.url for job in jobs]
+            ids_by_url = {job.url: job.id for job in jobs}
+            for job in jobs:
+                priorities.setdefault(job.url, _priority_named(getattr(job.priority, "value", "")))
+            if journal is None:
+                remaining = list(ids_by_url.items())
+            else:
+                remaining = [
+                    (url, job_id if job_id is not None else ids_by_url.get(url))
+                    for url, job_id in remaining
+                ]
+
+        missing = [url for url, job_id in remaining if job_id is None]
+        if missing:
+            logger.warning(
+                "Skipping journaled URLs without a job row", batch_id=batch_id, urls=missing
+            )
+        pending = [
+            (url, job_id)
+            for url, job_id in remaining
+            if job_id is not None and (job_ids is None or job_id in job_ids)
+        ]
 
         logger.info(
             "Resuming batch",
             batch_id=batch_id,
-            pending_jobs=len(pending_urls),
+            source=source,
+            pending_jobs=len(pending),
             total_jobs=batch.total_jobs,
         )
 
-        # Process remaining URLs
-        results = await self.process_batch(batch.name + "_resumed", pending_urls)
+        results = BatchResults(total=batch.total_jobs)
+        if not pending:
+            if journal is not None:
+                journal.close()
+            return results
+
+        # Keep appending to the batch's journal
+        if self.config.save_checkpoints:
+            if journal is None:
+                journal = CheckpointJournal(path)
+                journal.register(
+                    [url for url, _ in pending],
+                    [job_id for _, job_id in pending],
+                    [priorities.get(url, Priority.NORMAL).name.lower() for url, _ in pending],
+                )
+            self.journal = journal
+        elif journal is not None:
+            journal.close()
+
+        # Pending jobs keep the order they were journaled or created in and the
+        # priority they were given in the original run
+        await self._run_batch(
+            batch_id,
+            pending,
+            lambda url: priorities.get(url, Priority.NORMAL),
+            results,
+            completed_before=completed_before,
+        )
 
-        # Adjust totals to include previously completed jobs
-        results.total = batch.total_jobs
+        logger.info(
+            "Batch resume complete",
+            batch_id=batch_id,
+            total=results.total,
+            successful=len(results.successful),
+            failed=len(results.failed),
+            duration=results.duration,
+        )
 
         return results
 
     async def _save_checkpoint(self, batch_id: int):
-        """Save processing checkpoint for recovery.
+        """Append progress counters to the checkpoint journal for recovery.
+
+        Per-URL state is already journaled as it changes; this syncs the
+        journal to disk and compacts it when it has grown enough.
 
         Args:
             batch_id: Batch ID to checkpoint
         """
-        checkpoint_data = {
-            "batch_id": batch_id,
-            "completed": self.completed_count,
-            "failed": self.failed_count,
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
-
-        checkpoint_file = self.config.output_directory / f"checkpoint_{batch_id}.json"
-        checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(checkpoint_file, "w") as f:
-            json.dump(checkpoint_data, f, indent=2)
+        journal = self.journal or CheckpointJournal(self.checkpoint_path(batch_id))
+        try:
+            journal.checkpoint(
+                batch_id=batch_id, completed=self.completed_count, failed=self.failed_count
+            )
+        finally:
+            if journal is not self.journal:
+                journal.close()
 
-        logger.debug("Saved checkpoint", batch_id=batch_id, file=str(checkpoint_file))
+        logger.debug("Saved checkpoint", batch_id=batch_id, file=str(journal.path))
 
     def cancel(self):
         """Cancel ongoing batch processing."""
@@ -388,6 +666,9 @@ class BatchProcessor:
             "average_time_per_url": 0,  # Would need timing tracking
             "total_time_seconds": 0,  # Would need timing tracking
             "urls_per_second": 0,  # Would need timing tracking
+            "concurrency": self.concurrency.get_statistics(),
         }
+        if self.domain_limiter is not None:
+            stats["domain_concurrency"] = self.domain_limiter.get_statistics()
 
         return stats
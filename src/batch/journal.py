@@ -0,0 +1,259 @@
+"""Append-only NDJSON checkpoint journal for batch processing.
+
+Each line records one state transition for one URL, so checkpointing a job
+costs a single small append instead of rewriting the whole batch state.
+Replaying the journal (last line per URL wins) recovers exactly which URLs
+still need processing, including ones that were running when the process
+died. The file is periodically compacted to one line per URL so it stays
+proportional to the batch size rather than to the number of transitions.
+"""
+
+import json
+import os
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+import structlog
+
+from src.constants import CONSTANTS
+
+logger = structlog.get_logger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# States that still need work on resume
+UNFINISHED_STATES = frozenset({PENDING, RUNNING})
+
+
+def journal_path(directory: Path, batch_id: int) -> Path:
+    """Location of a batch's checkpoint journal.
+
+    Args:
+        directory: Batch output directory
+        batch_id: Batch ID
+
+    Returns:
+        Path of the NDJSON journal
+    """
+    return directory / f"checkpoint_{batch_id}.ndjson"
+
+
+class JournalState:
+    """Latest known state per URL, rebuilt from a journal."""
+
+    def __init__(self) -> None:
+        """Initialize an empty state."""
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.counts: dict[str, Any] = {}
+
+    def apply(self, record: dict[str, Any]) -> None:
+        """Fold one journal record into the state.
+
+        Args:
+            record: Parsed journal line
+        """
+        if "url" in record:
+            entry = self.entries.setdefault(record["url"], {})
+            entry.pop("error", None)  # Errors only describe the attempt that produced them
+            entry.update({k: v for k, v in record.items() if k != "url"})
+        elif record.get("event") == "checkpoint":
+            self.counts = {k: v for k, v in record.items() if k != "event"}
+
+    def remaining(self, include_failed: bool = True) -> list[str]:
+        """URLs that have not finished successfully, in journal order.
+
+        Args:
+            include_failed: Also return URLs whose last attempt failed
+
+        Returns:
+            URLs to process on resume
+        """
+        return [url for url, _ in self.remaining_jobs(include_failed)]
+
+    def remaining_jobs(self, include_failed: bool = True) -> list[tuple[str, int | None]]:
+        """Unfinished URLs with their journaled job IDs, in journal order.
+
+        Args:
+            include_failed: Also return URLs whose last attempt failed
+
+        Returns:
+            ``(url, job_id)`` pairs; ``job_id`` is None when none was journaled
+        """
+        wanted = UNFINISHED_STATES | {FAILED} if include_failed else UNFINISHED_STATES
+        return [
+            (url, entry.get("job_id"))
+            for url, entry in self.entries.items()
+            if entry.get("state") in wanted
+        ]
+
+    def state_counts(self) -> dict[str, int]:
+        """Number of URLs in each state."""
+        counts: dict[str, int] = {}
+        for entry in self.entries.values():
+            state = entry.get("state", PENDING)
+            counts[state] = counts.get(state, 0) + 1
+        return counts
+
+
+class CheckpointJournal:
+    """Append-only per-URL state journal with periodic compaction."""
+
+    def __init__(
+        self, path: Path, compact_factor: int = CONSTANTS.BATCH_JOURNAL_COMPACT_FACTOR
+    ) -> None:
+        """Initialize the journal.
+
+        Existing content at ``path`` is replayed so appending continues from
+        the recovered state.
+
+        Args:
+            path: Journal file location
+            compact_factor: Compact once the file holds this many lines per URL
+        """
+        if compact_factor < 2:
+            raise ValueError("compact_factor must be at least 2")
+
+        self.path = path
+        self.compact_factor = compact_factor
+        self.state = JournalState()
+        self._lines = 0
+        if path.exists():
+            for record in self._read_records(path):
+                self.state.apply(record)
+                self._lines += 1
+        self._file: TextIO | None = None
+
+    @staticmethod
+    def _read_records(path: Path) -> Iterable[dict[str, Any]]:
+        """Yield parsed records, skipping a torn or corrupt line."""
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-append leaves a partial last line
+                    logger.warning(
+                        "Skipping invalid journal line", file=str(path), line=line_number
+                    )
+
+    @classmethod
+    def replay(cls, path: Path) -> JournalState:
+        """Rebuild the per-URL state from a journal file.
+
+        Args:
+            path: Journal file location
+
+        Returns:
+            Recovered state, empty if the file does not exist
+        """
+        state = JournalState()
+        if path.exists():
+            for record in cls._read_records(path):
+                state.apply(record)
+        return state
+
+    def _append(self, records: Iterable[dict[str, Any]]) -> None:
+        """Append records and apply them to the in-memory state."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")  # noqa: SIM115
+
+        lines = []
+        for record in records:
+            self.state.apply(record)
+            lines.append(json.dumps(record, default=str))
+        if lines:
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            self._lines += len(lines)
+
+    def register(
+        self,
+        urls: Iterable[str],
+        job_ids: Iterable[int | None] | None = None,
+        priorities: Iterable[str | None] | None = None,
+    ) -> None:
+        """Record URLs as pending, in one write.
+
+        Args:
+            urls: URLs in processing order
+            job_ids: Optional database job IDs parallel to ``urls``
+            priorities: Optional priority names parallel to ``urls``
+        """
+        ids = iter(job_ids) if job_ids is not None else None
+        names = iter(priorities) if priorities is not None else None
+        records = []
+        for url in urls:
+            record: dict[str, Any] = {"url": url, "state": PENDING}
+            job_id = next(ids) if ids is not None else None
+            if job_id is not None:
+                record["job_id"] = job_id
+            priority = next(names) if names is not None else None
+            if priority is not None:
+                record["priority"] = priority
+            records.append(record)
+        self._append(records)
+
+    def record(self, url: str, state: str, **fields: Any) -> None:
+        """Record a state transition for a URL.
+
+        Args:
+            url: URL whose state changed
+            state: New state (pending, running, completed, failed)
+            **fields: Extra fields to store, e.g. error or duration
+        """
+        self._append([{"url": url, "state": state, **fields}])
+
+    def checkpoint(self, **counts: Any) -> None:
+        """Record progress counters, sync to disk and compact if due.
+
+        Args:
+            **counts: Counters to store with the checkpoint
+        """
+        self._append(
+            [{"event": "checkpoint", "timestamp": datetime.now(UTC).isoformat(), **counts}]
+        )
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+        if self._lines > self.compact_factor * max(len(self.state.entries), 1):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the journal as one line per URL plus the last checkpoint.
+
+        The new file is written beside the journal and atomically swapped in.
+        """
+        temp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        self.close()
+
+        with open(temp_path, "w", encoding="utf-8") as f:
+            lines = 0
+            for url, entry in self.state.entries.items():
+                f.write(json.dumps({"url": url, **entry}, default=str) + "\n")
+                lines += 1
+            if self.state.counts:
+                f.write(
+                    json.dumps({"event": "checkpoint", **self.state.counts}, default=str) + "\n"
+                )
+                lines += 1
+            f.flush()
+            os.fsync(f.fileno())
+
+        temp_path.replace(self.path)
+        logger.debug(
+            "Compacted checkpoint journal", file=str(self.path), before=self._lines, after=lines
+        )
+        self._lines = lines
+
+    def close(self) -> None:
+        """Close the underlying file; later writes reopen it."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -1,5 +1,6 @@
 """Comprehensive monitoring and reporting system for batch processing operations."""
 
+import asyncio
 import json
 import statistics
 from datetime import UTC, datetime, timedelta
@@ -7,10 +8,10 @@ from pathlib import Path
 from typing import Any
 
 import structlog
-from sqlalchemy import case, func
 
 from src.batch.enhanced_processor import BatchResults
-from src.database.models import Batch, JobStatus, ScrapingJob, SystemMetrics
+from src.database.async_service import AsyncDatabaseService, call_service
+from src.database.models import JobStatus, SystemMetrics
 from src.database.service import DatabaseService
 
 logger = structlog.get_logger(__name__)
@@ -19,14 +20,16 @@ logger = structlog.get_logger(__name__)
 class MetricsCollector:
     """Collects and aggregates batch processing metrics."""
 
-    def __init__(self, database_service: DatabaseService):
+    def __init__(self, database_service: DatabaseService | AsyncDatabaseService):
         """Initialize metrics collector.
 
         Args:
-            database_service: Database service for persistence
+            database_service: Database service for persistence; with an async
+                service metrics are written in the background without blocking the loop
         """
         self.database_service = database_service
         self.start_time = datetime.now(UTC)
+        self.pending_writes: set[asyncio.Task] = set()
 
         # Runtime metrics
         self.urls_processed = 0
@@ -171,6 +174,17 @@ class MetricsCollector:
             json_value: JSON value if applicable
             component: Component name
         """
+        if isinstance(self.database_service, AsyncDatabaseService):
+            self._schedule_system_metric(
+                metric_type=metric_type,
+                metric_name=metric_name,
+                numeric_value=numeric_value,
+                string_value=string_value,
+                json_value=json_value,
+                component=component,
+            )
+            return
+
         try:
             with self.database_service.get_session() as session:
                 metric = SystemMetrics(
@@ -187,230 +201,202 @@ class MetricsCollector:
         except Exception as e:
             logger.error("Failed to record system metric", error=str(e))
 
+    def _schedule_system_metric(self, **metric: Any) -> None:
+        """Write a metric through the async service as a background task."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("No running event loop, dropping system metric", **metric)
+            return
+
+        task = loop.create_task(self.database_service.record_system_metric(**metric))
+        self.pending_writes.add(task)
+        task.add_done_callback(self._system_metric_written)
+
+    def _system_metric_written(self, task: asyncio.Task) -> None:
+        """Forget a finished metric write and log its failure, if any."""
+        self.pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Failed to record system metric", error=str(task.exception()))
+
+    async def wait_for_writes(self) -> None:
+        """Wait until all background metric writes have finished."""
+        if self.pending_writes:
+            await asyncio.gather(*self.pending_writes, return_exceptions=True)
+
 
 class BatchMonitor:
     """Monitors batch processing operations and provides real-time status."""
 
-    def __init__(self, database_service: DatabaseService):
+    def __init__(self, database_service: DatabaseService | AsyncDatabaseService):
         """Initialize batch monitor.
 
         Args:
-            database_service: Database service for data access
+            database_service: Database service for data access; synchronous
+                services are called from a worker thread so they never block the loop
         """
         self.database_service = database_service
         self.metrics_collector = MetricsCollector(database_service)
 
         logger.info("Initialized batch monitor")
 
-    def get_active_batches(self) -> list[dict[str, Any]]:
+    async def get_active_batches(self) -> list[dict[str, Any]]:
         """Get information about currently active batches.
 
         Returns:
             List of active batch information
         """
-        with self.database_service.get_session() as session:
-            active_batches = (
-                session.query(Batch)
-                .filter(Batch.status.in_([JobStatus.PENDING, JobStatus.RUNNING]))
-                .all()
-            )
-
-            batch_info = []
-            for batch in active_batches:
-                # Get job statistics for this batch
-                job_stats = (
-                    session.query(
-                        func.count(ScrapingJob.id).label("total"),
-                        func.sum(
-                            case((ScrapingJob.status == JobStatus.COMPLETED, 1), else_=0)
-                        ).label("completed"),
-                        func.sum(case((ScrapingJob.status == JobStatus.RUNNING, 1), else_=0)).label(
-                            "running"
-                        ),
-                        func.sum(case((ScrapingJob.status == JobStatus.FAILED, 1), else_=0)).label(
-                            "failed"
-                        ),
-                    )
-                    .filter(ScrapingJob.batch_id == batch.id)
-                    .first()
-                )
-
-                batch_info.append(
-                    {
-                        "id": batch.id,
-                        "name": batch.name,
-                        "status": batch.status.value,
-                        "created_at": batch.created_at.isoformat(),
-                        "started_at": batch.started_at.isoformat() if batch.started_at else None,
-                        "total_jobs": job_stats.total or 0,
-                        "completed_jobs": job_stats.completed or 0,
-                        "running_jobs": job_stats.running or 0,
-                        "failed_jobs": job_stats.failed or 0,
-                        "progress_percent": (
-                            (job_stats.completed or 0) / (job_stats.total or 1) * 100
-                            if job_stats.total
-                            else 0
-                        ),
-                        "max_concurrent": batch.max_concurrent,
-                        "output_directory": batch.output_base_directory,
-                    }
-                )
-
-            return batch_info
-
-    def get_batch_details(self, batch_id: int) -> dict[str, Any] | None:
-        """Get detailed information about a specific batch.
-
-        Args:
-            batch_id: ID of the batch to get details for
-
-        Returns:
-            Detailed batch information or None if not found
-        """
-        with self.database_service.get_session() as session:
-            batch = session.query(Batch).filter(Batch.id == batch_id).first()
-            if not batch:
-                return None
-
-            # Get all jobs for this batch
-            jobs = session.query(ScrapingJob).filter(ScrapingJob.batch_id == batch_id).all()
-
-            # Calculate statistics
-            job_stats = {
-                "total": len(jobs),
-                "pending": len([j for j in jobs if j.status == JobStatus.PENDING]),
-                "running": len([j for j in jobs if j.status == JobStatus.RUNNING]),
-                "completed": len([j for j in jobs if j.status == JobStatus.COMPLETED]),
-                "failed": len([j for j in jobs if j.status == JobStatus.FAILED]),
-                "skipped": len([j for j in jobs if j.status == JobStatus.SKIPPED]),
-            }
-
-            # Calculate timing statistics
-            completed_jobs = [j for j in jobs if j.duration_seconds is not None]
-            timing_stats = None
-            if completed_jobs:
-                durations = [j.duration_seconds for j in completed_jobs]
-                timing_stats = {
-                    "average_duration": statistics.mean(durations),
-                    "median_duration": statistics.median(durations),
-                    "min_duration": min(durations),
-                    "max_duration": max(durations),
-                    "total_processing_time": sum(durations),
-                }
+        active_batches = await call_service(
+            self.database_service.get_batches, [JobStatus.PENDING, JobStatus.RUNNING]
+        )
 
-            # Recent job activity
-            recent_jobs = sorted(
-                [j for j in jobs if j.completed_at], key=lambda x: x.completed_at, reverse=True
-            )[:10]
+        batch_info = []
+        for batch in active_batches:
+            # Get job statistics for this batch
+            counts = await call_service(self.database_service.get_job_status_counts, batch.id)
+            total = sum(counts.values())
+            completed = counts.get(JobStatus.COMPLETED, 0)
 
-            recent_activity = [
+            batch_info.append(
                 {
-                    "url": job.url,
-                    "status": job.status.value,
-                    "completed_at": job.completed_at.isoformat() if job.completed_at else None,
-                    "duration": job.duration_seconds,
-                    "error": job.error_message,
-                }
-                for job in recent_jobs
-            ]
-
-            return {
-                "batch": {
                     "id": batch.id,
                     "name": batch.name,
-                    "description": batch.description,
                     "status": batch.status.value,
                     "created_at": batch.created_at.isoformat(),
                     "started_at": batch.started_at.isoformat() if batch.started_at else None,
-                    "completed_at": batch.completed_at.isoformat() if batch.completed_at else None,
+                    "total_jobs": total,
+                    "completed_jobs": completed,
+                    "running_jobs": counts.get(JobStatus.RUNNING, 0),
+                    "failed_jobs": counts.get(JobStatus.FAILED, 0),
+                    "progress_percent": completed / total * 100 if total else 0,
                     "max_concurrent": batch.max_concurrent,
                     "output_directory": batch.output_base_directory,
-                },
-                "job_statistics": job_stats,
-                "timing_statistics": timing_stats,
-                "recent_activity": recent_activity,
-            }
+                }
+            )
 
-    def get_system_health(self) -> dict[str, Any]:
-        """Get overall system health metrics.
+        return batch_info
 
-        Returns:
-            System health information
-        """
-        with self.database_service.get_session() as session:
-            # Get counts by status
-            job_counts = (
-                session.query(ScrapingJob.status, func.count(ScrapingJob.id))
-                .group_by(ScrapingJob.status)
-                .all()
-            )
+    async def get_batch_details(self, batch_id: int) -> dict[str, Any] | None:
+        """Get detailed information about a specific batch.
 
-            status_counts = {status.value: 0 for status in JobStatus}
-            for status, count in job_counts:
-                status_counts[status.value] = count
+        Args:
+            batch_id: ID of the batch to get details for
 
-            # Get recent error rate (last hour)
-            one_hour_ago = datetime.now(UTC) - timedelta(hours=1)
-            recent_jobs = (
-                session.query(ScrapingJob).filter(ScrapingJob.created_at >= one_hour_ago).all()
-            )
+        Returns:
+            Detailed batch information or None if not found
+        """
+        batch = await call_service(self.database_service.get_batch, batch_id)
+        if not batch:
+            return None
+
+        # Get all jobs for this batch
+        jobs = await call_service(self.database_service.get_batch_jobs, batch_id)
+
+        # Calculate statistics
+        job_stats = {
+            "total": len(jobs),
+            "pending": len([j for j in jobs if j.status == JobStatus.PENDING]),
+            "running": len([j for j in jobs if j.status == JobStatus.RUNNING]),
+            "completed": len([j for j in jobs if j.status == JobStatus.COMPLETED]),
+            "failed": len([j for j in jobs if j.status == JobStatus.FAILED]),
+            "skipped": len([j for j in jobs if j.status == JobStatus.SKIPPED]),
+        }
 
-            recent_error_rate = 0.0
-            if recent_jobs:
-                failed_recent = len([j for j in recent_jobs if j.status == JobStatus.FAILED])
-                recent_error_rate = failed_recent / len(recent_jobs) * 100
-
-            # Database connection pool status
-            engine_stats = {
-                "pool_size": self.database_service.engine.pool.size(),
-                "checked_in": self.database_service.engine.pool.checkedin(),
-                "checked_out": self.database_service.engine.pool.checkedout(),
-                "overflow": self.database_service.engine.pool.overflow(),
-                "invalid": self.database_service.engine.pool.invalid(),
+        # Calculate timing statistics
+        completed_jobs = [j for j in jobs if j.duration_seconds is not None]
+        timing_stats = None
+        if completed_jobs:
+            durations = [j.duration_seconds for j in completed_jobs]
+            timing_stats = {
+                "average_duration": statistics.mean(durations),
+                "median_duration": statistics.median(durations),
+                "min_duration": min(durations),
+                "max_duration": max(durations),
+                "total_processing_time": sum(durations),
             }
 
-            return {
-                "timestamp": datetime.now(UTC).isoformat(),
-                "job_status_counts": status_counts,
-                "total_jobs": sum(status_counts.values()),
-                "recent_error_rate_percent": recent_error_rate,
-                "database": {
-                    "connection_pool": engine_stats,
-                    "healthy": self._check_database_health_sync(),
-                },
-                "runtime_metrics": self.metrics_collector.get_current_metrics(),
+        # Recent job activity
+        recent_jobs = sorted(
+            [j for j in jobs if j.completed_at], key=lambda x: x.completed_at, reverse=True
+        )[:10]
+
+        recent_activity = [
+            {
+                "url": job.url,
+                "status": job.status.value,
+                "completed_at": job.completed_at.isoformat() if job.completed_at else None,
+                "duration": job.duration_seconds,
+                "error": job.error_message,
             }
+            for job in recent_jobs
+        ]
+
+        return {
+            "batch": {
+                "id": batch.id,
+                "name": batch.name,
+                "description": batch.description,
+                "status": batch.status.value,
+                "created_at": batch.created_at.isoformat(),
+                "started_at": batch.started_at.isoformat() if batch.started_at else None,
+                "completed_at": batch.completed_at.isoformat() if batch.completed_at else None,
+                "max_concurrent": batch.max_concurrent,
+                "output_directory": batch.output_base_directory,
+            },
+            "job_statistics": job_stats,
+            "timing_statistics": timing_stats,
+            "recent_activity": recent_activity,
+        }
 
-    def _check_database_health_sync(self) -> bool:
-        """Check if database connection is healthy (synchronous version).
+    async def get_system_health(self) -> dict[str, Any]:
+        """Get overall system health metrics.
 
         Returns:
-            True if database is healthy, False otherwise
+            System health information
         """
-        try:
-            with self.database_service.get_session() as session:
-                # Try a simple query
-                from sqlalchemy import text
+        # Get counts by status
+        job_counts = await call_service(self.database_service.get_job_status_counts)
+        status_counts = {status.value: job_counts.get(status, 0) for status in JobStatus}
+
+        # Get recent error rate (last hour)
+        one_hour_ago = datetime.now(UTC) - timedelta(hours=1)
+        recent_jobs = await call_service(self.database_service.get_jobs, created_from=one_hour_ago)
+
+        recent_error_rate = 0.0
+        if recent_jobs:
+            failed_recent = len([j for j in recent_jobs if j.status == JobStatus.FAILED])
+            recent_error_rate = failed_recent / len(recent_jobs) * 100
+
+        # Database connection pool status
+        pool = self.database_service.engine.pool
+        engine_stats = {
+            "pool_size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+            "invalid": pool.invalid(),
+        }
 
-                result = session.execute(text("SELECT 1"))
-                return result is not None
-        except Exception as e:
-            logger.error("Database health check failed", error=str(e))
-            return False
+        return {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "job_status_counts": status_counts,
+            "total_jobs": sum(status_counts.values()),
+            "recent_error_rate_percent": recent_error_rate,
+            "database": {
+                "connection_pool": engine_stats,
+                "healthy": await self._check_database_health(),
+            },
+            "runtime_metrics": self.metrics_collector.get_current_metrics(),
+        }
 
     async def _check_database_health(self) -> bool:
-        """Check if database connection is healthy (async version).
+        """Check if database connection is healthy.
 
         Returns:
             True if database is healthy, False otherwise
         """
         try:
-            with self.database_service.get_session() as session:
-                # Try a simple query
-                from sqlalchemy import text
-
-                result = session.execute(text("SELECT 1"))
-                return result is not None
+            return await call_service(self.database_service.check_connection)
         except Exception as e:
             logger.error("Database health check failed", error=str(e))
             return False
@@ -428,116 +414,110 @@ class BatchMonitor:
         Returns:
             Report data as dictionary
         """
-        with self.database_service.get_session() as session:
-            # Get batches in date range
-            batches = (
-                session.query(Batch)
-                .filter(Batch.created_at >= start_date, Batch.created_at <= end_date)
-                .all()
-            )
+        # Get batches and jobs in date range
+        batches = await call_service(
+            self.database_service.get_batches, created_from=start_date, created_to=end_date
+        )
+        jobs = await call_service(
+            self.database_service.get_jobs, created_from=start_date, created_to=end_date
+        )
 
-            # Get jobs in date range
-            jobs = (
-                session.query(ScrapingJob)
-                .filter(ScrapingJob.created_at >= start_date, ScrapingJob.created_at <= end_date)
-                .all()
-            )
+        # Calculate summary statistics
+        total_jobs = len(jobs)
+        successful_jobs = len([j for j in jobs if j.status == JobStatus.COMPLETED])
+        failed_jobs = len([j for j in jobs if j.status == JobStatus.FAILED])
+
+        # Processing time statistics
+        completed_with_duration = [j for j in jobs if j.duration_seconds is not None]
+        duration_stats = None
+        if completed_with_duration:
+            durations = [j.duration_seconds for j in completed_with_duration]
+            duration_stats = {
+                "average": statistics.mean(durations),
+                "median": statistics.median(durations),
+                "min": min(durations),
+                "max": max(durations),
+                "total": sum(durations),
+            }
 
-            # Calculate summary statistics
-            total_jobs = len(jobs)
-            successful_jobs = len([j for j in jobs if j.status == JobStatus.COMPLETED])
-            failed_jobs = len([j for j in jobs if j.status == JobStatus.FAILED])
-
-            # Processing time statistics
-            completed_with_duration = [j for j in jobs if j.duration_seconds is not None]
-            duration_stats = None
-            if completed_with_duration:
-                durations = [j.duration_seconds for j in completed_with_duration]
-                duration_stats = {
-                    "average": statistics.mean(durations),
-                    "median": statistics.median(durations),
-                    "min": min(durations),
-                    "max": max(durations),
-                    "total": sum(durations),
+        # Top domains by processing count
+        domain_counts: dict[str, int] = {}
+        for job in jobs:
+            domain = job.domain
+            domain_counts[domain] = domain_counts.get(domain, 0) + 1
+
+        top_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+
+        # Error analysis
+        error_types: dict[str, int] = {}
+        for job in jobs:
+            if job.status == JobStatus.FAILED and job.error_type:
+                error_types[job.error_type] = error_types.get(job.error_type, 0) + 1
+
+        # Build report
+        report = {
+            "report_period": {
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "duration_days": (end_date - start_date).days,
+            },
+            "summary": {
+                "total_batches": len(batches),
+                "total_jobs": total_jobs,
+                "successful_jobs": successful_jobs,
+                "failed_jobs": failed_jobs,
+                "success_rate_percent": (
+                    successful_jobs / total_jobs * 100 if total_jobs > 0 else 0
+                ),
+            },
+            "processing_statistics": {
+                "duration_statistics": duration_stats,
+                "total_processing_time_hours": (
+                    duration_stats["total"] / 3600 if duration_stats else 0
+                ),
+            },
+            "top_domains": top_domains,
+            "error_analysis": {
+                "error_types": error_types,
+                "most_common_error": (
+                    max(error_types.items(), key=lambda x: x[1]) if error_types else None
+                ),
+            },
+            "batch_details": [
+                {
+                    "name": batch.name,
+                    "status": batch.status.value,
+                    "created_at": batch.created_at.isoformat(),
+                    "total_jobs": batch.total_jobs,
+                    "completed_jobs": batch.completed_jobs,
+                    "failed_jobs": batch.failed_jobs,
+                    "success_rate": batch.success_rate,
                 }
+                for batch in batches
+            ],
+            "generated_at": datetime.now(UTC).isoformat(),
+        }
 
-            # Top domains by processing count
-            domain_counts: dict[str, int] = {}
-            for job in jobs:
-                domain = job.domain
-                domain_counts[domain] = domain_counts.get(domain, 0) + 1
-
-            top_domains = sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-
-            # Error analysis
-            error_types: dict[str, int] = {}
-            for job in jobs:
-                if job.status == JobStatus.FAILED and job.error_type:
-                    error_types[job.error_type] = error_types.get(job.error_type, 0) + 1
-
-            # Build report
-            report = {
-                "report_period": {
-                    "start_date": start_date.isoformat(),
-                    "end_date": end_date.isoformat(),
-                    "duration_days": (end_date - start_date).days,
-                },
-                "summary": {
-                    "total_batches": len(batches),
-                    "total_jobs": total_jobs,
-                    "successful_jobs": successful_jobs,
-                    "failed_jobs": failed_jobs,
-                    "success_rate_percent": (
-                        successful_jobs / total_jobs * 100 if total_jobs > 0 else 0
-                    ),
-                },
-                "processing_statistics": {
-                    "duration_statistics": duration_stats,
-                    "total_processing_time_hours": (
-                        duration_stats["total"] / 3600 if duration_stats else 0
-                    ),
-                },
-                "top_domains": top_domains,
-                "error_analysis": {
-                    "error_types": error_types,
-                    "most_common_error": (
-                        max(error_types.items(), key=lambda x: x[1]) if error_types else None
-                    ),
-                },
-                "batch_details": [
-                    {
-                        "name": batch.name,
-                        "status": batch.status.value,
-                        "created_at": batch.created_at.isoformat(),
-                        "total_jobs": batch.total_jobs,
-                        "completed_jobs": batch.completed_jobs,
-                        "failed_jobs": batch.failed_jobs,
-                        "success_rate": batch.success_rate,
-                    }
-                    for batch in batches
-                ],
-                "generated_at": datetime.now(UTC).isoformat(),
-            }
-
-            # Save report to file if requested
-            if output_file:
-                output_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_file, "w") as f:
-                    json.dump(report, f, indent=2)
+        # Save report to file if requested
+        if output_file:
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_file, "w") as f:
+                json.dump(report, f, indent=2)
 
-                logger.info("Generated batch processing report", file=str(output_file))
+            logger.info("Generated batch processing report", file=str(output_file))
 
-            return report
+        return report
 
 
 class AlertManager:
     """Manages alerts and notifications for batch processing issues."""
 
-    def __init__(self, database_service: DatabaseService):
+    def __init__(self, database_service: DatabaseService | AsyncDatabaseService):
         """Initialize alert manager.
 
         Args:
-            database_service: Database service for data access
+            database_service: Database service for data access; synchronous
+                services are called from a worker thread so they never block the loop
         """
         self.database_service = database_service
         self.alert_thresholds = {
@@ -556,33 +536,29 @@ class AlertManager:
         Returns:
             Alert dictionary if threshold exceeded, None otherwise
         """
-        with self.database_service.get_session() as session:
-            # Check error rate in last hour
-            one_hour_ago = datetime.now(UTC) - timedelta(hours=1)
+        # Check error rate in last hour
+        one_hour_ago = datetime.now(UTC) - timedelta(hours=1)
+        recent_jobs = await call_service(self.database_service.get_jobs, created_from=one_hour_ago)
 
-            recent_jobs = (
-                session.query(ScrapingJob).filter(ScrapingJob.created_at >= one_hour_ago).all()
-            )
+        if not recent_jobs:
+            return None
 
-            if not recent_jobs:
-                return None
-
-            failed_count = len([j for j in recent_jobs if j.status == JobStatus.FAILED])
-            error_rate = failed_count / len(recent_jobs) * 100
-
-            if error_rate > self.alert_thresholds["error_rate_percent"]:
-                return {
-                    "type": "high_error_rate",
-                    "severity": "warning" if error_rate < 25 else "critical",
-                    "message": f"Error rate is {error_rate:.1f}% (threshold: {self.alert_thresholds['error_rate_percent']}%)",
-                    "details": {
-                        "error_rate_percent": error_rate,
-                        "failed_jobs": failed_count,
-                        "total_jobs": len(recent_jobs),
-                        "time_period": "last_hour",
-                    },
-                    "timestamp": datetime.now(UTC).isoformat(),
-                }
+        failed_count = len([j for j in recent_jobs if j.status == JobStatus.FAILED])
+        error_rate = failed_count / len(recent_jobs) * 100
+
+        if error_rate > self.alert_thresholds["error_rate_percent"]:
+            return {
+                "type": "high_error_rate",
+                "severity": "warning" if error_rate < 25 else "critical",
+                "message": f"Error rate is {error_rate:.1f}% (threshold: {self.alert_thresholds['error_rate_percent']}%)",
+                "details": {
+                    "error_rate_percent": error_rate,
+                    "failed_jobs": failed_count,
+                    "total_jobs": len(recent_jobs),
+                    "time_period": "last_hour",
+                },
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
 
         return None
 
@@ -592,36 +568,32 @@ class AlertManager:
         Returns:
             Alert dictionary if stalled jobs found, None otherwise
         """
-        with self.database_service.get_session() as session:
-            threshold_time = datetime.now(UTC) - timedelta(
-                minutes=self.alert_thresholds["processing_delay_minutes"]
-            )
-
-            stalled_jobs = (
-                session.query(ScrapingJob)
-                .filter(
-                    ScrapingJob.status == JobStatus.RUNNING, ScrapingJob.started_at < threshold_time
-                )
-                .all()
-            )
+        threshold_time = datetime.now(UTC) - timedelta(
+            minutes=self.alert_thresholds["processing_delay_minutes"]
+        )
+        stalled_jobs = await call_service(
+            self.database_service.get_jobs,
+            statuses=[JobStatus.RUNNING],
+            started_before=threshold_time,
+        )
 
-            if stalled_jobs:
-                return {
-                    "type": "stalled_jobs",
-                    "severity": "warning",
-                    "message": f"Found {len(stalled_jobs)} jobs running longer than {self.alert_thresholds['processing_delay_minutes']} minutes",
-                    "details": {
-                        "stalled_count": len(stalled_jobs),
-                        "threshold_minutes": self.alert_thresholds["processing_delay_minutes"],
-                        "oldest_job_url": stalled_jobs[0].url if stalled_jobs else None,
-                        "oldest_started_at": (
-                            stalled_jobs[0].started_at.isoformat()
-                            if stalled_jobs and stalled_jobs[0].started_at
-                            else None
-                        ),
-                    },
-                    "timestamp": datetime.now(UTC).isoformat(),
-                }
+        if stalled_jobs:
+            return {
+                "type": "stalled_jobs",
+                "severity": "warning",
+                "message": f"Found {len(stalled_jobs)} jobs running longer than {self.alert_thresholds['processing_delay_minutes']} minutes",
+                "details": {
+                    "stalled_count": len(stalled_jobs),
+                    "threshold_minutes": self.alert_thresholds["processing_delay_minutes"],
+                    "oldest_job_url": stalled_jobs[0].url if stalled_jobs else None,
+                    "oldest_started_at": (
+                        stalled_jobs[0].started_at.isoformat()
+                        if stalled_jobs and stalled_jobs[0].started_at
+                        else None
+                    ),
+                },
+                "timestamp": datetime.now(UTC).isoformat(),
+            }
 
         return None
 
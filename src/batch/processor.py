@@ -1,26 +1,51 @@
 """Batch processing for multiple URLs with concurrent execution."""
 
 import asyncio
+import csv
+import hashlib
+import json
 import re
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import aclosing, nullcontext
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, TypedDict
+from typing import Any, NotRequired, TextIO, TypedDict
 from urllib.parse import urlparse
 
 import structlog
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskID, TextColumn, TimeElapsedColumn
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TaskID,
+    TextColumn,
+    TimeElapsedColumn,
+    TimeRemainingColumn,
+)
 from rich.table import Table
 
 from ..constants import CONSTANTS
-from ..core.converter import AsyncWordPressConverter
+from ..core.converter import AsyncWordPressConverter, ConversionResult
+from ..utils.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    DomainConcurrencyLimiter,
+    bounded_as_completed,
+)
+from ..utils.deadline import stage_budget
+from ..utils.dedup import URLDeduplicator, fingerprint
 from ..utils.path_utils import (
     safe_filename,
     truncate_path_component,
 )
+from ..utils.retry import domain_hold_time
+from ..utils.url import canonicalize_url, domain_key
+from .archiver import archive_suffix, build_archive
+from .scheduler import DomainScheduler
 
 logger = structlog.get_logger(__name__)
 
@@ -33,6 +58,7 @@ class JobSummaryData(TypedDict):
     output_dir: str
     duration: float | None
     error: str | None
+    partial: NotRequired[bool]  # Completed, but the job deadline cut image downloads short
 
 
 class BatchSummary(TypedDict):
@@ -45,6 +71,8 @@ class BatchSummary(TypedDict):
     jobs: list[JobSummaryData]
     total_duration: float
     average_duration: float
+    duplicates: NotRequired[int]  # URLs dropped as duplicates while loading jobs
+    jobs_file: NotRequired[str]  # Streaming mode: NDJSON file holding the job entries
 
 
 console = Console()
@@ -60,7 +88,7 @@ class BatchJobStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchJob:  # pylint: disable=too-many-instance-attributes
     """Individual job in a batch processing operation."""
 
@@ -72,6 +100,7 @@ class BatchJob:  # pylint: disable=too-many-instance-attributes
     end_time: float | None = None
     progress_task: TaskID | None = None
     archive_path: Path | None = None
+    partial: bool = False  # Content saved, but the deadline stopped image downloads
 
     @property
     def duration(self) -> float | None:
@@ -94,8 +123,23 @@ class BatchConfig:  # pylint: disable=too-many-instance-attributes
     retry_failed: bool = True
     max_retries: int = 2
     create_archives: bool = False  # Create ZIP archives for each job
-    archive_format: str = "zip"  # zip, tar, tar.gz
+    archive_format: str = "zip"  # zip, tar, tar.gz, tar.zst
     cleanup_after_archive: bool = False  # Remove directories after zipping
+    archive_compression_level: int = 6  # zlib level for zip/tar.gz, zstd level for tar.zst
+    archive_workers: int = 2  # Archives built concurrently with running jobs
+    archive_executor: str = "thread"  # thread, process
+    lookahead: int = CONSTANTS.BATCH_LOOKAHEAD  # Jobs admitted beyond max_concurrent
+    stream_input: bool = False  # Parse URL files lazily instead of loading every job up front
+    progress_mode: str = "auto"  # auto, detailed, aggregate
+    adaptive_concurrency: bool = CONSTANTS.BATCH_ADAPTIVE_CONCURRENCY  # AIMD limit per domain
+    min_concurrent: int = CONSTANTS.BATCH_MIN_CONCURRENT  # Floor for the adaptive limits
+    adaptive_max_concurrent: int = CONSTANTS.BATCH_ADAPTIVE_MAX_CONCURRENT  # 0 = max_concurrent
+    target_p95_seconds: float | None = None  # Adaptive latency target, defaults to timeout / 2
+    per_domain_concurrency: int = CONSTANTS.BATCH_PER_DOMAIN_CONCURRENCY  # 0 = uncapped
+    domain_concurrency: dict[str, int] = field(default_factory=dict)  # Per-domain overrides
+    domain_weights: dict[str, int] = field(default_factory=dict)  # Jobs per round-robin turn
+    dedup_expected_urls: int = CONSTANTS.DEDUP_EXPECTED_URLS  # Bloom filter sizing
+    dedup_false_positive_rate: float = CONSTANTS.DEDUP_FALSE_POSITIVE_RATE
 
 
 class BatchProcessor:
@@ -109,15 +153,71 @@ class BatchProcessor:
         """
         self.config = batch_config or BatchConfig()
         self.jobs: list[BatchJob] = []
-        self.semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        ceiling = self.config.max_concurrent
+        self.domain_limiter: DomainConcurrencyLimiter | None = None
+        if self.config.adaptive_concurrency:
+            # Every domain starts at max_concurrent and converges to what it sustains
+            ceiling = max(ceiling, self.config.adaptive_max_concurrent)
+            self.domain_limiter = DomainConcurrencyLimiter(
+                initial_limit=self.config.max_concurrent,
+                min_limit=self.config.min_concurrent,
+                max_limit=ceiling,
+                target_p95=self.config.target_p95_seconds or self.config.timeout_per_job / 2,
+            )
+        # Jobs converting at once across all domains
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial_limit=ceiling, min_limit=ceiling, max_limit=ceiling
+        )
         self.results: dict[str, Any] = {}
+        self.duplicates_skipped = 0
+        self.seen_urls = self._new_url_filter()
+        self._archive_executor: Executor | None = None
 
         logger.info(
             "Initialized batch processor",
             max_concurrent=self.config.max_concurrent,
+            adaptive=self.domain_limiter is not None,
             continue_on_error=self.config.continue_on_error,
         )
 
+    @staticmethod
+    def _publish_concurrency_limit(limit: int) -> None:
+        """Export the effective concurrency limit as a metric."""
+        from ..monitoring.metrics import metrics_collector
+
+        metrics_collector.set_batch_concurrency_limit(limit)
+
+    def _new_url_filter(self) -> URLDeduplicator:
+        """Seen-set for URLs loaded from files."""
+        return URLDeduplicator(
+            expected_urls=self.config.dedup_expected_urls,
+            false_positive_rate=self.config.dedup_false_positive_rate,
+        )
+
+    def _add_unique_job(
+        self, url: str, output_dir: Path | None = None, custom_slug: str | None = None
+    ) -> bool:
+        """Add a job for a file-loaded URL unless an equivalent URL was already loaded.
+
+        The URL is canonicalized first, so ``http``/``https``, trailing
+        slashes, tracking parameters and fragments do not create extra jobs.
+
+        Args:
+            url: URL read from a jobs file
+            output_dir: Optional specific output directory
+            custom_slug: Optional custom slug
+
+        Returns:
+            True if a job was added, False if the URL was a duplicate
+        """
+        url = canonicalize_url(url) or url
+        if not self.seen_urls.add(url):
+            self.duplicates_skipped += 1
+            logger.debug("Skipped duplicate URL", url=url)
+            return False
+        self.add_job(url, output_dir=output_dir, custom_slug=custom_slug)
+        return True
+
     def add_job(
         self, url: str, output_dir: Path | None = None, custom_slug: str | None = None
     ) -> BatchJob:
@@ -213,8 +313,6 @@ class BatchProcessor:
         except Exception as e:
             logger.warning("Failed to generate directory from URL", url=url, error=str(e))
             # Fallback to hash-based naming
-            import hashlib
-
             url_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
             return self.config.output_base_dir / f"post_{url_hash}"
 
@@ -296,8 +394,8 @@ class BatchProcessor:
                 url = line.strip()
                 if url and not url.startswith("#"):  # Skip empty lines and comments
                     try:
-                        self.add_job(url)
-                        added += 1
+                        if self._add_unique_job(url):
+                            added += 1
                     except Exception as e:
                         logger.warning(
                             "Skipped invalid URL",
@@ -348,8 +446,6 @@ class BatchProcessor:
 
     def _process_structured_csv(self, file_handle) -> int:
         """Process structured CSV with columns."""
-        import csv
-
         added = 0
         from ..constants import CONSTANTS
 
@@ -378,7 +474,8 @@ class BatchProcessor:
                 if custom_output:
                     custom_output = Path(custom_output)
 
-                self.add_job(url=url, output_dir=custom_output, custom_slug=custom_slug)
+                if not self._add_unique_job(url, output_dir=custom_output, custom_slug=custom_slug):
+                    continue
                 added += 1
 
                 logger.debug(
@@ -396,8 +493,6 @@ class BatchProcessor:
 
     def _process_simple_csv(self, file_handle) -> int:
         """Process simple CSV/list of URLs."""
-        import csv
-
         added = 0
         file_handle.seek(0)
 
@@ -413,9 +508,9 @@ class BatchProcessor:
                     url = url.strip()
                     if url and not url.startswith("#"):
                         try:
-                            self.add_job(url)
-                            added += 1
-                            logger.debug("Added simple CSV job", row_num=row_num, url=url)
+                            if self._add_unique_job(url):
+                                added += 1
+                                logger.debug("Added simple CSV job", row_num=row_num, url=url)
                         except Exception as e:
                             logger.warning(
                                 "Skipped invalid URL", row_num=row_num, url=url, error=str(e)
@@ -426,9 +521,9 @@ class BatchProcessor:
                 url = line.strip()
                 if url and not url.startswith("#"):
                     try:
-                        self.add_job(url)
-                        added += 1
-                        logger.debug("Added simple list job", line_num=line_num, url=url)
+                        if self._add_unique_job(url):
+                            added += 1
+                            logger.debug("Added simple list job", line_num=line_num, url=url)
                     except Exception as e:
                         logger.warning(
                             "Skipped invalid URL", line_num=line_num, url=url, error=str(e)
@@ -436,6 +531,91 @@ class BatchProcessor:
 
         return added
 
+    def iter_urls_from_file(
+        self, file_path: str | Path
+    ) -> Iterator[tuple[str, str | None, Path | None]]:
+        """Lazily parse a URL file without loading it into memory.
+
+        Accepts the same plain text and CSV formats as ``add_jobs_from_file``.
+
+        Args:
+            file_path: Path to file (.txt or .csv)
+
+        Yields:
+            Tuples of (url, custom slug, custom output directory)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Jobs file not found: {file_path}")
+
+        is_csv = file_path.suffix.lower() == ".csv"
+        with open(file_path, encoding="utf-8", newline="" if is_csv else None) as f:
+            first_line = f.readline()
+            f.seek(0)
+
+            if is_csv and "url" in first_line.lower() and ("," in first_line or "\t" in first_line):
+                # Structured CSV - the header decides the delimiter
+                delimiter = "\t" if "\t" in first_line else ","
+                for row in csv.DictReader(f, delimiter=delimiter):
+                    url = (row.get("url") or "").strip()
+                    if not url or url.startswith("#"):
+                        continue
+                    custom_slug = (row.get("slug") or "").strip() or None
+                    custom_output = (row.get("output_dir") or "").strip() or None
+                    yield url, custom_slug, Path(custom_output) if custom_output else None
+            elif is_csv:
+                for row in csv.reader(f):
+                    for cell in row:
+                        url = cell.strip()
+                        if url and not url.startswith("#"):
+                            yield url, None, None
+            else:
+                for line in f:
+                    url = line.strip()
+                    if url and not url.startswith("#"):
+                        yield url, None, None
+
+    def iter_jobs_from_file(self, file_path: str | Path) -> Iterator[BatchJob]:
+        """Lazily create jobs from a URL file, skipping duplicate URLs.
+
+        URLs are canonicalized and checked against a fixed-memory seen-set
+        (exact for small files, a Bloom filter for very large ones), and
+        only fingerprints of output directories are retained, so jobs can be
+        created for very large files. Skipped duplicates are counted in
+        ``duplicates_skipped``.
+
+        Args:
+            file_path: Path to file (.txt or .csv)
+
+        Yields:
+            Jobs in file order
+        """
+        seen_urls = self._new_url_filter()
+        used_dirs: set[int] = set()
+
+        for url, custom_slug, output_dir in self.iter_urls_from_file(file_path):
+            url = canonicalize_url(url) or url
+            if not seen_urls.add(url):
+                self.duplicates_skipped += 1
+                logger.debug("Skipped duplicate URL", url=url)
+                continue
+
+            if output_dir is None:
+                output_dir = self._generate_output_directory(url, custom_slug)
+
+            # Same numbering scheme as _ensure_unique_directory
+            unique_dir = output_dir
+            counter = 2
+            while fingerprint(str(unique_dir)) in used_dirs:
+                unique_dir = Path(f"{output_dir}-{counter}")
+                counter += 1
+            used_dirs.add(fingerprint(str(unique_dir)))
+
+            yield BatchJob(url=url, output_dir=unique_dir)
+
     async def process_all(
         self, progress_callback: Callable[[str, int], None] | None = None
     ) -> BatchSummary:
@@ -449,51 +629,234 @@ class BatchProcessor:
         """
         if not self.jobs:
             logger.warning("No jobs to process")
-            return {
-                "total": 0,
-                "successful": 0,
-                "failed": 0,
-                "skipped": 0,
-                "jobs": [],
-                "total_duration": 0.0,
-                "average_duration": 0.0,
-            }
+            return self._empty_summary(0)
 
         logger.info("Starting batch processing", total_jobs=len(self.jobs))
 
-        # Setup progress display
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console,
-        ) as progress:
-            # Create main progress task
-            main_task = progress.add_task(
-                f"Processing {len(self.jobs)} URLs...", total=len(self.jobs)
+        summary = self._empty_summary(len(self.jobs))
+        summary["duplicates"] = self.duplicates_skipped
+        if self.config.create_summary and self._use_aggregate_progress(len(self.jobs)):
+            # Large batch - append job entries to the NDJSON summary as they finish
+            jobs_file = self._jobs_file_path()
+            with open(jobs_file, "w", encoding="utf-8") as journal:
+                await self._run_jobs(self.jobs, summary, len(self.jobs), progress_callback, journal)
+            summary["jobs_file"] = str(jobs_file)
+        else:
+            await self._run_jobs(self.jobs, summary, len(self.jobs), progress_callback)
+        return await self._complete_summary(summary)
+
+    async def process_file(
+        self,
+        file_path: str | Path,
+        progress_callback: Callable[[str, int], None] | None = None,
+    ) -> BatchSummary:
+        """Process a URL file in streaming mode.
+
+        The file is parsed lazily and duplicate URLs are skipped. Jobs only
+        exist while they are in flight; each finished job is appended to
+        ``batch_jobs.ndjson`` in the output directory and dropped, so memory
+        stays flat regardless of how many URLs the file contains.
+
+        Args:
+            file_path: Path to file (.txt or .csv)
+            progress_callback: Optional callback for progress updates
+
+        Returns:
+            Summary with counters; per-job entries are in the jobs file
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Jobs file not found: {file_path}")
+
+        logger.info("Starting streaming batch processing", file_path=str(file_path))
+
+        jobs_file = self._jobs_file_path()
+        summary = self._empty_summary(0)
+        self.duplicates_skipped = 0
+        with open(jobs_file, "w", encoding="utf-8") as journal:
+            await self._run_jobs(
+                self.iter_jobs_from_file(file_path), summary, None, progress_callback, journal
             )
 
-            # Create individual job tasks
-            for job in self.jobs:
-                job.progress_task = progress.add_task(
-                    f"Queued: {job.url}", total=100, visible=False
+        summary["total"] = summary["successful"] + summary["failed"] + summary["skipped"]
+        summary["duplicates"] = self.duplicates_skipped
+        summary["jobs_file"] = str(jobs_file)
+        return await self._complete_summary(summary)
+
+    async def _run_jobs(
+        self,
+        jobs: Iterable[BatchJob],
+        summary: BatchSummary,
+        total: int | None,
+        progress_callback: Callable[[str, int], None] | None = None,
+        journal: TextIO | None = None,
+    ) -> None:
+        """Execute jobs with a bounded number in flight, folding results into the summary.
+
+        Args:
+            jobs: Jobs to run, consumed lazily
+            summary: Summary being accumulated
+            total: Number of jobs if known, for the progress bar
+            progress_callback: Optional callback for progress updates
+            journal: Optional file that finished job entries are written to
+                instead of being kept in the summary
+        """
+        stop_admission = False
+        archive_tasks: set[asyncio.Task] = set()
+        aggregate = self._use_aggregate_progress(total)
+        started = 0
+        finished = 0
+        errors = 0
+        start_time = asyncio.get_event_loop().time()
+        self._publish_concurrency_limit(self.concurrency.limit)
+
+        # Domains take turns so one slow site cannot hold every slot
+        scheduler = DomainScheduler(
+            jobs,
+            lambda job: domain_key(job.url),
+            per_domain_limit=self.config.per_domain_concurrency,
+            domain_limits=self.config.domain_concurrency,
+            domain_weights=self.config.domain_weights,
+            hold=domain_hold_time,
+            adaptive_limit=self.domain_limiter.limit if self.domain_limiter else None,
+        )
+
+        async def admitted_jobs() -> AsyncIterator[BatchJob]:
+            async for job in scheduler:
+                if stop_admission:
+                    scheduler.release(job)
+                    return
+                yield job
+
+        if aggregate:
+            # One row of aggregate stats - rendering cost is independent of batch size
+            columns: tuple[Any, ...] = (
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                TextColumn("{task.fields[rate]:.1f} URLs/s"),
+                TextColumn("in flight: {task.fields[in_flight]}"),
+                TextColumn("errors: {task.fields[error_rate]:.1%}"),
+                TimeElapsedColumn(),
+                TimeRemainingColumn(),
+            )
+        else:
+            columns = (
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                TimeElapsedColumn(),
+            )
+
+        try:
+            # Setup progress display
+            with Progress(*columns, console=console) as progress:
+                # Create main progress task
+                description = f"Processing {total} URLs..." if total else "Processing URLs..."
+                main_task = progress.add_task(
+                    description, total=total, rate=0.0, in_flight=0, error_rate=0.0
                 )
 
-            # Process jobs concurrently
-            tasks = [
-                self._process_single_job(job, progress, progress_callback) for job in self.jobs
-            ]
+                async def run_job(job: BatchJob) -> BatchJob:
+                    nonlocal started
+                    started += 1
+                    try:
+                        if aggregate:
+                            progress.update(main_task, in_flight=started - finished)
+                            return await self._process_single_job(job, progress, progress_callback)
+
+                        # Per-job rows exist only while the job is in flight
+                        job.progress_task = progress.add_task(f"Queued: {job.url}", total=100)
+                        try:
+                            return await self._process_single_job(job, progress, progress_callback)
+                        finally:
+                            progress.remove_task(job.progress_task)
+                            job.progress_task = None
+                    finally:
+                        scheduler.release(job)
+
+                def record(job: BatchJob) -> None:
+                    nonlocal finished, errors
+                    self._record_job(summary, job, journal)
+                    finished += 1
+                    if job.status == BatchJobStatus.FAILED:
+                        errors += 1
+
+                    elapsed = asyncio.get_event_loop().time() - start_time
+                    progress.update(
+                        main_task,
+                        advance=1,
+                        rate=finished / elapsed if elapsed > 0 else 0.0,
+                        in_flight=started - finished,
+                        error_rate=errors / finished,
+                    )
+
+                async def archive_and_record(job: BatchJob) -> None:
+                    await self._archive_job(job)
+                    record(job)
+
+                # Producer/consumer: at most self.concurrency.limit + lookahead jobs are in
+                # flight, of which only self.concurrency.limit convert at once
+                max_in_flight = self.concurrency.limit + self.config.lookahead
+                async with aclosing(
+                    bounded_as_completed(admitted_jobs(), run_job, max_in_flight)
+                ) as completed:
+                    async for job, result in completed:
+                        if self.config.create_archives and job.status == BatchJobStatus.COMPLETED:
+                            # Archiving is a separate stage bounded by the archive pool, so a
+                            # slow archive never holds a slot that a new fetch could use
+                            task = asyncio.create_task(archive_and_record(job))
+                            archive_tasks.add(task)
+                            task.add_done_callback(archive_tasks.discard)
+                        else:
+                            record(job)
+
+                        if isinstance(result, Exception) and not self.config.continue_on_error:
+                            # Let in-flight jobs finish but admit no new ones
+                            stop_admission = True
+
+                    if archive_tasks:
+                        await asyncio.gather(*archive_tasks)
+        finally:
+            for task in archive_tasks:
+                task.cancel()
+            # Wait for archives still compressing and release the pool
+            self._shutdown_archive_executor()
+
+    def _use_aggregate_progress(self, total: int | None) -> bool:
+        """Decide between per-job progress rows and a single aggregate row.
+
+        Args:
+            total: Number of jobs if known
 
-            # Wait for all jobs to complete
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        Returns:
+            True when only aggregate progress should be rendered
+        """
+        if self.config.progress_mode == "auto":
+            return total is None or total > CONSTANTS.BATCH_DETAILED_PROGRESS_LIMIT
+        return self.config.progress_mode == "aggregate"
 
-            # Update main progress
-            progress.update(main_task, completed=len(self.jobs))
+    def _jobs_file_path(self) -> Path:
+        """Path of the NDJSON file that per-job summary entries are appended to."""
+        jobs_file = self.config.output_base_dir / "batch_jobs.ndjson"
+        jobs_file.parent.mkdir(parents=True, exist_ok=True)
+        return jobs_file
 
-        # Compile results
-        summary = self._compile_results(results)
+    async def _complete_summary(self, summary: BatchSummary) -> BatchSummary:
+        """Finalize statistics, write the report and log completion.
+
+        Args:
+            summary: Accumulated summary
+
+        Returns:
+            Finalized summary
+        """
+        self._finalize_summary(summary)
 
         if self.config.create_summary:
             await self._create_summary_report(summary)
@@ -513,7 +876,7 @@ class BatchProcessor:
         progress: Progress,
         progress_callback: Callable[[str, int], None] | None = None,
     ) -> BatchJob:
-        """Process a single job with semaphore control.
+        """Process a single job under the global and its domain's concurrency limits.
 
         Args:
             job: Job to process
@@ -523,7 +886,17 @@ class BatchProcessor:
         Returns:
             Updated job with results
         """
-        async with self.semaphore:
+        limiter = (
+            self.domain_limiter.for_domain(domain_key(job.url))
+            if self.domain_limiter
+            else None
+        )
+
+        def record_latency(error: BaseException | None = None) -> None:
+            if limiter is not None:
+                limiter.record(job.end_time - job.start_time, error)
+
+        async with self.concurrency, limiter or nullcontext():
             job.start_time = asyncio.get_event_loop().time()
             job.status = BatchJobStatus.RUNNING
 
@@ -552,14 +925,20 @@ class BatchProcessor:
                     if progress_callback:
                         progress_callback(job.url, p)
 
-                # Process with timeout
-                await asyncio.wait_for(
-                    converter.convert(progress_callback=job_progress_callback),
+                # Process with timeout - the stages share a deadline just inside it, so a
+                # job out of budget keeps its saved content instead of being cancelled
+                result = await asyncio.wait_for(
+                    converter.convert(
+                        progress_callback=job_progress_callback,
+                        budget=stage_budget(self.config.timeout_per_job),
+                    ),
                     timeout=self.config.timeout_per_job,
                 )
 
+                job.partial = isinstance(result, ConversionResult) and result.partial
                 job.status = BatchJobStatus.COMPLETED
                 job.end_time = asyncio.get_event_loop().time()
+                record_latency()
 
                 if job.progress_task:
                     progress.update(
@@ -568,19 +947,11 @@ class BatchProcessor:
 
                 logger.info("Job completed successfully", url=job.url, duration=job.duration)
 
-                # Create archive if configured
-                if self.config.create_archives:
-                    try:
-                        archive_path = await self._create_archive(job)
-                        job.archive_path = archive_path
-                        logger.info("Created job archive", url=job.url, archive=str(archive_path))
-                    except Exception as e:
-                        logger.warning("Failed to create archive", url=job.url, error=str(e))
-
-            except TimeoutError:
+            except TimeoutError as e:
                 job.status = BatchJobStatus.FAILED
                 job.error = f"Timeout after {self.config.timeout_per_job}s"
                 job.end_time = asyncio.get_event_loop().time()
+                record_latency(e)
 
                 if job.progress_task:
                     progress.update(
@@ -593,6 +964,7 @@ class BatchProcessor:
                 job.status = BatchJobStatus.FAILED
                 job.error = str(e)
                 job.end_time = asyncio.get_event_loop().time()
+                record_latency(e)
 
                 if job.progress_task:
                     progress.update(
@@ -604,7 +976,19 @@ class BatchProcessor:
                 if not self.config.continue_on_error:
                     raise
 
-            return job
+        return job
+
+    async def _archive_job(self, job: BatchJob) -> None:
+        """Archive a completed job's output, logging rather than raising on failure.
+
+        Args:
+            job: Completed job
+        """
+        try:
+            job.archive_path = await self._create_archive(job)
+            logger.info("Created job archive", url=job.url, archive=str(job.archive_path))
+        except Exception as e:
+            logger.warning("Failed to create archive", url=job.url, error=str(e))
 
     def _compile_results(self, results: list[Any]) -> BatchSummary:
         """Compile processing results into a summary.
@@ -615,8 +999,24 @@ class BatchProcessor:
         Returns:
             Summary dictionary with statistics
         """
-        summary: BatchSummary = {
-            "total": len(self.jobs),
+        summary = self._empty_summary(len(self.jobs))
+        for job in self.jobs:
+            self._record_job(summary, job)
+        self._finalize_summary(summary)
+        return summary
+
+    @staticmethod
+    def _empty_summary(total: int) -> BatchSummary:
+        """Create a summary with zeroed counters.
+
+        Args:
+            total: Total number of jobs in the batch
+
+        Returns:
+            Empty summary dictionary
+        """
+        return {
+            "total": total,
             "successful": 0,
             "failed": 0,
             "skipped": 0,
@@ -625,30 +1025,48 @@ class BatchProcessor:
             "average_duration": 0.0,
         }
 
-        for job in self.jobs:
-            job_data: JobSummaryData = {
-                "url": job.url,
-                "status": job.status.value,
-                "output_dir": str(job.output_dir),
-                "duration": job.duration,
-                "error": job.error,
-            }
+    @staticmethod
+    def _record_job(summary: BatchSummary, job: BatchJob, journal: TextIO | None = None) -> None:
+        """Add a finished job to the summary counters.
+
+        Args:
+            summary: Summary being accumulated
+            job: Job to record
+            journal: Optional file the job entry is written to instead of the summary
+        """
+        job_data: JobSummaryData = {
+            "url": job.url,
+            "status": job.status.value,
+            "output_dir": str(job.output_dir),
+            "duration": job.duration,
+            "error": job.error,
+        }
+        if job.partial:
+            job_data["partial"] = True
+        if journal is None:
             summary["jobs"].append(job_data)
+        else:
+            journal.write(json.dumps(job_data, default=str) + "\n")
+
+        if job.status == BatchJobStatus.COMPLETED:
+            summary["successful"] += 1
+            if job.duration:
+                summary["total_duration"] += job.duration
+        elif job.status == BatchJobStatus.FAILED:
+            summary["failed"] += 1
+        elif job.status == BatchJobStatus.SKIPPED:
+            summary["skipped"] += 1
 
-            if job.status == BatchJobStatus.COMPLETED:
-                summary["successful"] += 1
-                if job.duration:
-                    summary["total_duration"] += job.duration
-            elif job.status == BatchJobStatus.FAILED:
-                summary["failed"] += 1
-            elif job.status == BatchJobStatus.SKIPPED:
-                summary["skipped"] += 1
+    @staticmethod
+    def _finalize_summary(summary: BatchSummary) -> None:
+        """Compute derived statistics once all jobs are recorded.
 
+        Args:
+            summary: Summary to finalize
+        """
         if summary["successful"] > 0:
             summary["average_duration"] = summary["total_duration"] / summary["successful"]
 
-        return summary
-
     async def _create_summary_report(self, summary: BatchSummary) -> None:
         """Create a summary report of the batch processing.
 
@@ -688,67 +1106,64 @@ Total Jobs: {summary["total"]}
 ⏭️  Skipped: {summary["skipped"]}
 ⏱️  Average Duration: {summary["average_duration"]:.1f}s
         """.strip()
+        if "duplicates" in summary:
+            stats_text += f"\n🔁 Duplicates Skipped: {summary['duplicates']}"
 
         console.print()
         console.print(Panel(stats_text, title="📊 Batch Results", expand=False))
         console.print()
-        console.print(table)
+        if summary["jobs"]:
+            console.print(table)
+        elif "jobs_file" in summary:
+            console.print(f"📄 Per-job results: [bold]{summary['jobs_file']}[/bold]")
 
         # Save summary to file
         summary_path = self.config.output_base_dir / "batch_summary.json"
         summary_path.parent.mkdir(parents=True, exist_ok=True)
 
-        import json
-
         with open(summary_path, "w", encoding="utf-8") as f:
             json.dump(summary, f, indent=2, default=str)
 
         logger.info("Summary report saved", path=str(summary_path))
 
     async def _create_archive(self, job: BatchJob) -> Path:
-        """Create a ZIP archive of the job's output directory.
+        """Create an archive of the job's output directory.
+
+        Compression runs in the archive executor so the event loop keeps
+        serving other jobs while the archive is written.
 
         Args:
             job: Completed batch job
 
         Returns:
-            Path to the created ZIP archive
+            Path to the created archive
 
         Raises:
             Exception: If archive creation fails
         """
-        import zipfile
-
         if not job.output_dir.exists():
             raise ValueError(f"Output directory does not exist: {job.output_dir}")
 
         # Create archive name based on job slug/URL
-        archive_name = f"{job.output_dir.name}.zip"
+        archive_name = f"{job.output_dir.name}{archive_suffix(self.config.archive_format)}"
         archive_path = self.config.output_base_dir / "archives" / archive_name
 
-        # Ensure archives directory exists
-        archive_path.parent.mkdir(parents=True, exist_ok=True)
-
         logger.debug("Creating archive", job_url=job.url, archive_path=str(archive_path))
 
-        # Create ZIP archive
-        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            # Add all files from the output directory
-            for file_path in job.output_dir.rglob("*"):
-                if file_path.is_file():
-                    # Calculate relative path within the archive
-                    arc_path = file_path.relative_to(job.output_dir)
-                    zip_file.write(file_path, arc_path)
-                    logger.debug("Added file to archive", file=str(arc_path))
-
-        # Optional: Clean up original directory if configured
-        if getattr(self.config, "cleanup_after_archive", False):
-            import shutil
-
-            shutil.rmtree(job.output_dir)
+        loop = asyncio.get_running_loop()
+        archive_size = await loop.run_in_executor(
+            self._get_archive_executor(),
+            build_archive,
+            job.output_dir,
+            archive_path,
+            self.config.archive_format,
+            self.config.archive_compression_level,
+            self.config.cleanup_after_archive,
+        )
+
+        if self.config.cleanup_after_archive:
             logger.debug("Cleaned up original directory", path=str(job.output_dir))
 
-        archive_size = archive_path.stat().st_size
         logger.info(
             "Archive created successfully",
             job_url=job.url,
@@ -758,3 +1173,22 @@ Total Jobs: {summary["total"]}
         )
 
         return archive_path
+
+    def _get_archive_executor(self) -> Executor:
+        """Create the archive pool on first use."""
+        if self._archive_executor is None:
+            if self.config.archive_executor == "process":
+                self._archive_executor = ProcessPoolExecutor(
+                    max_workers=self.config.archive_workers
+                )
+            else:
+                self._archive_executor = ThreadPoolExecutor(
+                    max_workers=self.config.archive_workers, thread_name_prefix="batch-archive"
+                )
+        return self._archive_executor
+
+    def _shutdown_archive_executor(self) -> None:
+        """Release archive pool workers once a run is over."""
+        if self._archive_executor is not None:
+            self._archive_executor.shutdown(wait=True)
+            self._archive_executor = None
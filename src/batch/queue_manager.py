@@ -1,16 +1,20 @@
 """Priority-based batch queue management system for Phase 4B."""
 
 import asyncio
-import heapq
+import itertools
+from collections import Counter
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from enum import Enum
 from typing import Any
 
 import structlog
 
 from src.batch.enhanced_processor import Priority, ProcessingResult
+from src.constants import CONSTANTS
 from src.database.service import DatabaseService
+from src.utils.url import canonicalize_url, url_dedup_key
 
 logger = structlog.get_logger(__name__)
 
@@ -41,8 +45,141 @@ class QueueItem:
             self.timestamp = datetime.now(UTC)
 
 
+class IndexedHeap:
+    """Binary min-heap of queue items with a URL index.
+
+    The index tracks each item's position, so besides O(log n) push and pop
+    an item can be removed or re-keyed by URL in O(log n) without a scan.
+    Entries are ``[key, sequence, item]``; the sequence keeps equal keys FIFO.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty heap."""
+        self._entries: list[list[Any]] = []
+        self._positions: dict[str, int] = {}
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        """Number of queued items."""
+        return len(self._entries)
+
+    def __contains__(self, url: object) -> bool:
+        """Whether an item with this URL is queued."""
+        return url in self._positions
+
+    def __iter__(self) -> Iterator[QueueItem]:
+        """Queued items in heap (not priority) order."""
+        return (entry[2] for entry in self._entries)
+
+    def get(self, url: str) -> QueueItem | None:
+        """Queued item for a URL, if any."""
+        index = self._positions.get(url)
+        return self._entries[index][2] if index is not None else None
+
+    def push(self, key: float, item: QueueItem) -> None:
+        """Add an item.
+
+        Args:
+            key: Sort key, smallest first
+            item: Item to add; its URL must not already be queued
+        """
+        self._entries.append([key, next(self._sequence), item])
+        self._positions[item.url] = len(self._entries) - 1
+        self._sift_up(len(self._entries) - 1)
+
+    def pop(self) -> QueueItem:
+        """Remove and return the item with the smallest key.
+
+        Raises:
+            IndexError: If the heap is empty
+        """
+        if not self._entries:
+            raise IndexError("pop from empty heap")
+        return self._remove_at(0)
+
+    def remove(self, url: str) -> QueueItem | None:
+        """Remove the item queued for a URL.
+
+        Returns:
+            The removed item, or None if the URL is not queued
+        """
+        index = self._positions.get(url)
+        return self._remove_at(index) if index is not None else None
+
+    def update(self, url: str, key: float) -> bool:
+        """Change the key of a queued item, keeping its FIFO sequence.
+
+        Returns:
+            True if the URL was queued
+        """
+        index = self._positions.get(url)
+        if index is None:
+            return False
+        old_key = self._entries[index][0]
+        self._entries[index][0] = key
+        if key < old_key:
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+        return True
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self._entries.clear()
+        self._positions.clear()
+
+    def _remove_at(self, index: int) -> QueueItem:
+        entry = self._entries[index]
+        last = self._entries.pop()
+        del self._positions[entry[2].url]
+        if index < len(self._entries):
+            self._entries[index] = last
+            self._positions[last[2].url] = index
+            self._sift_down(index)
+            self._sift_up(index)
+        return entry[2]
+
+    def _swap(self, i: int, j: int) -> None:
+        entries = self._entries
+        entries[i], entries[j] = entries[j], entries[i]
+        self._positions[entries[i][2].url] = i
+        self._positions[entries[j][2].url] = j
+
+    def _less(self, i: int, j: int) -> bool:
+        return self._entries[i][:2] < self._entries[j][:2]
+
+    def _sift_up(self, index: int) -> None:
+        while index > 0:
+            parent = (index - 1) // 2
+            if not self._less(index, parent):
+                return
+            self._swap(index, parent)
+            index = parent
+
+    def _sift_down(self, index: int) -> None:
+        size = len(self._entries)
+        while True:
+            smallest = index
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < size and self._less(child, smallest):
+                    smallest = child
+            if smallest == index:
+                return
+            self._swap(index, smallest)
+            index = smallest
+
+
 class BatchQueueManager:
-    """Manages prioritized batch processing queues with intelligent scheduling."""
+    """Manages a prioritized batch processing queue with time-based aging.
+
+    All items live in one indexed heap keyed by effective priority. An item's
+    effective priority improves by one level for every ``aging_seconds`` it
+    waits, which is equivalent to the static key
+    ``enqueue_time + priority * aging_seconds``, so aging never requires
+    re-sorting and a low-priority item waits at most
+    ``(priority - URGENT) * aging_seconds`` longer than urgent items enqueued
+    at the same time.
+    """
 
     def __init__(
         self,
@@ -51,6 +188,7 @@ class BatchQueueManager:
         processing_threads: int = 3,
         requeue_failed: bool = True,
         max_retries_per_item: int = 3,
+        aging_seconds: float = CONSTANTS.BATCH_QUEUE_AGING_SECONDS,
     ):
         """Initialize the batch queue manager.
 
@@ -60,19 +198,27 @@ class BatchQueueManager:
             processing_threads: Number of concurrent processors
             requeue_failed: Whether to requeue failed items
             max_retries_per_item: Maximum retries per queue item
+            aging_seconds: Waiting time that raises an item by one priority level,
+                0 to order strictly by priority
         """
+        if aging_seconds < 0:
+            raise ValueError("aging_seconds cannot be negative")
+
         self.database_service = database_service
         self.max_queue_size = max_queue_size
         self.processing_threads = processing_threads
         self.requeue_failed = requeue_failed
         self.max_retries_per_item = max_retries_per_item
+        self.aging_seconds = aging_seconds
 
-        # Priority queues for different priority levels
-        self.urgent_queue: list[QueueItem] = []
-        self.high_queue: list[QueueItem] = []
-        self.normal_queue: list[QueueItem] = []
-        self.low_queue: list[QueueItem] = []
-        self.deferred_queue: list[QueueItem] = []
+        # One heap for every priority level, plus per-level counts for statistics
+        self.queue = IndexedHeap()
+        self.level_counts: Counter[int] = Counter()
+
+        # Dedup keys of URLs queued, in flight or waiting to be requeued; a URL is
+        # forgotten once it finishes or is cancelled so it can be queued again
+        self.active_urls: set[str] = set()
+        self.duplicates_dropped = 0
 
         # Queue management
         self.processing_items: set[str] = set()
@@ -99,7 +245,12 @@ class BatchQueueManager:
         batch_id: int | None = None,
         metadata: dict[str, Any] | None = None,
     ) -> bool:
-        """Add an item to the appropriate priority queue.
+        """Add an item to the priority queue.
+
+        The URL is canonicalized first. A URL that is already queued only has
+        its priority raised, and an equivalent one that is queued or still
+        being processed is dropped; both count as duplicates. Finished and
+        cancelled URLs can be added again.
 
         Args:
             url: URL to process
@@ -108,34 +259,108 @@ class BatchQueueManager:
             metadata: Optional metadata
 
         Returns:
-            True if item was added, False if queue is full
+            True if item was added, already queued or dropped as a duplicate,
+            False if queue is full
+        """
+        url = canonicalize_url(url) or url
+        existing = self.queue.get(url)
+        if existing is None:
+            if self.get_queue_size() >= self.max_queue_size:
+                logger.warning("Queue is full", size=self.max_queue_size)
+                return False
+            key = self._dedup_key(url)
+            if key not in self.active_urls:
+                self.active_urls.add(key)
+                item = QueueItem(
+                    priority=priority.value,
+                    timestamp=datetime.now(UTC),
+                    url=url,
+                    batch_id=batch_id,
+                    metadata=metadata or {},
+                )
+                return await self._enqueue(item)
+        elif priority.value < existing.priority:
+            self._set_priority(existing, priority.value)
+
+        self.duplicates_dropped += 1
+        logger.debug("Dropped duplicate URL", url=url)
+        return True
+
+    async def _enqueue(self, item: QueueItem) -> bool:
+        """Push an item and wake a waiting processor.
+
+        A URL that is already queued keeps a single entry at the better of
+        the two priorities.
+
+        Args:
+            item: Item to queue
+
+        Returns:
+            True if the item is queued, False if the queue is full
         """
+        existing = self.queue.get(item.url)
+        if existing is not None:
+            if item.priority < existing.priority:
+                self._set_priority(existing, item.priority)
+            return True
+
         if self.get_queue_size() >= self.max_queue_size:
             logger.warning("Queue is full", size=self.max_queue_size)
             return False
 
-        item = QueueItem(
-            priority=priority.value,
-            timestamp=datetime.now(UTC),
-            url=url,
-            batch_id=batch_id,
-            metadata=metadata or {},
-        )
-
-        # Add to appropriate queue based on priority
-        queue = self._get_queue_for_priority(priority)
-        heapq.heappush(queue, item)
+        self.queue.push(self._sort_key(item), item)
+        self.level_counts[item.priority] += 1
 
         # Notify waiting processors
         async with self.queue_condition:
             self.queue_condition.notify()
 
         logger.debug(
-            "Added item to queue", url=url, priority=priority.name, queue_size=self.get_queue_size()
+            "Added item to queue",
+            url=item.url,
+            priority=item.priority,
+            queue_size=self.get_queue_size(),
         )
 
         return True
 
+    @staticmethod
+    def _dedup_key(url: str) -> str:
+        """Identity of a URL for deduplication; invalid URLs are compared verbatim."""
+        return url_dedup_key(url) or url
+
+    def _forget(self, url: str) -> None:
+        """Let a URL that left the queue for good be added again."""
+        self.active_urls.discard(self._dedup_key(url))
+
+    def _sort_key(self, item: QueueItem) -> float:
+        """Static heap key equivalent to ordering by aged effective priority."""
+        if not self.aging_seconds:
+            return float(item.priority)
+        return item.timestamp.timestamp() + item.priority * self.aging_seconds
+
+    def _set_priority(self, item: QueueItem, priority: int) -> None:
+        """Re-key a queued item for a new base priority."""
+        self.level_counts[item.priority] -= 1
+        item.priority = priority
+        self.level_counts[priority] += 1
+        self.queue.update(item.url, self._sort_key(item))
+
+    def effective_priority(self, item: QueueItem, now: datetime | None = None) -> float:
+        """Priority of an item after aging, lower is served first.
+
+        Args:
+            item: Queue item
+            now: Reference time, defaults to the current time
+
+        Returns:
+            Base priority minus one level per aging interval waited
+        """
+        if not self.aging_seconds:
+            return float(item.priority)
+        waited = ((now or datetime.now(UTC)) - item.timestamp).total_seconds()
+        return item.priority - waited / self.aging_seconds
+
     async def add_batch(
         self, urls: list[str], priority: Priority = Priority.NORMAL, batch_id: int | None = None
     ) -> int:
@@ -147,12 +372,13 @@ class BatchQueueManager:
             batch_id: Optional batch ID
 
         Returns:
-            Number of items successfully added
+            Number of items successfully added, excluding dropped duplicates
         """
         added = 0
         for url in urls:
+            duplicates = self.duplicates_dropped
             if await self.add_item(url, priority, batch_id):
-                added += 1
+                added += self.duplicates_dropped == duplicates
             else:
                 logger.warning("Could not add all items to queue", total=len(urls), added=added)
                 break
@@ -166,21 +392,47 @@ class BatchQueueManager:
             Next QueueItem or None if queues are empty
         """
         async with self.processing_lock:
-            # Check queues in priority order
-            for queue in [
-                self.urgent_queue,
-                self.high_queue,
-                self.normal_queue,
-                self.low_queue,
-                self.deferred_queue,
-            ]:
-                if queue:
-                    item = heapq.heappop(queue)
-                    self.processing_items.add(item.url)
-                    return item
+            if self.queue:
+                item = self.queue.pop()
+                self.level_counts[item.priority] -= 1
+                self.processing_items.add(item.url)
+                return item
 
         return None
 
+    def cancel_item(self, url: str) -> bool:
+        """Remove a queued item.
+
+        Args:
+            url: URL of the item to remove
+
+        Returns:
+            True if the item was queued
+        """
+        item = self.queue.remove(url)
+        if item is None:
+            return False
+        self.level_counts[item.priority] -= 1
+        self._forget(item.url)
+        logger.debug("Cancelled queued item", url=url)
+        return True
+
+    def reprioritize_item(self, url: str, priority: Priority) -> bool:
+        """Change the priority of a queued item, keeping the age it has accrued.
+
+        Args:
+            url: URL of the item
+            priority: New base priority
+
+        Returns:
+            True if the item was queued
+        """
+        item = self.queue.get(url)
+        if item is None:
+            return False
+        self._set_priority(item, priority.value)
+        return True
+
     async def mark_completed(self, item: QueueItem, result: ProcessingResult):
         """Mark an item as completed.
 
@@ -194,6 +446,7 @@ class BatchQueueManager:
             self.total_processed += 1
             # Remove from failed items if it was there
             self.failed_items.pop(item.url, None)
+            self._forget(item.url)
         else:
             self.total_failed += 1
 
@@ -205,13 +458,15 @@ class BatchQueueManager:
                     Priority.LOW.value,
                 )
 
-                # Add back to queue with delay
+                # Add back to queue with delay, keeping the retry count
                 await asyncio.sleep(2**item.retry_count)  # Exponential backoff
-                await self.add_item(item.url, Priority(item.priority), item.batch_id, item.metadata)
+                item.timestamp = datetime.now(UTC)
+                await self._enqueue(item)
 
                 logger.info("Requeued failed item", url=item.url, retry_count=item.retry_count)
             else:
                 self.failed_items[item.url] = item.retry_count
+                self._forget(item.url)
 
     async def process_queue(self, processor_func):
         """Process items from the queue continuously.
@@ -280,18 +535,12 @@ class BatchQueueManager:
         )
 
     def get_queue_size(self) -> int:
-        """Get total number of items in all queues."""
-        return (
-            len(self.urgent_queue)
-            + len(self.high_queue)
-            + len(self.normal_queue)
-            + len(self.low_queue)
-            + len(self.deferred_queue)
-        )
+        """Get total number of queued items."""
+        return len(self.queue)
 
     def is_empty(self) -> bool:
-        """Check if all queues are empty."""
-        return self.get_queue_size() == 0
+        """Check if the queue is empty."""
+        return not self.queue
 
     def get_statistics(self) -> dict[str, Any]:
         """Get queue statistics.
@@ -302,17 +551,14 @@ class BatchQueueManager:
         return {
             "status": self.status.value,
             "queue_sizes": {
-                "urgent": len(self.urgent_queue),
-                "high": len(self.high_queue),
-                "normal": len(self.normal_queue),
-                "low": len(self.low_queue),
-                "deferred": len(self.deferred_queue),
+                **{level.name.lower(): self.level_counts[level.value] for level in Priority},
                 "total": self.get_queue_size(),
             },
             "processing": len(self.processing_items),
             "total_processed": self.total_processed,
             "total_failed": self.total_failed,
             "failed_items": len(self.failed_items),
+            "duplicates_dropped": self.duplicates_dropped,
             "success_rate": (
                 (self.total_processed / (self.total_processed + self.total_failed) * 100)
                 if (self.total_processed + self.total_failed) > 0
@@ -320,56 +566,6 @@ class BatchQueueManager:
             ),
         }
 
-    def _get_queue_for_priority(self, priority: Priority) -> list[QueueItem]:
-        """Get the queue for a given priority.
-
-        Args:
-            priority: Priority level
-
-        Returns:
-            The appropriate queue list
-        """
-        queue_map = {
-            Priority.URGENT: self.urgent_queue,
-            Priority.HIGH: self.high_queue,
-            Priority.NORMAL: self.normal_queue,
-            Priority.LOW: self.low_queue,
-            Priority.DEFERRED: self.deferred_queue,
-        }
-        return queue_map.get(priority, self.normal_queue)
-
-    async def rebalance_queues(self):
-        """Rebalance queues based on age and priority."""
-        current_time = datetime.now(UTC)
-
-        # Move aged items to higher priority
-        for source_queue, target_queue, age_threshold in [
-            (self.normal_queue, self.high_queue, timedelta(hours=1)),
-            (self.low_queue, self.normal_queue, timedelta(hours=2)),
-            (self.deferred_queue, self.low_queue, timedelta(hours=4)),
-        ]:
-            aged_items = []
-
-            # Find aged items
-            for item in source_queue:
-                age = current_time - item.timestamp
-                if age > age_threshold:
-                    aged_items.append(item)
-
-            # Move aged items
-            for item in aged_items:
-                source_queue.remove(item)
-                item.priority = max(item.priority - 1, Priority.URGENT.value)
-                heapq.heappush(target_queue, item)
-
-            if aged_items:
-                logger.info(
-                    "Rebalanced aged items",
-                    count=len(aged_items),
-                    from_queue=source_queue,
-                    to_queue=target_queue,
-                )
-
     async def persist_queue_state(self, filepath: str):
         """Save current queue state to file for recovery.
 
@@ -377,19 +573,17 @@ class BatchQueueManager:
             filepath: Path to save queue state
         """
         import json
-        from datetime import datetime
+
+        # Grouped by base priority level; timestamps preserve accrued age
+        queues: dict[str, list[dict[str, Any]]] = {level.name.lower(): [] for level in Priority}
+        for item in self.queue:
+            queues[Priority(item.priority).name.lower()].append(self._item_to_dict(item))
 
         state = {
             "timestamp": datetime.now(UTC).isoformat(),
             "status": self.status.value,
             "statistics": self.get_statistics(),
-            "queues": {
-                "urgent": [self._item_to_dict(item) for item in self.urgent_queue],
-                "high": [self._item_to_dict(item) for item in self.high_queue],
-                "normal": [self._item_to_dict(item) for item in self.normal_queue],
-                "low": [self._item_to_dict(item) for item in self.low_queue],
-                "deferred": [self._item_to_dict(item) for item in self.deferred_queue],
-            },
+            "queues": queues,
             "processing": list(self.processing_items),
             "failed": self.failed_items,
         }
@@ -410,19 +604,19 @@ class BatchQueueManager:
         with open(filepath) as f:
             state = json.load(f)
 
-        # Clear current queues
-        self.urgent_queue.clear()
-        self.high_queue.clear()
-        self.normal_queue.clear()
-        self.low_queue.clear()
-        self.deferred_queue.clear()
+        # Clear current queue
+        self.queue.clear()
+        self.level_counts.clear()
+        self.active_urls = {self._dedup_key(url) for url in self.processing_items}
 
-        # Restore queues
-        for priority_name, items in state["queues"].items():
-            queue = getattr(self, f"{priority_name}_queue")
+        # Restore items
+        for items in state["queues"].values():
             for item_dict in items:
                 item = self._dict_to_item(item_dict)
-                heapq.heappush(queue, item)
+                if item.url not in self.queue:
+                    self.active_urls.add(self._dedup_key(item.url))
+                    self.queue.push(self._sort_key(item), item)
+                    self.level_counts[item.priority] += 1
 
         # Restore statistics
         self.total_processed = state["statistics"]["total_processed"]
@@ -1,16 +1,15 @@
 """Batch recovery and resume functionality for Phase 4B."""
 
-import json
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import structlog
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
 
 from src.batch.enhanced_processor import BatchProcessor, BatchResults
+from src.batch.journal import CheckpointJournal, JournalState, journal_path
 from src.core.exceptions import BatchProcessingError
+from src.database.async_service import AsyncDatabaseService, call_service
 from src.database.models import Batch, JobStatus, ScrapingJob
 from src.database.service import DatabaseService
 
@@ -18,10 +17,17 @@ logger = structlog.get_logger(__name__)
 
 
 class CheckpointManager:
-    """Manages checkpoint creation and recovery for batch operations."""
+    """Manages checkpoint creation and recovery for batch operations.
+
+    Checkpoints live in the same ``checkpoint_{batch_id}.ndjson`` journals the
+    batch processor writes; point ``checkpoint_directory`` at the batch output
+    directory to inspect a processor's journals.
+    """
 
     def __init__(
-        self, database_service: DatabaseService, checkpoint_directory: Path = Path("checkpoints")
+        self,
+        database_service: DatabaseService | AsyncDatabaseService,
+        checkpoint_directory: Path = Path("checkpoints"),
     ):
         """Initialize checkpoint manager.
 
@@ -35,90 +41,90 @@ class CheckpointManager:
 
         logger.info("Initialized checkpoint manager", directory=str(checkpoint_directory))
 
-    def create_checkpoint(self, batch_id: int, current_state: dict[str, Any]) -> Path:
-        """Create a checkpoint file for the current batch state.
+    def checkpoint_path(self, batch_id: int) -> Path:
+        """Location of a batch's checkpoint journal.
 
         Args:
-            batch_id: ID of the batch being checkpointed
-            current_state: Current processing state
+            batch_id: ID of the batch
 
         Returns:
-            Path to the created checkpoint file
+            Path of the NDJSON journal
         """
-        checkpoint_data = {
-            "batch_id": batch_id,
-            "timestamp": datetime.now(UTC).isoformat(),
-            "version": "1.0",
-            "state": current_state,
-        }
+        return journal_path(self.checkpoint_directory, batch_id)
 
-        checkpoint_file = self.checkpoint_directory / f"batch_{batch_id}_checkpoint.json"
-
-        # Write checkpoint atomically using temporary file
-        temp_file = checkpoint_file.with_suffix(".tmp")
-        try:
-            with open(temp_file, "w") as f:
-                json.dump(checkpoint_data, f, indent=2)
-
-            # Atomic move to final location
-            temp_file.replace(checkpoint_file)
+    def create_checkpoint(self, batch_id: int, current_state: dict[str, Any]) -> Path:
+        """Append a checkpoint record for the current batch state.
 
-            logger.info("Created checkpoint", batch_id=batch_id, file=str(checkpoint_file))
+        The record goes to the batch's append-only journal, the same file the
+        batch processor journals per-URL state to, so only one line is written.
 
-            return checkpoint_file
+        Args:
+            batch_id: ID of the batch being checkpointed
+            current_state: Current processing counters
 
+        Returns:
+            Path to the checkpoint journal
+        """
+        checkpoint_file = self.checkpoint_path(batch_id)
+        try:
+            journal = CheckpointJournal(checkpoint_file)
+            try:
+                journal.checkpoint(**{**current_state, "batch_id": batch_id})
+            finally:
+                journal.close()
         except Exception as e:
-            # Clean up temp file if it exists
-            if temp_file.exists():
-                temp_file.unlink()
-
             logger.error("Failed to create checkpoint", batch_id=batch_id, error=str(e))
-            raise BatchProcessingError(f"Checkpoint creation failed: {e}")
+            raise BatchProcessingError(f"Checkpoint creation failed: {e}") from e
 
-    def load_checkpoint(self, batch_id: int) -> dict[str, Any] | None:
-        """Load checkpoint data for a batch.
+        logger.info("Created checkpoint", batch_id=batch_id, file=str(checkpoint_file))
+        return checkpoint_file
+
+    def load_checkpoint(self, batch_id: int) -> JournalState | None:
+        """Replay a batch's checkpoint journal.
 
         Args:
             batch_id: ID of the batch to load checkpoint for
 
         Returns:
-            Checkpoint data if found, None otherwise
+            Recovered per-URL state and last checkpoint counters, None if the
+            batch has no journal
         """
-        checkpoint_file = self.checkpoint_directory / f"batch_{batch_id}_checkpoint.json"
+        checkpoint_file = self.checkpoint_path(batch_id)
 
         if not checkpoint_file.exists():
             return None
 
         try:
-            with open(checkpoint_file) as f:
-                checkpoint_data = json.load(f)
-
-            logger.info("Loaded checkpoint", batch_id=batch_id, file=str(checkpoint_file))
-
-            return checkpoint_data
-
-        except Exception as e:
+            state = CheckpointJournal.replay(checkpoint_file)
+        except OSError as e:
             logger.error("Failed to load checkpoint", batch_id=batch_id, error=str(e))
             return None
 
+        logger.info("Loaded checkpoint", batch_id=batch_id, file=str(checkpoint_file))
+        return state
+
     def list_checkpoints(self) -> list[tuple[int, datetime, Path]]:
         """List all available checkpoints.
 
+        The timestamp is the journal's last checkpoint record, or its
+        modification time when it has none yet.
+
         Returns:
             List of tuples (batch_id, timestamp, file_path)
         """
         checkpoints = []
 
-        for checkpoint_file in self.checkpoint_directory.glob("batch_*_checkpoint.json"):
+        for checkpoint_file in self.checkpoint_directory.glob("checkpoint_*.ndjson"):
             try:
-                with open(checkpoint_file) as f:
-                    data = json.load(f)
-
-                batch_id = data["batch_id"]
-                timestamp = datetime.fromisoformat(data["timestamp"])
+                batch_id = int(checkpoint_file.stem.removeprefix("checkpoint_"))
+                counts = CheckpointJournal.replay(checkpoint_file).counts
+                if "timestamp" in counts:
+                    timestamp = datetime.fromisoformat(counts["timestamp"])
+                else:
+                    timestamp = datetime.fromtimestamp(checkpoint_file.stat().st_mtime, UTC)
                 checkpoints.append((batch_id, timestamp, checkpoint_file))
 
-            except Exception as e:
+            except (OSError, ValueError) as e:
                 logger.warning("Invalid checkpoint file", file=str(checkpoint_file), error=str(e))
 
         # Sort by timestamp, newest first
@@ -154,11 +160,16 @@ class CheckpointManager:
 class BatchRecoveryManager:
     """Manages recovery of interrupted or failed batch operations."""
 
-    def __init__(self, database_service: DatabaseService, checkpoint_manager: CheckpointManager):
+    def __init__(
+        self,
+        database_service: DatabaseService | AsyncDatabaseService,
+        checkpoint_manager: CheckpointManager,
+    ):
         """Initialize recovery manager.
 
         Args:
-            database_service: Database service for data access
+            database_service: Database service for data access; synchronous
+                services are called from a worker thread so they never block the loop
             checkpoint_manager: Checkpoint manager for state persistence
         """
         self.database_service = database_service
@@ -166,70 +177,49 @@ class BatchRecoveryManager:
 
         logger.info("Initialized batch recovery manager")
 
-    def find_interrupted_batches(self) -> list[dict[str, Any]]:
+    async def find_interrupted_batches(self) -> list[dict[str, Any]]:
         """Find batches that were interrupted during processing.
 
         Returns:
             List of interrupted batch information
         """
-        with self.database_service.get_session() as session:
-            # Find batches that are in RUNNING state but have no active jobs
-            interrupted_batches = (
-                session.query(Batch).filter(Batch.status == JobStatus.RUNNING).all()
-            )
-
-            recovery_candidates = []
-
-            for batch in interrupted_batches:
-                # Check if batch has any running jobs
-                running_jobs = (
-                    session.query(ScrapingJob)
-                    .filter(
-                        and_(
-                            ScrapingJob.batch_id == batch.id,
-                            ScrapingJob.status == JobStatus.RUNNING,
-                        )
-                    )
-                    .count()
-                )
+        # Find batches that are in RUNNING state but have no active jobs
+        interrupted_batches = await call_service(
+            self.database_service.get_batches, [JobStatus.RUNNING]
+        )
 
-                # Check for pending jobs
-                pending_jobs = (
-                    session.query(ScrapingJob)
-                    .filter(
-                        and_(
-                            ScrapingJob.batch_id == batch.id,
-                            ScrapingJob.status == JobStatus.PENDING,
-                        )
-                    )
-                    .count()
+        recovery_candidates = []
+
+        for batch in interrupted_batches:
+            counts = await call_service(self.database_service.get_job_status_counts, batch.id)
+            running_jobs = counts.get(JobStatus.RUNNING, 0)
+            pending_jobs = counts.get(JobStatus.PENDING, 0)
+
+            # Check if there's a checkpoint
+            checkpoint = self.checkpoint_manager.load_checkpoint(batch.id)
+
+            if running_jobs == 0 and (pending_jobs > 0 or checkpoint):
+                recovery_candidates.append(
+                    {
+                        "batch_id": batch.id,
+                        "name": batch.name,
+                        "created_at": batch.created_at,
+                        "started_at": batch.started_at,
+                        "pending_jobs": pending_jobs,
+                        "has_checkpoint": checkpoint is not None,
+                        "checkpoint_timestamp": (
+                            datetime.fromisoformat(checkpoint.counts["timestamp"])
+                            if checkpoint and "timestamp" in checkpoint.counts
+                            else None
+                        ),
+                    }
                 )
 
-                # Check if there's a checkpoint
-                checkpoint = self.checkpoint_manager.load_checkpoint(batch.id)
-
-                if running_jobs == 0 and (pending_jobs > 0 or checkpoint):
-                    recovery_candidates.append(
-                        {
-                            "batch_id": batch.id,
-                            "name": batch.name,
-                            "created_at": batch.created_at,
-                            "started_at": batch.started_at,
-                            "pending_jobs": pending_jobs,
-                            "has_checkpoint": checkpoint is not None,
-                            "checkpoint_timestamp": (
-                                datetime.fromisoformat(checkpoint["timestamp"])
-                                if checkpoint
-                                else None
-                            ),
-                        }
-                    )
-
-            logger.info("Found interrupted batches", count=len(recovery_candidates))
+        logger.info("Found interrupted batches", count=len(recovery_candidates))
 
-            return recovery_candidates
+        return recovery_candidates
 
-    def analyze_batch_failure(self, batch_id: int) -> dict[str, Any]:
+    async def analyze_batch_failure(self, batch_id: int) -> dict[str, Any]:
         """Analyze why a batch failed and determine recovery options.
 
         Args:
@@ -238,73 +228,70 @@ class BatchRecoveryManager:
         Returns:
             Analysis results and recovery recommendations
         """
-        with self.database_service.get_session() as session:
-            batch = session.query(Batch).filter(Batch.id == batch_id).first()
-            if not batch:
-                raise ValueError(f"Batch {batch_id} not found")
-
-            # Get all jobs for this batch
-            jobs = session.query(ScrapingJob).filter(ScrapingJob.batch_id == batch_id).all()
-
-            # Analyze job statuses
-            status_counts = {}
-            for status in JobStatus:
-                status_counts[status.value] = len([j for j in jobs if j.status == status])
-
-            # Analyze failure patterns
-            failed_jobs = [j for j in jobs if j.status == JobStatus.FAILED]
-            error_patterns: dict[str, int] = {}
-            for job in failed_jobs:
-                error_type = job.error_type or "unknown"
-                error_patterns[error_type] = error_patterns.get(error_type, 0) + 1
-
-            # Determine recovery strategy
-            recovery_strategy = self._determine_recovery_strategy(
-                batch, jobs, status_counts, error_patterns
-            )
+        batch = await call_service(self.database_service.get_batch, batch_id)
+        if not batch:
+            raise ValueError(f"Batch {batch_id} not found")
+
+        # Get all jobs for this batch
+        jobs = await call_service(self.database_service.get_batch_jobs, batch_id)
+
+        # Analyze job statuses
+        status_counts = {}
+        for status in JobStatus:
+            status_counts[status.value] = len([j for j in jobs if j.status == status])
+
+        # Analyze failure patterns
+        failed_jobs = [j for j in jobs if j.status == JobStatus.FAILED]
+        error_patterns: dict[str, int] = {}
+        for job in failed_jobs:
+            error_type = job.error_type or "unknown"
+            error_patterns[error_type] = error_patterns.get(error_type, 0) + 1
+
+        # Determine recovery strategy
+        recovery_strategy = self._determine_recovery_strategy(
+            batch, jobs, status_counts, error_patterns
+        )
 
-            # Load checkpoint if available
-            checkpoint = self.checkpoint_manager.load_checkpoint(batch_id)
-
-            analysis: dict[str, Any] = {
-                "batch_info": {
-                    "id": batch.id,
-                    "name": batch.name,
-                    "status": batch.status.value,
-                    "created_at": batch.created_at.isoformat(),
-                    "started_at": batch.started_at.isoformat() if batch.started_at else None,
-                },
-                "job_analysis": {
-                    "total_jobs": len(jobs),
-                    "status_counts": status_counts,
-                    "completion_rate": (
-                        status_counts.get("completed", 0) / len(jobs) * 100 if jobs else 0
-                    ),
-                },
-                "failure_analysis": {
-                    "error_patterns": error_patterns,
-                    "most_common_error": (
-                        max(error_patterns.items(), key=lambda x: x[1]) if error_patterns else None
-                    ),
-                    "failure_rate": (
-                        status_counts.get("failed", 0) / len(jobs) * 100 if jobs else 0
-                    ),
-                },
-                "recovery_options": recovery_strategy,
-                "checkpoint_available": checkpoint is not None,
-                "checkpoint_timestamp": (checkpoint.get("timestamp") if checkpoint else None),
-            }
+        # Load checkpoint if available
+        checkpoint = self.checkpoint_manager.load_checkpoint(batch_id)
 
-            completion_rate = analysis["job_analysis"]["completion_rate"]
-            failure_rate = analysis["failure_analysis"]["failure_rate"]
-            logger.info(
-                "Analyzed batch failure",
-                batch_id=batch_id,
-                completion_rate=completion_rate,
-                failure_rate=failure_rate,
-            )
+        analysis: dict[str, Any] = {
+            "batch_info": {
+                "id": batch.id,
+                "name": batch.name,
+                "status": batch.status.value,
+                "created_at": batch.created_at.isoformat(),
+                "started_at": batch.started_at.isoformat() if batch.started_at else None,
+            },
+            "job_analysis": {
+                "total_jobs": len(jobs),
+                "status_counts": status_counts,
+                "completion_rate": (
+                    status_counts.get("completed", 0) / len(jobs) * 100 if jobs else 0
+                ),
+            },
+            "failure_analysis": {
+                "error_patterns": error_patterns,
+                "most_common_error": (
+                    max(error_patterns.items(), key=lambda x: x[1]) if error_patterns else None
+                ),
+                "failure_rate": (status_counts.get("failed", 0) / len(jobs) * 100 if jobs else 0),
+            },
+            "recovery_options": recovery_strategy,
+            "checkpoint_available": checkpoint is not None,
+            "checkpoint_timestamp": (checkpoint.counts.get("timestamp") if checkpoint else None),
+        }
 
-            return analysis
+        completion_rate = analysis["job_analysis"]["completion_rate"]
+        failure_rate = analysis["failure_analysis"]["failure_rate"]
+        logger.info(
+            "Analyzed batch failure",
+            batch_id=batch_id,
+            completion_rate=completion_rate,
+            failure_rate=failure_rate,
+        )
+
+        return analysis
 
     async def recover_batch(
         self,
@@ -324,45 +311,30 @@ class BatchRecoveryManager:
         """
         logger.info("Starting batch recovery", batch_id=batch_id, strategy=recovery_strategy)
 
-        with self.database_service.get_session() as session:
-            batch = session.query(Batch).filter(Batch.id == batch_id).first()
-            if not batch:
-                raise ValueError(f"Batch {batch_id} not found")
-
-            # Load checkpoint if available
-            self.checkpoint_manager.load_checkpoint(batch_id)
+        batch = await call_service(self.database_service.get_batch, batch_id)
+        if not batch:
+            raise ValueError(f"Batch {batch_id} not found")
 
-            # Get jobs to recover based on strategy
-            jobs_to_recover = self._get_jobs_for_recovery(session, batch_id, recovery_strategy)
-
-            if not jobs_to_recover:
-                logger.info("No jobs to recover", batch_id=batch_id)
-                return BatchResults(total=0)
-
-            # Reset job statuses to PENDING for retry
-            urls_to_retry = []
-            for job in jobs_to_recover:
-                if job.status == JobStatus.FAILED:
-                    job.status = JobStatus.PENDING
-                    job.error_message = None
-                    job.error_type = None
-                    job.retry_count += 1
+        # Get jobs to recover based on strategy
+        jobs_to_recover = await call_service(
+            self.database_service.get_batch_jobs,
+            batch_id,
+            self._recovery_statuses(recovery_strategy),
+        )
 
-                urls_to_retry.append(job.url)
+        if not jobs_to_recover:
+            logger.info("No jobs to recover", batch_id=batch_id)
+            return BatchResults(total=0)
 
-            session.commit()
+        # Reset failed jobs to PENDING for retry and mark the batch running
+        job_ids = [job.id for job in jobs_to_recover]
+        await call_service(self.database_service.requeue_jobs, batch_id, job_ids)
 
-            # Update batch status
-            batch.status = JobStatus.RUNNING
-            session.commit()
+        logger.info("Prepared batch for recovery", batch_id=batch_id, jobs_to_retry=len(job_ids))
 
-            logger.info(
-                "Prepared batch for recovery", batch_id=batch_id, urls_to_retry=len(urls_to_retry)
-            )
-
-        # Process the recovered URLs if processor is provided
+        # Resume the same batch so its job rows and checkpoint journal are reused
         if processor:
-            results = await processor.process_batch(f"{batch.name}_recovery", urls_to_retry)
+            results = await processor.resume_batch(batch_id, job_ids=job_ids)
 
             logger.info(
                 "Batch recovery complete",
@@ -375,12 +347,12 @@ class BatchRecoveryManager:
         else:
             # Return info about what would be recovered
             return BatchResults(
-                total=len(urls_to_retry),
+                total=len(job_ids),
                 successful=[],  # Not actually processed yet
                 failed=[],
             )
 
-    def create_recovery_plan(self, batch_id: int) -> dict[str, Any]:
+    async def create_recovery_plan(self, batch_id: int) -> dict[str, Any]:
         """Create a detailed recovery plan for a failed batch.
 
         Args:
@@ -389,7 +361,7 @@ class BatchRecoveryManager:
         Returns:
             Detailed recovery plan
         """
-        analysis = self.analyze_batch_failure(batch_id)
+        analysis = await self.analyze_batch_failure(batch_id)
 
         plan_steps = []
 
@@ -490,23 +462,16 @@ class BatchRecoveryManager:
             "recommendation_reason": f"Completion: {completion_rate:.1%}, Failure: {failure_rate:.1%}",
         }
 
-    def _get_jobs_for_recovery(
-        self, session: Session, batch_id: int, strategy: str
-    ) -> list[ScrapingJob]:
-        """Get jobs that need to be recovered based on strategy."""
-        base_query = session.query(ScrapingJob).filter(ScrapingJob.batch_id == batch_id)
-
-        if strategy == "resume_pending":
-            return base_query.filter(ScrapingJob.status == JobStatus.PENDING).all()
-        elif strategy == "retry_failed":
-            return base_query.filter(ScrapingJob.status == JobStatus.FAILED).all()
+    @staticmethod
+    def _recovery_statuses(strategy: str) -> list[JobStatus]:
+        """Job statuses a recovery strategy picks up."""
+        if strategy == "retry_failed":
+            return [JobStatus.FAILED]
         elif strategy == "full_retry":
-            return base_query.filter(
-                or_(ScrapingJob.status == JobStatus.PENDING, ScrapingJob.status == JobStatus.FAILED)
-            ).all()
+            return [JobStatus.PENDING, JobStatus.FAILED]
         else:
-            # Default to pending jobs
-            return base_query.filter(ScrapingJob.status == JobStatus.PENDING).all()
+            # resume_pending, and the default for other strategies
+            return [JobStatus.PENDING]
 
     def _estimate_success_probability(self, analysis: dict[str, Any]) -> float:
         """Estimate probability of successful recovery."""
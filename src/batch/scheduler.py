@@ -0,0 +1,239 @@
+"""Per-domain fair scheduling for multi-domain batches.
+
+Jobs are read ahead into one FIFO sub-queue per domain and handed out with
+deficit round robin: each domain may take ``weight`` jobs per turn, and a
+domain already running its politeness limit of jobs is skipped until one of
+them finishes. A slow site therefore cannot occupy every slot while a fast
+site waits behind it in file order.
+
+Read-ahead is bounded by a window, and each domain may fill only a share of
+it. Jobs of a domain beyond its share are set aside in a bounded spill and
+moved up as its queued jobs are handed out, so a long run of one domain in
+the input does not hide the jobs of other domains that follow it.
+
+An optional ``hold`` callback defers a domain altogether, e.g. while its
+circuit breaker is open, and then lets its jobs through one at a time.
+"""
+
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Generic, TypeVar
+
+from src.constants import CONSTANTS
+
+T = TypeVar("T")
+
+
+class DomainScheduler(Generic[T]):  # noqa: UP046
+    """Hand out jobs round-robin across domains, each capped by its own limit.
+
+    Iterate with ``async for`` and call :meth:`release` once each yielded job
+    has finished, which frees its domain slot.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        domain_of: Callable[[T], str],
+        per_domain_limit: int = CONSTANTS.BATCH_PER_DOMAIN_CONCURRENCY,
+        domain_limits: dict[str, int] | None = None,
+        domain_weights: dict[str, int] | None = None,
+        window: int = CONSTANTS.BATCH_SCHEDULER_WINDOW,
+        domain_share: float = CONSTANTS.BATCH_SCHEDULER_DOMAIN_SHARE,
+        spill: int = CONSTANTS.BATCH_SCHEDULER_SPILL,
+        rank: Callable[[T], int] | None = None,
+        hold: Callable[[str], float | None] | None = None,
+        adaptive_limit: Callable[[str], int] | None = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            items: Jobs in submission order, consumed lazily
+            domain_of: Maps a job to its domain
+            per_domain_limit: Jobs allowed in flight per domain, 0 for no cap
+            domain_limits: Per-domain overrides of ``per_domain_limit``
+            domain_weights: Jobs a domain may take per round, default 1 (plain round robin)
+            window: Maximum number of jobs read ahead of the running ones
+            domain_share: Fraction of the window one domain may fill
+            spill: Maximum number of jobs set aside beyond their domain's share;
+                reading pauses while it is full, and 0 lets any domain fill the window
+            rank: Optional priority of a job, lower first; domains whose next job
+                has the best rank are served before the others
+            hold: Optional check of whether a domain is held back: None to run it
+                normally, 0 to run one job at a time, or seconds until it may run again
+            adaptive_limit: Optional current limit of a domain from a concurrency
+                controller, applied on top of its politeness limit
+
+        Raises:
+            ValueError: If a limit, weight, the window, share or spill is invalid
+        """
+        if per_domain_limit < 0:
+            raise ValueError("per_domain_limit cannot be negative")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        if not 0 < domain_share <= 1:
+            raise ValueError("domain_share must be between 0 and 1")
+        if spill < 0:
+            raise ValueError("spill cannot be negative")
+        if any(limit <= 0 for limit in (domain_limits or {}).values()):
+            raise ValueError("domain limits must be positive")
+        if any(weight <= 0 for weight in (domain_weights or {}).values()):
+            raise ValueError("domain weights must be positive")
+
+        self._source = iter(items)
+        self._exhausted = False
+        self.domain_of = domain_of
+        self.per_domain_limit = per_domain_limit
+        self.domain_limits = {k.lower(): v for k, v in (domain_limits or {}).items()}
+        self.domain_weights = {k.lower(): v for k, v in (domain_weights or {}).items()}
+        self.window = window
+        self.domain_window = max(1, int(window * domain_share))
+        self.spill = spill
+        self.rank = rank
+        self.hold = hold
+        self.adaptive_limit = adaptive_limit
+        self._queues: dict[str, deque[T]] = {}
+        self._ring: deque[str] = deque()  # Domains with queued jobs, in service order
+        self._deficit: dict[str, int] = {}
+        self._in_flight: dict[str, int] = {}
+        self._buffered = 0
+        self._spilled: dict[str, deque[T]] = {}  # Jobs beyond a domain's share of the window
+        self._spilled_count = 0
+        self._slot_freed = asyncio.Event()
+
+    @property
+    def buffered(self) -> int:
+        """Jobs read from the source but not yet handed out."""
+        return self._buffered + self._spilled_count
+
+    def in_flight(self, domain: str) -> int:
+        """Jobs currently running for a domain."""
+        return self._in_flight.get(domain, 0)
+
+    def limit_for(self, domain: str) -> int:
+        """Effective limit for a domain, 0 meaning uncapped."""
+        limit = self.domain_limits.get(domain, self.per_domain_limit)
+        if self.adaptive_limit is not None:
+            adaptive = self.adaptive_limit(domain)
+            limit = min(limit, adaptive) if limit else adaptive
+        return limit
+
+    def _has_capacity(self, domain: str) -> bool:
+        in_flight = self._in_flight.get(domain, 0)
+        held = self.hold(domain) if self.hold else None
+        if held is not None:
+            # Held domains wait, then run a single probe job at a time
+            return held <= 0 and not in_flight
+        limit = self.limit_for(domain)
+        return not limit or in_flight < limit
+
+    def _next_hold_expiry(self) -> float | None:
+        """Seconds until the first held domain with queued jobs may run again."""
+        if not self.hold:
+            return None
+        waits = [held for d in self._ring if (held := self.hold(d)) is not None and held > 0]
+        return min(waits, default=None)
+
+    def _fill(self) -> None:
+        """Read ahead from the source until the window or the spill is full."""
+        while not self._exhausted and self._buffered < self.window:
+            if self.spill and self._spilled_count >= self.spill:
+                return
+            try:
+                item = next(self._source)
+            except StopIteration:
+                self._exhausted = True
+                return
+            domain = self.domain_of(item).lower()
+            queue = self._queues.get(domain)
+            if queue is None:
+                queue = self._queues[domain] = deque()
+            if self.spill and len(queue) >= self.domain_window:
+                # The domain has its share of the window - set the job aside and keep
+                # reading for other domains' jobs
+                self._spilled.setdefault(domain, deque()).append(item)
+                self._spilled_count += 1
+                continue
+            if not queue:
+                self._ring.append(domain)
+            queue.append(item)
+            self._buffered += 1
+
+    def _promote(self, domain: str, queue: deque[T]) -> None:
+        """Move a domain's oldest set-aside job into its queue."""
+        spilled = self._spilled.get(domain)
+        if spilled:
+            queue.append(spilled.popleft())
+            self._spilled_count -= 1
+            self._buffered += 1
+            if not spilled:
+                del self._spilled[domain]
+
+    def _next_ready(self) -> T | None:
+        """Pop the next job by deficit round robin, or None if every domain is capped."""
+        ready = [domain for domain in self._ring if self._has_capacity(domain)]
+        if not ready:
+            return None
+
+        best_rank = min(self.rank(self._queues[d][0]) for d in ready) if self.rank else None
+        for _ in range(len(self._ring)):
+            domain = self._ring[0]
+            queue = self._queues[domain]
+            if self._has_capacity(domain) and (
+                best_rank is None or self.rank(queue[0]) == best_rank  # type: ignore[misc]
+            ):
+                if self._deficit.get(domain, 0) <= 0:
+                    self._deficit[domain] = self.domain_weights.get(domain, 1)
+                self._deficit[domain] -= 1
+                item = queue.popleft()
+                self._buffered -= 1
+                self._in_flight[domain] = self._in_flight.get(domain, 0) + 1
+                self._promote(domain, queue)
+
+                if not queue:
+                    self._ring.popleft()
+                    self._deficit[domain] = 0
+                elif self._deficit[domain] <= 0:
+                    self._ring.rotate(-1)
+                return item
+            self._ring.rotate(-1)
+        return None
+
+    def release(self, item: T) -> None:
+        """Free the domain slot held by a finished job.
+
+        Args:
+            item: Job previously yielded by the scheduler
+        """
+        domain = self.domain_of(item).lower()
+        self._in_flight[domain] = max(0, self._in_flight.get(domain, 0) - 1)
+        self._slot_freed.set()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        """Yield jobs as domain capacity allows until the source is drained."""
+        while True:
+            self._fill()
+            item = self._next_ready()
+            if item is not None:
+                yield item
+                continue
+            if self._exhausted and not self.buffered:
+                return
+            # Every domain with queued jobs is at its limit or held - wait for a job to
+            # finish or for a hold to expire
+            self._slot_freed.clear()
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._slot_freed.wait(), timeout=self._next_hold_expiry())
+
+    def get_statistics(self) -> dict[str, dict[str, int]]:
+        """Queued and running job counts per domain."""
+        return {
+            domain: {
+                "queued": len(queue) + len(self._spilled.get(domain, ())),
+                "in_flight": self._in_flight.get(domain, 0),
+            }
+            for domain, queue in self._queues.items()
+            if queue or self._in_flight.get(domain, 0)
+        }
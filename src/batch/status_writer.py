@@ -0,0 +1,159 @@
+"""Buffered job status persistence for batch processing.
+
+Status transitions are collected in memory and written in one transaction
+every ``flush_every`` transitions or ``flush_interval`` seconds, whichever
+comes first, instead of one round trip per transition.
+"""
+
+import asyncio
+import contextlib
+from collections import Counter
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+
+from src.constants import CONSTANTS
+from src.core.exceptions import DatabaseError
+from src.database.async_service import AsyncDatabaseService, call_service
+from src.database.models import JobStatus
+from src.database.service import DatabaseService
+
+logger = structlog.get_logger(__name__)
+
+FINAL_STATUSES = frozenset(
+    {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.SKIPPED, JobStatus.CANCELLED}
+)
+
+
+class JobStatusWriter:
+    """Coalesce job status changes and flush them to the database in bulk."""
+
+    def __init__(
+        self,
+        database_service: DatabaseService | AsyncDatabaseService,
+        flush_every: int = CONSTANTS.BATCH_DB_FLUSH_JOBS,
+        flush_interval: float = CONSTANTS.BATCH_DB_FLUSH_INTERVAL_MS / 1000,
+    ):
+        """Initialize the writer.
+
+        Args:
+            database_service: Database service used to apply updates
+            flush_every: Flush once this many transitions are buffered
+            flush_interval: Seconds between background flushes, 0 disables them
+        """
+        if flush_every <= 0:
+            raise ValueError("flush_every must be positive")
+        if flush_interval < 0:
+            raise ValueError("flush_interval cannot be negative")
+
+        self.database_service = database_service
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending: dict[int, dict[str, Any]] = {}
+        self._batch_deltas: dict[int, Counter[JobStatus]] = {}
+        self._buffered = 0
+        self._lock = asyncio.Lock()
+        self._flusher: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of jobs with unflushed changes."""
+        return len(self._pending)
+
+    async def start(self) -> None:
+        """Start the periodic background flush."""
+        if self.flush_interval and self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def close(self) -> None:
+        """Stop the background flush and write everything still buffered."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush(raise_errors=True)
+
+    async def record(
+        self,
+        job_id: int,
+        status: JobStatus,
+        batch_id: int | None = None,
+        error_message: str | None = None,
+        duration: float | None = None,
+    ) -> None:
+        """Buffer a status transition, flushing if the buffer is full.
+
+        Transitions for the same job are merged, so a job that starts and
+        finishes between flushes costs a single row update.
+
+        Args:
+            job_id: Job identifier
+            status: New job status
+            batch_id: Batch whose counters a final status should increment
+            error_message: Optional error message for failed jobs
+            duration: Optional execution duration in seconds
+        """
+        now = datetime.now(UTC)
+        row = self._pending.setdefault(job_id, {"id": job_id})
+        row["status"] = status
+
+        if status == JobStatus.RUNNING:
+            row["started_at"] = now
+        elif status in FINAL_STATUSES:
+            row["completed_at"] = now
+            if duration is not None:
+                row["duration_seconds"] = duration
+            if error_message:
+                row["error_message"] = error_message
+            if batch_id is not None:
+                self._batch_deltas.setdefault(batch_id, Counter())[status] += 1
+
+        self._buffered += 1
+        if self._buffered >= self.flush_every:
+            await self.flush()
+
+    async def flush(self, raise_errors: bool = False) -> None:
+        """Write buffered changes in a single transaction.
+
+        On failure the changes are put back so the next flush retries them.
+
+        Args:
+            raise_errors: Re-raise database errors instead of only logging them
+        """
+        async with self._lock:
+            if not self._pending and not self._batch_deltas:
+                return
+
+            pending, self._pending = self._pending, {}
+            deltas, self._batch_deltas = self._batch_deltas, {}
+            self._buffered = 0
+
+            try:
+                await call_service(
+                    self.database_service.apply_job_updates,
+                    list(pending.values()),
+                    {batch_id: dict(counts) for batch_id, counts in deltas.items()},
+                )
+            except DatabaseError as e:
+                self._restore(pending, deltas)
+                logger.error("Failed to flush job status updates", jobs=len(pending), error=str(e))
+                if raise_errors:
+                    raise
+
+    def _restore(
+        self, pending: dict[int, dict[str, Any]], deltas: dict[int, Counter[JobStatus]]
+    ) -> None:
+        """Merge unflushed changes back underneath anything recorded since."""
+        for job_id, row in pending.items():
+            self._pending[job_id] = {**row, **self._pending.get(job_id, {})}
+        for batch_id, counts in deltas.items():
+            self._batch_deltas.setdefault(batch_id, Counter()).update(counts)
+        self._buffered = len(self._pending)
+
+    async def _flush_periodically(self) -> None:
+        """Flush on a fixed interval until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
@@ -3,6 +3,8 @@
 from .base import CacheBackend, CacheConfig, CacheEntry
 from .file_cache import FileCache
 from .manager import CacheManager
+from .memory_cache import MemoryCache
+from .sqlite_cache import SqliteCache
 
 # Import Redis cache only if available
 try:
@@ -13,8 +15,18 @@ try:
         "CacheEntry",
         "CacheConfig",
         "FileCache",
+        "MemoryCache",
         "RedisCache",
+        "SqliteCache",
         "CacheManager",
     ]
 except ImportError:
-    __all__ = ["CacheBackend", "CacheEntry", "CacheConfig", "FileCache", "CacheManager"]
+    __all__ = [
+        "CacheBackend",
+        "CacheEntry",
+        "CacheConfig",
+        "FileCache",
+        "MemoryCache",
+        "SqliteCache",
+        "CacheManager",
+    ]
@@ -1,9 +1,11 @@
 """Base cache interfaces and types."""
 
 import abc
+import asyncio
 import hashlib
 import json
 import time
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -22,6 +24,7 @@ class CacheBackend(Enum):
     FILE = "file"
     REDIS = "redis"
     MEMORY = "memory"
+    SQLITE = "sqlite"
 
 
 @dataclass
@@ -35,7 +38,17 @@ class CacheConfig:
     ttl_metadata: int = CONSTANTS.CACHE_TTL_METADATA
     ttl_robots: int = CONSTANTS.ROBOTS_CACHE_DURATION
 
-    # File cache settings
+    # Stale-while-revalidate windows and request coalescing for CacheManager.get_or_load
+    stale_html: int = CONSTANTS.CACHE_STALE_HTML
+    stale_images: int = CONSTANTS.CACHE_STALE_IMAGES
+    stale_metadata: int = CONSTANTS.CACHE_STALE_METADATA
+    stale_robots: int = CONSTANTS.CACHE_STALE_ROBOTS
+    coalesce_html: bool = CONSTANTS.CACHE_COALESCE_HTML
+    coalesce_images: bool = CONSTANTS.CACHE_COALESCE_IMAGES
+    coalesce_metadata: bool = CONSTANTS.CACHE_COALESCE_METADATA
+    coalesce_robots: bool = CONSTANTS.CACHE_COALESCE_ROBOTS
+
+    # File and SQLite cache settings
     cache_dir: Path = Path(".cache")
     max_cache_size_mb: int = CONSTANTS.MAX_CACHE_SIZE_MB
 
@@ -46,8 +59,14 @@ class CacheConfig:
     redis_password: str | None = None
     redis_key_prefix: str = CONSTANTS.REDIS_KEY_PREFIX
 
+    # In-process L1 tier (and memory backend) settings
+    memory_tier_enabled: bool = CONSTANTS.CACHE_MEMORY_TIER
+    memory_tier_max_mb: int = CONSTANTS.CACHE_MEMORY_TIER_MAX_MB
+    memory_tier_ttl: int = CONSTANTS.CACHE_MEMORY_TIER_TTL
+
     # General settings
     compress: bool = True
+    compression: str = CONSTANTS.CACHE_COMPRESSION
     cleanup_on_startup: bool = True
     max_key_length: int = CONSTANTS.MAX_KEY_LENGTH
 
@@ -174,6 +193,53 @@ class BaseCacheBackend(abc.ABC):
         """
         pass
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get several cache entries at once.
+
+        Looks the keys up concurrently; backends with a bulk read override this.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Entries found and not expired, by key
+        """
+        keys = list(dict.fromkeys(keys))
+        entries = await asyncio.gather(*(self.get(key) for key in keys))
+        return {key: entry for key, entry in zip(keys, entries, strict=True) if entry}
+
+    async def set_many(
+        self, values: Mapping[str, Any], ttl: int | None = None, content_type: str = "generic"
+    ) -> bool:
+        """Set several cache entries at once.
+
+        Writes the entries concurrently; backends with a bulk write override this.
+
+        Args:
+            values: Values to cache, by key
+            ttl: Time to live in seconds (uses default if None)
+            content_type: Type of content being cached
+
+        Returns:
+            True if every entry was cached
+        """
+        stored = await asyncio.gather(
+            *(self.set(key, value, ttl, content_type) for key, value in values.items())
+        )
+        return all(stored)
+
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several cache entries at once.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = await asyncio.gather(*(self.delete(key) for key in dict.fromkeys(keys)))
+        return sum(deleted)
+
     def generate_key(self, *parts: str | int | float) -> str:
         """Generate a cache key from parts.
 
@@ -214,6 +280,35 @@ class BaseCacheBackend(abc.ABC):
 
         return ttl_mapping.get(content_type, self.config.ttl_default)
 
+    def _serialize_entry(self, entry: CacheEntry) -> bytes:
+        """Encode an entry in the binary entry format, compressed as its content type needs.
+
+        Args:
+            entry: Entry to encode
+
+        Returns:
+            Encoded entry
+        """
+        from .serialization import choose_codec, encode_entry
+
+        codec = choose_codec(entry.content_type, self.config.compress, self.config.compression)
+        return encode_entry(entry, codec, self._json_serializer)
+
+    def _deserialize_entry(self, data: bytes) -> CacheEntry:
+        """Decode an entry, accepting entries still in the legacy compressed JSON format.
+
+        Args:
+            data: Encoded entry
+
+        Returns:
+            Decoded entry
+        """
+        from .serialization import decode_entry, is_binary_entry
+
+        if is_binary_entry(data):
+            return decode_entry(data, self._json_deserializer)
+        return CacheEntry.from_dict(self._decompress_data(data, compressed=True))
+
     def _compress_data(self, data: Any) -> bytes:
         """Compress data if compression is enabled.
 
@@ -1,7 +1,12 @@
 """File-based cache backend implementation."""
 
+import asyncio
 import hashlib
+import json
+import math
 import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 from typing import Any
 
@@ -10,9 +15,31 @@ import aiofiles
 from ..constants import CONSTANTS
 from .base import BaseCacheBackend, CacheConfig, CacheEntry
 
+# Content types with their own directory; a key prefixed "<type>:" is stored under it
+CONTENT_TYPES = frozenset({"html", "image", "metadata", "robots"})
+
 
 class FileCache(BaseCacheBackend):
-    """File-based cache backend using local filesystem."""
+    """File-based cache backend using local filesystem.
+
+    Entries live under a directory per content type, fanned out two levels by
+    the first hex digits of the key's hash (``html/ab/cd/abcd....cache``) so no
+    directory grows past a few hundred files. The content type of a key comes
+    from its prefix (``html:``, ``image:``, ...) as built by the cache manager;
+    keys stored under any other type are recorded in a small persistent index,
+    so every lookup resolves to exactly one path without probing.
+
+    Sizes and access order are tracked in memory: a running byte count and an
+    LRU-ordered index of every file, rebuilt from disk on startup and saved
+    periodically so recency survives restarts. Writes evict least recently
+    used entries in amortized O(1) instead of walking the cache directory.
+
+    Bulk operations read and write their files concurrently in worker threads,
+    and ``set_many`` enforces the size limit once for the whole batch.
+    """
+
+    INDEX_FILE = "index.json"
+    LRU_FILE = "lru.json"
 
     def __init__(self, config: CacheConfig):
         """Initialize file cache.
@@ -31,16 +58,46 @@ class FileCache(BaseCacheBackend):
         self.robots_dir = self.cache_dir / "robots"
         self.generic_dir = self.cache_dir / "generic"
 
-        for directory in [
+        for directory in self._type_dirs():
+            directory.mkdir(exist_ok=True)
+
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
+
+        # Content types of keys whose prefix doesn't name their type, by key hash
+        self._index_path = self.cache_dir / self.INDEX_FILE
+        self._type_index: dict[str, str] = self._load_type_index()
+        self._fanout_dirs: set[Path] = set()
+
+        # On-disk size and expiry time of every entry, least recently used first
+        self._lru_path = self.cache_dir / self.LRU_FILE
+        self._entries: OrderedDict[Path, tuple[int, float]] = OrderedDict()
+        self._total_size = 0
+        self._unsaved_changes = 0
+        self._reconcile()
+
+    def _type_dirs(self) -> list[Path]:
+        return [
             self.html_dir,
             self.image_dir,
             self.metadata_dir,
             self.robots_dir,
             self.generic_dir,
-        ]:
-            directory.mkdir(exist_ok=True)
+        ]
 
-        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
+    def _cache_files(self) -> Iterator[Path]:
+        """Every cache file on disk, including any left in the flat pre-fan-out layout."""
+        for directory in self._type_dirs():
+            yield from directory.rglob("*.cache")
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @staticmethod
+    def _type_from_key(key: str) -> str:
+        """Content type named by a key's prefix, or generic if it names none."""
+        prefix = key.split(":", 1)[0]
+        return prefix if prefix in CONTENT_TYPES else "generic"
 
     def _get_cache_path(self, key: str, content_type: str) -> Path:
         """Get the file path for a cache key.
@@ -62,52 +119,194 @@ class FileCache(BaseCacheBackend):
 
         base_dir = type_dirs.get(content_type, self.generic_dir)
 
-        # Create safe filename from key
-        safe_key = hashlib.sha256(key.encode()).hexdigest()
-        return base_dir / f"{safe_key}.cache"
+        # Create safe filename from key, fanned out over two levels of directories
+        safe_key = self._hash_key(key)
+        return base_dir / safe_key[:2] / safe_key[2:4] / f"{safe_key}.cache"
+
+    def _resolve_path(self, key: str) -> Path:
+        """The one path a key can be stored at, from the index or the key's prefix."""
+        content_type = self._type_index.get(self._hash_key(key)) or self._type_from_key(key)
+        return self._get_cache_path(key, content_type)
+
+    def _load_type_index(self) -> dict[str, str]:
+        try:
+            index = json.loads(self._index_path.read_text())
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning("Cache type index unreadable, starting empty", error=str(e))
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_type_index(self) -> None:
+        temp_path = self._index_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(self._type_index))
+        temp_path.replace(self._index_path)
+
+    def _index_type(self, key: str, content_type: str) -> None:
+        """Record a key's content type unless its prefix already names it."""
+        key_hash = self._hash_key(key)
+        if content_type == self._type_from_key(key):
+            if self._type_index.pop(key_hash, None) is not None:
+                self._save_type_index()
+        elif self._type_index.get(key_hash) != content_type:
+            self._type_index[key_hash] = content_type
+            self._save_type_index()
+
+    def _unindex(self, key_hashes: Iterable[str]) -> None:
+        removed = [h for h in key_hashes if self._type_index.pop(h, None) is not None]
+        if removed:
+            self._save_type_index()
+
+    def _reconcile(self) -> None:
+        """Rebuild the access order and byte count from the files on disk.
+
+        Files keep their last saved order; files written since (or by another
+        process) follow, oldest first. Files without a saved expiry are assumed
+        to expire ``ttl_default`` after they were written.
+        """
+        saved = self._load_lru()
+        on_disk = {}
+        for cache_file in self._cache_files():
+            try:
+                on_disk[cache_file] = cache_file.stat()
+            except OSError:
+                continue
+
+        ordered = [path for path in saved if path in on_disk]
+        ordered += sorted(
+            (path for path in on_disk if path not in saved), key=lambda p: on_disk[p].st_mtime
+        )
+        for path in ordered:
+            stat = on_disk[path]
+            expires_at = saved.get(path, stat.st_mtime + self.config.ttl_default)
+            self._entries[path] = (stat.st_size, expires_at)
+            self._total_size += stat.st_size
+
+    def _load_lru(self) -> dict[Path, float]:
+        try:
+            rows = json.loads(self._lru_path.read_text())
+            return {self.cache_dir / path: float(expires_at) for path, expires_at in rows}
+        except FileNotFoundError:
+            return {}
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Cache access order unreadable, using file times", error=str(e))
+            return {}
+
+    def _save_lru(self) -> None:
+        rows = [
+            [str(path.relative_to(self.cache_dir)), expires_at]
+            for path, (_, expires_at) in self._entries.items()
+        ]
+        temp_path = self._lru_path.with_suffix(".tmp")
+        temp_path.write_text(json.dumps(rows))
+        temp_path.replace(self._lru_path)
+        self._unsaved_changes = 0
+
+    def _note_change(self) -> None:
+        """Save the access order once changes since the last save outnumber the entries."""
+        self._unsaved_changes += 1
+        if self._unsaved_changes >= max(CONSTANTS.CACHE_LRU_PERSIST_INTERVAL, len(self._entries)):
+            try:
+                self._save_lru()
+            except OSError as e:
+                self.logger.warning("Failed to save cache access order", error=str(e))
+
+    def _track(self, path: Path, size: int, expires_at: float) -> None:
+        """Record an entry as the most recently used."""
+        self._forget(path)
+        self._entries[path] = (size, expires_at)
+        self._total_size += size
+
+    def _forget(self, path: Path) -> None:
+        tracked = self._entries.pop(path, None)
+        if tracked is not None:
+            self._total_size -= tracked[0]
+        self._note_change()
+
+    @staticmethod
+    def _expires_at(entry: CacheEntry) -> float:
+        return entry.created_at + entry.ttl if entry.ttl > 0 else math.inf
 
     async def get(self, key: str) -> CacheEntry | None:
         """Get a cache entry by key."""
         try:
-            # We need to check all possible content type directories
-            # since we don't know the content type from just the key
-            possible_paths = []
-            for content_type in ["html", "image", "metadata", "robots", "generic"]:
-                possible_paths.append(self._get_cache_path(key, content_type))
-
-            cache_path = None
-            for path in possible_paths:
-                if path.exists():
-                    cache_path = path
-                    break
-
-            if not cache_path:
-                self._stats["misses"] += 1
-                return None
-
-            # Read cache entry
-            async with aiofiles.open(cache_path, "rb") as f:
-                data = await f.read()
-
-            # Deserialize entry
-            entry_data = self._decompress_data(data, compressed=True)
-            entry = CacheEntry.from_dict(entry_data)
+            cache_path = self._resolve_path(key)
 
-            # Check if expired
-            if entry.is_expired:
-                await self.delete(key)
+            # Read cache entry - a missing file is the only check a miss costs
+            try:
+                async with aiofiles.open(cache_path, "rb") as f:
+                    data = await f.read()
+            except FileNotFoundError:
                 self._stats["misses"] += 1
                 return None
 
-            self._stats["hits"] += 1
-            self.logger.debug("Cache hit", key=key, age_seconds=entry.age_seconds)
-            return entry
+            return await self._accept_read(key, cache_path, data)
 
         except Exception as e:
             self._stats["errors"] += 1
             self.logger.warning("Cache get failed", key=key, error=str(e))
             return None
 
+    async def _accept_read(self, key: str, cache_path: Path, data: bytes) -> CacheEntry | None:
+        """Deserialize a file just read, counting it as a hit unless it has expired."""
+        entry = self._deserialize_entry(data)
+
+        # Check if expired
+        if entry.is_expired:
+            await self.delete(key)
+            self._stats["misses"] += 1
+            return None
+
+        if cache_path in self._entries:
+            self._entries.move_to_end(cache_path)
+            self._note_change()
+        else:
+            self._track(cache_path, len(data), self._expires_at(entry))
+
+        self._stats["hits"] += 1
+        self.logger.debug("Cache hit", key=key, age_seconds=entry.age_seconds)
+        return entry
+
+    @staticmethod
+    def _read_file(path: Path) -> bytes | None:
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get several cache entries, reading their files concurrently.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Entries found and not expired, by key
+        """
+        paths = {key: self._resolve_path(key) for key in keys}
+        reads = await asyncio.gather(
+            *(asyncio.to_thread(self._read_file, path) for path in paths.values()),
+            return_exceptions=True,
+        )
+
+        entries = {}
+        for (key, cache_path), data in zip(paths.items(), reads, strict=True):
+            if data is None:
+                self._stats["misses"] += 1
+                continue
+            try:
+                if isinstance(data, BaseException):
+                    raise data
+                entry = await self._accept_read(key, cache_path, data)
+            except Exception as e:
+                self._stats["errors"] += 1
+                self.logger.warning("Cache get failed", key=key, error=str(e))
+                continue
+            if entry:
+                entries[key] = entry
+        return entries
+
     async def set(
         self, key: str, value: Any, ttl: int | None = None, content_type: str = "generic"
     ) -> bool:
@@ -116,33 +315,7 @@ class FileCache(BaseCacheBackend):
             if ttl is None:
                 ttl = self.get_ttl_for_content_type(content_type)
 
-            # Create cache entry
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=time.time(),
-                ttl=ttl,
-                content_type=content_type,
-                size_bytes=self._calculate_size(value),
-                compressed=self.config.compress,
-            )
-
-            # Get cache file path
-            cache_path = self._get_cache_path(key, content_type)
-
-            # Serialize and compress entry
-            entry_data = self._compress_data(entry.to_dict())
-
-            # Write to file atomically
-            temp_path = cache_path.with_suffix(".tmp")
-            async with aiofiles.open(temp_path, "wb") as f:
-                await f.write(entry_data)
-
-            # Atomic move
-            temp_path.rename(cache_path)
-
-            self._stats["sets"] += 1
-            self.logger.debug("Cache set", key=key, size_bytes=entry.size_bytes, ttl=ttl)
+            await self._write(key, value, ttl, content_type)
 
             # Check if cache size is getting too large
             await self._enforce_size_limit()
@@ -154,17 +327,87 @@ class FileCache(BaseCacheBackend):
             self.logger.error("Cache set failed", key=key, error=str(e))
             return False
 
+    async def set_many(
+        self, values: Mapping[str, Any], ttl: int | None = None, content_type: str = "generic"
+    ) -> bool:
+        """Set several cache entries, writing their files concurrently.
+
+        Args:
+            values: Values to cache, by key
+            ttl: Time to live in seconds (uses default if None)
+            content_type: Type of content being cached
+
+        Returns:
+            True if every entry was cached
+        """
+        if ttl is None:
+            ttl = self.get_ttl_for_content_type(content_type)
+
+        results = await asyncio.gather(
+            *(self._write(key, value, ttl, content_type) for key, value in values.items()),
+            return_exceptions=True,
+        )
+        failed = 0
+        for key, result in zip(values, results, strict=True):
+            if isinstance(result, Exception):
+                failed += 1
+                self._stats["errors"] += 1
+                self.logger.error("Cache set failed", key=key, error=str(result))
+
+        # One size check for the whole batch
+        await self._enforce_size_limit()
+        return not failed
+
+    async def _write(self, key: str, value: Any, ttl: int, content_type: str) -> None:
+        """Write an entry's file and track it, without enforcing the size limit."""
+        # Create cache entry
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            created_at=time.time(),
+            ttl=ttl,
+            content_type=content_type,
+            size_bytes=self._calculate_size(value),
+            compressed=self.config.compress,
+        )
+
+        # Get cache file path, replacing any entry stored under another type
+        previous_path = self._resolve_path(key)
+        cache_path = self._get_cache_path(key, content_type)
+        if cache_path.parent not in self._fanout_dirs:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._fanout_dirs.add(cache_path.parent)
+
+        # Serialize and compress entry
+        entry_data = self._serialize_entry(entry)
+
+        # Write to file atomically
+        temp_path = cache_path.with_suffix(".tmp")
+        async with aiofiles.open(temp_path, "wb") as f:
+            await f.write(entry_data)
+
+        # Atomic move
+        temp_path.replace(cache_path)
+        if previous_path != cache_path:
+            previous_path.unlink(missing_ok=True)
+            self._forget(previous_path)
+        self._index_type(key, content_type)
+        self._track(cache_path, len(entry_data), self._expires_at(entry))
+
+        self._stats["sets"] += 1
+        self.logger.debug("Cache set", key=key, size_bytes=entry.size_bytes, ttl=ttl)
+
     async def delete(self, key: str) -> bool:
         """Delete a cache entry."""
         try:
-            deleted = False
-
-            # Check all possible content type directories
-            for content_type in ["html", "image", "metadata", "robots", "generic"]:
-                cache_path = self._get_cache_path(key, content_type)
-                if cache_path.exists():
-                    cache_path.unlink()
-                    deleted = True
+            cache_path = self._resolve_path(key)
+            try:
+                cache_path.unlink()
+                deleted = True
+            except FileNotFoundError:
+                deleted = False
+            self._forget(cache_path)
+            self._unindex([self._hash_key(key)])
 
             if deleted:
                 self._stats["deletes"] += 1
@@ -177,19 +420,46 @@ class FileCache(BaseCacheBackend):
             self.logger.error("Cache delete failed", key=key, error=str(e))
             return False
 
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several cache entries, saving the type index at most once.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of entries deleted
+        """
+        deleted = 0
+        key_hashes = []
+        for key in dict.fromkeys(keys):
+            cache_path = self._resolve_path(key)
+            try:
+                cache_path.unlink()
+                deleted += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self._stats["errors"] += 1
+                self.logger.error("Cache delete failed", key=key, error=str(e))
+                continue
+            self._forget(cache_path)
+            key_hashes.append(self._hash_key(key))
+        self._unindex(key_hashes)
+
+        self._stats["deletes"] += deleted
+        return deleted
+
     async def clear(self) -> bool:
         """Clear all cache entries."""
         try:
             # Remove all files in cache directories
-            for directory in [
-                self.html_dir,
-                self.image_dir,
-                self.metadata_dir,
-                self.robots_dir,
-                self.generic_dir,
-            ]:
-                for cache_file in directory.glob("*.cache"):
-                    cache_file.unlink()
+            for cache_file in list(self._cache_files()):
+                cache_file.unlink()
+            self._type_index.clear()
+            self._save_type_index()
+            self._entries.clear()
+            self._total_size = 0
+            self._save_lru()
 
             # Reset stats
             self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
@@ -205,31 +475,13 @@ class FileCache(BaseCacheBackend):
     async def stats(self) -> dict[str, Any]:
         """Get cache statistics."""
         try:
-            # Calculate cache size and entry count
-            total_size = 0
-            total_entries = 0
-            expired_entries = 0
-
-            for directory in [
-                self.html_dir,
-                self.image_dir,
-                self.metadata_dir,
-                self.robots_dir,
-                self.generic_dir,
-            ]:
-                for cache_file in directory.glob("*.cache"):
-                    try:
-                        file_size = cache_file.stat().st_size
-                        total_size += file_size
-                        total_entries += 1
-
-                        # Check if expired (basic check without full deserialization)
-                        mtime = cache_file.stat().st_mtime
-                        if time.time() - mtime > self.config.ttl_default:
-                            expired_entries += 1
-
-                    except OSError:
-                        continue
+            # Sizes and expiry times are tracked in memory - no directory walk
+            now = time.time()
+            total_size = self._total_size
+            total_entries = len(self._entries)
+            expired_entries = sum(
+                1 for _, expires_at in self._entries.values() if expires_at <= now
+            )
 
             return {
                 **self._stats,
@@ -253,31 +505,29 @@ class FileCache(BaseCacheBackend):
         cleaned = 0
 
         try:
-            for directory in [
-                self.html_dir,
-                self.image_dir,
-                self.metadata_dir,
-                self.robots_dir,
-                self.generic_dir,
-            ]:
-                for cache_file in directory.glob("*.cache"):
-                    try:
-                        # Read and check if expired
-                        async with aiofiles.open(cache_file, "rb") as f:
-                            data = await f.read()
-
-                        entry_data = self._decompress_data(data, compressed=True)
-                        entry = CacheEntry.from_dict(entry_data)
-
-                        if entry.is_expired:
-                            cache_file.unlink()
-                            cleaned += 1
-
-                    except Exception:
-                        # If we can't read the file, it's probably corrupted
+            removed_hashes = []
+            for cache_file in list(self._cache_files()):
+                try:
+                    # Read and check if expired
+                    async with aiofiles.open(cache_file, "rb") as f:
+                        data = await f.read()
+
+                    entry = self._deserialize_entry(data)
+
+                    if entry.is_expired:
                         cache_file.unlink()
+                        self._forget(cache_file)
+                        removed_hashes.append(cache_file.stem)
                         cleaned += 1
-                        continue
+
+                except Exception:
+                    # If we can't read the file, it's probably corrupted
+                    cache_file.unlink()
+                    self._forget(cache_file)
+                    removed_hashes.append(cache_file.stem)
+                    cleaned += 1
+                    continue
+            self._unindex(removed_hashes)
 
             if cleaned > 0:
                 self.logger.info("Cleaned up expired cache entries", count=cleaned)
@@ -289,65 +539,49 @@ class FileCache(BaseCacheBackend):
             return 0
 
     async def _enforce_size_limit(self) -> None:
-        """Enforce cache size limit by removing oldest entries."""
-        try:
-            stats = await self.stats()
-            current_size_mb = stats.get("total_size_mb", 0)
+        """Evict least recently used entries once the cache outgrows its size limit.
 
-            if current_size_mb <= self.config.max_cache_size_mb:
+        Evicting down to ``CACHE_CLEANUP_RATIO`` of the limit means every entry
+        is evicted at most once per write that added it, so the cost per write
+        is amortized O(1).
+        """
+        try:
+            limit = self.config.max_cache_size_mb * CONSTANTS.BYTES_PER_MB
+            if self._total_size <= limit:
                 return
 
-            self.logger.info(
-                "Cache size limit exceeded, cleaning up",
-                current_size_mb=current_size_mb,
-                limit_mb=self.config.max_cache_size_mb,
-            )
-
-            # Get all cache files with their modification times
-            cache_files = []
-            for directory in [
-                self.html_dir,
-                self.image_dir,
-                self.metadata_dir,
-                self.robots_dir,
-                self.generic_dir,
-            ]:
-                for cache_file in directory.glob("*.cache"):
-                    try:
-                        mtime = cache_file.stat().st_mtime
-                        size = cache_file.stat().st_size
-                        cache_files.append((cache_file, mtime, size))
-                    except OSError:
-                        continue
-
-            # Sort by modification time (oldest first)
-            cache_files.sort(key=lambda x: x[1])
-
-            # Remove oldest files until under limit
+            target_size = limit * CONSTANTS.CACHE_CLEANUP_RATIO
             removed_size = 0
-            removed_count = 0
-            target_size = (
-                self.config.max_cache_size_mb
-                * CONSTANTS.CACHE_CLEANUP_RATIO
-                * CONSTANTS.BYTES_PER_MB
-            )
-
-            for cache_file, mtime, size in cache_files:
-                if current_size_mb * CONSTANTS.BYTES_PER_MB - removed_size <= target_size:
-                    break
-
+            removed_hashes = []
+            while self._total_size > target_size and self._entries:
+                cache_file, (size, _) = self._entries.popitem(last=False)
+                self._total_size -= size
                 try:
-                    cache_file.unlink()
-                    removed_size += size
-                    removed_count += 1
-                except OSError:
+                    cache_file.unlink(missing_ok=True)
+                except OSError as e:
+                    # Untracked until the next startup reconciles with disk
+                    self.logger.warning(
+                        "Failed to evict cache file", path=str(cache_file), error=str(e)
+                    )
                     continue
+                removed_size += size
+                removed_hashes.append(cache_file.stem)
+            self._unindex(removed_hashes)
+            self._note_change()
 
             self.logger.info(
-                "Cache cleanup completed",
-                removed_count=removed_count,
+                "Cache eviction completed",
+                removed_count=len(removed_hashes),
                 removed_size_mb=round(removed_size / CONSTANTS.BYTES_PER_MB, 2),
+                limit_mb=self.config.max_cache_size_mb,
             )
 
         except Exception as e:
             self.logger.error("Cache size enforcement failed", error=str(e))
+
+    async def shutdown(self) -> None:
+        """Save the access order so recency survives a restart."""
+        try:
+            self._save_lru()
+        except OSError as e:
+            self.logger.warning("Failed to save cache access order", error=str(e))
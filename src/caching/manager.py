@@ -1,12 +1,18 @@
 """Cache manager for coordinating cache operations and strategies."""
 
+import asyncio
+import functools
 import hashlib
+import time
+from collections.abc import Awaitable, Callable, Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
 import structlog
 
-from .base import BaseCacheBackend, CacheBackend, CacheConfig
+from .base import BaseCacheBackend, CacheBackend, CacheConfig, CacheEntry
 from .file_cache import FileCache
+from .memory_cache import MemoryCache
+from .sqlite_cache import SqliteCache
 
 # Import Redis cache only if available
 try:
@@ -24,7 +30,21 @@ logger = structlog.get_logger(__name__)
 
 
 class CacheManager:
-    """High-level cache manager that coordinates multiple cache backends."""
+    """High-level cache manager that coordinates multiple cache backends.
+
+    With ``memory_tier_enabled`` an in-process :class:`MemoryCache` (L1) sits
+    in front of the configured backend (L2): reads try L1 first and promote L2
+    hits into it, writes and invalidations go to both tiers.
+
+    Images and metadata can also be read and written in bulk (``get_images``,
+    ``set_images``, ``get_metadata_many``, ``set_metadata_many``), which costs
+    one backend round trip per call instead of one per URL.
+
+    :meth:`get_or_load` takes a loader for misses. An entry in the last
+    ``stale_*`` seconds of its TTL is served at once and reloaded once in the
+    background, so popular entries are refreshed before they expire; with
+    ``coalesce_*`` set, concurrent misses for one key await a single loader.
+    """
 
     def __init__(self, config: CacheConfig | None = None):
         """Initialize cache manager.
@@ -34,8 +54,13 @@ class CacheManager:
         """
         self.config = config or CacheConfig()
         self.backend: BaseCacheBackend | None = None
+        self.memory: MemoryCache | None = None
         self._initialized = False
 
+        # In-flight loader calls by key, shared by coalesced callers and background refreshes
+        self._loads: dict[str, asyncio.Future] = {}
+        self._load_stats = {"loads": 0, "coalesced": 0, "stale_served": 0, "failed": 0}
+
     def _ensure_backend(self) -> BaseCacheBackend:
         """Ensure backend is initialized and return it."""
         if self.backend is None:
@@ -59,9 +84,17 @@ class CacheManager:
                 self.backend = RedisCache(self.config)
                 # Initialize Redis connection - this will test connectivity
                 await self.backend.initialize()
+            elif self.config.backend == CacheBackend.MEMORY:
+                self.backend = MemoryCache(self.config)
+            elif self.config.backend == CacheBackend.SQLITE:
+                self.backend = SqliteCache(self.config)
             else:
                 raise ValueError(f"Unsupported cache backend: {self.config.backend}")
 
+            # A memory tier in front of a memory backend would only hold duplicates
+            if self.config.memory_tier_enabled and self.config.backend != CacheBackend.MEMORY:
+                self.memory = MemoryCache(self.config)
+
             # Cleanup expired entries on startup if configured
             if self.config.cleanup_on_startup:
                 backend = self._ensure_backend()
@@ -89,8 +122,7 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_html_key(url)
-        backend = self._ensure_backend()
-        entry = await backend.get(key)
+        entry = await self._get_entry(key)
 
         if entry:
             logger.debug("Cache hit for HTML", url=url)
@@ -113,8 +145,7 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_html_key(url)
-        backend = self._ensure_backend()
-        return await backend.set(key, html_content, ttl, "html")
+        return await self._set_entry(key, html_content, ttl, "html")
 
     async def get_image(self, image_url: str) -> bytes | None:
         """Get cached image data.
@@ -129,8 +160,7 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_image_key(image_url)
-        backend = self._ensure_backend()
-        entry = await backend.get(key)
+        entry = await self._get_entry(key)
 
         if entry:
             logger.debug("Cache hit for image", url=image_url)
@@ -153,8 +183,41 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_image_key(image_url)
-        backend = self._ensure_backend()
-        return await backend.set(key, image_data, ttl, "image")
+        return await self._set_entry(key, image_data, ttl, "image")
+
+    async def get_images(self, image_urls: Iterable[str]) -> dict[str, bytes]:
+        """Get cached image data for several images at once.
+
+        Args:
+            image_urls: URLs of the images
+
+        Returns:
+            Cached image data by URL, for the images found and not expired
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        keys = {self._make_image_key(url): url for url in image_urls}
+        entries = await self._get_entries(keys)
+
+        logger.debug("Cache lookup for images", requested=len(keys), hits=len(entries))
+        return {keys[key]: entry.value for key, entry in entries.items()}
+
+    async def set_images(self, images: Mapping[str, bytes], ttl: int | None = None) -> bool:
+        """Cache data for several images at once.
+
+        Args:
+            images: Image data by image URL
+            ttl: Custom TTL in seconds
+
+        Returns:
+            True if every image was cached
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        values = {self._make_image_key(url): data for url, data in images.items()}
+        return await self._set_entries(values, ttl, "image")
 
     async def get_metadata(self, url: str) -> dict[str, Any] | None:
         """Get cached metadata for a URL.
@@ -169,8 +232,7 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_metadata_key(url)
-        backend = self._ensure_backend()
-        entry = await backend.get(key)
+        entry = await self._get_entry(key)
 
         if entry:
             logger.debug("Cache hit for metadata", url=url)
@@ -195,8 +257,43 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_metadata_key(url)
-        backend = self._ensure_backend()
-        return await backend.set(key, metadata, ttl, "metadata")
+        return await self._set_entry(key, metadata, ttl, "metadata")
+
+    async def get_metadata_many(self, urls: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Get cached metadata for several URLs at once.
+
+        Args:
+            urls: URLs to get metadata for
+
+        Returns:
+            Cached metadata by URL, for the URLs found and not expired
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        keys = {self._make_metadata_key(url): url for url in urls}
+        entries = await self._get_entries(keys)
+
+        logger.debug("Cache lookup for metadata", requested=len(keys), hits=len(entries))
+        return {keys[key]: entry.value for key, entry in entries.items()}
+
+    async def set_metadata_many(
+        self, metadata: Mapping[str, dict[str, Any]], ttl: int | None = None
+    ) -> bool:
+        """Cache metadata for several URLs at once.
+
+        Args:
+            metadata: Metadata by the URL it came from
+            ttl: Custom TTL in seconds
+
+        Returns:
+            True if the metadata of every URL was cached
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        values = {self._make_metadata_key(url): value for url, value in metadata.items()}
+        return await self._set_entries(values, ttl, "metadata")
 
     async def get_robots_txt(self, domain: str) -> str | None:
         """Get cached robots.txt content for a domain.
@@ -211,8 +308,7 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_robots_key(domain)
-        backend = self._ensure_backend()
-        entry = await backend.get(key)
+        entry = await self._get_entry(key)
 
         if entry:
             logger.debug("Cache hit for robots.txt", domain=domain)
@@ -237,8 +333,116 @@ class CacheManager:
             await self.initialize()
 
         key = self._make_robots_key(domain)
-        backend = self._ensure_backend()
-        return await backend.set(key, robots_content, ttl, "robots")
+        return await self._set_entry(key, robots_content, ttl, "robots")
+
+    async def get_or_load(
+        self,
+        content_type: str,
+        source: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+    ) -> Any:
+        """Get a cached value, loading and caching it on a miss.
+
+        Args:
+            content_type: ``"html"``, ``"image"``, ``"metadata"`` or ``"robots"``
+            source: URL the content comes from (the domain for robots.txt)
+            loader: Coroutine function returning the value to cache; a None
+                result is returned but not cached
+            ttl: Custom TTL in seconds for loaded values
+
+        Returns:
+            The cached value (possibly stale, while it is being reloaded) or the
+            loaded value
+
+        Raises:
+            ValueError: If the content type is unknown
+            Exception: Whatever the loader raises on a miss
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        key = self._make_key(content_type, source)
+        entry = await self._get_entry(key)
+        if entry:
+            if self._is_stale(entry):
+                self._load_stats["stale_served"] += 1
+                self._start_load(key, content_type, loader, ttl)
+                logger.debug("Serving stale cache entry while reloading", key=key)
+            return entry.value
+
+        if not self._coalesce(content_type):
+            return await self._load(key, content_type, loader, ttl)
+
+        if key in self._loads:
+            self._load_stats["coalesced"] += 1
+        # Shielded so a cancelled caller doesn't cancel the load other callers await
+        return await asyncio.shield(self._start_load(key, content_type, loader, ttl))
+
+    def _is_stale(self, entry: CacheEntry) -> bool:
+        """Whether an entry is in its content type's stale window before expiry."""
+        if entry.ttl <= 0:
+            return False
+        remaining = entry.created_at + entry.ttl - time.time()
+        return remaining <= self._stale_window(entry.content_type)
+
+    def _stale_window(self, content_type: str) -> int:
+        stale_mapping = {
+            "html": self.config.stale_html,
+            "image": self.config.stale_images,
+            "metadata": self.config.stale_metadata,
+            "robots": self.config.stale_robots,
+        }
+        return stale_mapping.get(content_type, 0)
+
+    def _coalesce(self, content_type: str) -> bool:
+        coalesce_mapping = {
+            "html": self.config.coalesce_html,
+            "image": self.config.coalesce_images,
+            "metadata": self.config.coalesce_metadata,
+            "robots": self.config.coalesce_robots,
+        }
+        return coalesce_mapping.get(content_type, False)
+
+    def _start_load(
+        self,
+        key: str,
+        content_type: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int | None,
+    ) -> asyncio.Future:
+        """The in-flight load of a key, starting one if there is none."""
+        task = self._loads.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, content_type, loader, ttl))
+            self._loads[key] = task
+            task.add_done_callback(functools.partial(self._load_done, key))
+        return task
+
+    def _load_done(self, key: str, task: asyncio.Future) -> None:
+        if self._loads.get(key) is task:
+            del self._loads[key]
+        # Retrieving the exception also keeps background failures from going unnoticed
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("Cache load failed", key=key, error=str(task.exception()))
+
+    async def _load(
+        self,
+        key: str,
+        content_type: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int | None,
+    ) -> Any:
+        """Call a loader and cache its result."""
+        self._load_stats["loads"] += 1
+        try:
+            value = await loader()
+        except Exception:
+            self._load_stats["failed"] += 1
+            raise
+        if value is not None:
+            await self._set_entry(key, value, ttl, content_type)
+        return value
 
     async def invalidate_url(self, url: str) -> bool:
         """Invalidate all cached data for a URL.
@@ -256,13 +460,12 @@ class CacheManager:
 
         # Delete HTML cache
         html_key = self._make_html_key(url)
-        backend = self._ensure_backend()
-        if await backend.delete(html_key):
+        if await self._delete_entry(html_key):
             deleted_any = True
 
         # Delete metadata cache
         metadata_key = self._make_metadata_key(url)
-        if await backend.delete(metadata_key):
+        if await self._delete_entry(metadata_key):
             deleted_any = True
 
         logger.debug("Invalidated cache for URL", url=url, deleted=deleted_any)
@@ -280,6 +483,12 @@ class CacheManager:
         backend = self._ensure_backend()
         stats = await backend.stats()
         stats["backend"] = self.config.backend.value
+        # Backend hits and misses only count lookups the memory tier missed
+        stats["l2"] = {
+            name: stats[name] for name in ("hits", "misses", "hit_rate") if name in stats
+        }
+        stats["l1"] = await self.memory.stats() if self.memory else None
+        stats["loads"] = {**self._load_stats, "in_flight": len(self._loads)}
         stats["config"] = {
             "ttl_html": self.config.ttl_html,
             "ttl_images": self.config.ttl_images,
@@ -300,6 +509,8 @@ class CacheManager:
             await self.initialize()
 
         backend = self._ensure_backend()
+        if self.memory:
+            await self.memory.cleanup_expired()
         return await backend.cleanup_expired()
 
     async def clear_cache(self) -> bool:
@@ -312,8 +523,70 @@ class CacheManager:
             await self.initialize()
 
         backend = self._ensure_backend()
+        if self.memory:
+            await self.memory.clear()
         return await backend.clear()
 
+    async def _get_entry(self, key: str) -> CacheEntry | None:
+        """Read an entry from the memory tier, then the backend, promoting backend hits."""
+        if self.memory:
+            entry = await self.memory.get(key)
+            if entry:
+                return entry
+
+        entry = await self._ensure_backend().get(key)
+        if entry and self.memory:
+            self.memory.put(entry)
+        return entry
+
+    async def _set_entry(self, key: str, value: Any, ttl: int | None, content_type: str) -> bool:
+        """Write an entry to the backend and the memory tier."""
+        if self.memory:
+            await self.memory.set(key, value, ttl, content_type)
+        return await self._ensure_backend().set(key, value, ttl, content_type)
+
+    async def _get_entries(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Read entries from the memory tier, then the rest from the backend in one call."""
+        keys = list(keys)
+        entries = await self.memory.get_many(keys) if self.memory else {}
+
+        missing = [key for key in keys if key not in entries]
+        if missing:
+            found = await self._ensure_backend().get_many(missing)
+            if self.memory:
+                for entry in found.values():
+                    self.memory.put(entry)
+            entries.update(found)
+        return entries
+
+    async def _set_entries(
+        self, values: Mapping[str, Any], ttl: int | None, content_type: str
+    ) -> bool:
+        """Write entries to the backend in one call, and to the memory tier."""
+        if not values:
+            return True
+        if self.memory:
+            await self.memory.set_many(values, ttl, content_type)
+        return await self._ensure_backend().set_many(values, ttl, content_type)
+
+    async def _delete_entry(self, key: str) -> bool:
+        """Delete an entry from both tiers."""
+        if self.memory:
+            await self.memory.delete(key)
+        return await self._ensure_backend().delete(key)
+
+    def _make_key(self, content_type: str, source: str) -> str:
+        """Create the cache key of a content type for a URL (or domain for robots.txt)."""
+        key_makers = {
+            "html": self._make_html_key,
+            "image": self._make_image_key,
+            "metadata": self._make_metadata_key,
+            "robots": self._make_robots_key,
+        }
+        if content_type not in key_makers:
+            raise ValueError(f"Unsupported cache content type: {content_type}")
+        return key_makers[content_type](source)
+
     def _make_html_key(self, url: str) -> str:
         """Create cache key for HTML content."""
         return f"html:{self._hash_url(url)}"
@@ -338,6 +611,9 @@ class CacheManager:
 
     async def shutdown(self) -> None:
         """Shutdown cache manager and backend."""
+        for task in list(self._loads.values()):
+            task.cancel()
+
         if self.backend:
             if hasattr(self.backend, "shutdown"):
                 await self.backend.shutdown()
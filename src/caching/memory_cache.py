@@ -0,0 +1,141 @@
+"""In-process memory cache backend, bounded by bytes and evicted least recently used."""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any
+
+from ..constants import CONSTANTS
+from .base import BaseCacheBackend, CacheConfig, CacheEntry
+
+
+class MemoryCache(BaseCacheBackend):
+    """In-process cache of deserialized entries.
+
+    Entries are kept until their own expiry or ``memory_tier_ttl`` after they
+    were stored, whichever comes first, and the least recently used are
+    evicted once the cached values exceed ``memory_tier_max_mb``. Used by the
+    cache manager as an L1 tier in front of the file or Redis backend, or on
+    its own as the memory backend.
+    """
+
+    def __init__(self, config: CacheConfig):
+        """Initialize memory cache.
+
+        Args:
+            config: Cache configuration
+        """
+        super().__init__(config)
+        self.max_bytes = config.memory_tier_max_mb * CONSTANTS.BYTES_PER_MB
+        self.max_age = config.memory_tier_ttl
+
+        # Entry, expiry time and size of every key, least recently used first
+        self._entries: OrderedDict[str, tuple[CacheEntry, float, int]] = OrderedDict()
+        self._total_size = 0
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "evictions": 0}
+
+    def put(self, entry: CacheEntry) -> bool:
+        """Store an entry as it is, keeping its creation time and TTL.
+
+        Args:
+            entry: Entry to store, e.g. one just read from a slower tier
+
+        Returns:
+            True if stored, False if the entry is larger than the whole cache
+        """
+        self._discard(entry.key)
+        size = entry.size_bytes or self._calculate_size(entry.value)
+        if size > self.max_bytes:
+            return False
+
+        expires_at = time.time() + self.max_age if self.max_age > 0 else float("inf")
+        if entry.ttl > 0:
+            expires_at = min(expires_at, entry.created_at + entry.ttl)
+        self._entries[entry.key] = (entry, expires_at, size)
+        self._total_size += size
+
+        while self._total_size > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._total_size -= evicted_size
+            self._stats["evictions"] += 1
+        return True
+
+    def _discard(self, key: str) -> bool:
+        stored = self._entries.pop(key, None)
+        if stored is None:
+            return False
+        self._total_size -= stored[2]
+        return True
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get a cache entry by key."""
+        stored = self._entries.get(key)
+        if stored is None or stored[1] <= time.time():
+            self._discard(key)
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        entry = stored[0]
+        if isinstance(entry.value, str | bytes):
+            return entry
+        # Callers must not be able to change the cached copy of a mutable value
+        return CacheEntry(**{**entry.to_dict(), "value": copy.deepcopy(entry.value)})
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, content_type: str = "generic"
+    ) -> bool:
+        """Set a cache entry."""
+        if ttl is None:
+            ttl = self.get_ttl_for_content_type(content_type)
+
+        if not isinstance(value, str | bytes):
+            value = copy.deepcopy(value)
+        stored = self.put(
+            CacheEntry(
+                key=key,
+                value=value,
+                created_at=time.time(),
+                ttl=ttl,
+                content_type=content_type,
+                size_bytes=self._calculate_size(value),
+            )
+        )
+        if stored:
+            self._stats["sets"] += 1
+        return stored
+
+    async def delete(self, key: str) -> bool:
+        """Delete a cache entry."""
+        deleted = self._discard(key)
+        if deleted:
+            self._stats["deletes"] += 1
+        return deleted
+
+    async def clear(self) -> bool:
+        """Clear all cache entries."""
+        self._entries.clear()
+        self._total_size = 0
+        self._stats = dict.fromkeys(self._stats, 0)
+        return True
+
+    async def stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self._stats,
+            "total_entries": len(self._entries),
+            "total_size_bytes": self._total_size,
+            "total_size_mb": round(self._total_size / CONSTANTS.BYTES_PER_MB, 2),
+            "max_size_mb": self.config.memory_tier_max_mb,
+            "hit_rate": (self._stats["hits"] / max(1, self._stats["hits"] + self._stats["misses"]))
+            * 100,
+        }
+
+    async def cleanup_expired(self) -> int:
+        """Clean up expired cache entries."""
+        now = time.time()
+        expired = [key for key, (_, expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            self._discard(key)
+        return len(expired)
@@ -1,6 +1,7 @@
 """Redis-based cache backend implementation."""
 
 import time
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
 import structlog
@@ -27,7 +28,13 @@ except ImportError:
 
 
 class RedisCache(BaseCacheBackend):
-    """Redis-based cache backend for high-performance caching."""
+    """Redis-based cache backend for high-performance caching.
+
+    The Redis server may be shared with other applications, so nothing here
+    walks the whole keyspace in one command: clearing iterates with ``SCAN``
+    and frees keys with ``UNLINK`` in batches, and statistics are estimated
+    from ``DBSIZE`` and one ``SCAN`` step instead of ``KEYS``.
+    """
 
     def __init__(self, config: CacheConfig):
         """Initialize Redis cache.
@@ -122,8 +129,7 @@ class RedisCache(BaseCacheBackend):
                 return None
 
             # Deserialize entry
-            entry_data = self._decompress_data(data, compressed=True)
-            entry = CacheEntry.from_dict(entry_data)
+            entry = self._deserialize_entry(data)
 
             # Redis TTL handling means we shouldn't get expired entries,
             # but check anyway for safety
@@ -141,6 +147,21 @@ class RedisCache(BaseCacheBackend):
             self.logger.warning("Cache get failed", key=key, error=str(e))
             return None
 
+    def _encode(
+        self, key: str, value: Any, ttl: int, content_type: str
+    ) -> tuple[CacheEntry, bytes]:
+        """Build and serialize the entry stored for a value."""
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            created_at=time.time(),
+            ttl=ttl,
+            content_type=content_type,
+            size_bytes=self._calculate_size(value),
+            compressed=self.config.compress,
+        )
+        return entry, self._serialize_entry(entry)
+
     async def set(
         self, key: str, value: Any, ttl: int | None = None, content_type: str = "generic"
     ) -> bool:
@@ -149,19 +170,8 @@ class RedisCache(BaseCacheBackend):
             if ttl is None:
                 ttl = self.get_ttl_for_content_type(content_type)
 
-            # Create cache entry
-            entry = CacheEntry(
-                key=key,
-                value=value,
-                created_at=time.time(),
-                ttl=ttl,
-                content_type=content_type,
-                size_bytes=self._calculate_size(value),
-                compressed=self.config.compress,
-            )
-
-            # Serialize and compress entry
-            entry_data = self._compress_data(entry.to_dict())
+            # Create, serialize and compress entry
+            entry, entry_data = self._encode(key, value, ttl, content_type)
 
             # Store in Redis
             client = await self._get_client()
@@ -182,6 +192,82 @@ class RedisCache(BaseCacheBackend):
             self.logger.error("Cache set failed", key=key, error=str(e))
             return False
 
+    async def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get several cache entries with a single ``MGET``.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Entries found, by key; missing and expired keys are left out
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        try:
+            client = await self._get_client()
+            values = await client.mget([self._make_redis_key(key) for key in keys])
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.warning("Cache get_many failed", keys=len(keys), error=str(e))
+            return {}
+
+        entries = {}
+        for key, data in zip(keys, values, strict=True):
+            entry = None
+            if data is not None:
+                try:
+                    entry = self._deserialize_entry(data)
+                except Exception as e:
+                    self._stats["errors"] += 1
+                    self.logger.warning("Cache entry unreadable", key=key, error=str(e))
+            if entry is None or entry.is_expired:
+                self._stats["misses"] += 1
+                continue
+            self._stats["hits"] += 1
+            entries[key] = entry
+        return entries
+
+    async def set_many(
+        self, values: Mapping[str, Any], ttl: int | None = None, content_type: str = "generic"
+    ) -> bool:
+        """Set several cache entries in one pipelined round trip.
+
+        Args:
+            values: Values to cache, by key
+            ttl: Time to live in seconds (the content type's TTL if None)
+            content_type: Type of content being cached
+
+        Returns:
+            True if every entry was stored
+        """
+        if not values:
+            return True
+
+        try:
+            if ttl is None:
+                ttl = self.get_ttl_for_content_type(content_type)
+
+            client = await self._get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    _, entry_data = self._encode(key, value, ttl, content_type)
+                    if ttl > 0:
+                        pipe.setex(self._make_redis_key(key), ttl, entry_data)
+                    else:
+                        pipe.set(self._make_redis_key(key), entry_data)
+                await pipe.execute()
+
+            self._stats["sets"] += len(values)
+            self.logger.debug("Cache set_many", keys=len(values), ttl=ttl)
+            return True
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.error("Cache set_many failed", keys=len(values), error=str(e))
+            return False
+
     async def delete(self, key: str) -> bool:
         """Delete a cache entry."""
         try:
@@ -201,17 +287,50 @@ class RedisCache(BaseCacheBackend):
             self.logger.error("Cache delete failed", key=key, error=str(e))
             return False
 
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several cache entries with a single ``UNLINK``.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of entries deleted
+        """
+        redis_keys = [self._make_redis_key(key) for key in dict.fromkeys(keys)]
+        if not redis_keys:
+            return 0
+
+        try:
+            client = await self._get_client()
+            deleted = await client.unlink(*redis_keys)
+            self._stats["deletes"] += deleted
+            self.logger.debug("Cache delete_many", keys=len(redis_keys), deleted=deleted)
+            return deleted
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.error("Cache delete_many failed", keys=len(redis_keys), error=str(e))
+            return 0
+
     async def clear(self) -> bool:
         """Clear all cache entries with our prefix."""
         try:
             client = await self._get_client()
 
-            # Find all keys with our prefix
+            # Walk our keys a SCAN step at a time and free them in the background
+            # with UNLINK, so other clients are never blocked for the whole walk
             pattern = f"{self.config.redis_key_prefix}*"
-            keys = await client.keys(pattern)
+            deleted = 0
+            batch = []
+            async for key in client.scan_iter(match=pattern, count=CONSTANTS.REDIS_SCAN_COUNT):
+                batch.append(key)
+                if len(batch) >= CONSTANTS.REDIS_SCAN_COUNT:
+                    deleted += await client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await client.unlink(*batch)
 
-            if keys:
-                deleted = await client.delete(*keys)
+            if deleted:
                 self.logger.info("Cache cleared", deleted_keys=deleted)
             else:
                 self.logger.info("Cache was already empty")
@@ -226,39 +345,54 @@ class RedisCache(BaseCacheBackend):
             self.logger.error("Cache clear failed", error=str(e))
             return False
 
+    async def _estimate_usage(self, client) -> tuple[int, int]:
+        """Estimate how many keys we hold and their memory from a sample.
+
+        Reads ``DBSIZE`` and a single ``SCAN`` step over the whole database:
+        the share of sampled keys with our prefix, scaled by ``DBSIZE``, gives
+        the entry count, and ``MEMORY USAGE`` of a few of them gives the
+        average size. If the step covered the whole database the count is exact.
+
+        Returns:
+            Estimated entry count and size in bytes
+        """
+        db_size = await client.dbsize()
+        cursor, sampled = await client.scan(0, count=CONSTANTS.REDIS_SCAN_COUNT)
+        prefix = self.config.redis_key_prefix.encode("utf-8")
+        ours = [key for key in sampled if bytes(key).startswith(prefix)]
+
+        if cursor == 0:
+            total_entries = len(ours)
+        else:
+            total_entries = round(db_size * len(ours) / max(1, len(sampled)))
+
+        if not ours:
+            return total_entries, 0
+
+        async with client.pipeline(transaction=False) as pipe:
+            for key in ours[: CONSTANTS.SAMPLE_KEY_COUNT]:
+                pipe.memory_usage(key)
+            usages = await pipe.execute(raise_on_error=False)
+
+        # Keys that expired since the SCAN report None; failed commands come back as errors
+        sizes = [usage for usage in usages if isinstance(usage, int)]
+        if not sizes:
+            return total_entries, 0
+        return total_entries, int(sum(sizes) / len(sizes) * total_entries)
+
     async def stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics.
+
+        Entry count and size are estimated from a sample, so polling stats
+        costs a few cheap commands however many keys the database holds.
+        """
         try:
             client = await self._get_client()
 
             # Get Redis info
             redis_info = await client.info()
 
-            # Count our keys
-            pattern = f"{self.config.redis_key_prefix}*"
-            keys = await client.keys(pattern)
-            total_entries = len(keys)
-
-            # Calculate total size (approximate)
-            total_size = 0
-            if keys:
-                # Sample a few keys to estimate average size
-                sample_keys = keys[: min(CONSTANTS.SAMPLE_KEY_COUNT, len(keys))]
-                sample_sizes = []
-
-                for key in sample_keys:
-                    try:
-                        data = await client.get(key)
-                        if data:
-                            sample_sizes.append(len(data))
-                    except (redis.RedisError, OSError) as e:
-                        # Skip keys that cause Redis errors or network issues
-                        logger.debug(f"Failed to sample key {key}: {e}")
-                        continue
-
-                if sample_sizes:
-                    avg_size = sum(sample_sizes) / len(sample_sizes)
-                    total_size = int(avg_size * total_entries)
+            total_entries, total_size = await self._estimate_usage(client)
 
             return {
                 **self._stats,
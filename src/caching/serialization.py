@@ -0,0 +1,179 @@
+"""Binary cache entry format shared by the file and Redis backends.
+
+An entry is a fixed header, the UTF-8 content type and key, then the payload::
+
+    magic "WPC" | version | value kind | codec | content type length | key length
+    | created_at (f64) | ttl (i64) | size_bytes (u64) | content type | key | payload
+
+Bytes and strings are stored raw (strings UTF-8 encoded); any other value is
+JSON. The codec is chosen per content type: images, which are already
+compressed, are stored as-is, so reading one is a single read of its bytes.
+"""
+
+import gzip
+import json
+import struct
+from collections.abc import Callable
+from enum import IntEnum
+from typing import Any
+
+from .base import CacheEntry
+
+# Optional zstd support
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None  # type: ignore[assignment]
+    ZSTD_AVAILABLE = False
+
+MAGIC = b"WPC"
+VERSION = 1
+HEADER = struct.Struct(">3sBBBBHdqQ")
+
+# Content types whose payloads are already compressed
+UNCOMPRESSED_CONTENT_TYPES = frozenset({"image"})
+
+
+class ValueKind(IntEnum):
+    """How an entry's payload encodes its value."""
+
+    BYTES = 0
+    TEXT = 1
+    JSON = 2
+
+
+class Codec(IntEnum):
+    """Compression applied to an entry's payload."""
+
+    NONE = 0
+    GZIP = 1
+    ZSTD = 2
+
+
+def choose_codec(content_type: str, compress: bool, compression: str) -> Codec:
+    """Codec for a content type.
+
+    Args:
+        content_type: Type of content being cached
+        compress: Whether compression is enabled at all
+        compression: Preferred codec, ``"zstd"`` or ``"gzip"`` (gzip if zstd is not installed)
+
+    Returns:
+        The codec to encode the entry with
+    """
+    if not compress or content_type in UNCOMPRESSED_CONTENT_TYPES:
+        return Codec.NONE
+    if compression == "zstd" and ZSTD_AVAILABLE:
+        return Codec.ZSTD
+    return Codec.GZIP
+
+
+def _compressor(codec: Codec) -> Callable[[bytes], bytes]:
+    if codec == Codec.GZIP:
+        return gzip.compress
+    if codec == Codec.ZSTD:
+        return zstandard.ZstdCompressor().compress
+    return bytes
+
+
+def _decompressor(codec: Codec) -> Callable[[bytes], bytes]:
+    if codec == Codec.GZIP:
+        return gzip.decompress
+    if codec == Codec.ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError("Cache entry is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress
+    return bytes
+
+
+def is_binary_entry(data: bytes) -> bool:
+    """Whether data is in the binary entry format rather than the legacy JSON one."""
+    return data[: len(MAGIC)] == MAGIC
+
+
+def encode_entry(
+    entry: CacheEntry, codec: Codec, json_default: Callable[[Any], Any] | None = None
+) -> bytes:
+    """Encode a cache entry.
+
+    Args:
+        entry: Entry to encode
+        codec: Compression for the payload
+        json_default: Serializer for values JSON can't encode natively
+
+    Returns:
+        The encoded entry
+    """
+    value = entry.value
+    if isinstance(value, bytes | bytearray | memoryview):
+        kind, payload = ValueKind.BYTES, bytes(value)
+    elif isinstance(value, str):
+        kind, payload = ValueKind.TEXT, value.encode("utf-8")
+    else:
+        kind, payload = ValueKind.JSON, json.dumps(value, default=json_default).encode("utf-8")
+
+    content_type = entry.content_type.encode("utf-8")
+    key = entry.key.encode("utf-8")
+    header = HEADER.pack(
+        MAGIC,
+        VERSION,
+        kind,
+        codec,
+        len(content_type),
+        len(key),
+        entry.created_at,
+        entry.ttl,
+        entry.size_bytes,
+    )
+    return b"".join((header, content_type, key, _compressor(codec)(payload)))
+
+
+def decode_entry(data: bytes, json_object_hook: Callable[[dict], Any] | None = None) -> CacheEntry:
+    """Decode a cache entry.
+
+    Args:
+        data: Encoded entry
+        json_object_hook: Deserializer for the custom types ``json_default`` encoded
+
+    Returns:
+        The decoded entry
+
+    Raises:
+        ValueError: If the data is not a valid entry
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Cache entry is truncated")
+    magic, version, kind, codec, type_length, key_length, created_at, ttl, size_bytes = (
+        HEADER.unpack_from(data)
+    )
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Unsupported cache entry format {magic!r} v{version}")
+
+    view = memoryview(data)
+    offset = HEADER.size
+    content_type = str(view[offset : offset + type_length], "utf-8")
+    offset += type_length
+    key = str(view[offset : offset + key_length], "utf-8")
+    offset += key_length
+
+    codec = Codec(codec)
+    payload = _decompressor(codec)(view[offset:])
+    kind = ValueKind(kind)
+    if kind == ValueKind.BYTES:
+        value: Any = payload
+    elif kind == ValueKind.TEXT:
+        value = str(payload, "utf-8")
+    else:
+        value = json.loads(payload, object_hook=json_object_hook)
+
+    return CacheEntry(
+        key=key,
+        value=value,
+        created_at=created_at,
+        ttl=ttl,
+        content_type=content_type,
+        size_bytes=size_bytes,
+        compressed=codec != Codec.NONE,
+    )
@@ -0,0 +1,510 @@
+"""SQLite cache backend for single-node deployments."""
+
+import asyncio
+import functools
+import math
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from ..constants import CONSTANTS
+from .base import BaseCacheBackend, CacheConfig, CacheEntry
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    key TEXT PRIMARY KEY,
+    content_type TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON cache_entries (expires_at);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_accessed_at ON cache_entries (accessed_at);
+"""
+
+# Most keys bound to one statement, below SQLite's variable limit on every version
+MAX_KEYS_PER_STATEMENT = 500
+
+# A write run on the writer thread, and the future its result is delivered to
+WriteOperation = tuple[Callable[[sqlite3.Connection], Any], asyncio.Future]
+
+
+def _chunks(keys: list[str]) -> Iterator[list[str]]:
+    for start in range(0, len(keys), MAX_KEYS_PER_STATEMENT):
+        yield keys[start : start + MAX_KEYS_PER_STATEMENT]
+
+
+def _placeholders(keys: list[str]) -> str:
+    return ", ".join("?" * len(keys))
+
+
+class SqliteCache(BaseCacheBackend):
+    """SQLite cache backend: one WAL-mode database instead of a file per entry.
+
+    Entries are stored in the binary entry format in a single table, indexed
+    by expiry time so ``cleanup_expired`` only visits expired rows, and by
+    last access time so the least recently used are evicted once the cache
+    outgrows ``max_cache_size_mb``. Statistics are a single aggregate query.
+
+    Reads run in worker threads on a shared connection; WAL mode lets them
+    proceed while a write commits. Every write goes through one dedicated
+    thread, which commits whatever has queued up since its last transaction
+    as one transaction. Access times of hits are kept in memory and written
+    with the next batch.
+    """
+
+    DATABASE_FILE = "cache.db"
+
+    def __init__(self, config: CacheConfig):
+        """Initialize SQLite cache and start its writer thread.
+
+        Args:
+            config: Cache configuration
+        """
+        super().__init__(config)
+        self.cache_dir = Path(config.cache_dir).resolve()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / self.DATABASE_FILE
+        self.max_bytes = config.max_cache_size_mb * CONSTANTS.BYTES_PER_MB
+
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
+
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._read_lock = threading.Lock()
+
+        # Access times of hits not yet written, by key
+        self._touched: dict[str, float] = {}
+        self._touch_lock = threading.Lock()
+
+        # Bytes stored, kept up to date by the writer thread
+        self._total_size: int = self._reader.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+        ).fetchone()[0]
+
+        self._queue: queue.SimpleQueue[WriteOperation | None] = queue.SimpleQueue()
+        self._closed = False
+        self._writer = threading.Thread(
+            target=self._write_loop, name="sqlite-cache-writer", daemon=True
+        )
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            self.db_path,
+            timeout=CONSTANTS.CACHE_SQLITE_BUSY_TIMEOUT,
+            isolation_level=None,  # Transactions are managed explicitly by the writer
+            check_same_thread=False,
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    # Writer thread
+
+    def _write_loop(self) -> None:
+        """Commit queued writes, batching everything queued during the previous commit."""
+        connection = self._connect()
+        try:
+            while True:
+                batch = [self._queue.get()]
+                while len(batch) < CONSTANTS.CACHE_SQLITE_BATCH_SIZE:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                self._commit(connection, [op for op in batch if op is not None])
+                if None in batch:
+                    return
+        finally:
+            connection.close()
+
+    def _commit(self, connection: sqlite3.Connection, batch: list[WriteOperation]) -> None:
+        """Run a batch of writes, pending access times and eviction in one transaction."""
+        results: list[tuple[Any, BaseException | None]] = []
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            self._write_touches(connection)
+            for operation, _ in batch:
+                try:
+                    results.append((operation(connection), None))
+                except sqlite3.Error as e:
+                    results.append((None, e))
+            self._evict(connection)
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            self.logger.error("Cache write transaction failed", writes=len(batch), error=str(e))
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            results = [(None, e)] * len(batch)
+            self._total_size = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache_entries"
+            ).fetchone()[0]
+
+        for (_, future), (result, error) in zip(batch, results, strict=True):
+            try:
+                future.get_loop().call_soon_threadsafe(self._resolve, future, result, error)
+            except RuntimeError:
+                # The caller's event loop has closed
+                continue
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Any, error: BaseException | None) -> None:
+        if future.done():
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def _write_touches(self, connection: sqlite3.Connection) -> None:
+        with self._touch_lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            connection.executemany(
+                "UPDATE cache_entries SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in touched.items()],
+            )
+
+    def _put_rows(
+        self, connection: sqlite3.Connection, rows: list[tuple[str, str, bytes, float]]
+    ) -> None:
+        now = time.time()
+        for key, content_type, data, expires_at in rows:
+            previous = connection.execute(
+                "SELECT size FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(key, content_type, value, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, content_type, data, len(data), expires_at, now),
+            )
+            self._total_size += len(data) - (previous[0] if previous else 0)
+
+    def _delete_keys(self, connection: sqlite3.Connection, keys: list[str]) -> int:
+        deleted = 0
+        for chunk in _chunks(keys):
+            where = f"WHERE key IN ({_placeholders(chunk)})"
+            count, freed = connection.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries {where}",  # noqa: S608
+                chunk,
+            ).fetchone()
+            connection.execute(f"DELETE FROM cache_entries {where}", chunk)  # noqa: S608
+            self._total_size -= freed
+            deleted += count
+        return deleted
+
+    def _delete_expired(self, connection: sqlite3.Connection, now: float) -> int:
+        count, freed = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries WHERE expires_at <= ?",
+            (now,),
+        ).fetchone()
+        connection.execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+        self._total_size -= freed
+        return count
+
+    def _delete_all(self, connection: sqlite3.Connection) -> None:
+        connection.execute("DELETE FROM cache_entries")
+        self._total_size = 0
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Evict least recently used entries once the cache outgrows its size limit.
+
+        Evicts down to ``CACHE_CLEANUP_RATIO`` of the limit, walking the access
+        time index from the oldest end.
+        """
+        if self._total_size <= self.max_bytes:
+            return
+
+        target_size = self.max_bytes * CONSTANTS.CACHE_CLEANUP_RATIO
+        size_before = self._total_size
+        removed = 0
+        while self._total_size > target_size:
+            rows = connection.execute(
+                "SELECT key, size FROM cache_entries ORDER BY accessed_at LIMIT ?",
+                (MAX_KEYS_PER_STATEMENT,),
+            ).fetchall()
+            if not rows:
+                break
+            excess = self._total_size - target_size
+            keys = []
+            for key, size in rows:
+                keys.append(key)
+                excess -= size
+                if excess <= 0:
+                    break
+            removed += self._delete_keys(connection, keys)
+
+        self.logger.info(
+            "Cache eviction completed",
+            removed_count=removed,
+            removed_size_mb=round((size_before - self._total_size) / CONSTANTS.BYTES_PER_MB, 2),
+            limit_mb=self.config.max_cache_size_mb,
+        )
+
+    async def _write(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Queue a write for the writer thread and wait for its transaction to commit."""
+        if self._closed:
+            raise RuntimeError("SQLite cache has been shut down")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put((operation, future))
+        return await future
+
+    # Reads
+
+    def _fetch(self, query: str, params: Iterable[Any]) -> list[tuple]:
+        with self._read_lock:
+            return self._reader.execute(query, tuple(params)).fetchall()
+
+    def _fetch_many(self, keys: list[str]) -> list[tuple]:
+        rows = []
+        for chunk in _chunks(keys):
+            rows += self._fetch(
+                "SELECT key, value, expires_at FROM cache_entries "  # noqa: S608
+                f"WHERE key IN ({_placeholders(chunk)})",
+                chunk,
+            )
+        return rows
+
+    def _accept_read(self, key: str, data: bytes, expires_at: float) -> CacheEntry | None:
+        """Deserialize a row just read, counting it as a hit unless it has expired.
+
+        Expired rows are left for ``cleanup_expired``, which removes them by index.
+        """
+        if expires_at <= time.time():
+            self._stats["misses"] += 1
+            return None
+
+        entry = self._deserialize_entry(data)
+        with self._touch_lock:
+            self._touched[key] = time.time()
+
+        self._stats["hits"] += 1
+        self.logger.debug("Cache hit", key=key, age_seconds=entry.age_seconds)
+        return entry
+
+    async def get(self, key: str) -> CacheEntry | None:
+        """Get a cache entry by key."""
+        try:
+            rows = await asyncio.to_thread(
+                self._fetch, "SELECT value, expires_at FROM cache_entries WHERE key = ?", (key,)
+            )
+            if not rows:
+                self._stats["misses"] += 1
+                return None
+            data, expires_at = rows[0]
+            return self._accept_read(key, data, expires_at)
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.warning("Cache get failed", key=key, error=str(e))
+            return None
+
+    async def get_many(self, keys: Iterable[str]) -> dict[str, CacheEntry]:
+        """Get several cache entries with one query per few hundred keys.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Entries found and not expired, by key
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+
+        try:
+            rows = await asyncio.to_thread(self._fetch_many, keys)
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.warning("Cache get_many failed", keys=len(keys), error=str(e))
+            return {}
+
+        entries = {}
+        for key, data, expires_at in rows:
+            try:
+                entry = self._accept_read(key, data, expires_at)
+            except Exception as e:
+                self._stats["errors"] += 1
+                self.logger.warning("Cache get failed", key=key, error=str(e))
+                continue
+            if entry:
+                entries[key] = entry
+        self._stats["misses"] += len(keys) - len(rows)
+        return entries
+
+    # Writes
+
+    def _encode_row(
+        self, key: str, value: Any, ttl: int, content_type: str
+    ) -> tuple[str, str, bytes, float]:
+        """Build and serialize the row stored for a value."""
+        entry = CacheEntry(
+            key=key,
+            value=value,
+            created_at=time.time(),
+            ttl=ttl,
+            content_type=content_type,
+            size_bytes=self._calculate_size(value),
+            compressed=self.config.compress,
+        )
+        expires_at = entry.created_at + ttl if ttl > 0 else math.inf
+        return key, content_type, self._serialize_entry(entry), expires_at
+
+    async def set(
+        self, key: str, value: Any, ttl: int | None = None, content_type: str = "generic"
+    ) -> bool:
+        """Set a cache entry."""
+        try:
+            if ttl is None:
+                ttl = self.get_ttl_for_content_type(content_type)
+
+            row = self._encode_row(key, value, ttl, content_type)
+            await self._write(functools.partial(self._put_rows, rows=[row]))
+
+            self._stats["sets"] += 1
+            self.logger.debug("Cache set", key=key, size_bytes=len(row[2]), ttl=ttl)
+            return True
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.error("Cache set failed", key=key, error=str(e))
+            return False
+
+    async def set_many(
+        self, values: Mapping[str, Any], ttl: int | None = None, content_type: str = "generic"
+    ) -> bool:
+        """Set several cache entries in a single transaction.
+
+        Args:
+            values: Values to cache, by key
+            ttl: Time to live in seconds (uses default if None)
+            content_type: Type of content being cached
+
+        Returns:
+            True if every entry was cached
+        """
+        if not values:
+            return True
+
+        try:
+            if ttl is None:
+                ttl = self.get_ttl_for_content_type(content_type)
+
+            rows = [
+                self._encode_row(key, value, ttl, content_type) for key, value in values.items()
+            ]
+            await self._write(functools.partial(self._put_rows, rows=rows))
+
+            self._stats["sets"] += len(rows)
+            self.logger.debug("Cache set_many", keys=len(rows), ttl=ttl)
+            return True
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.error("Cache set_many failed", keys=len(values), error=str(e))
+            return False
+
+    async def delete(self, key: str) -> bool:
+        """Delete a cache entry."""
+        return await self.delete_many([key]) > 0
+
+    async def delete_many(self, keys: Iterable[str]) -> int:
+        """Delete several cache entries in a single transaction.
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            Number of entries deleted
+        """
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return 0
+
+        try:
+            deleted = await self._write(functools.partial(self._delete_keys, keys=keys))
+            self._stats["deletes"] += deleted
+            if deleted:
+                self.logger.debug("Cache delete", keys=len(keys), deleted=deleted)
+            return deleted
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.error("Cache delete failed", keys=len(keys), error=str(e))
+            return 0
+
+    async def clear(self) -> bool:
+        """Clear all cache entries."""
+        try:
+            with self._touch_lock:
+                self._touched.clear()
+            await self._write(self._delete_all)
+
+            # Reset stats
+            self._stats = {"hits": 0, "misses": 0, "sets": 0, "deletes": 0, "errors": 0}
+
+            self.logger.info("Cache cleared")
+            return True
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            self.logger.error("Cache clear failed", error=str(e))
+            return False
+
+    async def stats(self) -> dict[str, Any]:
+        """Get cache statistics from a single aggregate query."""
+        try:
+            rows = await asyncio.to_thread(
+                self._fetch,
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(expires_at <= ?), 0) "
+                "FROM cache_entries",
+                (time.time(),),
+            )
+            total_entries, total_size, expired_entries = rows[0]
+
+            return {
+                **self._stats,
+                "total_entries": total_entries,
+                "expired_entries": expired_entries,
+                "total_size_bytes": total_size,
+                "total_size_mb": round(total_size / CONSTANTS.BYTES_PER_MB, 2),
+                "database": str(self.db_path),
+                "hit_rate": (
+                    self._stats["hits"] / max(1, self._stats["hits"] + self._stats["misses"])
+                )
+                * 100,
+            }
+
+        except Exception as e:
+            self.logger.error("Cache stats failed", error=str(e))
+            return {"error": str(e)}
+
+    async def cleanup_expired(self) -> int:
+        """Clean up expired cache entries using the expiry index."""
+        try:
+            cleaned = await self._write(functools.partial(self._delete_expired, now=time.time()))
+            if cleaned > 0:
+                self.logger.info("Cleaned up expired cache entries", count=cleaned)
+            return cleaned
+
+        except Exception as e:
+            self.logger.error("Cache cleanup failed", error=str(e))
+            return 0
+
+    async def shutdown(self) -> None:
+        """Commit pending writes and access times, then stop the writer and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        await asyncio.to_thread(self._writer.join)
+        with self._read_lock:
+            self._reader.close()
+        self.logger.info("SQLite cache closed", database=str(self.db_path))
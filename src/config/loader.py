@@ -171,6 +171,9 @@ class ConfigLoader:
                 "create_archives": False,
                 "archive_format": "zip",
                 "cleanup_after_archive": False,
+                "archive_compression_level": 6,
+                "stream_input": False,
+                "progress_mode": "auto",
             },
         }
 
@@ -48,7 +48,31 @@ DEFAULT_TTL: int = int(environ.get("DEFAULT_TTL", "1800"))  # 30 minutes
 CACHE_TTL_HTML: int = int(environ.get("CACHE_TTL_HTML", "1800"))  # 30 minutes for HTML
 CACHE_TTL_IMAGES: int = int(environ.get("CACHE_TTL_IMAGES", "86400"))  # 24 hours for images
 CACHE_TTL_METADATA: int = int(environ.get("CACHE_TTL_METADATA", "3600"))  # 1 hour for metadata
+# Stale-while-revalidate: in the last CACHE_STALE_* seconds before an entry expires,
+# CacheManager.get_or_load serves it and reloads it once in the background
+CACHE_STALE_HTML: int = int(environ.get("CACHE_STALE_HTML", "300"))
+CACHE_STALE_IMAGES: int = int(environ.get("CACHE_STALE_IMAGES", "3600"))
+CACHE_STALE_METADATA: int = int(environ.get("CACHE_STALE_METADATA", "600"))
+CACHE_STALE_ROBOTS: int = int(environ.get("CACHE_STALE_ROBOTS", "600"))
+# Single-flight: concurrent get_or_load misses for the same key await one loader call
+CACHE_COALESCE_HTML: bool = environ.get("CACHE_COALESCE_HTML", "true").lower() == "true"
+CACHE_COALESCE_IMAGES: bool = environ.get("CACHE_COALESCE_IMAGES", "true").lower() == "true"
+CACHE_COALESCE_METADATA: bool = environ.get("CACHE_COALESCE_METADATA", "true").lower() == "true"
+CACHE_COALESCE_ROBOTS: bool = environ.get("CACHE_COALESCE_ROBOTS", "true").lower() == "true"
 MAX_CACHE_SIZE_MB: int = int(environ.get("MAX_CACHE_SIZE_MB", "1000"))  # 1GB max cache
+# File cache access order is saved after this many changes (or one per entry, if more)
+CACHE_LRU_PERSIST_INTERVAL: int = int(environ.get("CACHE_LRU_PERSIST_INTERVAL", "1000"))
+# Cache entry compression - "gzip" or "zstd" (needs the zstandard package); images are stored raw
+CACHE_COMPRESSION: str = environ.get("CACHE_COMPRESSION", "gzip")
+# Optional in-process L1 cache tier in front of the file/Redis backend - bounded by size, and
+# entries are dropped CACHE_MEMORY_TIER_TTL seconds after they were stored even if still valid
+CACHE_MEMORY_TIER: bool = environ.get("CACHE_MEMORY_TIER", "false").lower() == "true"
+CACHE_MEMORY_TIER_MAX_MB: int = int(environ.get("CACHE_MEMORY_TIER_MAX_MB", "64"))
+CACHE_MEMORY_TIER_TTL: int = int(environ.get("CACHE_MEMORY_TIER_TTL", "300"))
+# SQLite cache backend - writes queued while a transaction commits are committed together,
+# up to CACHE_SQLITE_BATCH_SIZE per transaction
+CACHE_SQLITE_BATCH_SIZE: int = int(environ.get("CACHE_SQLITE_BATCH_SIZE", "256"))
+CACHE_SQLITE_BUSY_TIMEOUT: float = float(environ.get("CACHE_SQLITE_BUSY_TIMEOUT", "5.0"))
 REDIS_HOST: str = environ.get("REDIS_HOST", "localhost")
 REDIS_PORT: int = int(environ.get("REDIS_PORT", "6379"))
 REDIS_DB: int = int(environ.get("REDIS_DB", "0"))
@@ -58,6 +82,10 @@ REDIS_KEY_PREFIX: str = environ.get("REDIS_KEY_PREFIX", "wp_converter:")
 REDIS_SOCKET_CONNECT_TIMEOUT: float = float(environ.get("REDIS_SOCKET_CONNECT_TIMEOUT", "5.0"))
 REDIS_SOCKET_TIMEOUT: float = float(environ.get("REDIS_SOCKET_TIMEOUT", "5.0"))
 
+# Keys walked per SCAN step, and keys per UNLINK when clearing; the stats
+# estimate looks at one step of this many keys
+REDIS_SCAN_COUNT: int = int(environ.get("REDIS_SCAN_COUNT", "500"))
+
 # Robots.txt Configuration
 ROBOTS_CACHE_DURATION: int = int(environ.get("ROBOTS_CACHE_DURATION", "3600"))  # 1 hour
 RESPECT_ROBOTS_TXT: bool = environ.get("RESPECT_ROBOTS_TXT", "true").lower() == "true"
@@ -108,7 +136,9 @@ FILE_READ_BUFFER_SIZE: int = 1024  # Buffer size for file reading
 # HTTP Status codes
 HTTP_STATUS_OK: int = 200
 HTTP_STATUS_NOT_FOUND: int = 404
+HTTP_STATUS_TOO_MANY_REQUESTS: int = 429
 HTTP_STATUS_SERVER_ERROR: int = 500
+HTTP_STATUS_SERVICE_UNAVAILABLE: int = 503
 
 # API Error Messages
 ERROR_INTERNAL_SERVER: str = "Internal server error"
@@ -121,6 +151,83 @@ ALLOWED_ORIGINS_DEFAULT: str = environ.get(
     "ALLOWED_ORIGINS", "http://localhost:3000,http://localhost:4321"
 )
 
+# Job execution - "inline" runs conversions as FastAPI background tasks inside the API process,
+# "queue" leaves jobs PENDING for the standalone worker (python -m src.worker), which must be
+# deployed alongside the API
+JOB_EXECUTION_MODE: str = environ.get("JOB_EXECUTION_MODE", "inline").lower()
+
+# Standalone worker configuration
+WORKER_CONCURRENCY: int = int(environ.get("WORKER_CONCURRENCY", "4"))  # Jobs in flight
+WORKER_PROCESSES: int = int(environ.get("WORKER_PROCESSES", "0"))  # 0 = convert in-process
+WORKER_POLL_INTERVAL: float = float(environ.get("WORKER_POLL_INTERVAL", "2.0"))  # Seconds
+WORKER_MAX_TASKS_PER_CHILD: int = int(environ.get("WORKER_MAX_TASKS_PER_CHILD", "50"))
+WORKER_MEMORY_LIMIT_MB: int = int(environ.get("WORKER_MEMORY_LIMIT_MB", "0"))  # 0 = unlimited
+# Workers renew the lease on their running jobs every third of this; a RUNNING job whose lease
+# is older (its worker died) is claimed again
+WORKER_LEASE_SECONDS: float = float(environ.get("WORKER_LEASE_SECONDS", "300"))
+
+# Batch execution - jobs admitted beyond max_concurrent so a slot never waits on task creation
+BATCH_LOOKAHEAD: int = int(environ.get("BATCH_LOOKAHEAD", "2"))
+# Above this many jobs "auto" progress mode switches to aggregate-only display and NDJSON summaries
+BATCH_DETAILED_PROGRESS_LIMIT: int = int(environ.get("BATCH_DETAILED_PROGRESS_LIMIT", "100"))
+# Job status writes are buffered and flushed every N transitions or T milliseconds
+BATCH_DB_FLUSH_JOBS: int = int(environ.get("BATCH_DB_FLUSH_JOBS", "100"))
+BATCH_DB_FLUSH_INTERVAL_MS: int = int(environ.get("BATCH_DB_FLUSH_INTERVAL_MS", "250"))
+# Checkpoint journals are compacted once they hold this many lines per URL
+BATCH_JOURNAL_COMPACT_FACTOR: int = int(environ.get("BATCH_JOURNAL_COMPACT_FACTOR", "4"))
+# Adaptive (AIMD) batch concurrency, off by default - each domain's limit starts at
+# max_concurrent and moves between BATCH_MIN_CONCURRENT and BATCH_ADAPTIVE_MAX_CONCURRENT
+# (0 = max_concurrent), shrinking when p95 latency or timeouts exceed these bounds
+BATCH_ADAPTIVE_CONCURRENCY: bool = (
+    environ.get("BATCH_ADAPTIVE_CONCURRENCY", "false").lower() == "true"
+)
+BATCH_MIN_CONCURRENT: int = int(environ.get("BATCH_MIN_CONCURRENT", "1"))
+BATCH_ADAPTIVE_MAX_CONCURRENT: int = int(environ.get("BATCH_ADAPTIVE_MAX_CONCURRENT", "0"))
+BATCH_AIMD_DECREASE_FACTOR: float = float(environ.get("BATCH_AIMD_DECREASE_FACTOR", "0.5"))
+BATCH_AIMD_MAX_TIMEOUT_RATE: float = float(environ.get("BATCH_AIMD_MAX_TIMEOUT_RATE", "0.05"))
+BATCH_AIMD_MIN_SAMPLES: int = int(environ.get("BATCH_AIMD_MIN_SAMPLES", "10"))
+# Per-domain fair scheduling - jobs in flight per domain (0 = only the global limit applies)
+# and how many queued jobs are read ahead to find work for other domains. One domain may fill
+# at most BATCH_SCHEDULER_DOMAIN_SHARE of the window; its further jobs are set aside (up to
+# BATCH_SCHEDULER_SPILL in all) so reading continues to the jobs of other domains
+BATCH_PER_DOMAIN_CONCURRENCY: int = int(environ.get("BATCH_PER_DOMAIN_CONCURRENCY", "4"))
+BATCH_SCHEDULER_WINDOW: int = int(environ.get("BATCH_SCHEDULER_WINDOW", "1000"))
+BATCH_SCHEDULER_DOMAIN_SHARE: float = float(environ.get("BATCH_SCHEDULER_DOMAIN_SHARE", "0.1"))
+BATCH_SCHEDULER_SPILL: int = int(environ.get("BATCH_SCHEDULER_SPILL", "10000"))
+# Queued batch items gain one priority level per this many seconds of waiting (0 = no aging)
+BATCH_QUEUE_AGING_SECONDS: float = float(environ.get("BATCH_QUEUE_AGING_SECONDS", "900"))
+# URL deduplication - exact fingerprints up to DEDUP_EXACT_LIMIT URLs, then a Bloom filter
+# sized for DEDUP_EXPECTED_URLS at DEDUP_FALSE_POSITIVE_RATE
+DEDUP_EXACT_LIMIT: int = int(environ.get("DEDUP_EXACT_LIMIT", "100000"))
+DEDUP_EXPECTED_URLS: int = int(environ.get("DEDUP_EXPECTED_URLS", "10000000"))
+DEDUP_FALSE_POSITIVE_RATE: float = float(environ.get("DEDUP_FALSE_POSITIVE_RATE", "0.001"))
+# Seconds of a job's timeout held back from the deadline its stages see (at most 10%),
+# so a job that runs out of budget stops itself in time to keep partial results
+JOB_DEADLINE_GRACE: float = float(environ.get("JOB_DEADLINE_GRACE", "5.0"))
+# Request hedging - a page or image request still running at its host's observed
+# HEDGE_PERCENTILE latency gets one duplicate; hedges stay under HEDGE_BUDGET_PERCENT of requests
+HEDGE_REQUESTS: bool = environ.get("HEDGE_REQUESTS", "false").lower() == "true"
+HEDGE_PERCENTILE: float = float(environ.get("HEDGE_PERCENTILE", "0.95"))
+HEDGE_BUDGET_PERCENT: float = float(environ.get("HEDGE_BUDGET_PERCENT", "5.0"))
+HEDGE_MIN_SAMPLES: int = int(environ.get("HEDGE_MIN_SAMPLES", "20"))
+HEDGE_WINDOW: int = int(environ.get("HEDGE_WINDOW", "200"))
+# Retry budget - each successful request to a domain earns RETRY_BUDGET_RATIO retries for it,
+# with at most RETRY_BUDGET_MAX_TOKENS saved up, so retries stay a bounded share of traffic
+RETRY_BUDGET_RATIO: float = float(environ.get("RETRY_BUDGET_RATIO", "0.1"))
+RETRY_BUDGET_MAX_TOKENS: float = float(environ.get("RETRY_BUDGET_MAX_TOKENS", "10"))
+# Per-host circuit breakers - open after this many consecutive host failures, then hold the
+# host's jobs for the recovery timeout before letting probe requests through one at a time
+CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = int(environ.get("CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+CIRCUIT_BREAKER_RECOVERY_TIMEOUT: float = float(
+    environ.get("CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "60.0")
+)
+CIRCUIT_BREAKER_HALF_OPEN_CALLS: int = int(environ.get("CIRCUIT_BREAKER_HALF_OPEN_CALLS", "1"))
+CIRCUIT_BREAKER_MAX_HOSTS: int = int(environ.get("CIRCUIT_BREAKER_MAX_HOSTS", "10000"))
+# Domain throttling - a 429/503 holds its domain for its Retry-After (THROTTLE_DEFAULT_DELAY
+# without one), never longer than THROTTLE_MAX_DELAY; retries give up on longer Retry-After
+THROTTLE_DEFAULT_DELAY: float = float(environ.get("THROTTLE_DEFAULT_DELAY", "5.0"))
+THROTTLE_MAX_DELAY: float = float(environ.get("THROTTLE_MAX_DELAY", "300.0"))
+
 # Timeout configurations
 ROBOTS_TIMEOUT: int = int(environ.get("ROBOTS_TIMEOUT", "10"))  # Robots.txt fetch timeout
 
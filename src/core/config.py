@@ -18,6 +18,7 @@ class ConverterConfig:
     rate_limit_delay: float = CONSTANTS.RATE_LIMIT_DELAY
     max_retries: int = CONSTANTS.MAX_RETRIES
     backoff_factor: float = CONSTANTS.BACKOFF_FACTOR
+    hedge_requests: bool = CONSTANTS.HEDGE_REQUESTS
 
     # User Agent - using centralized constant
     user_agent: str = CONSTANTS.DEFAULT_USER_AGENT
@@ -1,7 +1,8 @@
 """Async WordPress to Shopify content converter using aiohttp."""
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
@@ -13,7 +14,9 @@ from ..constants import CONSTANTS, PROGRESS_CONSTANTS
 from ..processors.html_processor import HTMLProcessor
 from ..processors.image_downloader import AsyncImageDownloader
 from ..processors.metadata_extractor import MetadataExtractor
-from ..utils.retry import with_retry
+from ..utils.deadline import current_deadline, deadline_scope
+from ..utils.hedging import request_hedger
+from ..utils.retry import circuit_breakers, with_retry
 from ..utils.robots import robots_checker
 from .config import ConverterConfig
 from .config import config as default_config
@@ -22,6 +25,15 @@ from .exceptions import ConversionError, FetchError, ProcessingError, SaveError
 logger = structlog.get_logger(__name__)
 
 
+@dataclass
+class ConversionResult:
+    """Outcome of a finished conversion."""
+
+    images_total: int = 0
+    images_downloaded: int = 0
+    partial: bool = False  # Content saved, but the deadline stopped image downloads
+
+
 class AsyncWordPressConverter:
     """Async WordPress to Shopify content converter."""
 
@@ -42,7 +54,9 @@ class AsyncWordPressConverter:
         self.html_processor = HTMLProcessor()
         self.metadata_extractor = MetadataExtractor(self.base_url)
         self.image_downloader = AsyncImageDownloader(
-            self.images_dir, max_concurrent=self.config.max_concurrent_downloads
+            self.images_dir,
+            max_concurrent=self.config.max_concurrent_downloads,
+            hedge_requests=self.config.hedge_requests,
         )
 
         logger.info(
@@ -92,7 +106,7 @@ class AsyncWordPressConverter:
         except OSError as e:
             raise ConversionError(f"Failed to create directories: {e}")
 
-    @with_retry()
+    @with_retry(budget_key=lambda converter, *_: converter.base_url)
     async def _fetch_content(self, session: aiohttp.ClientSession) -> str:
         """Fetch webpage content using aiohttp.
 
@@ -104,6 +118,7 @@ class AsyncWordPressConverter:
 
         Raises:
             FetchError: If fetching fails
+            RateLimitError: If the host's circuit breaker is open
         """
         try:
             logger.info("Fetching content", url=self.base_url)
@@ -113,9 +128,18 @@ class AsyncWordPressConverter:
 
             from ..utils.http import safe_http_get_with_raise
 
-            content = await safe_http_get_with_raise(
-                session, self.base_url, timeout=self.config.default_timeout
-            )
+            def fetch() -> Awaitable[str]:
+                return safe_http_get_with_raise(
+                    session, self.base_url, timeout=self.config.default_timeout
+                )
+
+            # Fail fast while the host's circuit is open instead of running the retry schedule
+            async with circuit_breakers.breaker_for(self.base_url):
+                # A fetch still running at the host's p95 gets one duplicate request
+                if self.config.hedge_requests:
+                    content = await request_hedger.run(self.base_url, fetch)
+                else:
+                    content = await fetch()
 
             logger.info("Successfully fetched content", url=self.base_url, size=len(content))
 
@@ -259,15 +283,33 @@ class AsyncWordPressConverter:
             None, lambda: path.write_text(content, encoding="utf-8")
         )
 
-    async def convert(self, progress_callback: Callable[[int], None] | None = None) -> None:
+    async def convert(
+        self,
+        progress_callback: Callable[[int], None] | None = None,
+        budget: float | None = None,
+    ) -> ConversionResult:
         """Main conversion method with progress tracking.
 
+        With a ``budget``, robots.txt, the page fetch, retries and image
+        downloads all share one deadline. Content is saved before images are
+        downloaded, so running out of budget during images still returns a
+        partial result instead of failing the conversion.
+
         Args:
             progress_callback: Optional callback for progress updates (0-100)
+            budget: Optional latency budget in seconds for the whole conversion
+
+        Returns:
+            Conversion result with image counts and whether it is partial
 
         Raises:
             ConversionError: If conversion fails
         """
+        with deadline_scope(budget):
+            return await self._convert(progress_callback)
+
+    async def _convert(self, progress_callback: Callable[[int], None] | None) -> ConversionResult:
+        """Run the conversion stages under the current deadline."""
         try:
             logger.info("Starting async conversion", url=self.base_url)
 
@@ -308,24 +350,43 @@ class AsyncWordPressConverter:
                 if progress_callback:
                     progress_callback(70)
 
-                # Download images concurrently
-                if image_urls:
-                    await self.image_downloader.download_all(
+                # Download images concurrently with whatever budget is left
+                deadline = current_deadline()
+                downloaded: list[str] = []
+                partial = False
+                if image_urls and deadline is not None and deadline.expired:
+                    partial = True
+                    logger.warning(
+                        "Skipping image downloads - job deadline exceeded",
+                        url=self.base_url,
+                        images=len(image_urls),
+                    )
+                elif image_urls:
+                    downloaded = await self.image_downloader.download_all(
                         session,
                         image_urls,
-                        progress_callback=lambda p: progress_callback(70 + int(p * 0.3))
-                        if progress_callback
-                        else None,
+                        progress_callback=lambda p: (
+                            progress_callback(70 + int(p * 0.3)) if progress_callback else None
+                        ),
                     )
+                    partial = self.image_downloader.last_cancelled > 0
 
                 if progress_callback:
                     progress_callback(PROGRESS_CONSTANTS.COMPLETE)
 
+            result = ConversionResult(
+                images_total=len(image_urls),
+                images_downloaded=len(downloaded),
+                partial=partial,
+            )
             logger.info(
                 "Conversion completed successfully",
                 output_dir=str(self.output_dir),
-                images_downloaded=len(image_urls),
+                images_downloaded=result.images_downloaded,
+                images_total=result.images_total,
+                partial=result.partial,
             )
+            return result
 
         except ConversionError:
             raise
@@ -42,6 +42,12 @@ class RateLimitError(ConversionError):
     pass
 
 
+class DeadlineExceededError(TimeoutError):
+    """Exception raised when a job's latency budget is spent."""
+
+    pass
+
+
 class ConfigurationError(ConversionError):
     """Exception raised for configuration-related errors."""
 
@@ -0,0 +1,712 @@
+"""Async database service for use inside the event loop.
+
+``AsyncDatabaseService`` mirrors ``DatabaseService`` on an ``AsyncSession``
+factory. By default it uses the API's asyncpg engine from
+``src.api.dependencies`` so the batch subsystem and the API share one
+non-blocking connection pool.
+"""
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import structlog
+from sqlalchemy import func, insert, select, text, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..core.exceptions import DatabaseError
+from . import queries
+from .models import Batch, ContentResult, JobLog, JobStatus, ScrapingJob, SystemMetrics
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncDatabaseService:
+    """Non-blocking counterpart of ``DatabaseService``.
+
+    Every operation has the same name, arguments and error handling as the
+    synchronous service, but is a coroutine executed on an async engine.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession] | None = None):
+        """Initialize the async database service.
+
+        Args:
+            session_factory: Async session factory, defaults to the API's shared factory
+        """
+        if session_factory is None:
+            from ..api.dependencies import async_session
+
+            session_factory = async_session
+
+        self.SessionLocal = session_factory
+
+    @property
+    def engine(self):
+        """Async engine the session factory is bound to."""
+        return self.SessionLocal.kw.get("bind")
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[AsyncSession]:
+        """Async context manager for database sessions with automatic cleanup.
+
+        Yields:
+            AsyncSession with transaction management
+        """
+        session = self.SessionLocal()
+        try:
+            yield session
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            logger.error("Database session error, rolling back", error=str(e))
+            raise
+        finally:
+            await session.close()
+
+    # Job Management Operations
+
+    async def create_job(
+        self,
+        url: str,
+        output_directory: str,
+        domain: str | None = None,
+        slug: str | None = None,
+        batch_id: int | None = None,
+        priority: str = "normal",
+        **kwargs,
+    ) -> ScrapingJob:
+        """Create a new scraping job.
+
+        Args:
+            url: URL to scrape
+            output_directory: Directory for output files
+            domain: Domain name (auto-extracted if not provided)
+            slug: URL slug (auto-extracted if not provided)
+            batch_id: Optional batch ID for grouping
+            priority: Job priority level
+            **kwargs: Additional job configuration
+
+        Returns:
+            Created ScrapingJob instance
+
+        Raises:
+            DatabaseError: If job creation fails
+        """
+        try:
+            async with self.get_session() as session:
+                derived_domain, derived_slug = queries.derive_domain_and_slug(url)
+                domain = domain or derived_domain
+                if not slug and not kwargs.get("custom_slug"):
+                    slug = derived_slug
+
+                job = ScrapingJob(
+                    url=url,
+                    domain=domain,
+                    slug=slug,
+                    output_directory=output_directory,
+                    batch_id=batch_id,
+                    priority=queries.coerce_priority(priority),
+                    **kwargs,
+                )
+
+                session.add(job)
+                await session.flush()
+
+                logger.info("Created scraping job", job_id=job.id, url=url, domain=domain)
+                return job
+
+        except IntegrityError as e:
+            logger.error("Job creation failed - integrity constraint", url=url, error=str(e))
+            raise DatabaseError(f"Job creation failed: {e}") from e
+        except SQLAlchemyError as e:
+            logger.error("Job creation failed - database error", url=url, error=str(e))
+            raise DatabaseError(f"Job creation failed: {e}") from e
+
+    async def create_jobs_bulk(
+        self,
+        urls: list[str],
+        output_directory: str,
+        batch_id: int | None = None,
+        priorities: list[str] | None = None,
+    ) -> list[int]:
+        """Create many scraping jobs with multi-row INSERT statements.
+
+        Args:
+            urls: URLs to scrape
+            output_directory: Directory for output files
+            batch_id: Optional batch ID for grouping
+            priorities: Optional priority level per URL, parallel to ``urls``
+
+        Returns:
+            Created job IDs in the same order as ``urls``
+
+        Raises:
+            DatabaseError: If job creation fails
+        """
+        if not urls:
+            return []
+        if priorities is not None and len(priorities) != len(urls):
+            raise ValueError("priorities must have one entry per URL")
+
+        rows = [
+            queries.job_row(url, output_directory, batch_id, priorities[i] if priorities else None)
+            for i, url in enumerate(urls)
+        ]
+
+        try:
+            async with self.get_session() as session:
+                stmt = insert(ScrapingJob).returning(ScrapingJob.id, sort_by_parameter_order=True)
+                job_ids = list((await session.execute(stmt, rows)).scalars())
+
+            logger.info("Created scraping jobs in bulk", count=len(job_ids), batch_id=batch_id)
+            return job_ids
+
+        except SQLAlchemyError as e:
+            logger.error("Bulk job creation failed", count=len(urls), error=str(e))
+            raise DatabaseError(f"Bulk job creation failed: {e}") from e
+
+    async def get_job(self, job_id: int) -> ScrapingJob | None:
+        """Retrieve a job by ID.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            ScrapingJob instance or None if not found
+        """
+        try:
+            async with self.get_session() as session:
+                return await session.get(ScrapingJob, job_id)
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve job", job_id=job_id, error=str(e))
+            raise DatabaseError(f"Job retrieval failed: {e}") from e
+
+    async def update_job_status(
+        self,
+        job_id: int,
+        status: JobStatus,
+        error_message: str | None = None,
+        duration: float | None = None,
+    ) -> bool:
+        """Update job status with optional error and timing information.
+
+        Args:
+            job_id: Job identifier
+            status: New job status
+            error_message: Optional error message for failed jobs
+            duration: Optional execution duration in seconds
+
+        Returns:
+            True if update successful, False if job not found
+        """
+        try:
+            async with self.get_session() as session:
+                values = queries.status_update_values(
+                    status, datetime.now(UTC), error_message, duration
+                )
+                result = await session.execute(
+                    update(ScrapingJob).where(ScrapingJob.id == job_id).values(**values)
+                )
+
+                success = result.rowcount > 0
+                if not success:
+                    logger.warning("Job not found for status update", job_id=job_id)
+                return success
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to update job status", job_id=job_id, error=str(e))
+            raise DatabaseError(f"Job status update failed: {e}") from e
+
+    async def apply_job_updates(
+        self,
+        updates: list[dict[str, Any]],
+        batch_deltas: dict[int, dict[JobStatus, int]] | None = None,
+    ) -> None:
+        """Apply buffered job status changes and batch counter increments.
+
+        Args:
+            updates: Column values per job; each dict must include ``id``
+            batch_deltas: Per-batch count of jobs that reached each final status
+
+        Raises:
+            DatabaseError: If the update fails
+        """
+        try:
+            async with self.get_session() as session:
+                if updates:
+                    await session.execute(update(ScrapingJob), updates)
+
+                for batch_id, deltas in (batch_deltas or {}).items():
+                    stmt = queries.batch_counter_increment(batch_id, deltas)
+                    if stmt is not None:
+                        await session.execute(stmt)
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to apply job updates", jobs=len(updates), error=str(e))
+            raise DatabaseError(f"Job update flush failed: {e}") from e
+
+    async def get_pending_jobs(self, limit: int = 100) -> list[ScrapingJob]:
+        """Retrieve pending jobs ordered by priority and creation time.
+
+        Args:
+            limit: Maximum number of jobs to retrieve
+
+        Returns:
+            List of pending ScrapingJob instances
+        """
+        try:
+            async with self.get_session() as session:
+                result = await session.execute(queries.pending_jobs_query(limit))
+                return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve pending jobs", error=str(e))
+            raise DatabaseError(f"Pending jobs retrieval failed: {e}") from e
+
+    async def get_jobs_by_status(
+        self, status: JobStatus, limit: int = 100, offset: int = 0
+    ) -> list[ScrapingJob]:
+        """Retrieve jobs by status with pagination.
+
+        Args:
+            status: Job status to filter by
+            limit: Maximum number of jobs to retrieve
+            offset: Number of jobs to skip
+
+        Returns:
+            List of ScrapingJob instances
+        """
+        try:
+            async with self.get_session() as session:
+                result = await session.execute(queries.jobs_by_status_query(status, limit, offset))
+                return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve jobs by status", status=status.value, error=str(e))
+            raise DatabaseError(f"Jobs retrieval failed: {e}") from e
+
+    async def get_retry_jobs(self, max_jobs: int = 50) -> list[ScrapingJob]:
+        """Retrieve failed jobs eligible for retry.
+
+        Args:
+            max_jobs: Maximum number of jobs to retrieve
+
+        Returns:
+            List of ScrapingJob instances ready for retry
+        """
+        try:
+            async with self.get_session() as session:
+                stmt = queries.retry_jobs_query(max_jobs, datetime.now(UTC))
+                result = await session.execute(stmt)
+                return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve retry jobs", error=str(e))
+            raise DatabaseError(f"Retry jobs retrieval failed: {e}") from e
+
+    # Batch Management Operations
+
+    async def create_batch(
+        self,
+        name: str,
+        description: str | None = None,
+        output_base_directory: str = "batch_output",
+        **config,
+    ) -> Batch:
+        """Create a new batch processing operation.
+
+        Args:
+            name: Batch name
+            description: Optional description
+            output_base_directory: Base directory for batch outputs
+            **config: Additional batch configuration
+
+        Returns:
+            Created Batch instance
+        """
+        try:
+            async with self.get_session() as session:
+                batch = Batch(
+                    name=name,
+                    description=description,
+                    output_base_directory=output_base_directory,
+                    batch_config=config,
+                    **{k: v for k, v in config.items() if k in queries.BATCH_MODEL_FIELDS},
+                )
+
+                session.add(batch)
+                await session.flush()
+
+                logger.info("Created batch", batch_id=batch.id, name=name)
+                return batch
+
+        except SQLAlchemyError as e:
+            logger.error("Batch creation failed", name=name, error=str(e))
+            raise DatabaseError(f"Batch creation failed: {e}") from e
+
+    async def get_batch(self, batch_id: int) -> Batch | None:
+        """Retrieve a batch by ID.
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            Batch instance or None if not found
+        """
+        try:
+            async with self.get_session() as session:
+                result = await session.execute(select(Batch).where(Batch.id == batch_id))
+                return result.scalar_one_or_none()
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve batch", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Batch retrieval failed: {e}") from e
+
+    async def get_batch_jobs(
+        self, batch_id: int, statuses: list[JobStatus] | None = None
+    ) -> list[ScrapingJob]:
+        """Retrieve the jobs of a batch, optionally filtered by status.
+
+        Args:
+            batch_id: Batch identifier
+            statuses: Only return jobs in one of these statuses
+
+        Returns:
+            List of ScrapingJob instances ordered by ID
+        """
+        try:
+            async with self.get_session() as session:
+                result = await session.execute(queries.batch_jobs_query(batch_id, statuses))
+                return list(result.scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve batch jobs", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Batch jobs retrieval failed: {e}") from e
+
+    async def update_batch_progress(self, batch_id: int) -> bool:
+        """Update batch progress counters based on current job statuses.
+
+        Args:
+            batch_id: Batch identifier
+
+        Returns:
+            True if update successful, False if batch not found
+        """
+        try:
+            async with self.get_session() as session:
+                counts = (await session.execute(queries.batch_job_counts_query(batch_id))).one()
+                result = await session.execute(
+                    update(Batch)
+                    .where(Batch.id == batch_id)
+                    .values(
+                        total_jobs=counts.total,
+                        completed_jobs=counts.completed,
+                        failed_jobs=counts.failed,
+                        skipped_jobs=counts.skipped,
+                    )
+                )
+                return result.rowcount > 0
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to update batch progress", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Batch progress update failed: {e}") from e
+
+    async def get_batches(
+        self,
+        statuses: list[JobStatus] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[Batch]:
+        """Retrieve batches, optionally filtered by status and creation window.
+
+        Args:
+            statuses: Only return batches in one of these statuses
+            created_from: Only return batches created at or after this time
+            created_to: Only return batches created at or before this time
+
+        Returns:
+            List of Batch instances ordered by ID
+        """
+        try:
+            async with self.get_session() as session:
+                stmt = queries.batches_query(statuses, created_from, created_to)
+                return list((await session.execute(stmt)).scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve batches", error=str(e))
+            raise DatabaseError(f"Batches retrieval failed: {e}") from e
+
+    async def requeue_jobs(self, batch_id: int, job_ids: list[int]) -> int:
+        """Put failed jobs of a batch back to PENDING and mark the batch running.
+
+        Args:
+            batch_id: Batch identifier
+            job_ids: Jobs to requeue; only the failed ones are changed
+
+        Returns:
+            Number of jobs requeued
+        """
+        try:
+            async with self.get_session() as session:
+                result = await session.execute(queries.requeue_jobs_statement(batch_id, job_ids))
+                await session.execute(
+                    update(Batch).where(Batch.id == batch_id).values(status=JobStatus.RUNNING)
+                )
+
+                logger.info("Requeued batch jobs", batch_id=batch_id, count=result.rowcount)
+                return result.rowcount
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to requeue batch jobs", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Job requeue failed: {e}") from e
+
+    # Content and Logging Operations
+
+    async def save_content_result(
+        self,
+        job_id: int,
+        html_content: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        file_paths: dict[str, str] | None = None,
+        **kwargs,
+    ) -> ContentResult:
+        """Save converted content and metadata for a job.
+
+        Args:
+            job_id: Associated job ID
+            html_content: Converted HTML content
+            metadata: Extracted metadata dictionary
+            file_paths: Dictionary of file paths (html, metadata, images)
+            **kwargs: Additional content result data
+
+        Returns:
+            Created ContentResult instance
+        """
+        try:
+            async with self.get_session() as session:
+                content_result = ContentResult(job_id=job_id, converted_html=html_content, **kwargs)
+
+                if metadata:
+                    content_result.title = metadata.get("title")
+                    content_result.meta_description = metadata.get("meta_description")
+                    content_result.author = metadata.get("author")
+                    content_result.tags = metadata.get("tags")
+                    content_result.categories = metadata.get("categories")
+                    content_result.extra_metadata = metadata
+
+                if file_paths:
+                    content_result.html_file_path = file_paths.get("html")
+                    content_result.metadata_file_path = file_paths.get("metadata")
+                    content_result.images_directory = file_paths.get("images")
+
+                session.add(content_result)
+                await session.flush()
+                return content_result
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to save content result", job_id=job_id, error=str(e))
+            raise DatabaseError(f"Content result save failed: {e}") from e
+
+    async def add_job_log(
+        self,
+        job_id: int,
+        level: str,
+        message: str,
+        component: str | None = None,
+        operation: str | None = None,
+        context_data: dict[str, Any] | None = None,
+    ) -> JobLog | None:
+        """Add a log entry for a job.
+
+        Args:
+            job_id: Associated job ID
+            level: Log level (INFO, WARN, ERROR, DEBUG)
+            message: Log message
+            component: Component that generated the log
+            operation: Operation being performed
+            context_data: Additional structured context
+
+        Returns:
+            Created JobLog instance, or None if it could not be saved
+        """
+        try:
+            async with self.get_session() as session:
+                log_entry = JobLog(
+                    job_id=job_id,
+                    level=level.upper(),
+                    message=message,
+                    component=component,
+                    operation=operation,
+                    context_data=context_data,
+                )
+                session.add(log_entry)
+                await session.flush()
+                return log_entry
+
+        except Exception as e:
+            logger.error("Failed to add job log", job_id=job_id, error=str(e))
+            # Don't raise here - logging failures shouldn't break the main process
+            return None
+
+    async def record_system_metric(
+        self,
+        metric_type: str,
+        metric_name: str,
+        numeric_value: float | None = None,
+        string_value: str | None = None,
+        json_value: dict[str, Any] | None = None,
+        component: str = "batch_processing",
+    ) -> None:
+        """Record a system metric.
+
+        Args:
+            metric_type: Type of metric (performance, error, batch, etc.)
+            metric_name: Name of the metric
+            numeric_value: Numeric value if applicable
+            string_value: String value if applicable
+            json_value: JSON value if applicable
+            component: Component name
+        """
+        try:
+            async with self.get_session() as session:
+                session.add(
+                    SystemMetrics(
+                        timestamp=datetime.now(UTC),
+                        metric_type=metric_type,
+                        metric_name=metric_name,
+                        numeric_value=numeric_value,
+                        string_value=string_value,
+                        json_value=json_value,
+                        component=component,
+                    )
+                )
+        except SQLAlchemyError as e:
+            logger.error("Failed to record system metric", metric=metric_name, error=str(e))
+            raise DatabaseError(f"System metric recording failed: {e}") from e
+
+    # Statistics and Monitoring
+
+    async def get_job_statistics(self, days: int = 7) -> dict[str, Any]:
+        """Get job statistics for the specified time period.
+
+        Args:
+            days: Number of days to analyze
+
+        Returns:
+            Dictionary with comprehensive job statistics
+        """
+        try:
+            async with self.get_session() as session:
+                cutoff_date = datetime.now(UTC) - timedelta(days=days)
+                stats = (await session.execute(queries.job_statistics_query(cutoff_date))).one()
+                return queries.job_statistics_summary(stats, days)
+        except SQLAlchemyError as e:
+            logger.error("Failed to get job statistics", error=str(e))
+            raise DatabaseError(f"Statistics retrieval failed: {e}") from e
+
+    async def get_jobs(
+        self,
+        statuses: list[JobStatus] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        started_before: datetime | None = None,
+    ) -> list[ScrapingJob]:
+        """Retrieve jobs filtered by status, creation window and start time.
+
+        Args:
+            statuses: Only return jobs in one of these statuses
+            created_from: Only return jobs created at or after this time
+            created_to: Only return jobs created at or before this time
+            started_before: Only return jobs started before this time
+
+        Returns:
+            List of ScrapingJob instances ordered by ID
+        """
+        try:
+            async with self.get_session() as session:
+                stmt = queries.jobs_query(statuses, created_from, created_to, started_before)
+                return list((await session.execute(stmt)).scalars().all())
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve jobs", error=str(e))
+            raise DatabaseError(f"Jobs retrieval failed: {e}") from e
+
+    async def get_job_status_counts(self, batch_id: int | None = None) -> dict[JobStatus, int]:
+        """Count jobs per status.
+
+        Args:
+            batch_id: Only count jobs of this batch
+
+        Returns:
+            Job count for every status, zero when a status has no jobs
+        """
+        try:
+            async with self.get_session() as session:
+                counts = dict.fromkeys(JobStatus, 0)
+                counts.update(
+                    (await session.execute(queries.job_status_counts_query(batch_id))).all()
+                )
+                return counts
+        except SQLAlchemyError as e:
+            logger.error("Failed to count jobs by status", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Job status count failed: {e}") from e
+
+    async def check_connection(self) -> bool:
+        """Run a trivial query to verify the database is reachable.
+
+        Returns:
+            True if the query succeeded
+
+        Raises:
+            DatabaseError: If the database cannot be queried
+        """
+        try:
+            async with self.get_session() as session:
+                await session.execute(text("SELECT 1"))
+                return True
+        except SQLAlchemyError as e:
+            logger.error("Database connection check failed", error=str(e))
+            raise DatabaseError(f"Database connection check failed: {e}") from e
+
+    async def cleanup_old_jobs(self, days: int = 30) -> int:
+        """Clean up completed jobs older than specified days.
+
+        Args:
+            days: Age threshold in days
+
+        Returns:
+            Number of jobs cleaned up
+        """
+        try:
+            async with self.get_session() as session:
+                old_jobs = queries.old_jobs_condition(datetime.now(UTC) - timedelta(days=days))
+                deleted_count = (
+                    await session.execute(select(func.count(ScrapingJob.id)).where(old_jobs))
+                ).scalar()
+                await session.execute(
+                    update(ScrapingJob).where(old_jobs).values(status=JobStatus.CANCELLED)
+                )
+
+                logger.info("Cleaned up old jobs", deleted_count=deleted_count, days=days)
+                return deleted_count
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to cleanup old jobs", error=str(e))
+            raise DatabaseError(f"Job cleanup failed: {e}") from e
+
+
+async def call_service(method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Call a database service method without blocking the event loop.
+
+    Coroutine methods (``AsyncDatabaseService``) are awaited directly;
+    synchronous ones (``DatabaseService``) run in a worker thread.
+
+    Args:
+        method: Bound service method
+        *args: Positional arguments for the method
+        **kwargs: Keyword arguments for the method
+
+    Returns:
+        Whatever the method returns
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(*args, **kwargs)
+    return await asyncio.to_thread(method, *args, **kwargs)
@@ -0,0 +1,298 @@
+"""Statements and row builders shared by the sync and async database services.
+
+Keeping query construction here means ``DatabaseService`` and
+``AsyncDatabaseService`` only differ in how they execute statements.
+"""
+
+from datetime import datetime
+from typing import Any
+from urllib.parse import urlparse
+
+from sqlalchemy import Select, Update, and_, case, desc, func, or_, select, update
+
+from .models import Batch, JobPriority, JobStatus, ScrapingJob
+
+# Final statuses that have a dedicated counter column on Batch
+BATCH_COUNTERS = {
+    JobStatus.COMPLETED: Batch.completed_jobs,
+    JobStatus.FAILED: Batch.failed_jobs,
+    JobStatus.SKIPPED: Batch.skipped_jobs,
+}
+
+# Batch model columns that may be passed straight through from batch config
+BATCH_MODEL_FIELDS = frozenset(
+    {
+        "max_concurrent",
+        "continue_on_error",
+        "create_archives",
+        "cleanup_after_archive",
+        "total_jobs",
+        "completed_jobs",
+        "failed_jobs",
+        "skipped_jobs",
+        "summary_data",
+    }
+)
+
+PRIORITY_RANK = {
+    JobPriority.URGENT: 4,
+    JobPriority.HIGH: 3,
+    JobPriority.NORMAL: 2,
+    JobPriority.LOW: 1,
+}
+
+
+def derive_domain_and_slug(url: str) -> tuple[str, str]:
+    """Extract the domain and last path segment (or "homepage") from a URL."""
+    parsed = urlparse(url)
+    path_parts = parsed.path.strip("/").split("/")
+    return parsed.netloc, path_parts[-1] if path_parts[-1] else "homepage"
+
+
+def coerce_priority(priority: str | JobPriority | None) -> JobPriority:
+    """Convert a priority name to JobPriority, defaulting to NORMAL."""
+    if isinstance(priority, JobPriority):
+        return priority
+    try:
+        return JobPriority(priority.lower()) if priority else JobPriority.NORMAL
+    except ValueError:
+        return JobPriority.NORMAL
+
+
+def job_row(
+    url: str,
+    output_directory: str,
+    batch_id: int | None = None,
+    priority: str | JobPriority | None = None,
+) -> dict[str, Any]:
+    """Column values for a new job, used by bulk inserts."""
+    domain, slug = derive_domain_and_slug(url)
+    return {
+        "url": url,
+        "domain": domain,
+        "slug": slug,
+        "output_directory": output_directory,
+        "batch_id": batch_id,
+        "priority": coerce_priority(priority),
+    }
+
+
+def status_update_values(
+    status: JobStatus,
+    now: datetime,
+    error_message: str | None = None,
+    duration: float | None = None,
+) -> dict[str, Any]:
+    """Column values for a job status transition."""
+    values: dict[str, Any] = {"status": status}
+
+    if status == JobStatus.RUNNING:
+        values["started_at"] = now
+    elif status in {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.SKIPPED, JobStatus.CANCELLED}:
+        values["completed_at"] = now
+        if duration is not None:
+            values["duration_seconds"] = duration
+        if error_message:
+            values["error_message"] = error_message
+
+    return values
+
+
+def batch_counter_increment(batch_id: int, deltas: dict[JobStatus, int]) -> Update | None:
+    """UPDATE that adds per-status job counts to a batch's counters in place."""
+    values = {
+        BATCH_COUNTERS[status]: BATCH_COUNTERS[status] + count
+        for status, count in deltas.items()
+        if status in BATCH_COUNTERS and count
+    }
+    if not values:
+        return None
+    return update(Batch).where(Batch.id == batch_id).values(values)
+
+
+def pending_jobs_query(limit: int, lease_expired_before: datetime | None = None) -> Select:
+    """Pending jobs ordered by priority then creation time.
+
+    Args:
+        limit: Maximum number of jobs
+        lease_expired_before: Also include RUNNING jobs whose worker lease was last
+            renewed before this time
+    """
+    runnable = ScrapingJob.status == JobStatus.PENDING
+    if lease_expired_before is not None:
+        runnable = or_(
+            runnable,
+            and_(
+                ScrapingJob.status == JobStatus.RUNNING,
+                ScrapingJob.claimed_at < lease_expired_before,
+            ),
+        )
+    return (
+        select(ScrapingJob)
+        .where(runnable)
+        .order_by(
+            desc(
+                case(
+                    *[(ScrapingJob.priority == k, v) for k, v in PRIORITY_RANK.items()],
+                    else_=0,
+                )
+            ),
+            ScrapingJob.created_at,
+        )
+        .limit(limit)
+    )
+
+
+def jobs_by_status_query(status: JobStatus, limit: int, offset: int) -> Select:
+    """Jobs in a status, newest first."""
+    return (
+        select(ScrapingJob)
+        .where(ScrapingJob.status == status)
+        .order_by(desc(ScrapingJob.created_at))
+        .limit(limit)
+        .offset(offset)
+    )
+
+
+def retry_jobs_query(max_jobs: int, now: datetime) -> Select:
+    """Failed jobs with retries left whose backoff has elapsed."""
+    return (
+        select(ScrapingJob)
+        .where(
+            and_(
+                ScrapingJob.status == JobStatus.FAILED,
+                ScrapingJob.retry_count < ScrapingJob.max_retries,
+                or_(
+                    ScrapingJob.next_retry_at.is_(None),
+                    ScrapingJob.next_retry_at <= now,
+                ),
+            )
+        )
+        .order_by(ScrapingJob.next_retry_at.asc().nullsfirst())
+        .limit(max_jobs)
+    )
+
+
+def batch_job_counts_query(batch_id: int) -> Select:
+    """Total, completed, failed and skipped job counts for a batch."""
+    return select(
+        func.count(ScrapingJob.id).label("total"),
+        func.sum(case((ScrapingJob.status == JobStatus.COMPLETED, 1), else_=0)).label("completed"),
+        func.sum(case((ScrapingJob.status == JobStatus.FAILED, 1), else_=0)).label("failed"),
+        func.sum(case((ScrapingJob.status == JobStatus.SKIPPED, 1), else_=0)).label("skipped"),
+    ).where(ScrapingJob.batch_id == batch_id)
+
+
+def batch_jobs_query(batch_id: int, statuses: list[JobStatus] | None = None) -> Select:
+    """Jobs belonging to a batch, optionally filtered by status."""
+    stmt = select(ScrapingJob).where(ScrapingJob.batch_id == batch_id)
+    if statuses:
+        stmt = stmt.where(ScrapingJob.status.in_(statuses))
+    return stmt.order_by(ScrapingJob.id)
+
+
+def batches_query(
+    statuses: list[JobStatus] | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+) -> Select:
+    """Batches, optionally filtered by status and creation window, oldest first."""
+    stmt = select(Batch)
+    if statuses:
+        stmt = stmt.where(Batch.status.in_(statuses))
+    if created_from is not None:
+        stmt = stmt.where(Batch.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(Batch.created_at <= created_to)
+    return stmt.order_by(Batch.id)
+
+
+def jobs_query(
+    statuses: list[JobStatus] | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    started_before: datetime | None = None,
+) -> Select:
+    """Jobs filtered by status, creation window and start time, oldest first."""
+    stmt = select(ScrapingJob)
+    if statuses:
+        stmt = stmt.where(ScrapingJob.status.in_(statuses))
+    if created_from is not None:
+        stmt = stmt.where(ScrapingJob.created_at >= created_from)
+    if created_to is not None:
+        stmt = stmt.where(ScrapingJob.created_at <= created_to)
+    if started_before is not None:
+        stmt = stmt.where(ScrapingJob.started_at < started_before)
+    return stmt.order_by(ScrapingJob.id)
+
+
+def job_status_counts_query(batch_id: int | None = None) -> Select:
+    """Number of jobs per status, for one batch or all jobs."""
+    stmt = select(ScrapingJob.status, func.count(ScrapingJob.id)).group_by(ScrapingJob.status)
+    if batch_id is not None:
+        stmt = stmt.where(ScrapingJob.batch_id == batch_id)
+    return stmt
+
+
+def requeue_jobs_statement(batch_id: int, job_ids: list[int]) -> Update:
+    """UPDATE that puts failed jobs of a batch back to PENDING for another attempt."""
+    return (
+        update(ScrapingJob)
+        .where(
+            ScrapingJob.batch_id == batch_id,
+            ScrapingJob.id.in_(job_ids),
+            ScrapingJob.status == JobStatus.FAILED,
+        )
+        .values(
+            status=JobStatus.PENDING,
+            error_message=None,
+            error_type=None,
+            retry_count=ScrapingJob.retry_count + 1,
+        )
+    )
+
+
+def job_statistics_query(cutoff_date: datetime) -> Select:
+    """Aggregate job statistics since a cutoff date."""
+    return select(
+        func.count(ScrapingJob.id).label("total_jobs"),
+        func.count(ScrapingJob.id)
+        .filter(ScrapingJob.status == JobStatus.COMPLETED)
+        .label("completed_jobs"),
+        func.count(ScrapingJob.id)
+        .filter(ScrapingJob.status == JobStatus.FAILED)
+        .label("failed_jobs"),
+        func.count(ScrapingJob.id)
+        .filter(ScrapingJob.status == JobStatus.PENDING)
+        .label("pending_jobs"),
+        func.avg(ScrapingJob.duration_seconds).label("avg_duration"),
+        func.sum(ScrapingJob.content_size_bytes).label("total_content_size"),
+        func.sum(ScrapingJob.images_downloaded).label("total_images"),
+    ).where(ScrapingJob.created_at >= cutoff_date)
+
+
+def job_statistics_summary(stats: Any, days: int) -> dict[str, Any]:
+    """Turn a ``job_statistics_query`` row into the statistics dictionary."""
+    success_rate = 0.0
+    if stats.total_jobs > 0:
+        success_rate = (stats.completed_jobs / stats.total_jobs) * 100
+
+    return {
+        "period_days": days,
+        "total_jobs": stats.total_jobs or 0,
+        "completed_jobs": stats.completed_jobs or 0,
+        "failed_jobs": stats.failed_jobs or 0,
+        "pending_jobs": stats.pending_jobs or 0,
+        "success_rate_percent": round(success_rate, 2),
+        "avg_duration_seconds": float(stats.avg_duration or 0),
+        "total_content_size_bytes": stats.total_content_size or 0,
+        "total_images_downloaded": stats.total_images or 0,
+    }
+
+
+def old_jobs_condition(cutoff_date: datetime):
+    """Finished jobs that completed before the cutoff date."""
+    return and_(
+        ScrapingJob.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
+        ScrapingJob.completed_at < cutoff_date,
+    )
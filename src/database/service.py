@@ -9,11 +9,12 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import structlog
-from sqlalchemy import and_, case, desc, func, or_, select, update
+from sqlalchemy import func, insert, select, text, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import sessionmaker
 
 from ..core.exceptions import DatabaseError
+from . import queries
 from .models import (
     Base,
     Batch,
@@ -205,29 +206,10 @@ class DatabaseService:
         try:
             with self.get_session() as session:
                 # Auto-extract domain and slug if not provided
-                if not domain:
-                    from urllib.parse import urlparse
-
-                    parsed = urlparse(url)
-                    domain = parsed.netloc
-
+                derived_domain, derived_slug = queries.derive_domain_and_slug(url)
+                domain = domain or derived_domain
                 if not slug and not kwargs.get("custom_slug"):
-                    from urllib.parse import urlparse
-
-                    parsed = urlparse(url)
-                    path_parts = parsed.path.strip("/").split("/")
-                    slug = path_parts[-1] if path_parts and path_parts[-1] else "homepage"
-
-                # Convert string priority to enum if needed
-                from .models import JobPriority
-
-                if isinstance(priority, str):
-                    try:
-                        priority_enum = JobPriority(priority.lower())
-                    except ValueError:
-                        priority_enum = JobPriority.NORMAL
-                else:
-                    priority_enum = priority
+                    slug = derived_slug
 
                 job = ScrapingJob(
                     url=url,
@@ -235,7 +217,7 @@ class DatabaseService:
                     slug=slug,
                     output_directory=output_directory,
                     batch_id=batch_id,
-                    priority=priority_enum,
+                    priority=queries.coerce_priority(priority),
                     **kwargs,
                 )
 
@@ -296,17 +278,9 @@ class DatabaseService:
         """
         try:
             with self.get_session() as session:
-                now = datetime.now(UTC)
-                update_data: dict[str, Any] = {"status": status}
-
-                if status == JobStatus.RUNNING:
-                    update_data["started_at"] = now
-                elif status in {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED}:
-                    update_data["completed_at"] = now
-                    if duration is not None:
-                        update_data["duration_seconds"] = duration
-                    if error_message:
-                        update_data["error_message"] = error_message
+                update_data = queries.status_update_values(
+                    status, datetime.now(UTC), error_message, duration
+                )
 
                 result = session.execute(
                     update(ScrapingJob).where(ScrapingJob.id == job_id).values(**update_data)
@@ -324,6 +298,89 @@ class DatabaseService:
             logger.error("Failed to update job status", job_id=job_id, error=str(e))
             raise DatabaseError(f"Job status update failed: {e}") from e
 
+    def create_jobs_bulk(
+        self,
+        urls: list[str],
+        output_directory: str,
+        batch_id: int | None = None,
+        priorities: list[str] | None = None,
+    ) -> list[int]:
+        """Create many scraping jobs with multi-row INSERT statements.
+
+        Domain and slug are derived the same way as in ``create_job``.
+
+        Args:
+            urls: URLs to scrape
+            output_directory: Directory for output files
+            batch_id: Optional batch ID for grouping
+            priorities: Optional priority level per URL, parallel to ``urls``
+
+        Returns:
+            Created job IDs in the same order as ``urls``
+
+        Raises:
+            DatabaseError: If job creation fails
+        """
+        if not urls:
+            return []
+        if priorities is not None and len(priorities) != len(urls):
+            raise ValueError("priorities must have one entry per URL")
+
+        rows = [
+            queries.job_row(url, output_directory, batch_id, priorities[i] if priorities else None)
+            for i, url in enumerate(urls)
+        ]
+
+        try:
+            with self.get_session() as session:
+                stmt = insert(ScrapingJob).returning(ScrapingJob.id, sort_by_parameter_order=True)
+                job_ids = list(session.execute(stmt, rows).scalars())
+
+            logger.info("Created scraping jobs in bulk", count=len(job_ids), batch_id=batch_id)
+            return job_ids
+
+        except SQLAlchemyError as e:
+            logger.error("Bulk job creation failed", count=len(urls), error=str(e))
+            raise DatabaseError(f"Bulk job creation failed: {e}") from e
+
+    def apply_job_updates(
+        self,
+        updates: list[dict[str, Any]],
+        batch_deltas: dict[int, dict[JobStatus, int]] | None = None,
+    ) -> None:
+        """Apply buffered job status changes and batch counter increments.
+
+        Everything is written in one transaction: job rows are updated with a
+        single executemany keyed on primary key, and batch counters are
+        incremented in place rather than re-aggregated from the jobs table.
+
+        Args:
+            updates: Column values per job; each dict must include ``id``
+            batch_deltas: Per-batch count of jobs that reached each final status
+
+        Raises:
+            DatabaseError: If the update fails
+        """
+        try:
+            with self.get_session() as session:
+                if updates:
+                    session.execute(update(ScrapingJob), updates)
+
+                for batch_id, deltas in (batch_deltas or {}).items():
+                    stmt = queries.batch_counter_increment(batch_id, deltas)
+                    if stmt is not None:
+                        session.execute(stmt)
+
+            logger.debug(
+                "Applied buffered job updates",
+                jobs=len(updates),
+                batches=len(batch_deltas or {}),
+            )
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to apply job updates", jobs=len(updates), error=str(e))
+            raise DatabaseError(f"Job update flush failed: {e}") from e
+
     def get_pending_jobs(self, limit: int = 100) -> list[ScrapingJob]:
         """Retrieve pending jobs for processing.
 
@@ -336,32 +393,7 @@ class DatabaseService:
         try:
             with self.get_session() as session:
                 # Order by priority (URGENT -> HIGH -> NORMAL -> LOW) then by creation time
-                from .models import JobPriority
-
-                priority_order = {
-                    JobPriority.URGENT: 4,
-                    JobPriority.HIGH: 3,
-                    JobPriority.NORMAL: 2,
-                    JobPriority.LOW: 1,
-                }
-
-                stmt = (
-                    select(ScrapingJob)
-                    .where(ScrapingJob.status == JobStatus.PENDING)
-                    .order_by(
-                        desc(
-                            case(
-                                *[
-                                    (ScrapingJob.priority == k, v)
-                                    for k, v in priority_order.items()
-                                ],
-                                else_=0,
-                            )
-                        ),
-                        ScrapingJob.created_at,
-                    )
-                    .limit(limit)
-                )
+                stmt = queries.pending_jobs_query(limit)
 
                 jobs = session.execute(stmt).scalars().all()
 
@@ -387,13 +419,7 @@ class DatabaseService:
         """
         try:
             with self.get_session() as session:
-                stmt = (
-                    select(ScrapingJob)
-                    .where(ScrapingJob.status == status)
-                    .order_by(desc(ScrapingJob.created_at))
-                    .limit(limit)
-                    .offset(offset)
-                )
+                stmt = queries.jobs_by_status_query(status, limit, offset)
 
                 jobs = session.execute(stmt).scalars().all()
                 return list(jobs)
@@ -413,23 +439,7 @@ class DatabaseService:
         """
         try:
             with self.get_session() as session:
-                now = datetime.now(UTC)
-
-                stmt = (
-                    select(ScrapingJob)
-                    .where(
-                        and_(
-                            ScrapingJob.status == JobStatus.FAILED,
-                            ScrapingJob.retry_count < ScrapingJob.max_retries,
-                            or_(
-                                ScrapingJob.next_retry_at.is_(None),
-                                ScrapingJob.next_retry_at <= now,
-                            ),
-                        )
-                    )
-                    .order_by(ScrapingJob.next_retry_at.asc().nullsfirst())
-                    .limit(max_jobs)
-                )
+                stmt = queries.retry_jobs_query(max_jobs, datetime.now(UTC))
 
                 jobs = session.execute(stmt).scalars().all()
 
@@ -463,18 +473,9 @@ class DatabaseService:
         try:
             with self.get_session() as session:
                 # Extract valid Batch model fields from config
-                valid_batch_fields = {
-                    "max_concurrent",
-                    "continue_on_error",
-                    "create_archives",
-                    "cleanup_after_archive",
-                    "total_jobs",
-                    "completed_jobs",
-                    "failed_jobs",
-                    "skipped_jobs",
-                    "summary_data",
+                batch_model_params = {
+                    k: v for k, v in config.items() if k in queries.BATCH_MODEL_FIELDS
                 }
-                batch_model_params = {k: v for k, v in config.items() if k in valid_batch_fields}
 
                 batch = Batch(
                     name=name,
@@ -520,6 +521,27 @@ class DatabaseService:
             logger.error("Failed to retrieve batch", batch_id=batch_id, error=str(e))
             raise DatabaseError(f"Batch retrieval failed: {e}") from e
 
+    def get_batch_jobs(
+        self, batch_id: int, statuses: list[JobStatus] | None = None
+    ) -> list[ScrapingJob]:
+        """Retrieve the jobs of a batch, optionally filtered by status.
+
+        Args:
+            batch_id: Batch identifier
+            statuses: Only return jobs in one of these statuses
+
+        Returns:
+            List of ScrapingJob instances ordered by ID
+        """
+        try:
+            with self.get_session() as session:
+                jobs = session.execute(queries.batch_jobs_query(batch_id, statuses)).scalars().all()
+                return list(jobs)
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve batch jobs", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Batch jobs retrieval failed: {e}") from e
+
     def update_batch_progress(self, batch_id: int) -> bool:
         """Update batch progress counters based on current job statuses.
 
@@ -532,18 +554,7 @@ class DatabaseService:
         try:
             with self.get_session() as session:
                 # Get current job counts using case statements for conditional counting
-                counts_stmt = select(
-                    func.count(ScrapingJob.id).label("total"),
-                    func.sum(case((ScrapingJob.status == JobStatus.COMPLETED, 1), else_=0)).label(
-                        "completed"
-                    ),
-                    func.sum(case((ScrapingJob.status == JobStatus.FAILED, 1), else_=0)).label(
-                        "failed"
-                    ),
-                    func.sum(case((ScrapingJob.status == JobStatus.SKIPPED, 1), else_=0)).label(
-                        "skipped"
-                    ),
-                ).where(ScrapingJob.batch_id == batch_id)
+                counts_stmt = queries.batch_job_counts_query(batch_id)
 
                 counts = session.execute(counts_stmt).one()
 
@@ -578,6 +589,55 @@ class DatabaseService:
             logger.error("Failed to update batch progress", batch_id=batch_id, error=str(e))
             raise DatabaseError(f"Batch progress update failed: {e}") from e
 
+    def get_batches(
+        self,
+        statuses: list[JobStatus] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+    ) -> list[Batch]:
+        """Retrieve batches, optionally filtered by status and creation window.
+
+        Args:
+            statuses: Only return batches in one of these statuses
+            created_from: Only return batches created at or after this time
+            created_to: Only return batches created at or before this time
+
+        Returns:
+            List of Batch instances ordered by ID
+        """
+        try:
+            with self.get_session() as session:
+                stmt = queries.batches_query(statuses, created_from, created_to)
+                return list(session.execute(stmt).scalars().all())
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve batches", error=str(e))
+            raise DatabaseError(f"Batches retrieval failed: {e}") from e
+
+    def requeue_jobs(self, batch_id: int, job_ids: list[int]) -> int:
+        """Put failed jobs of a batch back to PENDING and mark the batch running.
+
+        Args:
+            batch_id: Batch identifier
+            job_ids: Jobs to requeue; only the failed ones are changed
+
+        Returns:
+            Number of jobs requeued
+        """
+        try:
+            with self.get_session() as session:
+                result = session.execute(queries.requeue_jobs_statement(batch_id, job_ids))
+                session.execute(
+                    update(Batch).where(Batch.id == batch_id).values(status=JobStatus.RUNNING)
+                )
+
+                logger.info("Requeued batch jobs", batch_id=batch_id, count=result.rowcount)
+                return result.rowcount
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to requeue batch jobs", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Job requeue failed: {e}") from e
+
     # Content and Logging Operations
 
     def save_content_result(
@@ -692,45 +752,79 @@ class DatabaseService:
                 cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
                 # Overall statistics
-                stats_stmt = select(
-                    func.count(ScrapingJob.id).label("total_jobs"),
-                    func.count(ScrapingJob.id)
-                    .filter(ScrapingJob.status == JobStatus.COMPLETED)
-                    .label("completed_jobs"),
-                    func.count(ScrapingJob.id)
-                    .filter(ScrapingJob.status == JobStatus.FAILED)
-                    .label("failed_jobs"),
-                    func.count(ScrapingJob.id)
-                    .filter(ScrapingJob.status == JobStatus.PENDING)
-                    .label("pending_jobs"),
-                    func.avg(ScrapingJob.duration_seconds).label("avg_duration"),
-                    func.sum(ScrapingJob.content_size_bytes).label("total_content_size"),
-                    func.sum(ScrapingJob.images_downloaded).label("total_images"),
-                ).where(ScrapingJob.created_at >= cutoff_date)
-
+                stats_stmt = queries.job_statistics_query(cutoff_date)
                 stats = session.execute(stats_stmt).one()
 
-                # Calculate success rate
-                success_rate = 0.0
-                if stats.total_jobs > 0:
-                    success_rate = (stats.completed_jobs / stats.total_jobs) * 100
-
-                return {
-                    "period_days": days,
-                    "total_jobs": stats.total_jobs or 0,
-                    "completed_jobs": stats.completed_jobs or 0,
-                    "failed_jobs": stats.failed_jobs or 0,
-                    "pending_jobs": stats.pending_jobs or 0,
-                    "success_rate_percent": round(success_rate, 2),
-                    "avg_duration_seconds": float(stats.avg_duration or 0),
-                    "total_content_size_bytes": stats.total_content_size or 0,
-                    "total_images_downloaded": stats.total_images or 0,
-                }
+                return queries.job_statistics_summary(stats, days)
 
         except SQLAlchemyError as e:
             logger.error("Failed to get job statistics", error=str(e))
             raise DatabaseError(f"Statistics retrieval failed: {e}") from e
 
+    def get_jobs(
+        self,
+        statuses: list[JobStatus] | None = None,
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        started_before: datetime | None = None,
+    ) -> list[ScrapingJob]:
+        """Retrieve jobs filtered by status, creation window and start time.
+
+        Args:
+            statuses: Only return jobs in one of these statuses
+            created_from: Only return jobs created at or after this time
+            created_to: Only return jobs created at or before this time
+            started_before: Only return jobs started before this time
+
+        Returns:
+            List of ScrapingJob instances ordered by ID
+        """
+        try:
+            with self.get_session() as session:
+                stmt = queries.jobs_query(statuses, created_from, created_to, started_before)
+                return list(session.execute(stmt).scalars().all())
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to retrieve jobs", error=str(e))
+            raise DatabaseError(f"Jobs retrieval failed: {e}") from e
+
+    def get_job_status_counts(self, batch_id: int | None = None) -> dict[JobStatus, int]:
+        """Count jobs per status.
+
+        Args:
+            batch_id: Only count jobs of this batch
+
+        Returns:
+            Job count for every status, zero when a status has no jobs
+        """
+        try:
+            with self.get_session() as session:
+                counts = dict.fromkeys(JobStatus, 0)
+                counts.update(session.execute(queries.job_status_counts_query(batch_id)).all())
+                return counts
+
+        except SQLAlchemyError as e:
+            logger.error("Failed to count jobs by status", batch_id=batch_id, error=str(e))
+            raise DatabaseError(f"Job status count failed: {e}") from e
+
+    def check_connection(self) -> bool:
+        """Run a trivial query to verify the database is reachable.
+
+        Returns:
+            True if the query succeeded
+
+        Raises:
+            DatabaseError: If the database cannot be queried
+        """
+        try:
+            with self.get_session() as session:
+                session.execute(text("SELECT 1"))
+                return True
+
+        except SQLAlchemyError as e:
+            logger.error("Database connection check failed", error=str(e))
+            raise DatabaseError(f"Database connection check failed: {e}") from e
+
     def cleanup_old_jobs(self, days: int = 30) -> int:
         """Clean up completed jobs older than specified days.
 
@@ -745,23 +839,14 @@ class DatabaseService:
                 cutoff_date = datetime.now(UTC) - timedelta(days=days)
 
                 # Delete old completed jobs and their associated data
+                old_jobs = queries.old_jobs_condition(cutoff_date)
                 deleted_count = session.execute(
-                    select(func.count(ScrapingJob.id)).where(
-                        and_(
-                            ScrapingJob.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
-                            ScrapingJob.completed_at < cutoff_date,
-                        )
-                    )
+                    select(func.count(ScrapingJob.id)).where(old_jobs)
                 ).scalar()
 
                 session.execute(
                     update(ScrapingJob)
-                    .where(
-                        and_(
-                            ScrapingJob.status.in_([JobStatus.COMPLETED, JobStatus.FAILED]),
-                            ScrapingJob.completed_at < cutoff_date,
-                        )
-                    )
+                    .where(old_jobs)
                     .values(status=JobStatus.CANCELLED)  # Soft delete by changing status
                 )
 
@@ -37,6 +37,7 @@ async def main_async(
     verbose: bool = False,
     converter_config=None,
     batch_config=None,
+    stream: bool = False,
 ) -> None:
     """Main async conversion function with batch support."""
     setup_logging(verbose=verbose)
@@ -50,6 +51,7 @@ async def main_async(
                 output_dir=output_dir,
                 batch_size=batch_size,
                 batch_config=batch_config,
+                stream=stream,
             )
         # Single URL mode
         elif url:
@@ -95,6 +97,7 @@ async def run_batch_processing(
     output_dir: str = "converted_content",
     batch_size: int = 3,
     batch_config=None,
+    stream: bool = False,
 ) -> None:
     """Run batch processing for multiple URLs."""
     console.print("[bold blue]🚀 Starting Batch Processing[/bold blue]")
@@ -113,10 +116,18 @@ async def run_batch_processing(
             batch_config.max_concurrent = batch_size
         if output_dir != "converted_content":  # CLI override
             batch_config.output_base_dir = Path(output_dir)
+    if stream:
+        batch_config.stream_input = True
 
     processor = BatchProcessor(batch_config)
 
     # Add jobs from different sources
+    if urls_file and batch_config.stream_input:
+        # Stream the file - jobs are created lazily and duplicates skipped
+        console.print(f"📄 Streaming URLs from [bold]{urls_file}[/bold]")
+        summary = await processor.process_file(urls_file)
+        _print_batch_result(summary, batch_config)
+        return
     if urls_file:
         # Load from file
         jobs_added = processor.add_jobs_from_file(urls_file)
@@ -134,8 +145,11 @@ async def run_batch_processing(
 
     # Process all jobs
     summary = await processor.process_all()
+    _print_batch_result(summary, batch_config)
+
 
-    # Final summary
+def _print_batch_result(summary, batch_config: BatchConfig) -> None:
+    """Print the final batch outcome."""
     if summary["successful"] > 0:
         console.print(f"🎉 [green]Successfully processed {summary['successful']} URLs![/green]")
     if summary["failed"] > 0:
@@ -171,6 +185,11 @@ Examples:
         "url", nargs="?", help="WordPress URL(s) to convert (comma-separated for multiple)"
     )
     url_group.add_argument("--urls-file", help="File containing URLs to process (one per line)")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream --urls-file lazily with deduplication (for very large files)",
+    )
 
     # Output options
     parser.add_argument(
@@ -259,6 +278,7 @@ Examples:
                 verbose=args.verbose,
                 converter_config=converter_config,
                 batch_config=batch_config,
+                stream=args.stream,
             )
         )
 
@@ -57,7 +57,7 @@ class MetricsCollector:
         self.registry: CollectorRegistry | None = None
         self.metrics: dict[str, Any] = {}
         self.system_metrics: dict[str, float] = {}
-        self.application_metrics: dict[str, float] = {}
+        self.application_metrics: dict[str, Any] = {}
         self._collection_task: asyncio.Task | None = None
         self._collecting = False
         self._lock = threading.Lock()
@@ -127,6 +127,17 @@ class MetricsCollector:
                 "Batch processing duration in seconds",
                 registry=self.registry,
             )
+            self.metrics["batch_concurrency_limit"] = Gauge(
+                "app_batch_concurrency_limit",
+                "Concurrency limit chosen by the adaptive batch controller",
+                registry=self.registry,
+            )
+            self.metrics["throttle_events"] = Counter(
+                "app_throttle_events_total",
+                "429/503 responses that throttled a domain",
+                ["domain", "status"],
+                registry=self.registry,
+            )
 
         # Cache metrics
         if self.config.cache_metrics_enabled:
@@ -288,6 +299,42 @@ class MetricsCollector:
         except Exception as e:
             logger.error("Failed to record batch job metrics", error=str(e))
 
+    def set_batch_concurrency_limit(self, limit: int) -> None:
+        """Record the current batch concurrency limit.
+
+        Args:
+            limit: Concurrent jobs currently allowed
+        """
+        with self._lock:
+            self.application_metrics["batch_concurrency_limit"] = limit
+
+        if not self.config.application_metrics_enabled or not PROMETHEUS_AVAILABLE:
+            return
+
+        try:
+            self.metrics["batch_concurrency_limit"].set(limit)
+        except Exception as e:
+            logger.error("Failed to record batch concurrency limit", error=str(e))
+
+    def record_throttle(self, domain: str, status: int) -> None:
+        """Record a 429/503 response that throttled a domain.
+
+        Args:
+            domain: Throttled domain
+            status: HTTP status of the throttling response
+        """
+        with self._lock:
+            throttled = self.application_metrics.setdefault("throttle_events", {})
+            throttled[domain] = throttled.get(domain, 0) + 1
+
+        if not self.config.application_metrics_enabled or not PROMETHEUS_AVAILABLE:
+            return
+
+        try:
+            self.metrics["throttle_events"].labels(domain=domain, status=str(status)).inc()
+        except Exception as e:
+            logger.error("Failed to record throttle event", error=str(e))
+
     def record_cache_hit(self, cache_type: str) -> None:
         """Record cache hit.
 
@@ -2,7 +2,9 @@
 
 import asyncio
 from collections.abc import Callable
+from contextlib import AsyncExitStack
 from pathlib import Path
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
 import aiohttp
@@ -11,24 +13,49 @@ from aiofiles import open as aopen
 
 from ..core.config import config
 from ..core.exceptions import ConversionError
-from ..utils.retry import with_retry
+from ..utils.deadline import budget_timeout, current_deadline
+from ..utils.hedging import request_hedger
+from ..utils.http import raise_for_status
+from ..utils.retry import circuit_breakers, with_retry
 from ..utils.robots import robots_checker
 
+if TYPE_CHECKING:
+    from ..caching.manager import CacheManager
+
 logger = structlog.get_logger(__name__)
 
 
 class AsyncImageDownloader:
-    """Async image downloader with concurrency control."""
+    """Async image downloader with concurrency control.
+
+    With a cache manager, images already cached (by an earlier post sharing
+    them) are written out without a request, and newly downloaded images are
+    cached. Each post costs one bulk cache lookup and one bulk write per
+    content type, however many images it has.
+    """
 
-    def __init__(self, output_dir: Path, max_concurrent: int = config.max_concurrent_downloads):
+    def __init__(
+        self,
+        output_dir: Path,
+        max_concurrent: int = config.max_concurrent_downloads,
+        hedge_requests: bool = config.hedge_requests,
+        cache: "CacheManager | None" = None,
+    ):
         """Initialize image downloader.
 
         Args:
             output_dir: Directory to save images
             max_concurrent: Maximum concurrent downloads
+            hedge_requests: Duplicate image requests that outlast their host's p95
+            cache: Cache manager to reuse images from (no caching if None)
         """
         self.output_dir = output_dir
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        self.hedge_requests = hedge_requests
+        self.cache = cache
+        self.last_cancelled = 0  # Downloads the last download_all cancelled at the deadline
+        # Filename and bytes of images downloaded since they were last cached, by URL
+        self._fetched: dict[str, tuple[str, bytes]] = {}
 
         logger.debug(
             "Initialized image downloader",
@@ -44,6 +71,10 @@ class AsyncImageDownloader:
     ) -> list[str]:
         """Download all images concurrently.
 
+        Under a job deadline, downloads still running when it passes are
+        cancelled and the images finished so far are returned; the number
+        cancelled is left in ``last_cancelled``.
+
         Args:
             session: aiohttp client session
             image_urls: List of image URLs to download
@@ -52,43 +83,138 @@ class AsyncImageDownloader:
         Returns:
             List of successfully downloaded filenames
         """
+        self.last_cancelled = 0
         if not image_urls:
             logger.info("No images to download")
             return []
 
         logger.info("Starting concurrent image downloads", count=len(image_urls))
 
-        # Create download tasks
+        cached = await self._restore_cached(image_urls) if self.cache else {}
+        if cached and progress_callback:
+            progress_callback(len(cached) / len(image_urls))
+
+        # Create download tasks for the images not restored from the cache
+        to_download = [i for i, url in enumerate(image_urls) if url not in cached]
         download_tasks = [
-            self._download_single(session, url, i, len(image_urls), progress_callback)
-            for i, url in enumerate(image_urls)
+            asyncio.ensure_future(
+                self._download_single(session, image_urls[i], i, len(image_urls), progress_callback)
+            )
+            for i in to_download
         ]
 
-        # Execute downloads concurrently
-        results = await asyncio.gather(*download_tasks, return_exceptions=True)
+        # Execute downloads concurrently, stopping at the job deadline if there is one
+        results = []
+        if download_tasks:
+            deadline = current_deadline()
+            _, pending = await asyncio.wait(
+                download_tasks, timeout=deadline.remaining() if deadline else None
+            )
+            for task in pending:
+                task.cancel()
+            self.last_cancelled = len(pending)
+            results = await asyncio.gather(*download_tasks, return_exceptions=True)
+            if pending:
+                logger.warning(
+                    "Image downloads cut short by job deadline",
+                    cancelled=len(pending),
+                    total=len(image_urls),
+                )
 
-        # Process results
+        # Process results, keeping the order of image_urls
         successful_downloads = []
         failed_count = 0
-
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.warning("Image download failed", url=image_urls[i], error=str(result))
+        results_by_index = dict(zip(to_download, results, strict=True))
+
+        for i, url in enumerate(image_urls):
+            if url in cached:
+                successful_downloads.append(cached[url])
+                continue
+            result = results_by_index[i]
+            if isinstance(result, asyncio.CancelledError):
+                failed_count += 1
+            elif isinstance(result, Exception):
+                logger.warning("Image download failed", url=url, error=str(result))
                 failed_count += 1
             elif result and isinstance(result, str):
                 successful_downloads.append(result)
             elif result is None:
                 failed_count += 1
 
+        if self.cache:
+            await self._cache_downloaded(image_urls)
+
         logger.info(
             "Image downloads completed",
             successful=len(successful_downloads),
+            cached=len(cached),
             failed=failed_count,
             total=len(image_urls),
         )
 
         return successful_downloads
 
+    async def _restore_cached(self, image_urls: list[str]) -> dict[str, str]:
+        """Write images cached by earlier posts to the output directory.
+
+        Args:
+            image_urls: Image URLs of the post
+
+        Returns:
+            Filenames of the images restored, by URL
+        """
+        try:
+            images = await self.cache.get_images(image_urls)
+            details = await self.cache.get_metadata_many(images) if images else {}
+        except Exception as e:
+            logger.warning("Image cache lookup failed", error=str(e))
+            return {}
+
+        filenames = {
+            url: Path(meta["filename"]).name
+            for url, meta in details.items()
+            if url in images and meta.get("filename")
+        }
+        if not filenames:
+            return {}
+
+        async def restore(url: str, filename: str) -> None:
+            async with aopen(self.output_dir / filename, "wb") as f:
+                await f.write(images[url])
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        results = await asyncio.gather(
+            *(restore(url, filename) for url, filename in filenames.items()),
+            return_exceptions=True,
+        )
+
+        restored = {}
+        for (url, filename), result in zip(filenames.items(), results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning("Failed to restore cached image", url=url, error=str(result))
+            else:
+                restored[url] = filename
+        logger.debug("Restored cached images", count=len(restored), total=len(image_urls))
+        return restored
+
+    async def _cache_downloaded(self, image_urls: list[str]) -> None:
+        """Cache the images of a post that were downloaded, in one bulk write per type.
+
+        Args:
+            image_urls: Image URLs of the post
+        """
+        fetched = {url: self._fetched.pop(url) for url in image_urls if url in self._fetched}
+        if not fetched:
+            return
+
+        try:
+            await self.cache.set_images({url: data for url, (_, data) in fetched.items()})
+            await self.cache.set_metadata_many(
+                {url: {"filename": filename} for url, (filename, _) in fetched.items()}
+            )
+        except Exception as e:
+            logger.warning("Failed to cache downloaded images", count=len(fetched), error=str(e))
+
     async def _download_single(
         self,
         session: aiohttp.ClientSession,
@@ -127,7 +253,7 @@ class AsyncImageDownloader:
                 logger.error("Failed to download image", url=url, error=str(e))
                 return None
 
-    @with_retry()
+    @with_retry(budget_key=lambda _downloader, _session, url: url)
     async def _download_image(self, session: aiohttp.ClientSession, url: str) -> str:
         """Download image with retry logic.
 
@@ -140,6 +266,7 @@ class AsyncImageDownloader:
 
         Raises:
             ConversionError: If download fails after retries
+            RateLimitError: If the image host's circuit breaker is open
         """
         try:
             logger.debug("Downloading image", url=url)
@@ -147,38 +274,72 @@ class AsyncImageDownloader:
             # Check robots.txt and enforce crawl delay for images
             await robots_checker.check_and_delay(url, config.user_agent, session)
 
-            from ..constants import CONSTANTS
-
-            async with session.get(
-                url, timeout=aiohttp.ClientTimeout(total=CONSTANTS.DEFAULT_TIMEOUT)
-            ) as response:
-                response.raise_for_status()
-
-                # Generate filename
-                filename = self._generate_filename(url, response)
-                filepath = self.output_dir / filename
-
-                # Ensure output directory exists
-                self.output_dir.mkdir(parents=True, exist_ok=True)
-
-                # Download and save image
-                async with aopen(filepath, "wb") as f:
-                    async for chunk in response.content.iter_chunked(8192):
-                        await f.write(chunk)
-
-                logger.debug(
-                    "Successfully downloaded image",
-                    url=url,
-                    filename=filename,
-                    size=response.content_length,
-                )
-                return filename
+            async with circuit_breakers.breaker_for(url):
+                # Only waiting for the response is hedged - the body is streamed from the winner
+                if self.hedge_requests:
+                    request, response = await request_hedger.run(
+                        url,
+                        lambda: self._open_image(session, url),
+                        discard=lambda opened: opened[0].aclose(),
+                    )
+                else:
+                    request, response = await self._open_image(session, url)
+
+                async with request:
+                    raise_for_status(response, url)
+
+                    # Generate filename
+                    filename = self._generate_filename(url, response)
+                    filepath = self.output_dir / filename
+
+                    # Ensure output directory exists
+                    self.output_dir.mkdir(parents=True, exist_ok=True)
+
+                    # Download and save image, keeping the bytes if they will be cached
+                    body = []
+                    async with aopen(filepath, "wb") as f:
+                        async for chunk in response.content.iter_chunked(8192):
+                            await f.write(chunk)
+                            if self.cache:
+                                body.append(chunk)
+                    if self.cache:
+                        self._fetched[url] = (filename, b"".join(body))
+
+            logger.debug(
+                "Successfully downloaded image",
+                url=url,
+                filename=filename,
+                size=response.content_length,
+            )
+            return filename
 
         except aiohttp.ClientError as e:
             raise ConversionError(f"Failed to download image {url}: {e}") from e
         except OSError as e:
             raise ConversionError(f"Failed to save image {url}: {e}") from e
 
+    async def _open_image(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> tuple[AsyncExitStack, aiohttp.ClientResponse]:
+        """Send an image request and wait for its response headers.
+
+        Args:
+            session: aiohttp client session
+            url: Image URL to request
+
+        Returns:
+            Exit stack that releases the response, and the response itself
+        """
+        from ..constants import CONSTANTS
+
+        request = AsyncExitStack()
+        response = await request.enter_async_context(
+            session.get(
+                url, timeout=aiohttp.ClientTimeout(total=budget_timeout(CONSTANTS.DEFAULT_TIMEOUT))
+            )
+        )
+        return request, response
+
     def _generate_filename(self, url: str, response: aiohttp.ClientResponse) -> str:
         """Generate filename for downloaded image.
 
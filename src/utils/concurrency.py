@@ -0,0 +1,465 @@
+"""Bounded concurrent execution helpers."""
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable, Iterable
+from types import TracebackType
+from typing import Any, TypeVar
+
+import structlog
+
+from ..constants import CONSTANTS
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Outcomes fed to AdaptiveConcurrencyLimiter
+OK = "ok"
+TIMEOUT = "timeout"
+THROTTLED = "throttled"
+ERROR = "error"
+
+THROTTLE_STATUSES = frozenset({429, 503})
+
+
+async def bounded_as_completed(  # noqa: UP047
+    items: Iterable[T] | AsyncIterable[T],
+    func: Callable[[T], Awaitable[R]],
+    max_in_flight: int,
+    task_registry: set[asyncio.Task] | None = None,
+) -> AsyncIterator[tuple[T, R | BaseException]]:
+    """Run ``func`` over ``items`` keeping at most ``max_in_flight`` tasks alive.
+
+    Items are pulled lazily from the iterable only when a slot frees up, so the
+    number of tasks (and their frames) stays constant regardless of how many
+    items there are. Results are yielded in completion order; exceptions raised
+    by ``func`` are yielded in place of the result, mirroring
+    ``asyncio.gather(..., return_exceptions=True)``.
+
+    Closing the generator early (e.g. via ``contextlib.aclosing``) cancels any
+    tasks still in flight.
+
+    Args:
+        items: Items to process, sync or async iterable
+        func: Coroutine function applied to each item
+        max_in_flight: Maximum number of concurrently running tasks
+        task_registry: Optional set that running tasks are added to and removed
+            from, so callers can cancel them
+
+    Yields:
+        Tuples of (item, result or exception)
+
+    Raises:
+        ValueError: If max_in_flight is not positive
+    """
+    if max_in_flight <= 0:
+        raise ValueError("max_in_flight must be positive")
+
+    if isinstance(items, AsyncIterable):
+        iterator = aiter(items)
+
+        async def next_item() -> tuple[bool, T | None]:
+            try:
+                return True, await anext(iterator)
+            except StopAsyncIteration:
+                return False, None
+
+    else:
+        sync_iterator = iter(items)
+
+        async def next_item() -> tuple[bool, T | None]:
+            try:
+                return True, next(sync_iterator)
+            except StopIteration:
+                return False, None
+
+    pending: dict[asyncio.Task, T] = {}
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < max_in_flight:
+                has_item, item = await next_item()
+                if not has_item:
+                    exhausted = True
+                    break
+                task = asyncio.ensure_future(func(item))  # type: ignore[arg-type]
+                pending[task] = item  # type: ignore[assignment]
+                if task_registry is not None:
+                    task_registry.add(task)
+                    task.add_done_callback(task_registry.discard)
+
+            if not pending:
+                return
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                item = pending.pop(task)
+                if task.cancelled():
+                    yield item, asyncio.CancelledError()
+                elif task.exception() is not None:
+                    yield item, task.exception()  # type: ignore[misc]
+                else:
+                    yield item, task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def classify_outcome(error: BaseException | None) -> str:
+    """Map a job's exception to a congestion signal.
+
+    The exception chain is followed through ``__cause__``, ``__context__`` and
+    the ``cause`` attribute of ``ConversionError`` so wrapped HTTP errors (e.g.
+    a ``FetchError`` around an ``aiohttp.ClientResponseError``) are recognised.
+
+    Args:
+        error: Exception raised by the job, or None on success
+
+    Returns:
+        One of ``ok``, ``timeout``, ``throttled`` or ``error``
+    """
+    seen: set[int] = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, TimeoutError):
+            return TIMEOUT
+        if getattr(error, "status", None) in THROTTLE_STATUSES:
+            return THROTTLED
+        error = error.__cause__ or getattr(error, "cause", None) or error.__context__
+    return OK if not seen else ERROR
+
+
+class RatioBudget:
+    """Token bucket that keeps optional extra work a fixed fraction of normal work.
+
+    Every unit of normal work deposits ``ratio`` tokens and every unit of
+    extra work (a hedge, a retry) withdraws one, so over time extra work
+    cannot exceed ``ratio`` times the normal work. ``max_tokens`` bounds how
+    much unused budget can be saved up for a burst.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float, initial_tokens: float = 0.0):
+        """Initialize the budget.
+
+        Args:
+            ratio: Tokens earned per unit of normal work
+            max_tokens: Cap on saved-up tokens
+            initial_tokens: Tokens available before any work is done
+
+        Raises:
+            ValueError: If ratio or max_tokens is out of range
+        """
+        if ratio < 0:
+            raise ValueError("ratio cannot be negative")
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min(initial_tokens, max_tokens)
+
+    @property
+    def tokens(self) -> float:
+        """Currently available tokens."""
+        return self._tokens
+
+    def deposit(self, units: int = 1) -> None:
+        """Earn tokens for completed normal work."""
+        self._tokens = min(self.max_tokens, self._tokens + self.ratio * units)
+
+    def withdraw(self) -> bool:
+        """Spend one token for extra work.
+
+        Returns:
+            True if the extra work is allowed
+        """
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def drain(self) -> None:
+        """Discard every saved token."""
+        self._tokens = 0.0
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit tuned at runtime with additive increase, multiplicative decrease.
+
+    Completed calls are collected into a window of ``max(limit, min_samples)``
+    samples, roughly one round of work at the current limit. When a window
+    closes, the limit is multiplied by ``decrease_factor`` if the p95 latency
+    exceeds ``target_p95`` or the timeout rate exceeds its bound. Otherwise, if
+    callers actually had to wait for a slot during the window, the limit grows
+    by ``increase_step``. 429/503 responses are not treated as congestion here;
+    they carry a wait of their own that the per-domain throttle honors. Fixed
+    concurrency is the special case ``min_limit == max_limit``.
+
+    Use as ``async with limiter:`` around the work and report each call with
+    :meth:`record`.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = CONSTANTS.BATCH_MIN_CONCURRENT,
+        max_limit: int | None = None,
+        target_p95: float | None = None,
+        increase_step: int = 1,
+        decrease_factor: float = CONSTANTS.BATCH_AIMD_DECREASE_FACTOR,
+        max_timeout_rate: float = CONSTANTS.BATCH_AIMD_MAX_TIMEOUT_RATE,
+        min_samples: int = CONSTANTS.BATCH_AIMD_MIN_SAMPLES,
+        on_change: Callable[[int], None] | None = None,
+        name: str | None = None,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting concurrency limit
+            min_limit: Lowest limit a decrease can reach
+            max_limit: Highest limit an increase can reach, defaults to initial_limit
+            target_p95: p95 latency in seconds above which the limit shrinks, None to ignore
+            increase_step: Slots added after a healthy, saturated window
+            decrease_factor: Multiplier applied to the limit on congestion
+            max_timeout_rate: Fraction of timed out calls tolerated per window
+            min_samples: Smallest number of calls per evaluation window
+            on_change: Called with the new limit whenever it changes
+            name: What the limiter guards (e.g. a domain), for logging
+
+        Raises:
+            ValueError: If the bounds or tuning parameters are invalid
+        """
+        max_limit = initial_limit if max_limit is None else max_limit
+        if min_limit <= 0:
+            raise ValueError("min_limit must be positive")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if target_p95 is not None and target_p95 <= 0:
+            raise ValueError("target_p95 must be positive")
+        if increase_step <= 0:
+            raise ValueError("increase_step must be positive")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if min_samples <= 0:
+            raise ValueError("min_samples must be positive")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.target_p95 = target_p95
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.max_timeout_rate = max_timeout_rate
+        self.min_samples = min_samples
+        self.on_change = on_change
+        self.name = name
+        self._limit = initial_limit
+        self._in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: list[float] = []
+        self._outcomes: dict[str, int] = {}
+        self._saturated = False
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    @property
+    def adaptive(self) -> bool:
+        """Whether the limit can move at all."""
+        return self.min_limit < self.max_limit
+
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit."""
+        while self._in_flight >= self._limit:
+            self._saturated = True
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                else:
+                    self._wake()  # Pass the wake-up on to the next waiter
+                raise
+        self._in_flight += 1
+        if self._in_flight >= self._limit:
+            self._saturated = True
+
+    def release(self) -> None:
+        """Return a slot and wake waiters that now fit under the limit."""
+        self._in_flight -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free slots."""
+        free = self._limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    async def __aenter__(self) -> "AdaptiveConcurrencyLimiter":
+        """Acquire a slot."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Release the slot."""
+        self.release()
+
+    def record(self, latency: float, error: BaseException | None = None) -> None:
+        """Report one completed call and adjust the limit when a window closes.
+
+        Args:
+            latency: Call duration in seconds
+            error: Exception the call raised, None on success
+        """
+        outcome = classify_outcome(error)
+        self._latencies.append(latency)
+        self._outcomes[outcome] = self._outcomes.get(outcome, 0) + 1
+
+        if len(self._latencies) >= max(self._limit, self.min_samples):
+            self._adjust()
+
+    def _adjust(self) -> None:
+        """Apply one AIMD step from the closed window and start a new one."""
+        samples = len(self._latencies)
+        latencies = sorted(self._latencies)
+        p95 = latencies[math.ceil(0.95 * samples) - 1]
+        timeout_rate = self._outcomes.get(TIMEOUT, 0) / samples
+        saturated = self._saturated
+
+        self._latencies = []
+        self._outcomes = {}
+        self._saturated = self._in_flight >= self._limit
+
+        if timeout_rate > self.max_timeout_rate:
+            reason = "timeouts"
+        elif self.target_p95 is not None and p95 > self.target_p95:
+            reason = "latency"
+        else:
+            reason = None
+
+        if reason is not None:
+            new_limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        elif saturated:
+            new_limit = min(self.max_limit, self._limit + self.increase_step)
+        else:
+            return
+
+        if new_limit == self._limit:
+            return
+
+        if new_limit > self._limit:
+            self.increases += 1
+        else:
+            self.decreases += 1
+        logger.info(
+            "Adjusted concurrency limit",
+            name=self.name,
+            previous=self._limit,
+            limit=new_limit,
+            reason=reason or "healthy",
+            p95=round(p95, 3),
+            timeout_rate=round(timeout_rate, 3),
+        )
+        self._limit = new_limit
+        self._wake()
+        if self.on_change is not None:
+            self.on_change(new_limit)
+
+    def get_statistics(self) -> dict[str, int]:
+        """Current limit, bounds and adjustment counters."""
+        return {
+            "limit": self._limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+class DomainConcurrencyLimiter:
+    """One :class:`AdaptiveConcurrencyLimiter` per domain.
+
+    Each origin converges to the concurrency it can sustain on its own, so a
+    slow or failing site shrinks only its own limit. Limiters are created on
+    first use with the same bounds and tuning.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = CONSTANTS.BATCH_MIN_CONCURRENT,
+        max_limit: int | None = None,
+        on_change: Callable[[str, int], None] | None = None,
+        **tuning: Any,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting limit of every domain
+            min_limit: Lowest limit a domain can reach
+            max_limit: Highest limit a domain can reach, defaults to initial_limit
+            on_change: Called with the domain and its new limit whenever one changes
+            **tuning: Further :class:`AdaptiveConcurrencyLimiter` parameters
+
+        Raises:
+            ValueError: If the bounds or tuning parameters are invalid
+        """
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = initial_limit if max_limit is None else max_limit
+        self.on_change = on_change
+        self.tuning = tuning
+        self._limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+        # Fail on bad parameters now rather than on the first job
+        self._create("")
+
+    def _create(self, domain: str) -> AdaptiveConcurrencyLimiter:
+        on_change = self.on_change
+        return AdaptiveConcurrencyLimiter(
+            self.initial_limit,
+            min_limit=self.min_limit,
+            max_limit=self.max_limit,
+            on_change=(lambda limit: on_change(domain, limit)) if on_change else None,
+            name=domain,
+            **self.tuning,
+        )
+
+    def for_domain(self, domain: str) -> AdaptiveConcurrencyLimiter:
+        """Limiter of a domain, created on first use."""
+        limiter = self._limiters.get(domain)
+        if limiter is None:
+            limiter = self._limiters[domain] = self._create(domain)
+        return limiter
+
+    def limit(self, domain: str) -> int:
+        """Current limit of a domain."""
+        limiter = self._limiters.get(domain)
+        return limiter.limit if limiter is not None else self.initial_limit
+
+    def get_statistics(self) -> dict[str, dict[str, int]]:
+        """Limit, bounds and adjustment counters per domain."""
+        return {domain: limiter.get_statistics() for domain, limiter in self._limiters.items()}
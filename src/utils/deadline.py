@@ -0,0 +1,135 @@
+"""Per-job latency budgets propagated to every stage of a conversion.
+
+A job sets one :class:`Deadline` with :func:`deadline_scope`. The stages
+below it - robots.txt, the page fetch, retries and image downloads - read it
+from a context variable, so each one shrinks its own timeout and retry
+decisions to what is left of the job's budget instead of applying an
+unrelated fixed timeout. Tasks created inside the scope inherit the deadline.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from ..constants import CONSTANTS
+from ..core.exceptions import DeadlineExceededError
+
+_current_deadline: ContextVar["Deadline | None"] = ContextVar("deadline", default=None)
+
+
+class Deadline:
+    """Absolute point in time by which a job must finish."""
+
+    __slots__ = ("budget", "expires_at")
+
+    def __init__(self, budget: float):
+        """Initialize a deadline ``budget`` seconds from now.
+
+        Args:
+            budget: Seconds the job may take
+
+        Raises:
+            ValueError: If budget is not positive
+        """
+        if budget <= 0:
+            raise ValueError("budget must be positive")
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        """Seconds left, never negative."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is spent."""
+        return self.remaining() <= 0
+
+    def timeout(self, default: float) -> float:
+        """Shrink a stage timeout to the remaining budget.
+
+        Args:
+            default: Timeout the stage would use without a deadline
+
+        Returns:
+            The smaller of ``default`` and the remaining budget
+
+        Raises:
+            DeadlineExceededError: If nothing is left of the budget
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(f"Job deadline of {self.budget}s exceeded")
+        return min(default, remaining)
+
+    def allows(self, delay: float) -> bool:
+        """Whether waiting ``delay`` seconds still leaves time for another attempt."""
+        return self.remaining() > delay
+
+
+def stage_budget(timeout: float, grace: float = CONSTANTS.JOB_DEADLINE_GRACE) -> float:
+    """Deadline budget for the stages of a job bounded by a hard ``timeout``.
+
+    Args:
+        timeout: Hard per-job timeout enforced by the caller
+        grace: Seconds held back for wrapping up, capped at 10% of ``timeout``
+
+    Returns:
+        Budget that expires shortly before the hard timeout
+    """
+    return timeout - min(grace, timeout * 0.1)
+
+
+def current_deadline() -> Deadline | None:
+    """Deadline of the job running in this context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(budget: float | None) -> Iterator[Deadline | None]:
+    """Run the enclosed stages under a latency budget.
+
+    A nested scope can only tighten an enclosing deadline, never extend it.
+
+    Args:
+        budget: Seconds the enclosed work may take, None to keep the current deadline
+
+    Yields:
+        The deadline in effect inside the scope
+    """
+    outer = _current_deadline.get()
+    if budget is None:
+        yield outer
+        return
+
+    deadline = Deadline(budget)
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def budget_timeout(default: float) -> float:
+    """Timeout for a stage under the current deadline.
+
+    Args:
+        default: Timeout the stage would use without a deadline
+
+    Returns:
+        ``default`` shrunk to the remaining budget
+
+    Raises:
+        DeadlineExceededError: If the current deadline has passed
+    """
+    deadline = _current_deadline.get()
+    return default if deadline is None else deadline.timeout(default)
+
+
+def budget_allows(delay: float) -> bool:
+    """Whether the current deadline leaves room to wait ``delay`` seconds and retry."""
+    deadline = _current_deadline.get()
+    return deadline is None or deadline.allows(delay)
@@ -0,0 +1,185 @@
+"""Scalable seen-sets for URL deduplication.
+
+Small runs keep exact 64-bit fingerprints. Once a run grows past a limit the
+fingerprints are folded into a Bloom filter, whose memory is fixed by the
+expected number of URLs and the accepted false-positive rate rather than by
+how many URLs have been seen. A false positive drops a URL that was not
+actually a duplicate; a duplicate is never let through.
+"""
+
+import hashlib
+import math
+
+import structlog
+
+from ..constants import CONSTANTS
+from .url import url_dedup_key
+
+logger = structlog.get_logger(__name__)
+
+
+def fingerprint(value: str) -> int:
+    """Compact 64-bit fingerprint of a string."""
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit fingerprints.
+
+    The ``k`` bit positions are derived from one fingerprint by double
+    hashing, so each lookup costs a single hash of the key.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        """Initialize the filter.
+
+        Args:
+            capacity: Number of items the filter is sized for
+            error_rate: False-positive rate once ``capacity`` items are added
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size_bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: int) -> list[int]:
+        h1 = key >> 32
+        h2 = (key & 0xFFFFFFFF) | 1  # Odd step so positions never repeat early
+        return [(h1 + i * h2) % self.size_bits for i in range(self.hash_count)]
+
+    def add(self, key: int) -> bool:
+        """Add a fingerprint.
+
+        Returns:
+            True if the fingerprint was (probably) already present
+        """
+        present = True
+        for position in self._positions(key):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                present = False
+                self._bits[byte] |= 1 << bit
+        if not present:
+            self.count += 1
+        return present
+
+    def __contains__(self, key: object) -> bool:
+        """Whether a fingerprint is (probably) present."""
+        if not isinstance(key, int):
+            return False
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key)
+        )
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the bit array in bytes."""
+        return len(self._bits)
+
+
+class URLDeduplicator:
+    """Seen-set of URLs that reports and counts duplicates.
+
+    URLs are compared by ``url_dedup_key``, so scheme, trailing slash,
+    tracking parameters and fragments do not make a URL distinct.
+    """
+
+    def __init__(
+        self,
+        exact_limit: int = CONSTANTS.DEDUP_EXACT_LIMIT,
+        expected_urls: int = CONSTANTS.DEDUP_EXPECTED_URLS,
+        false_positive_rate: float = CONSTANTS.DEDUP_FALSE_POSITIVE_RATE,
+    ):
+        """Initialize the deduplicator.
+
+        Args:
+            exact_limit: URLs tracked exactly before switching to a Bloom filter
+            expected_urls: URLs the Bloom filter is sized for
+            false_positive_rate: Accepted Bloom filter false-positive rate
+
+        Raises:
+            ValueError: If a limit or the rate is out of range
+        """
+        if exact_limit < 0:
+            raise ValueError("exact_limit cannot be negative")
+        if expected_urls <= 0:
+            raise ValueError("expected_urls must be positive")
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+
+        self.exact_limit = exact_limit
+        self.expected_urls = expected_urls
+        self.false_positive_rate = false_positive_rate
+        self._exact: set[int] = set()
+        self._bloom: BloomFilter | None = None
+        self.seen = 0
+        self.duplicates = 0
+
+    @property
+    def probabilistic(self) -> bool:
+        """Whether the Bloom filter has replaced the exact set."""
+        return self._bloom is not None
+
+    def _switch_to_bloom(self) -> None:
+        """Fold the exact fingerprints into a Bloom filter."""
+        self._bloom = BloomFilter(max(self.expected_urls, self.seen), self.false_positive_rate)
+        for key in self._exact:
+            self._bloom.add(key)
+        self._exact = set()
+        logger.info(
+            "Switched URL deduplication to Bloom filter",
+            urls=self.seen,
+            memory_bytes=self._bloom.memory_bytes,
+            false_positive_rate=self.false_positive_rate,
+        )
+
+    def add(self, url: str) -> bool:
+        """Record a URL.
+
+        Args:
+            url: URL to record; invalid URLs are compared verbatim
+
+        Returns:
+            True if the URL is new, False if it is a duplicate
+        """
+        key = fingerprint(url_dedup_key(url) or url)
+
+        if self._bloom is not None:
+            if self._bloom.add(key):
+                self.duplicates += 1
+                return False
+            self.seen += 1
+            if self.seen == self._bloom.capacity + 1:
+                logger.warning(
+                    "URL deduplication exceeded Bloom filter capacity",
+                    capacity=self._bloom.capacity,
+                    false_positive_rate=self.false_positive_rate,
+                )
+            return True
+
+        if key in self._exact:
+            self.duplicates += 1
+            return False
+        self._exact.add(key)
+        self.seen += 1
+        if len(self._exact) > self.exact_limit:
+            self._switch_to_bloom()
+        return True
+
+    def get_statistics(self) -> dict[str, int | bool]:
+        """Seen and dropped URL counts."""
+        return {
+            "seen": self.seen,
+            "duplicates": self.duplicates,
+            "probabilistic": self.probabilistic,
+        }
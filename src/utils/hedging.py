@@ -0,0 +1,172 @@
+"""Hedged requests to cut tail latency on slow hosts.
+
+A request that is still running when it reaches its host's observed p95
+latency gets one duplicate, and whichever finishes first wins. Because only
+the slowest ~5% of requests are ever eligible, and hedges are paid for from a
+:class:`~src.utils.concurrency.RatioBudget` funded by ordinary requests, the
+extra load on an origin stays under a fixed percentage even when it is slow.
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import structlog
+
+from ..constants import CONSTANTS
+from .concurrency import RatioBudget
+from .url import domain_key
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Hedges that can be saved up while a host is fast
+HEDGE_BURST = 10
+
+
+class RequestHedger:
+    """Per-host latency tracking and hedged execution of idempotent requests."""
+
+    def __init__(
+        self,
+        percentile: float = CONSTANTS.HEDGE_PERCENTILE,
+        budget_percent: float = CONSTANTS.HEDGE_BUDGET_PERCENT,
+        min_samples: int = CONSTANTS.HEDGE_MIN_SAMPLES,
+        window: int = CONSTANTS.HEDGE_WINDOW,
+    ):
+        """Initialize the hedger.
+
+        Args:
+            percentile: Latency percentile after which a request is hedged
+            budget_percent: Hedges allowed per 100 requests
+            min_samples: Latencies needed for a host before it is hedged
+            window: Recent latencies kept per host
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+        if budget_percent < 0:
+            raise ValueError("budget_percent cannot be negative")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("window must be at least min_samples, which must be positive")
+
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = RatioBudget(budget_percent / 100, HEDGE_BURST)
+        self._latencies: dict[str, deque[float]] = {}
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self, host: str) -> float | None:
+        """Observed latency percentile for a host, None until enough samples exist."""
+        samples = self._latencies.get(host)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * self.percentile))]
+
+    def record(self, host: str, latency: float) -> None:
+        """Add a successful request's latency to its host's window."""
+        samples = self._latencies.get(host)
+        if samples is None:
+            samples = self._latencies[host] = deque(maxlen=self.window)
+        samples.append(latency)
+
+    async def run(
+        self,
+        url: str,
+        attempt: Callable[[], Awaitable[T]],
+        discard: Callable[[T], Awaitable[Any]] | None = None,
+    ) -> T:
+        """Run an idempotent request, hedging it if it outlasts the host's p95.
+
+        Args:
+            url: Request URL, used to look up the host's latency
+            attempt: Starts one copy of the request
+            discard: Releases the result of a copy that finished but lost the race
+
+        Returns:
+            Result of whichever copy succeeded first
+
+        Raises:
+            Exception: The error of the last copy to fail if none succeeded
+        """
+        host = domain_key(url)
+        self.requests += 1
+        self.budget.deposit()
+        started = time.monotonic()
+
+        delay = self.hedge_delay(host)
+        primary = asyncio.ensure_future(attempt())
+        tasks = [primary]
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self.budget.withdraw():
+                    self.hedges += 1
+                    logger.debug("Hedging slow request", url=url, after=round(delay, 3))
+                    tasks.append(asyncio.ensure_future(attempt()))
+            winner, result = await self._first_success(tasks, discard)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        if winner is not primary:
+            self.hedge_wins += 1
+        self.record(host, time.monotonic() - started)
+        return result
+
+    @staticmethod
+    async def _first_success(
+        tasks: list["asyncio.Future[T]"], discard: Callable[[T], Awaitable[Any]] | None
+    ) -> tuple["asyncio.Future[T]", T]:
+        """Wait for the first copy to succeed, then cancel or discard the rest."""
+        pending = set(tasks)
+        winner: asyncio.Future[T] | None = None
+        error: BaseException | None = None
+        losers: list[T] = []
+
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is not None:
+                    error = task.exception()
+                elif winner is None:
+                    winner = task
+                else:
+                    losers.append(task.result())
+
+        for task in pending:
+            task.cancel()
+        for outcome in await asyncio.gather(*pending, return_exceptions=True):
+            if not isinstance(outcome, BaseException):
+                losers.append(outcome)
+        if discard is not None:
+            for loser in losers:
+                await discard(loser)
+
+        if winner is None:
+            raise error  # type: ignore[misc]
+        return winner, winner.result()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Hedging counters and the current per-host hedge delays."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+            "hedge_delays": {host: self.hedge_delay(host) for host in self._latencies},
+        }
+
+
+# Global instance so latency history is shared across jobs
+request_hedger = RequestHedger()
@@ -4,6 +4,8 @@ import aiohttp
 import structlog
 
 from ..constants import CONSTANTS
+from .deadline import budget_timeout
+from .throttle import THROTTLE_STATUSES, domain_throttle, parse_retry_after
 
 logger = structlog.get_logger(__name__)
 
@@ -30,7 +32,7 @@ async def safe_http_get(
     Args:
         session: aiohttp session
         url: URL to fetch
-        timeout: Request timeout in seconds (uses default if None)
+        timeout: Request timeout in seconds (uses default if None), capped by the job deadline
         expected_statuses: Set of acceptable status codes (default: 2xx)
         log_errors: Whether to log errors
 
@@ -39,9 +41,10 @@ async def safe_http_get(
 
     Raises:
         aiohttp.ClientError: For connection/timeout errors
+        DeadlineExceededError: If the job deadline has already passed
         Exception: For unexpected errors
     """
-    timeout = timeout or CONSTANTS.DEFAULT_TIMEOUT
+    timeout = budget_timeout(timeout or CONSTANTS.DEFAULT_TIMEOUT)
     expected_statuses = expected_statuses or {CONSTANTS.HTTP_STATUS_OK}
 
     try:
@@ -87,22 +90,43 @@ async def safe_http_get_with_raise(
     Args:
         session: aiohttp session
         url: URL to fetch
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds, capped by the job deadline
 
     Returns:
         Response content as string
 
     Raises:
-        aiohttp.HTTPError: For HTTP error status codes
+        aiohttp.ClientResponseError: For HTTP error status codes, with the response headers
         aiohttp.ClientError: For connection/timeout errors
+        DeadlineExceededError: If the job deadline has already passed
     """
-    timeout = timeout or CONSTANTS.DEFAULT_TIMEOUT
+    timeout = budget_timeout(timeout or CONSTANTS.DEFAULT_TIMEOUT)
 
     async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
-        response.raise_for_status()  # Raises for 4xx/5xx status codes
+        raise_for_status(response, url)
         return await response.text()
 
 
+def raise_for_status(response: aiohttp.ClientResponse, url: str) -> None:
+    """Raise for 4xx/5xx responses, throttling the domain first on 429/503.
+
+    A 429 or 503 holds the URL's domain for its ``Retry-After`` so queued jobs
+    wait once instead of each retrying. The raised error keeps the response
+    headers, letting retry layers honor ``Retry-After`` too.
+
+    Args:
+        response: Response to check
+        url: URL that was requested
+
+    Raises:
+        aiohttp.ClientResponseError: For HTTP error status codes
+    """
+    if response.status in THROTTLE_STATUSES:
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        domain_throttle.throttle(url, response.status, retry_after)
+    response.raise_for_status()  # Raises for 4xx/5xx status codes, headers included
+
+
 def check_http_status(status: int, url: str, context: str = "request") -> bool:
     """Check HTTP status and log appropriately.
 
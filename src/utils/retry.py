@@ -18,10 +18,15 @@ from enum import Enum
 from typing import Any, TypeVar
 
 import structlog
-from aiohttp import ClientError, ServerTimeoutError
+from aiohttp import ClientError, ClientResponseError, ServerTimeoutError
 
+from ..constants import CONSTANTS
 from ..core.config import config
-from ..core.exceptions import RateLimitError
+from ..core.exceptions import DeadlineExceededError, RateLimitError
+from .concurrency import RatioBudget
+from .deadline import budget_allows
+from .throttle import domain_throttle, retry_after_from
+from .url import domain_key, host_key
 
 logger = structlog.get_logger(__name__)
 
@@ -62,14 +67,18 @@ class RetryConfig:
         if not 0 <= self.jitter_factor <= 1:
             raise ValueError("jitter_factor must be between 0 and 1")
 
-    def calculate_delay(self, attempt: int) -> float:
+    def calculate_delay(self, attempt: int, retry_after: float | None = None) -> float:
         """Calculate delay with exponential backoff and jitter.
 
         Uses the latest jitter implementation with full decorrelated jitter
-        to prevent thundering herd problems effectively.
+        to prevent thundering herd problems effectively. A server's
+        ``Retry-After`` is a floor: the delay is never shorter than it asked,
+        even beyond ``max_delay``, up to ``THROTTLE_MAX_DELAY`` like the
+        domain throttle.
 
         Args:
             attempt: Current attempt number (0-indexed)
+            retry_after: Seconds a 429/503 response asked to wait, if any
 
         Returns:
             Calculated delay in seconds with jitter applied
@@ -85,38 +94,126 @@ class RetryConfig:
             # Ensure minimum delay to prevent too aggressive retries
             delay = max(0.1, delay)
 
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, CONSTANTS.THROTTLE_MAX_DELAY))
+
         return delay
 
 
+class RetryBudget:
+    """Shared per-domain retry allowance that keeps retries a bounded share of traffic.
+
+    Each domain has a token bucket that successful requests refill by
+    ``ratio`` tokens and each retry drains by one. While a domain is healthy
+    retries are always available; when it starts failing, every retry layer
+    that consults the budget runs out together after at most ``max_tokens``
+    retries instead of multiplying load on the failing origin.
+    """
+
+    def __init__(
+        self,
+        ratio: float = CONSTANTS.RETRY_BUDGET_RATIO,
+        max_tokens: float = CONSTANTS.RETRY_BUDGET_MAX_TOKENS,
+    ):
+        """Initialize the retry budget.
+
+        Args:
+            ratio: Retries earned per successful request
+            max_tokens: Retries a domain can save up, also its allowance before any success
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._buckets: dict[str, RatioBudget] = {}
+        self.denied: dict[str, int] = {}
+
+    def _bucket(self, url: str) -> tuple[str, RatioBudget]:
+        domain = domain_key(url)
+        bucket = self._buckets.get(domain)
+        if bucket is None:
+            bucket = self._buckets[domain] = RatioBudget(
+                self.ratio, self.max_tokens, initial_tokens=self.max_tokens
+            )
+        return domain, bucket
+
+    def record_success(self, url: str) -> None:
+        """Refill the budget of a URL's domain after a successful request."""
+        self._bucket(url)[1].deposit()
+
+    def try_retry(self, url: str) -> bool:
+        """Spend one retry for a URL's domain.
+
+        Returns:
+            True if the retry may go ahead
+        """
+        domain, bucket = self._bucket(url)
+        if bucket.withdraw():
+            return True
+        self.denied[domain] = self.denied.get(domain, 0) + 1
+        return False
+
+    def exhaust(self, url: str) -> None:
+        """Drop every saved retry for a URL's domain, e.g. when its circuit opens."""
+        self._bucket(url)[1].drain()
+
+    def reset(self) -> None:
+        """Forget every domain's budget."""
+        self._buckets.clear()
+        self.denied.clear()
+
+    def get_statistics(self) -> dict[str, dict[str, float]]:
+        """Available and denied retries per domain."""
+        return {
+            domain: {"tokens": round(bucket.tokens, 2), "denied": self.denied.get(domain, 0)}
+            for domain, bucket in self._buckets.items()
+        }
+
+
+# Global instance shared by every retry layer
+retry_budget = RetryBudget()
+
+
 def with_retry(
     retry_config: RetryConfig | None = None,
     retry_on: tuple = (ClientError, ServerTimeoutError, asyncio.TimeoutError),
     reraise_on: tuple = (RateLimitError,),
+    budget_key: Callable[..., str] | None = None,
+    budget: RetryBudget | None = None,
 ) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
     """Enhanced decorator for adding retry logic with exponential backoff and jitter.
 
     This implementation follows CLAUDE.md requirements for production-ready
     retry mechanisms with comprehensive observability and latest jitter algorithms.
+    Under a job deadline no retry is attempted once its backoff would outlast
+    the remaining budget, and an exceeded deadline is never retried. A 429/503
+    error's ``Retry-After`` sets the least a retry waits.
 
     Args:
         retry_config: Retry configuration object (uses defaults if None)
         retry_on: Exception types to retry on
         reraise_on: Exception types to immediately reraise
+        budget_key: Maps the call's arguments to the URL whose domain retry budget
+            is consulted before each retry and refilled on success
+        budget: Retry budget to use with ``budget_key`` (shared global budget if None)
 
     Returns:
         Decorated function with enhanced retry logic
     """
     if retry_config is None:
         retry_config = RetryConfig()
+    if budget is None:
+        budget = retry_budget
 
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
             last_exception = None
+            budget_url = budget_key(*args, **kwargs) if budget_key else None
 
             for attempt in range(retry_config.max_attempts):
                 try:
                     result = await func(*args, **kwargs)
+                    if budget_url is not None:
+                        budget.record_success(budget_url)
 
                     # Log successful retry recovery
                     if attempt > 0:
@@ -129,6 +226,10 @@ def with_retry(
 
                     return result
 
+                except DeadlineExceededError:
+                    # The job budget is spent - another attempt cannot succeed
+                    raise
+
                 except reraise_on as e:
                     # Don't retry these exceptions - immediate failure
                     logger.error(
@@ -146,7 +247,33 @@ def with_retry(
                     if attempt == retry_config.max_attempts - 1:
                         break
 
-                    delay = retry_config.calculate_delay(attempt)
+                    retry_after = retry_after_from(e)
+                    if retry_after is not None and retry_after > CONSTANTS.THROTTLE_MAX_DELAY:
+                        logger.warning(
+                            "Not retrying - Retry-After exceeds the longest allowed wait",
+                            function=func.__name__,
+                            attempt=attempt + 1,
+                            retry_after=retry_after,
+                            max_delay=CONSTANTS.THROTTLE_MAX_DELAY,
+                        )
+                        break
+                    delay = retry_config.calculate_delay(attempt, retry_after)
+                    if not budget_allows(delay):
+                        logger.warning(
+                            "Not retrying - backoff exceeds remaining job budget",
+                            function=func.__name__,
+                            attempt=attempt + 1,
+                            delay=round(delay, 2),
+                        )
+                        break
+                    if budget_url is not None and not budget.try_retry(budget_url):
+                        logger.warning(
+                            "Not retrying - domain retry budget exhausted",
+                            function=func.__name__,
+                            attempt=attempt + 1,
+                            domain=domain_key(budget_url),
+                        )
+                        break
 
                     logger.warning(
                         "Retrying after failure with exponential backoff and full jitter",
@@ -203,6 +330,8 @@ class CircuitBreaker:
         half_open_max_calls: int = 3,
         expected_exception: type[Exception] = Exception,
         name: str = "default",
+        retry_budget: RetryBudget | None = None,
+        is_failure: Callable[[BaseException], bool] | None = None,
     ):
         """Initialize circuit breaker with enhanced configuration.
 
@@ -212,12 +341,19 @@ class CircuitBreaker:
             half_open_max_calls: Maximum calls allowed in half-open state
             expected_exception: Exception type to monitor
             name: Circuit breaker name for logging
+            retry_budget: Optional retry budget keyed by ``name`` (a URL or host)
+                that opening the circuit exhausts; successes are credited by the
+                request layer, not here
+            is_failure: Optional finer check of which ``expected_exception`` errors count
+                as failures, e.g. to ignore 404s
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.half_open_max_calls = half_open_max_calls
         self.expected_exception = expected_exception
         self.name = name
+        self.retry_budget = retry_budget
+        self.is_failure = is_failure
 
         # State tracking
         self.failure_count = 0
@@ -278,12 +414,16 @@ class CircuitBreaker:
             # Success case
             self.successful_calls += 1
             self._handle_success()
-        elif exc_type and issubclass(exc_type, self.expected_exception):
+        elif issubclass(exc_type, self.expected_exception) and (
+            self.is_failure is None or self.is_failure(exc_val)
+        ):
             # Expected failure
             self.failed_calls += 1
             self._handle_failure()
         else:
-            # Unexpected exception - don't affect circuit breaker state
+            # Unexpected exception - don't affect circuit breaker state, but free the probe slot
+            if self.state == CircuitBreakerState.HALF_OPEN:
+                self.half_open_calls = max(0, self.half_open_calls - 1)
             logger.debug(
                 "Unexpected exception in circuit breaker",
                 name=self.name,
@@ -318,6 +458,7 @@ class CircuitBreaker:
             # Failure in half-open state - go back to open
             self.state = CircuitBreakerState.OPEN
             self.success_count = 0
+            self._exhaust_retry_budget()
             logger.warning(
                 "Circuit breaker reopened after failure in half-open state",
                 name=self.name,
@@ -326,6 +467,7 @@ class CircuitBreaker:
         elif self.failure_count >= self.failure_threshold:
             # Too many failures - open the circuit
             self.state = CircuitBreakerState.OPEN
+            self._exhaust_retry_budget()
             logger.warning(
                 "Circuit breaker opened due to failure threshold exceeded",
                 name=self.name,
@@ -333,6 +475,11 @@ class CircuitBreaker:
                 threshold=self.failure_threshold,
             )
 
+    def _exhaust_retry_budget(self) -> None:
+        """Stop other callers retrying against a circuit that just opened."""
+        if self.retry_budget is not None:
+            self.retry_budget.exhaust(self.name)
+
     @property
     def metrics(self) -> dict[str, Any]:
         """Get circuit breaker metrics for monitoring."""
@@ -350,6 +497,147 @@ class CircuitBreaker:
         }
 
 
+def is_host_failure(error: BaseException) -> bool:
+    """Whether an error means the host itself is failing rather than this request.
+
+    Connection errors, timeouts, 5xx and 429 responses count; other 4xx
+    responses, local I/O errors and an exceeded job deadline do not.
+    """
+    if isinstance(error, DeadlineExceededError):
+        return False
+    if isinstance(error, ClientResponseError):
+        return (
+            error.status >= CONSTANTS.HTTP_STATUS_SERVER_ERROR
+            or error.status == CONSTANTS.HTTP_STATUS_TOO_MANY_REQUESTS
+        )
+    return isinstance(error, ClientError | TimeoutError)
+
+
+class CircuitBreakerRegistry:
+    """One circuit breaker per host, shared by every request to that host.
+
+    Page fetches, image downloads and robots.txt fetches enter the breaker of
+    their host, so once a host keeps failing every caller fails fast with
+    :class:`RateLimitError` instead of running its full retry schedule.
+    Schedulers use :meth:`hold_time` to defer a host's queued jobs while its
+    breaker is open and to send them one at a time while it is probing.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CONSTANTS.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = CONSTANTS.CIRCUIT_BREAKER_RECOVERY_TIMEOUT,
+        half_open_max_calls: int = CONSTANTS.CIRCUIT_BREAKER_HALF_OPEN_CALLS,
+        max_hosts: int = CONSTANTS.CIRCUIT_BREAKER_MAX_HOSTS,
+        budget: RetryBudget | None = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            failure_threshold: Host failures before a breaker opens
+            recovery_timeout: Seconds an open breaker waits before probing
+            half_open_max_calls: Successful probes needed to close a breaker
+            max_hosts: Healthy breakers kept before the oldest are forgotten
+            budget: Retry budget the breakers exhaust when they open (shared budget if None)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.max_hosts = max_hosts
+        self.budget = budget if budget is not None else retry_budget
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """Circuit breaker of a URL's host, created on first use.
+
+        Args:
+            url: URL (or bare host) being requested
+
+        Returns:
+            The host's circuit breaker
+        """
+        host = host_key(url)
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            if len(self._breakers) >= self.max_hosts:
+                self._forget_healthy()
+            breaker = self._breakers[host] = CircuitBreaker(
+                failure_threshold=self.failure_threshold,
+                recovery_timeout=self.recovery_timeout,
+                half_open_max_calls=self.half_open_max_calls,
+                expected_exception=Exception,
+                name=host,
+                retry_budget=self.budget,
+                is_failure=is_host_failure,
+            )
+        return breaker
+
+    def _forget_healthy(self) -> None:
+        """Drop closed breakers without recent failures, oldest first, to bound memory."""
+        for host in [h for h, b in self._breakers.items() if self._is_healthy(b)]:
+            del self._breakers[host]
+            if len(self._breakers) < self.max_hosts // 2:
+                break
+
+    @staticmethod
+    def _is_healthy(breaker: CircuitBreaker) -> bool:
+        return breaker.state == CircuitBreakerState.CLOSED and breaker.failure_count == 0
+
+    def hold_time(self, url: str) -> float | None:
+        """How long jobs for a URL's host should wait before starting.
+
+        Args:
+            url: URL (or bare host) of the queued job
+
+        Returns:
+            None if the host's breaker is closed, 0.0 if it is ready for a probe
+            (one job at a time), otherwise seconds until it will be
+        """
+        breaker = self._breakers.get(host_key(url))
+        if breaker is None or breaker.state == CircuitBreakerState.CLOSED:
+            return None
+        if breaker.state == CircuitBreakerState.OPEN:
+            reopen_at = (breaker.last_failure_time or 0) + breaker.recovery_timeout
+            return max(0.0, reopen_at - time.time())
+        return 0.0
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Breaker counts by state, with the metrics of every breaker that is not closed."""
+        states = {state.value: 0 for state in CircuitBreakerState}
+        tripped = {}
+        for host, breaker in self._breakers.items():
+            states[breaker.state.value] += 1
+            if breaker.state != CircuitBreakerState.CLOSED:
+                tripped[host] = breaker.metrics
+        return {"hosts": len(self._breakers), "states": states, "tripped": tripped}
+
+    def clear(self) -> None:
+        """Forget every breaker."""
+        self._breakers.clear()
+
+
+# Global instance shared by the fetch, image and robots paths
+circuit_breakers = CircuitBreakerRegistry()
+
+
+def domain_hold_time(url: str) -> float | None:
+    """How long jobs for a URL's domain should wait, combining throttling and its breaker.
+
+    Args:
+        url: URL (or bare host) of the queued job
+
+    Returns:
+        The longer of the domain's Retry-After hold and its breaker's hold time,
+        or None if neither holds it (see :meth:`CircuitBreakerRegistry.hold_time`)
+    """
+    holds = [
+        hold
+        for hold in (domain_throttle.hold_time(url), circuit_breakers.hold_time(url))
+        if hold is not None
+    ]
+    return max(holds) if holds else None
+
+
 class BulkheadPattern:
     """Bulkhead pattern implementation for resource isolation.
 
@@ -507,11 +795,15 @@ class ResilienceManager:
                 # No additional patterns
                 return await func(*args, **kwargs)
 
-        # Apply retry pattern
+        # Apply retry pattern, sharing the circuit breaker's retry budget
+        breaker = self.circuit_breaker
+        shared_budget = breaker.retry_budget if breaker else None
         retry_decorator = with_retry(
             retry_config=self.retry_config,
             retry_on=retry_on,
             reraise_on=reraise_on,
+            budget_key=(lambda: breaker.name) if shared_budget else None,  # type: ignore[union-attr]
+            budget=shared_budget,
         )
 
         return await retry_decorator(_execute_with_patterns)()
@@ -6,15 +6,25 @@ from urllib.robotparser import RobotFileParser
 
 import aiohttp
 import structlog
-from tenacity import AsyncRetrying, stop_after_attempt, wait_fixed
+from tenacity import AsyncRetrying, retry_if_not_exception_type, stop_after_attempt, wait_fixed
 
 from ..constants import CONSTANTS
 from ..core.config import config
-from ..core.exceptions import RateLimitError
+from ..core.exceptions import DeadlineExceededError, RateLimitError
 from ..utils.http import safe_http_get
+from .deadline import budget_allows, current_deadline
+from .retry import circuit_breakers
 
 logger = structlog.get_logger(__name__)
 
+ROBOTS_RETRY_ATTEMPTS = 3
+ROBOTS_RETRY_WAIT = 1.0
+
+
+def _retry_outlasts_deadline(_retry_state) -> bool:
+    """Tenacity stop condition: the next wait would not fit the job deadline."""
+    return not budget_allows(ROBOTS_RETRY_WAIT)
+
 
 class RobotsChecker:
     """Handles robots.txt compliance and crawl delay enforcement."""
@@ -54,20 +64,24 @@ class RobotsChecker:
         try:
             logger.debug("Fetching robots.txt", url=robots_url)
 
-            # Use tenacity for retry logic
+            # Use tenacity for retry logic, giving up early if the job budget runs short
             async for attempt in AsyncRetrying(
-                stop=stop_after_attempt(3), wait=wait_fixed(1), reraise=True
+                stop=stop_after_attempt(ROBOTS_RETRY_ATTEMPTS) | _retry_outlasts_deadline,
+                wait=wait_fixed(ROBOTS_RETRY_WAIT),
+                retry=retry_if_not_exception_type(RateLimitError),
+                reraise=True,
             ):
                 with attempt:
-                    http_response = await safe_http_get(
-                        session,
-                        robots_url,
-                        timeout=CONSTANTS.ROBOTS_TIMEOUT,
-                        expected_statuses={
-                            CONSTANTS.HTTP_STATUS_OK,
-                            CONSTANTS.HTTP_STATUS_NOT_FOUND,
-                        },
-                    )
+                    async with circuit_breakers.breaker_for(domain):
+                        http_response = await safe_http_get(
+                            session,
+                            robots_url,
+                            timeout=CONSTANTS.ROBOTS_TIMEOUT,
+                            expected_statuses={
+                                CONSTANTS.HTTP_STATUS_OK,
+                                CONSTANTS.HTTP_STATUS_NOT_FOUND,
+                            },
+                        )
 
                     if http_response.status == CONSTANTS.HTTP_STATUS_OK:
                         robots_content = http_response.content
@@ -93,8 +107,16 @@ class RobotsChecker:
                         )
                         result = None
 
+        except RateLimitError as e:
+            # Host circuit is open - don't cache, so robots.txt is fetched once it recovers
+            logger.warning("Skipping robots.txt fetch", domain=domain, error=str(e))
+            return None
         except (TimeoutError, aiohttp.ClientError, OSError) as e:
             logger.warning("Failed to fetch robots.txt", domain=domain, error=str(e))
+            deadline = current_deadline()
+            if deadline is not None and deadline.expired:
+                # Cut short by this job's budget - let a later job fetch it properly
+                return None
             result = None
 
         # Cache the result (success or failure) to avoid repeated requests
@@ -175,6 +197,9 @@ class RobotsChecker:
             url: URL being accessed
             user_agent: User agent string
             session: aiohttp session
+
+        Raises:
+            DeadlineExceededError: If the delay would outlast the job deadline
         """
         parsed_url = urlparse(url)
         domain = f"{parsed_url.scheme}://{parsed_url.netloc}"
@@ -190,6 +215,10 @@ class RobotsChecker:
 
             if time_since_last < crawl_delay:
                 sleep_time = crawl_delay - time_since_last
+                if not budget_allows(sleep_time):
+                    raise DeadlineExceededError(
+                        f"Crawl delay of {sleep_time:.1f}s for {domain} exceeds job deadline"
+                    )
                 logger.debug(
                     "Enforcing crawl delay", domain=domain, delay=crawl_delay, sleep_time=sleep_time
                 )
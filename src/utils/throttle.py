@@ -0,0 +1,181 @@
+"""Per-domain throttling driven by 429/503 responses and their Retry-After headers.
+
+A host answering 429 Too Many Requests or 503 Service Unavailable is asking
+every client to back off, not just the request that got the answer. The
+response's ``Retry-After`` (delay-seconds or an HTTP date) sets a "not before"
+time for the whole domain: schedulers defer that domain's queued jobs until
+it passes, so they wait once together instead of each retrying blindly, and
+retry layers never back off for less than the host asked.
+"""
+
+import math
+import time
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import structlog
+from aiohttp import ClientResponseError
+
+from ..constants import CONSTANTS
+from .url import host_key
+
+logger = structlog.get_logger(__name__)
+
+# Statuses whose response throttles the whole domain
+THROTTLE_STATUSES = frozenset(
+    {CONSTANTS.HTTP_STATUS_TOO_MANY_REQUESTS, CONSTANTS.HTTP_STATUS_SERVICE_UNAVAILABLE}
+)
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait according to a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+        now: Current time for HTTP dates (the current UTC time if None)
+
+    Returns:
+        Seconds to wait (0.0 for dates in the past), or None if the value is
+        missing or unparseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=UTC)
+        seconds = (when - (now or datetime.now(UTC))).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
+
+
+def retry_after_from(error: BaseException | None) -> float | None:
+    """Retry-After delay carried by a 429/503 error or the error it wraps.
+
+    Follows ``cause`` and ``__cause__`` so a :class:`ClientResponseError`
+    wrapped in a FetchError or ConversionError is still found.
+
+    Args:
+        error: Exception raised by a request
+
+    Returns:
+        Seconds the host asked to wait, or None if the error is not a
+        throttling response with a usable Retry-After header
+    """
+    seen: set[int] = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, ClientResponseError):
+            if error.status not in THROTTLE_STATUSES or not error.headers:
+                return None
+            return parse_retry_after(error.headers.get("Retry-After"))
+        error = getattr(error, "cause", None) or error.__cause__
+    return None
+
+
+class DomainThrottle:
+    """Per-domain "not before" times set by 429/503 responses.
+
+    Every throttling response pushes its domain's not-before time out to
+    ``Retry-After`` (or ``default_delay`` without one), never pulling it in.
+    Schedulers read :meth:`hold_time` to defer the domain's queued jobs.
+    """
+
+    def __init__(
+        self,
+        default_delay: float = CONSTANTS.THROTTLE_DEFAULT_DELAY,
+        max_delay: float = CONSTANTS.THROTTLE_MAX_DELAY,
+        max_domains: int = CONSTANTS.CIRCUIT_BREAKER_MAX_HOSTS,
+    ):
+        """Initialize the throttle.
+
+        Args:
+            default_delay: Seconds to hold a domain whose response had no usable Retry-After
+            max_delay: Longest hold a Retry-After can request
+            max_domains: Throttled domains tracked before expired entries are dropped
+        """
+        self.default_delay = default_delay
+        self.max_delay = max_delay
+        self.max_domains = max_domains
+        self._not_before: dict[str, float] = {}
+        self.events: dict[str, int] = {}
+
+    def throttle(self, url: str, status: int, retry_after: float | None = None) -> float:
+        """Hold a URL's domain after a throttling response.
+
+        Args:
+            url: URL (or bare host) that was throttled
+            status: HTTP status of the response
+            retry_after: Seconds the response asked to wait (``default_delay`` if None)
+
+        Returns:
+            Seconds the domain is held from now
+        """
+        domain = host_key(url)
+        delay = min(self.default_delay if retry_after is None else retry_after, self.max_delay)
+        now = time.monotonic()
+        if len(self._not_before) >= self.max_domains:
+            self._forget_expired(now)
+        not_before = max(self._not_before.get(domain, 0.0), now + delay)
+        self._not_before[domain] = not_before
+        self.events[domain] = self.events.get(domain, 0) + 1
+
+        from ..monitoring.metrics import metrics_collector
+
+        metrics_collector.record_throttle(domain, status)
+        logger.warning(
+            "Domain throttled by server",
+            domain=domain,
+            status=status,
+            retry_after=retry_after,
+            hold=round(not_before - now, 2),
+        )
+        return not_before - now
+
+    def _forget_expired(self, now: float) -> None:
+        for domain in [d for d, t in self._not_before.items() if t <= now]:
+            del self._not_before[domain]
+
+    def hold_time(self, url: str) -> float | None:
+        """How long jobs for a URL's domain should wait before starting.
+
+        Args:
+            url: URL (or bare host) of the queued job
+
+        Returns:
+            Seconds until the domain's not-before time, or None if it is not held
+        """
+        domain = host_key(url)
+        not_before = self._not_before.get(domain)
+        if not_before is None:
+            return None
+        remaining = not_before - time.monotonic()
+        if remaining <= 0:
+            del self._not_before[domain]
+            return None
+        return remaining
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Throttling events per domain and the seconds each held domain has left."""
+        now = time.monotonic()
+        return {
+            "events": dict(self.events),
+            "held": {d: round(t - now, 2) for d, t in self._not_before.items() if t > now},
+        }
+
+    def clear(self) -> None:
+        """Forget every hold and event count."""
+        self._not_before.clear()
+        self.events.clear()
+
+
+# Global instance shared by the fetch and image paths and the batch schedulers
+domain_throttle = DomainThrottle()
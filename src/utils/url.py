@@ -1,11 +1,18 @@
 """URL processing utilities to eliminate DRY violations."""
 
-from urllib.parse import ParseResult, urljoin, urlparse
+from urllib.parse import ParseResult, parse_qsl, urlencode, urljoin, urlparse, urlunparse
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAM_PREFIXES = ("utm_",)
+TRACKING_PARAMS = frozenset(
+    {"fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid", "_ga"}
+)
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
 
 def safe_parse_url(url: str) -> ParseResult | None:
     """Safely parse URL with error handling.
@@ -40,6 +47,26 @@ def extract_domain(url: str) -> str | None:
     return parsed.netloc if parsed else None
 
 
+def domain_key(url: str) -> str:
+    """Per-host key for a URL: its lower-cased host, or the URL itself if unparsable."""
+    return (extract_domain(url) or url).lower()
+
+
+def host_key(url_or_host: str) -> str:
+    """Per-host key for a URL or a bare host, matching ``domain_key`` without logging.
+
+    Callers that already hold a host (e.g. the batch scheduler's domain keys)
+    can pass it as is instead of having it rejected as an invalid URL.
+    """
+    if "://" not in url_or_host:
+        return url_or_host.lower()
+    try:
+        netloc = urlparse(url_or_host).netloc
+    except ValueError:
+        netloc = ""
+    return (netloc or url_or_host).lower()
+
+
 def is_same_domain(url1: str, url2: str) -> bool:
     """Check if two URLs are from the same domain.
 
@@ -71,7 +98,7 @@ def normalize_url(url: str, base_url: str | None = None) -> str | None:
     url = url.strip()
 
     # If already absolute, validate and return
-    if url.startswith(("http://", "https://")):
+    if url.lower().startswith(("http://", "https://")):
         return url if safe_parse_url(url) else None
 
     # If relative and we have base_url, resolve it
@@ -94,6 +121,79 @@ def normalize_url(url: str, base_url: str | None = None) -> str | None:
     return None
 
 
+def canonicalize_url(url: str, base_url: str | None = None) -> str | None:
+    """Canonical form of a URL for deduplication and fetching.
+
+    Builds on ``normalize_url`` and then lower-cases the scheme and host,
+    drops default ports, the fragment and tracking parameters (``utm_*``,
+    ``fbclid``, ...), and sorts the remaining query parameters. The scheme
+    and trailing slash are kept because they can change what is fetched;
+    ``url_dedup_key`` ignores them.
+
+    Args:
+        url: URL to canonicalize (can be relative)
+        base_url: Base URL for resolving relative URLs
+
+    Returns:
+        Canonical absolute URL or None if invalid
+    """
+    normalized = normalize_url(url, base_url)
+    if normalized is None:
+        return None
+
+    parsed = safe_parse_url(normalized)
+    if parsed is None:
+        return None
+
+    scheme = parsed.scheme.lower()
+    host = (parsed.hostname or "").lower()
+    try:
+        port = parsed.port
+    except ValueError:
+        return None
+    netloc = host if port in (None, DEFAULT_PORTS.get(scheme)) else f"{host}:{port}"
+    if parsed.username or parsed.password:
+        userinfo = parsed.username or ""
+        if parsed.password:
+            userinfo = f"{userinfo}:{parsed.password}"
+        netloc = f"{userinfo}@{netloc}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS
+            and not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+        )
+    )
+    return urlunparse((scheme, netloc, parsed.path or "/", parsed.params, query, ""))
+
+
+def url_dedup_key(url: str) -> str | None:
+    """Identity of a URL for deduplication.
+
+    Two URLs share a key when their canonical forms differ only in
+    ``http``/``https`` or a trailing slash.
+
+    Args:
+        url: Absolute URL
+
+    Returns:
+        Scheme-less canonical key or None if the URL is invalid
+    """
+    canonical = canonicalize_url(url)
+    if canonical is None:
+        return None
+    parsed = urlparse(canonical)
+    path = parsed.path.rstrip("/") or "/"
+    key = f"//{parsed.netloc}{path}"
+    if parsed.params:
+        key += f";{parsed.params}"
+    if parsed.query:
+        key += f"?{parsed.query}"
+    return key
+
+
 def extract_filename_from_url(url: str, default_extension: str = "") -> str:
     """Extract filename from URL path.
 
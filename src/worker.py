@@ -0,0 +1,409 @@
+"""Standalone conversion worker.
+
+Pulls PENDING scraping jobs from the database and runs the conversions outside
+the API process, so request handlers only enqueue work. Conversions run either
+in the worker's event loop or in a pool of child processes that are recycled
+after a fixed number of jobs to keep memory growth bounded.
+
+Usage:
+    python -m src.worker --concurrency 8 --processes 4
+"""
+
+import argparse
+import asyncio
+import contextlib
+import signal
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from .api.crud import BatchCRUD, JobCRUD
+from .constants import CONSTANTS
+from .database.models import JobStatus
+from .utils.logging import setup_logging
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class WorkerConfig:
+    """Configuration for the standalone conversion worker."""
+
+    concurrency: int = CONSTANTS.WORKER_CONCURRENCY
+    processes: int = CONSTANTS.WORKER_PROCESSES
+    poll_interval: float = CONSTANTS.WORKER_POLL_INTERVAL
+    max_tasks_per_child: int = CONSTANTS.WORKER_MAX_TASKS_PER_CHILD
+    memory_limit_mb: int = CONSTANTS.WORKER_MEMORY_LIMIT_MB
+    burst: bool = False  # Exit once the queue is drained
+
+    def validate(self) -> None:
+        """Validate configuration parameters.
+
+        Raises:
+            ValueError: If any parameter is out of range
+        """
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if self.processes < 0:
+            raise ValueError("processes cannot be negative")
+        if self.poll_interval <= 0:
+            raise ValueError("poll_interval must be positive")
+        if self.max_tasks_per_child < 1:
+            raise ValueError("max_tasks_per_child must be at least 1")
+        if self.memory_limit_mb < 0:
+            raise ValueError("memory_limit_mb cannot be negative")
+
+
+def _limit_child_memory(memory_limit_mb: int) -> None:
+    """Cap the address space of a pool child process.
+
+    Args:
+        memory_limit_mb: Limit in megabytes, 0 disables the limit
+    """
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ImportError, ValueError, OSError):
+        # Not supported on this platform - run without a limit
+        pass
+
+
+async def _convert(url: str, output_dir: str) -> None:
+    """Run a single WordPress to Shopify conversion.
+
+    Args:
+        url: WordPress URL to convert
+        output_dir: Output directory for conversion results
+    """
+    from .core.config import config as default_config
+    from .core.converter import AsyncWordPressConverter
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    converter = AsyncWordPressConverter(base_url=url, output_dir=output_path, config=default_config)
+    await converter.convert()
+
+
+def _run_conversion_sync(url: str, output_dir: str) -> None:
+    """Process pool entry point - runs a conversion in a fresh event loop."""
+    asyncio.run(_convert(url, output_dir))
+
+
+def _collect_output_stats(output_dir: str) -> tuple[int, int]:
+    """Measure conversion output.
+
+    Args:
+        output_dir: Output directory of the conversion
+
+    Returns:
+        Tuple of (total content size in bytes, number of downloaded images)
+    """
+    output_path = Path(output_dir)
+    if not output_path.exists():
+        return 0, 0
+
+    total_size = sum(f.stat().st_size for f in output_path.rglob("*") if f.is_file())
+    images_dir = output_path / "images"
+    images = len(list(images_dir.glob("*"))) if images_dir.exists() else 0
+    return total_size, images
+
+
+class ConversionWorker:
+    """Polls the job table and executes conversions with bounded concurrency."""
+
+    def __init__(
+        self,
+        config: WorkerConfig | None = None,
+        session_factory: Callable[[], Any] | None = None,
+    ):
+        """Initialize worker.
+
+        Args:
+            config: Worker configuration
+            session_factory: Async session factory, defaults to the API engine session
+        """
+        self.config = config or WorkerConfig()
+        self.config.validate()
+
+        if session_factory is None:
+            from .api.dependencies import async_session
+
+            session_factory = async_session
+        self.session_factory = session_factory
+
+        self._stop_event = asyncio.Event()
+        self._in_flight: set[asyncio.Task] = set()
+        self._running_jobs: set[int] = set()
+        self._executor: Executor | None = None
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+
+    def stop(self) -> None:
+        """Request a graceful shutdown - in-flight jobs are allowed to finish."""
+        logger.info("Worker stop requested", in_flight=len(self._in_flight))
+        self._stop_event.set()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently being converted."""
+        return len(self._in_flight)
+
+    def _get_executor(self) -> Executor | None:
+        """Create the process pool on first use when process isolation is enabled."""
+        if self.config.processes > 0 and self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.config.processes,
+                max_tasks_per_child=self.config.max_tasks_per_child,
+                initializer=_limit_child_memory,
+                initargs=(self.config.memory_limit_mb,),
+            )
+        return self._executor
+
+    async def run(self) -> None:
+        """Run the worker loop until stopped (or until the queue drains in burst mode)."""
+        logger.info(
+            "Worker started",
+            concurrency=self.config.concurrency,
+            processes=self.config.processes,
+            burst=self.config.burst,
+        )
+        heartbeat = asyncio.create_task(self._renew_leases())
+        try:
+            while not self._stop_event.is_set():
+                claimed = 0
+                capacity = self.config.concurrency - len(self._in_flight)
+                if capacity > 0:
+                    claimed = await self._claim_and_dispatch(capacity)
+
+                if self.config.burst and claimed == 0 and not self._in_flight:
+                    break
+
+                # A full claim means more work is likely waiting - claim again once a slot frees
+                if capacity > 0 and claimed == capacity:
+                    if len(self._in_flight) < self.config.concurrency:
+                        continue
+                    await self._wait_for_progress(idle=False)
+                else:
+                    await self._wait_for_progress(idle=True)
+        finally:
+            if self._in_flight:
+                await asyncio.gather(*self._in_flight, return_exceptions=True)
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+            logger.info("Worker stopped", completed=self.jobs_completed, failed=self.jobs_failed)
+
+    async def _claim_and_dispatch(self, capacity: int) -> int:
+        """Claim up to ``capacity`` jobs and start converting them.
+
+        Returns:
+            Number of jobs claimed
+        """
+        try:
+            async with self.session_factory() as db:
+                jobs = await JobCRUD.claim_pending_jobs(db, capacity)
+                claimed = [(job.id, job.url, job.output_directory, job.batch_id) for job in jobs]
+                await db.commit()
+        except Exception as e:
+            logger.error("Failed to claim jobs", error=str(e))
+            return 0
+
+        for job_args in claimed:
+            task = asyncio.create_task(self._execute(*job_args))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+        if claimed:
+            logger.debug("Claimed jobs", count=len(claimed), in_flight=len(self._in_flight))
+        return len(claimed)
+
+    async def _renew_leases(self) -> None:
+        """Keep renewing the lease on running jobs so other workers don't reclaim them."""
+        interval = CONSTANTS.WORKER_LEASE_SECONDS / 3
+        while True:
+            await asyncio.sleep(interval)
+            if not self._running_jobs:
+                continue
+            try:
+                async with self.session_factory() as db:
+                    await JobCRUD.renew_leases(db, list(self._running_jobs))
+                    await db.commit()
+            except Exception as e:
+                logger.error("Failed to renew job leases", error=str(e))
+
+    async def _wait_for_progress(self, idle: bool) -> None:
+        """Sleep until a job finishes, the poll interval elapses or stop is requested.
+
+        Args:
+            idle: Whether the last claim drained the queue; when False the wait is
+                only bounded by in-flight jobs finishing
+        """
+        waiters: set[asyncio.Future] = set(self._in_flight)
+        stop_waiter = asyncio.ensure_future(self._stop_event.wait())
+        waiters.add(stop_waiter)
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self.config.poll_interval if idle else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            stop_waiter.cancel()
+
+    async def _execute(self, job_id: int, url: str, output_dir: str, batch_id: int | None) -> None:
+        """Convert a claimed job and record its outcome."""
+        error: Exception | None = None
+        self._running_jobs.add(job_id)
+        try:
+            executor = self._get_executor()
+            try:
+                if executor is None:
+                    await _convert(url, output_dir)
+                else:
+                    loop = asyncio.get_running_loop()
+                    await loop.run_in_executor(executor, _run_conversion_sync, url, output_dir)
+            except BrokenProcessPool:
+                # A child died (e.g. OOM-killed) and took the pool down - not the job's outcome
+                self._discard_executor(executor)
+                await self._requeue(job_id)
+                return
+            except Exception as e:
+                error = e
+
+            await self._finish(job_id, output_dir, batch_id, error)
+        finally:
+            self._running_jobs.discard(job_id)
+
+    def _discard_executor(self, executor: Executor | None) -> None:
+        """Drop a broken process pool so the next job starts a fresh one."""
+        if executor is None or self._executor is not executor:
+            return  # Another job already replaced it
+        logger.warning("Conversion process pool broke, starting a new one")
+        self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _requeue(self, job_id: int) -> None:
+        """Put a job whose run was lost back in the queue."""
+        try:
+            async with self.session_factory() as db:
+                status = await JobCRUD.requeue_job(db, job_id, BrokenProcessPool.__name__)
+                await db.commit()
+        except Exception as e:
+            # The job keeps its lease until it expires and another claim picks it up
+            logger.error("Failed to requeue job", job_id=job_id, error=str(e))
+            return
+
+        if status == JobStatus.FAILED:
+            self.jobs_failed += 1
+        logger.warning("Requeued job after its process pool broke", job_id=job_id, status=status)
+
+    async def _finish(
+        self, job_id: int, output_dir: str, batch_id: int | None, error: Exception | None
+    ) -> None:
+        """Persist the final job status and update batch counters."""
+        if error is None:
+            # Walking the output tree blocks - keep it off the loop and out of the session
+            output_stats = await asyncio.to_thread(_collect_output_stats, output_dir)
+        try:
+            async with self.session_factory() as db:
+                if error is None:
+                    job = await JobCRUD.update_job_status(db, job_id, JobStatus.COMPLETED)
+                    if job:
+                        job.content_size_bytes, job.images_downloaded = output_stats
+                    final_status = JobStatus.COMPLETED
+                else:
+                    await JobCRUD.update_job_status(
+                        db,
+                        job_id,
+                        JobStatus.FAILED,
+                        error_message=str(error),
+                        error_type=type(error).__name__,
+                    )
+                    final_status = JobStatus.FAILED
+
+                if batch_id is not None:
+                    await BatchCRUD.record_job_outcome(db, batch_id, final_status)
+                await db.commit()
+        except Exception as e:
+            logger.error("Failed to record job outcome", job_id=job_id, error=str(e))
+            return
+
+        if error is None:
+            self.jobs_completed += 1
+            logger.info("Job completed", job_id=job_id)
+        else:
+            self.jobs_failed += 1
+            logger.warning("Job failed", job_id=job_id, error=str(error))
+
+
+def main() -> None:
+    """Command-line entry point for the standalone worker."""
+    parser = argparse.ArgumentParser(description="Run the scraping job conversion worker")
+    parser.add_argument(
+        "--concurrency", type=int, default=CONSTANTS.WORKER_CONCURRENCY, help="Jobs in flight"
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=CONSTANTS.WORKER_PROCESSES,
+        help="Conversion child processes (0 = run in the worker process)",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=CONSTANTS.WORKER_POLL_INTERVAL,
+        help="Seconds between queue polls when idle",
+    )
+    parser.add_argument(
+        "--max-tasks-per-child",
+        type=int,
+        default=CONSTANTS.WORKER_MAX_TASKS_PER_CHILD,
+        help="Recycle a child process after this many jobs",
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=CONSTANTS.WORKER_MEMORY_LIMIT_MB,
+        help="Address space limit per child process (0 = unlimited)",
+    )
+    parser.add_argument("--burst", action="store_true", help="Exit when the queue is empty")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
+    args = parser.parse_args()
+
+    setup_logging(args.verbose)
+
+    config = WorkerConfig(
+        concurrency=args.concurrency,
+        processes=args.processes,
+        poll_interval=args.poll_interval,
+        max_tasks_per_child=args.max_tasks_per_child,
+        memory_limit_mb=args.memory_limit_mb,
+        burst=args.burst,
+    )
+
+    async def _run() -> None:
+        worker = ConversionWorker(config)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            # Signal handlers are unavailable on some platforms
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(sig, worker.stop)
+        await worker.run()
+
+    asyncio.run(_run())
+
+
+if __name__ == "__main__":
+    main()
@@ -153,6 +153,22 @@ class TestHealthEndpoints:
         assert data["status"] == "degraded"
         assert data["cache"]["status"] == "error"
 
+    def test_health_check_reports_open_circuit_breakers(self, client: TestClient):
+        """Test hosts failing fast are listed without degrading the service."""
+        from src.utils.retry import CircuitBreakerRegistry
+
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.breaker_for("https://down.example.com/")._handle_failure()
+
+        with patch("src.api.routers.health.circuit_breakers", registry):
+            response = client.get("/health/")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+
+        assert data["circuit_breakers"]["states"]["open"] == 1
+        assert data["circuit_breakers"]["tripped"]["down.example.com"]["state"] == "open"
+
     @patch("src.monitoring.metrics.metrics_collector.get_metrics_snapshot")
     def test_get_metrics_success(self, mock_metrics_snapshot, client: TestClient):
         """Test successful metrics retrieval."""
@@ -0,0 +1,76 @@
+"""Tests for batch archive creation."""
+
+import tarfile
+import zipfile
+from unittest.mock import patch
+
+import pytest
+
+from src.batch.archiver import archive_suffix, build_archive
+
+
+@pytest.fixture
+def job_dir(tmp_path):
+    """Create a job output directory with text and image files."""
+    source = tmp_path / "job"
+    (source / "images").mkdir(parents=True)
+    (source / "converted_content.html").write_text("<p>content</p>" * 200)
+    (source / "images" / "photo.jpg").write_bytes(b"\xff\xd8" + b"\x00" * 500)
+    return source
+
+
+class TestArchiveSuffix:
+    """Test archive format validation."""
+
+    @pytest.mark.parametrize(
+        "archive_format,suffix",
+        [("zip", ".zip"), ("tar", ".tar"), ("tar.gz", ".tar.gz"), ("tar.zst", ".tar.zst")],
+    )
+    def test_supported_formats(self, archive_format, suffix):
+        """Test each supported format maps to its suffix."""
+        assert archive_suffix(archive_format) == suffix
+
+    def test_unsupported_format(self):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError, match="Unsupported archive format"):
+            archive_suffix("rar")
+
+
+class TestBuildArchive:
+    """Test archive building."""
+
+    def test_zip_stores_images_and_deflates_text(self, job_dir, tmp_path):
+        """Test precompressed files are stored while text is deflated."""
+        archive_path = tmp_path / "out" / "job.zip"
+
+        size = build_archive(job_dir, archive_path, "zip", compression_level=9)
+
+        assert size == archive_path.stat().st_size
+        with zipfile.ZipFile(archive_path) as zip_file:
+            infos = {info.filename: info for info in zip_file.infolist()}
+        assert infos["images/photo.jpg"].compress_type == zipfile.ZIP_STORED
+        assert infos["converted_content.html"].compress_type == zipfile.ZIP_DEFLATED
+
+    def test_tar_gz(self, job_dir, tmp_path):
+        """Test tar.gz archives contain every file."""
+        archive_path = tmp_path / "job.tar.gz"
+
+        build_archive(job_dir, archive_path, "tar.gz", compression_level=1)
+
+        with tarfile.open(archive_path, "r:gz") as tar:
+            assert sorted(tar.getnames()) == ["converted_content.html", "images/photo.jpg"]
+
+    def test_tar_zst_requires_zstandard(self, job_dir, tmp_path):
+        """Test a clear error is raised when zstandard is unavailable."""
+        with (
+            patch.dict("sys.modules", {"zstandard": None}),
+            pytest.raises(ValueError, match="zstandard"),
+        ):
+            build_archive(job_dir, tmp_path / "job.tar.zst", "tar.zst")
+
+    def test_remove_source(self, job_dir, tmp_path):
+        """Test the source directory is removed when requested."""
+        build_archive(job_dir, tmp_path / "job.tar", "tar", remove_source=True)
+
+        assert not job_dir.exists()
+        assert (tmp_path / "job.tar").exists()
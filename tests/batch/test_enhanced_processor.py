@@ -13,8 +13,10 @@ from src.batch.enhanced_processor import (
     Priority,
     ProcessingResult,
 )
+from src.batch.journal import CheckpointJournal
+from src.constants import CONSTANTS
 from src.core.exceptions import BatchProcessingError
-from src.database.models import JobStatus
+from src.database.models import JobPriority, JobStatus
 from src.database.service import DatabaseService
 
 
@@ -28,6 +30,8 @@ def mock_database_service():
     # Mock database operations
     service.create_batch = Mock(return_value=Mock(id=1))
     service.create_job = Mock(return_value=Mock(id=1))
+    service.create_jobs_bulk = Mock(side_effect=lambda urls, **_: list(range(1, len(urls) + 1)))
+    service.apply_job_updates = Mock()
     service.update_job_status = Mock()
     service.update_batch_progress = Mock()
     service.get_batch = Mock()
@@ -44,14 +48,14 @@ def mock_converter():
 
 
 @pytest.fixture
-def batch_config():
+def batch_config(tmp_path):
     """Create batch configuration."""
     return BatchConfig(
         max_concurrent=3,
         timeout_seconds=10,
         retry_attempts=2,
         retry_delay=0.1,  # Short delay for tests
-        output_directory=Path("test_output"),
+        output_directory=tmp_path / "test_output",
         rate_limit_per_second=10,
     )
 
@@ -209,6 +213,27 @@ class TestBatchConfig:
         with pytest.raises(ValueError, match="retry_delay cannot be negative"):
             config.validate()
 
+    def test_batch_config_validation_invalid_min_concurrent(self):
+        """Test the adaptive floor must be positive and within max_concurrent."""
+        with pytest.raises(ValueError, match="min_concurrent must be positive"):
+            BatchConfig(min_concurrent=0).validate()
+
+        with pytest.raises(ValueError, match="min_concurrent cannot exceed max_concurrent"):
+            BatchConfig(max_concurrent=2, min_concurrent=3).validate()
+
+    def test_batch_config_validation_invalid_target_p95(self):
+        """Test the adaptive latency target must be positive."""
+        with pytest.raises(ValueError, match="target_p95_seconds must be positive"):
+            BatchConfig(target_p95_seconds=0).validate()
+
+    def test_batch_config_validation_invalid_adaptive_max_concurrent(self):
+        """Test the adaptive ceiling is unset or at least max_concurrent."""
+        with pytest.raises(ValueError, match="adaptive_max_concurrent cannot be negative"):
+            BatchConfig(adaptive_max_concurrent=-1).validate()
+
+        with pytest.raises(ValueError, match="cannot be below max_concurrent"):
+            BatchConfig(max_concurrent=4, adaptive_max_concurrent=2).validate()
+
 
 class TestBatchProcessor:
     """Test BatchProcessor functionality."""
@@ -227,9 +252,75 @@ class TestBatchProcessor:
         assert processor.completed_count == 0
         assert processor.failed_count == 0
         assert processor.cancelled is False
-        assert processor.semaphore._value == batch_config.max_concurrent
+        assert processor.concurrency.limit == batch_config.max_concurrent
+        assert processor.concurrency.max_limit == batch_config.max_concurrent
         assert processor.rate_limiter is not None  # Rate limiter configured
 
+    def test_fixed_concurrency_when_adaptive_disabled(self, mock_database_service, mock_converter):
+        """Test disabling the controller pins the limit to max_concurrent."""
+        config = BatchConfig(max_concurrent=4, adaptive_concurrency=False)
+        processor = BatchProcessor(config, mock_database_service, mock_converter)
+
+        assert processor.domain_limiter is None
+        assert processor.concurrency.adaptive is False
+        assert processor.concurrency.min_limit == processor.concurrency.max_limit == 4
+
+    def test_adaptive_ceiling_above_max_concurrent(self, mock_database_service, mock_converter):
+        """Test domains start at max_concurrent and may grow to adaptive_max_concurrent."""
+        config = BatchConfig(
+            max_concurrent=4, adaptive_concurrency=True, adaptive_max_concurrent=10
+        )
+        processor = BatchProcessor(config, mock_database_service, mock_converter)
+
+        assert processor.concurrency.limit == 10
+        assert processor.domain_limiter.limit("example.com") == 4
+        assert processor.domain_limiter.max_limit == 10
+
+    @pytest.mark.asyncio
+    async def test_timeouts_lower_only_their_domain_limit(
+        self, mock_database_service, mock_converter
+    ):
+        """Test a timing out domain shrinks its own limit and leaves the rest alone."""
+        config = BatchConfig(
+            max_concurrent=8, adaptive_concurrency=True, retry_attempts=0, retry_delay=0
+        )
+        processor = BatchProcessor(config, mock_database_service, mock_converter)
+
+        async def convert(url):
+            if "slow.com" in url:
+                raise TimeoutError
+            return {}
+
+        mock_converter.process_url.side_effect = convert
+        for i in range(CONSTANTS.BATCH_AIMD_MIN_SAMPLES):
+            await processor.process_single_url(f"https://slow.com/{i}")
+            await processor.process_single_url(f"https://fast.com/{i}")
+
+        assert processor.domain_limiter.limit("slow.com") == 4
+        assert processor.domain_limiter.limit("fast.com") == 8
+        assert processor.concurrency.limit == 8
+        stats = processor.get_statistics()
+        assert stats["domain_concurrency"]["slow.com"]["decreases"] == 1
+        assert stats["concurrency"]["decreases"] == 0
+
+    @pytest.mark.asyncio
+    async def test_throttled_responses_keep_concurrency_limit(
+        self, mock_database_service, mock_converter
+    ):
+        """Test 429 responses are left to the throttle and do not shrink the limit."""
+        config = BatchConfig(
+            max_concurrent=8, adaptive_concurrency=True, retry_attempts=0, retry_delay=0
+        )
+        processor = BatchProcessor(config, mock_database_service, mock_converter)
+        throttled = Exception("Too Many Requests")
+        throttled.status = 429
+        mock_converter.process_url.side_effect = throttled
+
+        for i in range(CONSTANTS.BATCH_AIMD_MIN_SAMPLES):
+            await processor.process_single_url(f"https://example.com/{i}")
+
+        assert processor.domain_limiter.limit("example.com") == 8
+
     def test_batch_processor_initialization_no_rate_limit(
         self, mock_database_service, mock_converter
     ):
@@ -341,8 +432,36 @@ class TestBatchProcessor:
 
         # Verify database calls
         batch_processor.database_service.create_batch.assert_called_once()
-        # update_batch_progress is called once per job + once at end, so 4 times total for 3 URLs
-        assert batch_processor.database_service.update_batch_progress.call_count == 4
+        # Jobs are created in one bulk insert rather than one create_job call each
+        batch_processor.database_service.create_jobs_bulk.assert_called_once()
+        batch_processor.database_service.create_job.assert_not_called()
+        # Batch counters are maintained incrementally and reconciled once at the end
+        assert batch_processor.database_service.update_batch_progress.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_process_batch_buffers_status_writes(self, batch_processor, mock_converter):
+        """Test status transitions are flushed in bulk instead of per job."""
+        batch_processor.config.db_flush_jobs = 1000
+        batch_processor.config.db_flush_interval_ms = 0
+        urls = [f"https://example.com/{i}" for i in range(50)]
+        mock_converter.process_url.return_value = {"status": "ok"}
+
+        await batch_processor.process_batch("buffered_batch", urls)
+
+        service = batch_processor.database_service
+        service.update_job_status.assert_not_called()
+        service.apply_job_updates.assert_called_once()  # Single flush on close
+
+        updates = [row for call in service.apply_job_updates.call_args_list for row in call.args[0]]
+        final = {row["id"]: row["status"] for row in updates}
+        assert final == dict.fromkeys(range(1, 51), JobStatus.COMPLETED)
+
+        completed = sum(
+            call.args[1].get(1, {}).get(JobStatus.COMPLETED, 0)
+            for call in service.apply_job_updates.call_args_list
+        )
+        assert completed == 50
+        assert batch_processor.status_writer is None
 
     @pytest.mark.asyncio
     async def test_process_batch_with_priorities(self, batch_processor, mock_converter):
@@ -412,10 +531,14 @@ class TestBatchProcessor:
         assert batch_processor.completed_count == 1
         assert batch_processor.failed_count == 0
 
-        # Verify database interactions
+        # Verify database interactions are written immediately outside process_batch
         batch_processor.database_service.create_job.assert_called_once()
-        batch_processor.database_service.update_job_status.assert_called()
-        batch_processor.database_service.update_batch_progress.assert_called_once()
+        update_calls = batch_processor.database_service.apply_job_updates.call_args_list
+        assert [call.args[0][0]["status"] for call in update_calls] == [
+            JobStatus.RUNNING,
+            JobStatus.COMPLETED,
+        ]
+        assert update_calls[-1].args[1] == {batch_id: {JobStatus.COMPLETED: 1}}
 
     @pytest.mark.asyncio
     async def test_process_with_tracking_failure(self, batch_processor, mock_converter):
@@ -436,8 +559,10 @@ class TestBatchProcessor:
         assert batch_processor.failed_count == 1
 
         # Verify failed job was updated with error
-        update_calls = batch_processor.database_service.update_job_status.call_args_list
-        assert any(JobStatus.FAILED.value in str(call) for call in update_calls)
+        update_calls = batch_processor.database_service.apply_job_updates.call_args_list
+        final_row = update_calls[-1].args[0][0]
+        assert final_row["status"] == JobStatus.FAILED
+        assert final_row["error_message"] == "Processing error"
 
     @pytest.mark.asyncio
     async def test_process_with_tracking_checkpoint_saving(self, batch_processor, mock_converter):
@@ -458,7 +583,7 @@ class TestBatchProcessor:
 
     @pytest.mark.asyncio
     async def test_resume_batch(self, batch_processor):
-        """Test resuming an interrupted batch."""
+        """Test resuming an interrupted batch reuses its job rows."""
         batch_id = 1
 
         # Mock batch
@@ -466,38 +591,31 @@ class TestBatchProcessor:
         mock_batch.id = batch_id
         mock_batch.name = "resume_test"
         mock_batch.total_jobs = 5
+        mock_batch.completed_jobs = 3
 
-        # Mock jobs for SQLAlchemy query
-        mock_pending_job = Mock(url="pending_url1")
-        mock_failed_job = Mock(url="failed_url")
-
-        # Mock SQLAlchemy session and query
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = [mock_pending_job, mock_failed_job]
-        mock_session.execute.return_value = mock_result
-        mock_session.__enter__ = Mock(return_value=mock_session)
-        mock_session.__exit__ = Mock(return_value=None)
+        # Mock pending and failed jobs of the batch
+        mock_pending_job = Mock(url="pending_url1", id=11)
+        mock_failed_job = Mock(url="failed_url", id=12)
 
         batch_processor.database_service.get_batch.return_value = mock_batch
-        batch_processor.database_service.get_session.return_value = mock_session
-
-        # Mock process_batch to avoid actual processing
-        with patch.object(batch_processor, "process_batch", new_callable=AsyncMock) as mock_process:
-            mock_process.return_value = BatchResults(
-                total=2, successful=["pending_url1"], failed=["failed_url"]
-            )
+        batch_processor.database_service.get_batch_jobs.return_value = [
+            mock_pending_job,
+            mock_failed_job,
+        ]
 
+        # Mock the run to avoid actual processing
+        with patch.object(batch_processor, "_run_batch", new_callable=AsyncMock) as mock_run:
             result = await batch_processor.resume_batch(batch_id)
 
-            assert result.total == 5  # Original total
-            mock_process.assert_called_once()
+        assert result.total == 5  # Original total
+        mock_run.assert_called_once()
 
-            # Should process pending and failed URLs
-            processed_urls = mock_process.call_args[0][1]
-            assert "pending_url1" in processed_urls
-            assert "failed_url" in processed_urls
-            assert len(processed_urls) == 2
+        # Should process pending and failed jobs under the same batch and job IDs
+        run_batch_id, jobs = mock_run.call_args[0][:2]
+        assert run_batch_id == batch_id
+        assert jobs == [("pending_url1", 11), ("failed_url", 12)]
+        assert mock_run.call_args.kwargs["completed_before"] == 3
+        batch_processor.database_service.create_batch.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_resume_batch_not_found(self, batch_processor):
@@ -516,19 +634,144 @@ class TestBatchProcessor:
 
         await batch_processor._save_checkpoint(123)
 
-        checkpoint_file = tmp_path / "checkpoint_123.json"
+        checkpoint_file = tmp_path / "checkpoint_123.ndjson"
         assert checkpoint_file.exists()
 
-        import json
-
-        with open(checkpoint_file) as f:
-            data = json.load(f)
+        data = CheckpointJournal.replay(checkpoint_file).counts
 
         assert data["batch_id"] == 123
         assert data["completed"] == 5
         assert data["failed"] == 2
         assert "timestamp" in data
 
+    @pytest.mark.asyncio
+    async def test_process_batch_journals_url_states(
+        self, batch_processor, mock_converter, tmp_path
+    ):
+        """Test every URL's final state is journaled for exact resume."""
+        batch_processor.config.output_directory = tmp_path
+        urls = ["https://example.com/ok", "https://example.com/fail"]
+
+        def mock_process_url(url):
+            if "fail" in url:
+                raise Exception("Processing failed")
+            return {"status": "ok"}
+
+        mock_converter.process_url.side_effect = mock_process_url
+
+        await batch_processor.process_batch("journal_batch", urls)
+
+        state = CheckpointJournal.replay(tmp_path / "checkpoint_1.ndjson")
+        assert state.entries["https://example.com/ok"]["state"] == "completed"
+        assert state.entries["https://example.com/fail"]["state"] == "failed"
+        assert state.entries["https://example.com/ok"]["job_id"] == 1
+        assert state.counts["completed"] == 1
+        assert batch_processor.journal is None
+
+    @pytest.mark.asyncio
+    async def test_resume_batch_from_journal(self, batch_processor, tmp_path):
+        """Test resume replays the journal, including jobs running at crash time."""
+        batch_processor.config.output_directory = tmp_path
+        mock_batch = Mock(id=7, total_jobs=4)
+        mock_batch.name = "crashed"
+        batch_processor.database_service.get_batch.return_value = mock_batch
+
+        journal = CheckpointJournal(tmp_path / "checkpoint_7.ndjson")
+        journal.register(["u1", "u2", "u3", "u4"], [1, 2, 3, 4], ["normal"] * 4)
+        journal.record("u1", "running")
+        journal.record("u1", "completed")
+        journal.record("u2", "running")  # In flight when the process died
+        journal.record("u3", "failed", error="boom")
+        journal.close()
+
+        with patch.object(batch_processor, "_run_batch", new_callable=AsyncMock) as mock_run:
+            result = await batch_processor.resume_batch(7)
+
+        assert mock_run.call_args[0][:2] == (7, [("u2", 2), ("u3", 3), ("u4", 4)])
+        assert mock_run.call_args.kwargs["completed_before"] == 1
+        assert result.total == 4
+        batch_processor.database_service.get_batch_jobs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_batch_keeps_journaled_priorities(self, batch_processor, tmp_path):
+        """Test resumed jobs are ranked with the priorities of the original run."""
+        batch_processor.config.output_directory = tmp_path
+        batch_processor.database_service.get_batch.return_value = Mock(id=7, total_jobs=3)
+
+        journal = CheckpointJournal(tmp_path / "checkpoint_7.ndjson")
+        journal.register(["u1", "u2", "u3"], [1, 2, 3], ["urgent", "normal", "low"])
+        journal.record("u2", "failed", error="boom")
+        journal.close()
+
+        with patch.object(batch_processor, "_run_batch", new_callable=AsyncMock) as mock_run:
+            await batch_processor.resume_batch(7)
+
+        _, jobs, priority_of = mock_run.call_args[0][:3]
+        assert jobs == [("u1", 1), ("u2", 2), ("u3", 3)]
+        assert [priority_of(url) for url, _ in jobs] == [
+            Priority.URGENT,
+            Priority.NORMAL,
+            Priority.LOW,
+        ]
+        batch_processor.database_service.get_batch_jobs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_batch_reads_priorities_from_job_rows(self, batch_processor):
+        """Test resuming without a journal ranks jobs by the priority stored on their rows."""
+        batch_processor.database_service.get_batch.return_value = Mock(
+            id=1, total_jobs=2, completed_jobs=0
+        )
+        batch_processor.database_service.get_batch_jobs.return_value = [
+            Mock(url="high_url", id=11, priority=JobPriority.HIGH),
+            Mock(url="low_url", id=12, priority=JobPriority.LOW),
+        ]
+
+        with patch.object(batch_processor, "_run_batch", new_callable=AsyncMock) as mock_run:
+            await batch_processor.resume_batch(1)
+
+        priority_of = mock_run.call_args[0][2]
+        assert priority_of("high_url") == Priority.HIGH
+        assert priority_of("low_url") == Priority.LOW
+
+    @pytest.mark.asyncio
+    async def test_resume_batch_continues_same_journal_and_jobs(
+        self, batch_processor, mock_converter, tmp_path
+    ):
+        """Test a resumed batch appends to its own journal and reuses its job IDs."""
+        batch_processor.config.output_directory = tmp_path
+        urls = ["https://example.com/ok", "https://example.com/flaky"]
+
+        def first_run(url):
+            if "flaky" in url:
+                raise Exception("down")
+            return {"status": "ok"}
+
+        mock_converter.process_url.side_effect = first_run
+        batch_processor.config.retry_attempts = 0
+        await batch_processor.process_batch("first_run", urls)
+
+        service = batch_processor.database_service
+        service.get_batch.return_value = Mock(id=1, total_jobs=2, completed_jobs=1)
+        service.create_batch.reset_mock()
+        service.create_jobs_bulk.reset_mock()
+        mock_converter.process_url.side_effect = None
+        mock_converter.process_url.return_value = {"status": "ok"}
+
+        result = await batch_processor.resume_batch(1)
+
+        assert result.successful == ["https://example.com/flaky"]
+        assert result.total == 2
+        service.create_batch.assert_not_called()
+        service.create_jobs_bulk.assert_not_called()
+        assert list(tmp_path.glob("checkpoint_*.ndjson")) == [tmp_path / "checkpoint_1.ndjson"]
+        state = CheckpointJournal.replay(tmp_path / "checkpoint_1.ndjson")
+        assert state.entries["https://example.com/flaky"] == {
+            "state": "completed",
+            "job_id": 2,
+            "priority": "normal",
+        }
+        assert state.counts["completed"] == 2
+
     def test_cancel(self, batch_processor):
         """Test cancelling batch processing."""
         # Add mock active tasks
@@ -590,6 +833,33 @@ class TestBatchProcessor:
         # Total time should be at least 0.3 seconds (3 * 0.1)
         assert end_time - start_time >= 0.25  # Allow some margin
 
+    @pytest.mark.asyncio
+    async def test_in_flight_tasks_bounded_for_large_batch(
+        self, batch_config, mock_database_service, mock_converter
+    ):
+        """Test tasks are created lazily so large batches keep a constant task count."""
+        batch_config.max_concurrent = 2
+        batch_config.lookahead = 1
+        batch_config.rate_limit_per_second = None
+        batch_config.save_checkpoints = False
+        processor = BatchProcessor(batch_config, mock_database_service, mock_converter)
+        peak_tasks = 0
+
+        async def process(url):
+            nonlocal peak_tasks
+            peak_tasks = max(peak_tasks, len(processor.active_tasks))
+            await asyncio.sleep(0)
+            return {"data": url}
+
+        mock_converter.process_url.side_effect = process
+        urls = [f"https://example.com/{i}" for i in range(200)]
+
+        result = await processor.process_batch("large_batch", urls)
+
+        assert len(result.successful) == 200
+        assert peak_tasks <= 3
+        assert not processor.active_tasks
+
 
 @pytest.mark.integration
 @pytest.mark.asyncio
@@ -607,6 +877,7 @@ async def test_batch_processor_integration(tmp_path):
     mock_db = MagicMock(spec=DatabaseService)
     mock_db.create_batch.return_value = Mock(id=1)
     mock_db.create_job.return_value = Mock(id=1)
+    mock_db.create_jobs_bulk.side_effect = lambda urls, **_: list(range(1, len(urls) + 1))
     mock_db.update_batch_status = Mock()
     mock_db.update_job_status = Mock()
     mock_db.update_batch_progress = Mock()
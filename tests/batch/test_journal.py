@@ -0,0 +1,136 @@
+"""Tests for the append-only checkpoint journal."""
+
+import json
+
+import pytest
+
+from src.batch.journal import CheckpointJournal
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    """Path for a journal file."""
+    return tmp_path / "checkpoint_1.ndjson"
+
+
+class TestCheckpointJournal:
+    """Test CheckpointJournal append, replay and compaction."""
+
+    def test_invalid_compact_factor(self, journal_path):
+        """Test compaction thresholds below two lines per URL are rejected."""
+        with pytest.raises(ValueError, match="compact_factor must be at least 2"):
+            CheckpointJournal(journal_path, compact_factor=1)
+
+    def test_transitions_are_appended(self, journal_path):
+        """Test each transition costs one appended line."""
+        journal = CheckpointJournal(journal_path)
+        journal.register(["a", "b"], [10, 11])
+        journal.record("a", "running")
+        journal.close()
+
+        lines = journal_path.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0]) == {"url": "a", "state": "pending", "job_id": 10}
+        assert json.loads(lines[2]) == {"url": "a", "state": "running"}
+
+    def test_replay_recovers_exact_remaining_set(self, journal_path):
+        """Test replay returns pending, running and failed URLs in journal order."""
+        journal = CheckpointJournal(journal_path)
+        journal.register(["a", "b", "c", "d"])
+        journal.record("a", "completed")
+        journal.record("b", "running")
+        journal.record("c", "failed", error="boom")
+        journal.close()
+
+        state = CheckpointJournal.replay(journal_path)
+
+        assert state.remaining() == ["b", "c", "d"]
+        assert state.remaining(include_failed=False) == ["b", "d"]
+        assert state.entries["c"]["error"] == "boom"
+        assert state.state_counts() == {"completed": 1, "running": 1, "failed": 1, "pending": 1}
+
+    def test_remaining_jobs_keep_journaled_ids(self, journal_path):
+        """Test resume gets each unfinished URL with the job ID it was registered under."""
+        journal = CheckpointJournal(journal_path)
+        journal.register(["a", "b", "c"], [10, 11, 12])
+        journal.record("a", "completed", job_id=10)
+        journal.record("b", "failed", error="boom")
+        journal.close()
+
+        state = CheckpointJournal.replay(journal_path)
+
+        assert state.remaining_jobs() == [("b", 11), ("c", 12)]
+        assert state.remaining_jobs(include_failed=False) == [("c", 12)]
+
+    def test_later_success_clears_error(self, journal_path):
+        """Test a retried URL does not keep the previous attempt's error."""
+        journal = CheckpointJournal(journal_path)
+        journal.record("a", "failed", error="boom")
+        journal.record("a", "completed")
+        journal.close()
+
+        assert "error" not in CheckpointJournal.replay(journal_path).entries["a"]
+
+    def test_replay_skips_torn_last_line(self, journal_path):
+        """Test a partial line left by a crash does not break replay."""
+        journal = CheckpointJournal(journal_path)
+        journal.register(["a", "b"])
+        journal.close()
+        with open(journal_path, "a") as f:
+            f.write('{"url": "a", "sta')
+
+        assert CheckpointJournal.replay(journal_path).remaining() == ["a", "b"]
+
+    def test_reopen_continues_from_existing_state(self, journal_path):
+        """Test a journal reopened after a crash appends to the recovered state."""
+        first = CheckpointJournal(journal_path)
+        first.register(["a", "b"])
+        first.close()
+
+        second = CheckpointJournal(journal_path)
+        second.record("a", "completed")
+        second.close()
+
+        assert CheckpointJournal.replay(journal_path).remaining() == ["b"]
+
+    def test_checkpoint_compacts_when_file_grows(self, journal_path):
+        """Test compaction rewrites the journal to one line per URL."""
+        journal = CheckpointJournal(journal_path, compact_factor=2)
+        journal.register(["a", "b"])
+        for url in ("a", "b"):
+            journal.record(url, "running")
+            journal.record(url, "completed")
+
+        journal.checkpoint(completed=2, failed=0)
+        journal.close()
+
+        lines = [json.loads(line) for line in journal_path.read_text().splitlines()]
+        assert len(lines) == 3  # One per URL plus the checkpoint
+        assert {line.get("url"): line.get("state") for line in lines if "url" in line} == {
+            "a": "completed",
+            "b": "completed",
+        }
+        assert lines[-1]["event"] == "checkpoint"
+        assert lines[-1]["completed"] == 2
+        assert not journal_path.with_suffix(".ndjson.tmp").exists()
+
+    def test_checkpoint_without_growth_does_not_compact(self, journal_path):
+        """Test a small journal is only appended to."""
+        journal = CheckpointJournal(journal_path)
+        journal.register(["a", "b", "c"])
+        journal.checkpoint(completed=0)
+        journal.close()
+
+        assert len(journal_path.read_text().splitlines()) == 4
+
+    def test_writes_after_compaction_are_appended(self, journal_path):
+        """Test the journal keeps appending to the compacted file."""
+        journal = CheckpointJournal(journal_path, compact_factor=2)
+        journal.register(["a"])
+        journal.record("a", "running")
+        journal.record("a", "failed")
+        journal.checkpoint()
+        journal.record("a", "completed")
+        journal.close()
+
+        assert CheckpointJournal.replay(journal_path).remaining() == []
@@ -9,6 +9,7 @@ import pytest
 
 from src.batch.enhanced_processor import BatchResults
 from src.batch.monitoring import AlertManager, BatchMonitor, MetricsCollector
+from src.database.async_service import AsyncDatabaseService
 from src.database.models import Batch, JobStatus, ScrapingJob
 from src.database.service import DatabaseService
 
@@ -159,6 +160,36 @@ class TestMetricsCollector:
 
         # Test passes if no exception is raised
 
+    @pytest.mark.asyncio
+    async def test_record_system_metric_async_service(self):
+        """Test metrics go through the async service as background writes."""
+        service = MagicMock(spec=AsyncDatabaseService)
+        collector = MetricsCollector(service)
+
+        collector.record_processing_result("url1", 1.0, False, error_type="Timeout")
+        assert len(collector.pending_writes) == 2
+
+        await collector.wait_for_writes()
+
+        assert not collector.pending_writes
+        names = [
+            call.kwargs["metric_name"] for call in service.record_system_metric.await_args_list
+        ]
+        assert names == ["processing_error", "processing_duration"]
+        service.get_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_record_system_metric_async_failure_is_logged(self):
+        """Test background write failures are swallowed like sync ones."""
+        service = MagicMock(spec=AsyncDatabaseService)
+        service.record_system_metric.side_effect = Exception("Database error")
+        collector = MetricsCollector(service)
+
+        collector._record_system_metric(metric_type="test", metric_name="m", numeric_value=1.0)
+        await collector.wait_for_writes()
+
+        assert not collector.pending_writes
+
 
 class TestBatchMonitor:
     """Test BatchMonitor functionality."""
@@ -170,12 +201,10 @@ class TestBatchMonitor:
         assert monitor.database_service is mock_database_service
         assert isinstance(monitor.metrics_collector, MetricsCollector)
 
-    def test_get_active_batches(self, batch_monitor):
+    @pytest.mark.asyncio
+    async def test_get_active_batches(self, batch_monitor):
         """Test getting active batches information."""
-        # Mock database queries
-        mock_session = (
-            batch_monitor.database_service.get_session.return_value.__enter__.return_value
-        )
+        service = batch_monitor.database_service
 
         # Mock batch
         mock_batch = Mock(spec=Batch)
@@ -187,18 +216,16 @@ class TestBatchMonitor:
         mock_batch.max_concurrent = 5
         mock_batch.output_base_directory = "/test/output"
 
-        mock_session.query.return_value.filter.return_value.all.return_value = [mock_batch]
+        service.get_batches.return_value = [mock_batch]
 
         # Mock job statistics
-        mock_stats = Mock()
-        mock_stats.total = 10
-        mock_stats.completed = 7
-        mock_stats.running = 2
-        mock_stats.failed = 1
-
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_stats
+        service.get_job_status_counts.return_value = {
+            JobStatus.COMPLETED: 7,
+            JobStatus.RUNNING: 2,
+            JobStatus.FAILED: 1,
+        }
 
-        batches = batch_monitor.get_active_batches()
+        batches = await batch_monitor.get_active_batches()
 
         assert len(batches) == 1
         batch_info = batches[0]
@@ -210,22 +237,22 @@ class TestBatchMonitor:
         assert batch_info["running_jobs"] == 2
         assert batch_info["failed_jobs"] == 1
         assert batch_info["progress_percent"] == 70.0  # 7/10 * 100
+        service.get_batches.assert_called_once_with([JobStatus.PENDING, JobStatus.RUNNING])
+        service.get_job_status_counts.assert_called_once_with(1)
+        service.get_session.assert_not_called()
 
-    def test_get_batch_details_not_found(self, batch_monitor):
+    @pytest.mark.asyncio
+    async def test_get_batch_details_not_found(self, batch_monitor):
         """Test getting details for non-existent batch."""
-        mock_session = (
-            batch_monitor.database_service.get_session.return_value.__enter__.return_value
-        )
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        batch_monitor.database_service.get_batch.return_value = None
 
-        result = batch_monitor.get_batch_details(999)
+        result = await batch_monitor.get_batch_details(999)
         assert result is None
 
-    def test_get_batch_details_found(self, batch_monitor):
+    @pytest.mark.asyncio
+    async def test_get_batch_details_found(self, batch_monitor):
         """Test getting detailed batch information."""
-        mock_session = (
-            batch_monitor.database_service.get_session.return_value.__enter__.return_value
-        )
+        service = batch_monitor.database_service
 
         # Mock batch
         mock_batch = Mock(spec=Batch)
@@ -239,7 +266,7 @@ class TestBatchMonitor:
         mock_batch.max_concurrent = 3
         mock_batch.output_base_directory = "/output"
 
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_batch
+        service.get_batch.return_value = mock_batch
 
         # Mock jobs
         mock_jobs = []
@@ -252,9 +279,9 @@ class TestBatchMonitor:
             job.error_message = None
             mock_jobs.append(job)
 
-        mock_session.query.return_value.filter.return_value.all.return_value = mock_jobs
+        service.get_batch_jobs.return_value = mock_jobs
 
-        details = batch_monitor.get_batch_details(1)
+        details = await batch_monitor.get_batch_details(1)
 
         assert details is not None
         assert details["batch"]["id"] == 1
@@ -274,11 +301,10 @@ class TestBatchMonitor:
         assert "recent_activity" in details
         assert len(details["recent_activity"]) == 3
 
-    def test_get_batch_details_no_completed_jobs(self, batch_monitor):
+    @pytest.mark.asyncio
+    async def test_get_batch_details_no_completed_jobs(self, batch_monitor):
         """Test getting batch details with no completed jobs."""
-        mock_session = (
-            batch_monitor.database_service.get_session.return_value.__enter__.return_value
-        )
+        service = batch_monitor.database_service
 
         mock_batch = Mock(spec=Batch)
         mock_batch.id = 1
@@ -291,7 +317,7 @@ class TestBatchMonitor:
         mock_batch.max_concurrent = 5
         mock_batch.output_base_directory = "/output"
 
-        mock_session.query.return_value.filter.return_value.first.return_value = mock_batch
+        service.get_batch.return_value = mock_batch
 
         # Mock jobs with no completed ones
         mock_jobs = [
@@ -299,27 +325,26 @@ class TestBatchMonitor:
                 spec=ScrapingJob, status=JobStatus.PENDING, duration_seconds=None, completed_at=None
             )
         ]
-        mock_session.query.return_value.filter.return_value.all.return_value = mock_jobs
+        service.get_batch_jobs.return_value = mock_jobs
 
-        details = batch_monitor.get_batch_details(1)
+        details = await batch_monitor.get_batch_details(1)
 
         assert details["timing_statistics"] is None
         assert len(details["recent_activity"]) == 0
 
-    def test_get_system_health(self, batch_monitor):
+    @pytest.mark.asyncio
+    async def test_get_system_health(self, batch_monitor):
         """Test getting system health metrics."""
-        mock_session = (
-            batch_monitor.database_service.get_session.return_value.__enter__.return_value
-        )
+        service = batch_monitor.database_service
 
         # Mock job status counts
-        mock_counts = [
-            (JobStatus.COMPLETED, 100),
-            (JobStatus.FAILED, 5),
-            (JobStatus.RUNNING, 3),
-            (JobStatus.PENDING, 10),
-        ]
-        mock_session.query.return_value.group_by.return_value.all.return_value = mock_counts
+        service.get_job_status_counts.return_value = {
+            JobStatus.COMPLETED: 100,
+            JobStatus.FAILED: 5,
+            JobStatus.RUNNING: 3,
+            JobStatus.PENDING: 10,
+        }
+        service.check_connection.return_value = True
 
         # Mock recent jobs for error rate calculation
         mock_recent_jobs = []
@@ -328,7 +353,7 @@ class TestBatchMonitor:
             job.status = JobStatus.FAILED if i < 2 else JobStatus.COMPLETED
             mock_recent_jobs.append(job)
 
-        mock_session.query.return_value.filter.return_value.all.return_value = mock_recent_jobs
+        service.get_jobs.return_value = mock_recent_jobs
 
         # Mock engine stats
         mock_engine = Mock()
@@ -341,7 +366,7 @@ class TestBatchMonitor:
         mock_engine.pool = mock_pool
         batch_monitor.database_service.engine = mock_engine
 
-        health = batch_monitor.get_system_health()
+        health = await batch_monitor.get_system_health()
 
         assert "timestamp" in health
         assert health["job_status_counts"]["completed"] == 100
@@ -353,15 +378,31 @@ class TestBatchMonitor:
         assert pool_stats["pool_size"] == 20
         assert pool_stats["checked_in"] == 15
         assert pool_stats["checked_out"] == 5
+        assert health["database"]["healthy"] is True
 
         assert "runtime_metrics" in health
 
+    @pytest.mark.asyncio
+    async def test_database_health_check_failure(self, batch_monitor):
+        """Test an unreachable database reports unhealthy instead of raising."""
+        batch_monitor.database_service.check_connection.side_effect = Exception("down")
+
+        assert await batch_monitor._check_database_health() is False
+
+    @pytest.mark.asyncio
+    async def test_async_service_is_awaited(self):
+        """Test an async service is awaited on the loop instead of opening sync sessions."""
+        service = MagicMock(spec=AsyncDatabaseService)
+        service.get_batch.return_value = None
+        monitor = BatchMonitor(service)
+
+        assert await monitor.get_batch_details(1) is None
+        service.get_batch.assert_awaited_once_with(1)
+
     @pytest.mark.asyncio
     async def test_generate_report(self, batch_monitor, tmp_path):
         """Test generating comprehensive batch processing report."""
-        mock_session = (
-            batch_monitor.database_service.get_session.return_value.__enter__.return_value
-        )
+        service = batch_monitor.database_service
 
         start_date = datetime.now(UTC) - timedelta(days=1)
         end_date = datetime.now(UTC)
@@ -389,11 +430,9 @@ class TestBatchMonitor:
             job.url = f"https://example.com/page{i}"
             mock_jobs.append(job)
 
-        # Setup query mocks
-        mock_session.query.return_value.filter.return_value.all.side_effect = [
-            mock_batches,  # First call for batches
-            mock_jobs,  # Second call for jobs
-        ]
+        # Setup service mocks
+        service.get_batches.return_value = mock_batches
+        service.get_jobs.return_value = mock_jobs
 
         output_file = tmp_path / "report.json"
 
@@ -435,10 +474,8 @@ class TestBatchMonitor:
     @pytest.mark.asyncio
     async def test_generate_report_no_output_file(self, batch_monitor):
         """Test generating report without saving to file."""
-        mock_session = (
-            batch_monitor.database_service.get_session.return_value.__enter__.return_value
-        )
-        mock_session.query.return_value.filter.return_value.all.return_value = []
+        batch_monitor.database_service.get_batches.return_value = []
+        batch_monitor.database_service.get_jobs.return_value = []
 
         start_date = datetime.now(UTC) - timedelta(days=1)
         end_date = datetime.now(UTC)
@@ -467,10 +504,7 @@ class TestAlertManager:
     @pytest.mark.asyncio
     async def test_check_error_rate_alert_no_jobs(self, alert_manager):
         """Test error rate check with no recent jobs."""
-        mock_session = (
-            alert_manager.database_service.get_session.return_value.__enter__.return_value
-        )
-        mock_session.query.return_value.filter.return_value.all.return_value = []
+        alert_manager.database_service.get_jobs.return_value = []
 
         alert = await alert_manager.check_error_rate_alert()
         assert alert is None
@@ -478,10 +512,6 @@ class TestAlertManager:
     @pytest.mark.asyncio
     async def test_check_error_rate_alert_low_error_rate(self, alert_manager):
         """Test error rate check with acceptable error rate."""
-        mock_session = (
-            alert_manager.database_service.get_session.return_value.__enter__.return_value
-        )
-
         # Mock 20 jobs, 1 failed (5% error rate - below threshold)
         mock_jobs = []
         for i in range(20):
@@ -490,7 +520,7 @@ class TestAlertManager:
             job.created_at = datetime.now(UTC) - timedelta(minutes=30)
             mock_jobs.append(job)
 
-        mock_session.query.return_value.filter.return_value.all.return_value = mock_jobs
+        alert_manager.database_service.get_jobs.return_value = mock_jobs
 
         alert = await alert_manager.check_error_rate_alert()
         assert alert is None
@@ -498,10 +528,6 @@ class TestAlertManager:
     @pytest.mark.asyncio
     async def test_check_error_rate_alert_high_error_rate_warning(self, alert_manager):
         """Test error rate check with warning-level error rate."""
-        mock_session = (
-            alert_manager.database_service.get_session.return_value.__enter__.return_value
-        )
-
         # Mock 20 jobs, 3 failed (15% error rate - above 10% threshold but below 25%)
         mock_jobs = []
         for i in range(20):
@@ -510,7 +536,7 @@ class TestAlertManager:
             job.created_at = datetime.now(UTC) - timedelta(minutes=30)
             mock_jobs.append(job)
 
-        mock_session.query.return_value.filter.return_value.all.return_value = mock_jobs
+        alert_manager.database_service.get_jobs.return_value = mock_jobs
 
         alert = await alert_manager.check_error_rate_alert()
 
@@ -524,10 +550,6 @@ class TestAlertManager:
     @pytest.mark.asyncio
     async def test_check_error_rate_alert_high_error_rate_critical(self, alert_manager):
         """Test error rate check with critical-level error rate."""
-        mock_session = (
-            alert_manager.database_service.get_session.return_value.__enter__.return_value
-        )
-
         # Mock 10 jobs, 3 failed (30% error rate - above 25% threshold)
         mock_jobs = []
         for i in range(10):
@@ -536,7 +558,7 @@ class TestAlertManager:
             job.created_at = datetime.now(UTC) - timedelta(minutes=30)
             mock_jobs.append(job)
 
-        mock_session.query.return_value.filter.return_value.all.return_value = mock_jobs
+        alert_manager.database_service.get_jobs.return_value = mock_jobs
 
         alert = await alert_manager.check_error_rate_alert()
 
@@ -547,10 +569,7 @@ class TestAlertManager:
     @pytest.mark.asyncio
     async def test_check_stalled_jobs_alert_no_stalled_jobs(self, alert_manager):
         """Test stalled jobs check with no stalled jobs."""
-        mock_session = (
-            alert_manager.database_service.get_session.return_value.__enter__.return_value
-        )
-        mock_session.query.return_value.filter.return_value.all.return_value = []
+        alert_manager.database_service.get_jobs.return_value = []
 
         alert = await alert_manager.check_stalled_jobs_alert()
         assert alert is None
@@ -558,19 +577,19 @@ class TestAlertManager:
     @pytest.mark.asyncio
     async def test_check_stalled_jobs_alert_with_stalled_jobs(self, alert_manager):
         """Test stalled jobs check with stalled jobs found."""
-        mock_session = (
-            alert_manager.database_service.get_session.return_value.__enter__.return_value
-        )
-
         # Mock stalled jobs
         stalled_job = Mock(spec=ScrapingJob)
         stalled_job.url = "https://example.com/stalled"
         stalled_job.started_at = datetime.now(UTC) - timedelta(hours=1)
 
-        mock_session.query.return_value.filter.return_value.all.return_value = [stalled_job]
+        alert_manager.database_service.get_jobs.return_value = [stalled_job]
 
         alert = await alert_manager.check_stalled_jobs_alert()
 
+        call = alert_manager.database_service.get_jobs.call_args
+        assert call.kwargs["statuses"] == [JobStatus.RUNNING]
+        assert call.kwargs["started_before"] < datetime.now(UTC) - timedelta(minutes=29)
+
         assert alert is not None
         assert alert["type"] == "stalled_jobs"
         assert alert["severity"] == "warning"
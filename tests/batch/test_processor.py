@@ -1,8 +1,10 @@
 """Unit tests for batch processor."""
+
 # pylint: disable=protected-access
 
 import asyncio
 import json
+import tarfile
 import tempfile
 import zipfile
 from pathlib import Path
@@ -11,6 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.batch.processor import BatchConfig, BatchJob, BatchJobStatus, BatchProcessor
+from src.core.converter import ConversionResult
 from src.core.exceptions import ConversionError
 from src.utils.path_utils import get_directory_name
 
@@ -412,6 +415,23 @@ class TestBatchProcessorFileLoading:
         ]
         assert urls == expected_urls
 
+    def test_add_jobs_from_file_drops_duplicates_across_files(self, processor, tmp_path):
+        """Test equivalent URLs are loaded once, even from different files."""
+        first = tmp_path / "first.txt"
+        first.write_text("https://example.com/post1?utm_medium=email\nhttps://example.com/post2\n")
+        second = tmp_path / "second.csv"
+        second.write_text("url,slug\nhttp://example.com/post1/,\nhttps://example.com/post3,\n")
+
+        assert processor.add_jobs_from_file(first) == 2
+        assert processor.add_jobs_from_file(second) == 1
+
+        assert [job.url for job in processor.jobs] == [
+            "https://example.com/post1",
+            "https://example.com/post2",
+            "https://example.com/post3",
+        ]
+        assert processor.duplicates_skipped == 1
+
     def test_add_jobs_from_nonexistent_file(self, processor):
         """Test loading from non-existent file raises error."""
         with pytest.raises(FileNotFoundError):
@@ -432,6 +452,161 @@ class TestBatchProcessorFileLoading:
             temp_path.unlink()
 
 
+class TestBatchProcessorStreaming:
+    """Test streaming URL file processing."""
+
+    @pytest.fixture
+    def processor(self, tmp_path):
+        """Create processor writing into a temporary directory."""
+        config = BatchConfig(output_base_dir=tmp_path / "out", create_summary=False)
+        return BatchProcessor(batch_config=config)
+
+    def test_iter_jobs_skips_duplicates(self, processor, tmp_path):
+        """Test duplicate URLs are skipped and counted."""
+        urls_file = tmp_path / "urls.txt"
+        urls_file.write_text(
+            "https://example.com/post1\n# comment\n\nhttps://example.com/post1\n"
+            "https://example.com/post2\n"
+        )
+
+        jobs = list(processor.iter_jobs_from_file(urls_file))
+
+        assert [job.url for job in jobs] == [
+            "https://example.com/post1",
+            "https://example.com/post2",
+        ]
+        assert processor.duplicates_skipped == 1
+        assert not processor.jobs  # Streaming never populates the job list
+
+    def test_iter_jobs_skips_equivalent_urls(self, processor, tmp_path):
+        """Test URLs differing only in scheme, slash, tracking params or fragment are skipped."""
+        urls_file = tmp_path / "urls.txt"
+        urls_file.write_text(
+            "https://example.com/post1\nhttp://example.com/post1/\n"
+            "https://example.com/post1?utm_source=newsletter\nhttps://example.com/post1#top\n"
+        )
+
+        jobs = list(processor.iter_jobs_from_file(urls_file))
+
+        assert [job.url for job in jobs] == ["https://example.com/post1"]
+        assert processor.duplicates_skipped == 3
+
+    def test_iter_jobs_unique_output_directories(self, processor, tmp_path):
+        """Test distinct URLs sharing a slug get numbered directories."""
+        urls_file = tmp_path / "urls.txt"
+        urls_file.write_text("https://example.com/a/post\nhttps://example.com/b/post\n")
+
+        jobs = list(processor.iter_jobs_from_file(urls_file))
+
+        assert jobs[0].output_dir.name == "example-com_post"
+        assert jobs[1].output_dir.name == "example-com_post-2"
+
+    def test_iter_urls_structured_csv(self, processor, tmp_path):
+        """Test structured CSV rows are parsed lazily with optional columns."""
+        csv_file = tmp_path / "urls.csv"
+        csv_file.write_text(
+            "url,slug,output_dir\n"
+            "https://example.com/post1,custom,\n"
+            "#https://example.com/skipped,,\n"
+            "https://example.com/post2,,/custom/dir\n"
+        )
+
+        rows = list(processor.iter_urls_from_file(csv_file))
+
+        assert rows == [
+            ("https://example.com/post1", "custom", None),
+            ("https://example.com/post2", None, Path("/custom/dir")),
+        ]
+
+    def test_iter_urls_missing_file(self, processor, tmp_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(processor.iter_urls_from_file(tmp_path / "missing.txt"))
+
+    def test_batch_job_is_slotted(self):
+        """Test job records have no per-instance dict."""
+        job = BatchJob(url="https://example.com", output_dir=Path("out"))
+
+        assert not hasattr(job, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_process_file_writes_job_entries(self, processor, tmp_path):
+        """Test finished jobs are written to the jobs file instead of the summary."""
+        urls_file = tmp_path / "urls.txt"
+        urls_file.write_text(
+            "https://example.com/post1\nhttps://example.com/post2\nhttps://example.com/post1\n"
+        )
+
+        async def complete(job, progress, callback=None):
+            job.status = BatchJobStatus.COMPLETED
+            return job
+
+        with patch.object(processor, "_process_single_job", side_effect=complete):
+            summary = await processor.process_file(urls_file)
+
+        assert summary["total"] == 2
+        assert summary["successful"] == 2
+        assert summary["duplicates"] == 1
+        assert summary["jobs"] == []
+
+        lines = Path(summary["jobs_file"]).read_text().splitlines()
+        entries = [json.loads(line) for line in lines]
+        assert sorted(entry["url"] for entry in entries) == [
+            "https://example.com/post1",
+            "https://example.com/post2",
+        ]
+        assert all(entry["status"] == "completed" for entry in entries)
+
+
+class TestBatchProcessorAggregateProgress:
+    """Test aggregate-only progress and NDJSON summaries."""
+
+    def test_auto_mode_switches_on_batch_size(self):
+        """Test auto mode only renders per-job rows for small known batches."""
+        processor = BatchProcessor()
+
+        assert not processor._use_aggregate_progress(3)
+        assert processor._use_aggregate_progress(100_000)
+        assert processor._use_aggregate_progress(None)
+
+    def test_explicit_modes(self):
+        """Test explicit progress modes override the batch size."""
+        assert BatchProcessor(BatchConfig(progress_mode="aggregate"))._use_aggregate_progress(1)
+        assert not BatchProcessor(BatchConfig(progress_mode="detailed"))._use_aggregate_progress(
+            100_000
+        )
+
+    @pytest.mark.asyncio
+    async def test_aggregate_mode_streams_job_entries(self, tmp_path):
+        """Test aggregate mode skips per-job rows and appends entries to NDJSON."""
+        config = BatchConfig(output_base_dir=tmp_path, progress_mode="aggregate")
+        processor = BatchProcessor(batch_config=config)
+        for i in range(5):
+            processor.add_job(f"https://example.com/post-{i}")
+        progress_tasks = []
+
+        async def process(job, progress, callback=None):
+            progress_tasks.append(job.progress_task)
+            job.status = (
+                BatchJobStatus.FAILED if job.url.endswith("4") else BatchJobStatus.COMPLETED
+            )
+            return job
+
+        with patch.object(processor, "_process_single_job", side_effect=process):
+            summary = await processor.process_all()
+
+        assert progress_tasks == [None] * 5
+        assert summary["jobs"] == []
+        assert summary["successful"] == 4
+        assert summary["failed"] == 1
+
+        entries = [json.loads(line) for line in (tmp_path / "batch_jobs.ndjson").open()]
+        assert len(entries) == 5
+        saved = json.loads((tmp_path / "batch_summary.json").read_text())
+        assert saved["jobs_file"] == str(tmp_path / "batch_jobs.ndjson")
+        assert saved["total"] == 5
+
+
 class TestBatchProcessorAsyncProcessing:
     """Test async batch processing functionality."""
 
@@ -484,6 +659,28 @@ class TestBatchProcessorAsyncProcessing:
             assert result.status == BatchJobStatus.FAILED
             assert "Timeout after" in result.error
 
+    @pytest.mark.asyncio
+    async def test_process_single_job_partial_result(self, processor):
+        """Test a job cut short during images completes and is marked partial."""
+        processor.config.timeout_per_job = 100
+        job = BatchJob(url="https://example.com/test", output_dir=Path("/tmp/test"))
+
+        with patch("src.batch.processor.AsyncWordPressConverter") as mock_converter_class:
+            mock_converter = AsyncMock()
+            mock_converter_class.return_value = mock_converter
+            mock_converter.convert = AsyncMock(return_value=ConversionResult(1, 0, partial=True))
+
+            result = await processor._process_single_job(job, MagicMock())
+
+        assert result.status == BatchJobStatus.COMPLETED
+        assert result.partial
+        # Stages get a deadline just inside the hard per-job timeout
+        assert mock_converter.convert.call_args.kwargs["budget"] == 95
+
+        summary = processor._empty_summary(1)
+        processor._record_job(summary, result)
+        assert summary["jobs"][0]["partial"] is True
+
     @pytest.mark.asyncio
     async def test_process_single_job_conversion_error(self, processor):
         """Test job error handling."""
@@ -537,6 +734,95 @@ class TestBatchProcessorAsyncProcessing:
                 assert summary["failed"] == 0
                 mock_summary.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_process_all_bounds_in_flight_jobs(self):
+        """Test only max_concurrent + lookahead jobs are admitted at a time."""
+        config = BatchConfig(max_concurrent=2, lookahead=1, create_summary=False)
+        processor = BatchProcessor(batch_config=config)
+        for i in range(20):
+            processor.add_job(f"https://example.com/post-{i}")
+
+        admitted = 0
+        peak_admitted = 0
+
+        async def process(job, progress, callback=None):
+            nonlocal admitted, peak_admitted
+            admitted += 1
+            peak_admitted = max(peak_admitted, admitted)
+            await asyncio.sleep(0)
+            job.status = BatchJobStatus.COMPLETED
+            admitted -= 1
+            return job
+
+        with patch.object(processor, "_process_single_job", side_effect=process):
+            summary = await processor.process_all()
+
+        assert summary["successful"] == 20
+        assert len(summary["jobs"]) == 20
+        assert peak_admitted <= 3
+
+    @pytest.mark.asyncio
+    async def test_process_all_shares_slots_across_domains(self):
+        """Test a slow site capped by its politeness limit leaves slots for a fast site."""
+        config = BatchConfig(
+            max_concurrent=4, lookahead=0, per_domain_concurrency=2, create_summary=False
+        )
+        processor = BatchProcessor(batch_config=config)
+        for i in range(8):
+            processor.add_job(f"https://slow.example.com/post-{i}")
+        for i in range(4):
+            processor.add_job(f"https://fast.example.com/post-{i}")
+
+        running: dict[str, int] = {}
+        peak: dict[str, int] = {}
+        finished: list[str] = []
+        fast_done = asyncio.Event()
+
+        async def process(job, progress, callback=None):
+            host = job.url.split("/")[2]
+            running[host] = running.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), running[host])
+            if host.startswith("slow"):
+                # Slow jobs hold their slots until every fast job has finished
+                await fast_done.wait()
+            else:
+                await asyncio.sleep(0)
+            running[host] -= 1
+            finished.append(host)
+            if finished.count("fast.example.com") == 4:
+                fast_done.set()
+            job.status = BatchJobStatus.COMPLETED
+            return job
+
+        with patch.object(processor, "_process_single_job", side_effect=process):
+            summary = await processor.process_all()
+
+        assert summary["successful"] == 12
+        assert peak == {"slow.example.com": 2, "fast.example.com": 2}
+        # The fast site finishes while the slow one is still working through its queue
+        assert finished[:4] == ["fast.example.com"] * 4
+
+    @pytest.mark.asyncio
+    async def test_process_all_stops_admitting_after_failure(self):
+        """Test continue_on_error=False stops admitting new jobs after a failure."""
+        config = BatchConfig(
+            max_concurrent=1, lookahead=0, continue_on_error=False, create_summary=False
+        )
+        processor = BatchProcessor(batch_config=config)
+        for i in range(5):
+            processor.add_job(f"https://example.com/post-{i}")
+
+        async def fail(job, progress, callback=None):
+            job.status = BatchJobStatus.FAILED
+            raise ConversionError("boom")
+
+        with patch.object(processor, "_process_single_job", side_effect=fail) as mock_process:
+            summary = await processor.process_all()
+
+        assert mock_process.call_count == 1
+        assert summary["failed"] == 1
+        assert summary["total"] == 5
+
     @pytest.mark.asyncio
     async def test_compile_results_statistics(self, processor):
         """Test result compilation and statistics."""
@@ -606,6 +892,22 @@ class TestBatchProcessorArchiving:
             assert "metadata.txt" in file_list
             assert "images/test.jpg" in file_list
 
+    @pytest.mark.asyncio
+    async def test_create_archive_honors_format(self, processor, tmp_path):
+        """Test archive_format selects the archive type."""
+        processor.config.output_base_dir = tmp_path
+        processor.config.archive_format = "tar.gz"
+        job_dir = tmp_path / "test_job"
+        job_dir.mkdir()
+        (job_dir / "content.html").write_text("<html>Test</html>")
+        job = BatchJob(url="https://example.com/test", output_dir=job_dir)
+
+        archive_path = await processor._create_archive(job)
+        processor._shutdown_archive_executor()
+
+        assert archive_path.name == "test_job.tar.gz"
+        assert tarfile.is_tarfile(archive_path)
+
     @pytest.mark.asyncio
     async def test_create_archive_nonexistent_directory(self, processor):
         """Test archive creation with non-existent directory."""
@@ -635,6 +937,44 @@ class TestBatchProcessorArchiving:
         # Directory should be removed after archiving
         assert not job_dir.exists()
 
+    @pytest.mark.asyncio
+    async def test_slow_archive_does_not_hold_job_slot(self, tmp_path):
+        """Test the next job runs while the previous job's archive is still being built."""
+        config = BatchConfig(
+            create_archives=True,
+            output_base_dir=tmp_path,
+            max_concurrent=1,
+            lookahead=0,
+            progress_mode="aggregate",
+        )
+        processor = BatchProcessor(batch_config=config)
+        processor.add_job("https://example.com/post-1")
+        processor.add_job("https://example.com/post-2")
+        processed = []
+        archive_gate = asyncio.Event()
+
+        async def process(job, progress, callback=None):
+            processed.append(job.url)
+            if len(processed) == 2:
+                # Both jobs converted before any archive finished
+                archive_gate.set()
+            job.status = BatchJobStatus.COMPLETED
+            return job
+
+        async def create_archive(job):
+            await archive_gate.wait()
+            return tmp_path / f"{job.output_dir.name}.zip"
+
+        with (
+            patch.object(processor, "_process_single_job", side_effect=process),
+            patch.object(processor, "_create_archive", side_effect=create_archive),
+        ):
+            summary = await asyncio.wait_for(processor.process_all(), timeout=5)
+
+        assert len(processed) == 2
+        assert summary["successful"] == 2
+        assert all(job.archive_path is not None for job in processor.jobs)
+
 
 class TestBatchProcessorSummaryReporting:
     """Test summary reporting functionality."""
@@ -796,7 +1136,12 @@ class TestBatchProcessorEdgeCases:
 
                     result = await processor._process_single_job(job, mock_progress)
 
+                    # Archiving is a separate stage that doesn't hold the job's slot
                     assert result.status == BatchJobStatus.COMPLETED
+                    mock_archive.assert_not_called()
+
+                    await processor._archive_job(result)
+
                     mock_archive.assert_called_once_with(job)
                     assert result.archive_path == Path("/tmp/test.zip")
 
@@ -819,6 +1164,7 @@ class TestBatchProcessorEdgeCases:
 
                 # Job should still complete successfully even if archive fails
                 result = await processor._process_single_job(job, mock_progress)
+                await processor._archive_job(result)
 
                 assert result.status == BatchJobStatus.COMPLETED
                 assert result.archive_path is None  # Archive creation failed
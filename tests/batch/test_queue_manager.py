@@ -1,13 +1,14 @@
 """Tests for batch queue management system."""
 
 import asyncio
-from datetime import UTC, datetime
+import random
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.batch.enhanced_processor import Priority, ProcessingResult
-from src.batch.queue_manager import BatchQueueManager, QueueItem, QueueStatus
+from src.batch.queue_manager import BatchQueueManager, IndexedHeap, QueueItem, QueueStatus
 from src.database.service import DatabaseService
 
 
@@ -76,6 +77,43 @@ class TestQueueItem:
         assert high_item < low_item
 
 
+class TestIndexedHeap:
+    """Test the URL-indexed heap behind the queue manager."""
+
+    def test_pop_order_with_removals_and_updates(self):
+        """Test pops stay sorted after arbitrary removes and key changes."""
+        rng = random.Random(42)
+        heap = IndexedHeap()
+        keys = {}
+        for i in range(200):
+            url = f"url{i}"
+            keys[url] = rng.random()
+            heap.push(keys[url], QueueItem(3, datetime.now(UTC), url))
+
+        for url in rng.sample(sorted(keys), 50):
+            assert heap.remove(url).url == url
+            del keys[url]
+        for url in rng.sample(sorted(keys), 50):
+            keys[url] = rng.random()
+            assert heap.update(url, keys[url]) is True
+
+        popped = [heap.pop().url for _ in range(len(heap))]
+
+        assert popped == sorted(keys, key=keys.get)
+        assert len(heap) == 0
+        assert heap.remove("url0") is None
+        with pytest.raises(IndexError):
+            heap.pop()
+
+    def test_equal_keys_are_fifo(self):
+        """Test items with the same key come out in insertion order."""
+        heap = IndexedHeap()
+        for url in ("a", "b", "c"):
+            heap.push(1.0, QueueItem(3, datetime.now(UTC), url))
+
+        assert [heap.pop().url for _ in range(3)] == ["a", "b", "c"]
+
+
 class TestBatchQueueManager:
     """Test BatchQueueManager functionality."""
 
@@ -90,7 +128,7 @@ class TestBatchQueueManager:
         assert manager.status == QueueStatus.IDLE
         assert manager.total_processed == 0
         assert manager.total_failed == 0
-        assert len(manager.urgent_queue) == 0
+        assert manager.get_queue_size() == 0
 
     @pytest.mark.asyncio
     async def test_add_item_success(self, queue_manager):
@@ -104,7 +142,19 @@ class TestBatchQueueManager:
 
         assert result is True
         assert queue_manager.get_queue_size() == 1
-        assert len(queue_manager.high_queue) == 1
+        assert queue_manager.get_statistics()["queue_sizes"]["high"] == 1
+
+    @pytest.mark.asyncio
+    async def test_add_item_already_queued(self, queue_manager):
+        """Test re-adding a queued URL keeps one entry at the better priority."""
+        await queue_manager.add_item("https://example.com/a", Priority.LOW)
+
+        assert await queue_manager.add_item("https://example.com/a", Priority.HIGH) is True
+        assert await queue_manager.add_item("https://example.com/a", Priority.DEFERRED) is True
+
+        assert queue_manager.get_queue_size() == 1
+        item = await queue_manager.get_next_item()
+        assert item.priority == Priority.HIGH.value
 
     @pytest.mark.asyncio
     async def test_add_item_queue_full(self, queue_manager):
@@ -215,8 +265,11 @@ class TestBatchQueueManager:
             await queue_manager.mark_completed(sample_queue_item, result)
 
         assert queue_manager.total_failed == 1
-        # Item should be requeued (queue size should be 1)
+        # Item should be requeued (queue size should be 1) with its retry count kept
         assert queue_manager.get_queue_size() == 1
+        requeued = await queue_manager.get_next_item()
+        assert requeued.retry_count == 2
+        assert requeued.priority == Priority.LOW.value
 
     @pytest.mark.asyncio
     async def test_mark_completed_failure_max_retries_exceeded(
@@ -311,28 +364,30 @@ class TestBatchQueueManager:
         assert queue_manager.status == QueueStatus.STOPPED
         assert queue_manager.shutdown_event.is_set()
 
-    def test_get_queue_size(self, queue_manager):
+    @pytest.mark.asyncio
+    async def test_get_queue_size(self, queue_manager):
         """Test getting total queue size."""
         assert queue_manager.get_queue_size() == 0
         assert queue_manager.is_empty() is True
 
-        # Add items to different priority queues
-        queue_manager.urgent_queue.append(QueueItem(1, datetime.now(UTC), "url1"))
-        queue_manager.normal_queue.append(QueueItem(3, datetime.now(UTC), "url2"))
-        queue_manager.low_queue.append(QueueItem(4, datetime.now(UTC), "url3"))
+        # Add items at different priority levels
+        await queue_manager.add_item("url1", Priority.URGENT)
+        await queue_manager.add_item("url2", Priority.NORMAL)
+        await queue_manager.add_item("url3", Priority.LOW)
 
         assert queue_manager.get_queue_size() == 3
         assert queue_manager.is_empty() is False
 
-    def test_get_statistics(self, queue_manager):
+    @pytest.mark.asyncio
+    async def test_get_statistics(self, queue_manager):
         """Test getting queue statistics."""
         queue_manager.total_processed = 10
         queue_manager.total_failed = 2
         queue_manager.processing_items.add("processing_url")
 
-        # Add some items to queues
-        queue_manager.urgent_queue.append(QueueItem(1, datetime.now(UTC), "url1"))
-        queue_manager.high_queue.append(QueueItem(2, datetime.now(UTC), "url2"))
+        # Add some items to the queue
+        await queue_manager.add_item("url1", Priority.URGENT)
+        await queue_manager.add_item("url2", Priority.HIGH)
 
         stats = queue_manager.get_statistics()
 
@@ -351,31 +406,58 @@ class TestBatchQueueManager:
         assert stats["success_rate"] == 0
 
     @pytest.mark.asyncio
-    async def test_rebalance_queues(self, queue_manager):
-        """Test queue rebalancing based on age."""
-        from datetime import timedelta
-
-        # Add old items to low priority queues
-        old_time = datetime.now(UTC) - timedelta(hours=3)
-        old_item = QueueItem(priority=Priority.LOW.value, timestamp=old_time, url="old_url")
-        queue_manager.low_queue.append(old_item)
-
-        # Add recent item
-        recent_item = QueueItem(
-            priority=Priority.LOW.value, timestamp=datetime.now(UTC), url="recent_url"
+    async def test_aged_items_overtake_fresh_higher_priority(self, queue_manager):
+        """Test a long-waiting low-priority item is served before fresh normal items."""
+        await queue_manager.add_item("fresh_normal", Priority.NORMAL)
+        # Two aging intervals old: effective priority LOW - 2 = HIGH
+        old_item = QueueItem(
+            priority=Priority.LOW.value,
+            timestamp=datetime.now(UTC) - timedelta(seconds=2 * queue_manager.aging_seconds),
+            url="old_low",
         )
-        queue_manager.low_queue.append(recent_item)
+        await queue_manager._enqueue(old_item)
+        await queue_manager.add_item("fresh_urgent", Priority.URGENT)
+
+        order = [(await queue_manager.get_next_item()).url for _ in range(3)]
+
+        assert order == ["fresh_urgent", "old_low", "fresh_normal"]
+        assert queue_manager.effective_priority(old_item) < Priority.NORMAL.value
+
+    @pytest.mark.asyncio
+    async def test_low_priority_wait_is_bounded_under_urgent_load(self, mock_database_service):
+        """Test steady urgent arrivals cannot starve a deferred item forever."""
+        manager = BatchQueueManager(mock_database_service, aging_seconds=60)
+        start = datetime.now(UTC)
+        await manager._enqueue(QueueItem(Priority.DEFERRED.value, start, "deferred"))
+
+        served = []
+        # One urgent arrival per simulated second, one item served per second
+        for second in range(300):
+            now = start + timedelta(seconds=second)
+            await manager._enqueue(QueueItem(Priority.URGENT.value, now, f"urgent-{second}"))
+            served.append((await manager.get_next_item()).url)
+
+        # Deferred is 4 levels below urgent: it runs once it has waited 4 intervals
+        assert "deferred" in served
+        assert served.index("deferred") <= 4 * 60 + 1
+
+    @pytest.mark.asyncio
+    async def test_aging_disabled_orders_strictly_by_priority(self, mock_database_service):
+        """Test aging_seconds=0 serves by priority then arrival order."""
+        manager = BatchQueueManager(mock_database_service, aging_seconds=0)
+        old = datetime.now(UTC) - timedelta(days=1)
+        await manager._enqueue(QueueItem(Priority.DEFERRED.value, old, "old_deferred"))
+        await manager.add_item("normal1", Priority.NORMAL)
+        await manager.add_item("normal2", Priority.NORMAL)
 
-        await queue_manager.rebalance_queues()
+        order = [(await manager.get_next_item()).url for _ in range(3)]
 
-        # Old item should be moved to higher priority queue
-        assert len(queue_manager.low_queue) == 1
-        assert len(queue_manager.normal_queue) == 1
+        assert order == ["normal1", "normal2", "old_deferred"]
 
-        # Verify the old item was moved and priority updated
-        moved_item = queue_manager.normal_queue[0]
-        assert moved_item.url == "old_url"
-        assert moved_item.priority < Priority.LOW.value  # Higher priority (lower number)
+    def test_negative_aging_rejected(self, mock_database_service):
+        """Test aging_seconds must not be negative."""
+        with pytest.raises(ValueError, match="aging_seconds cannot be negative"):
+            BatchQueueManager(mock_database_service, aging_seconds=-1)
 
     @pytest.mark.asyncio
     async def test_persist_and_restore_queue_state(self, queue_manager, tmp_path):
@@ -405,19 +487,82 @@ class TestBatchQueueManager:
         assert new_queue_manager.total_failed == 1
         assert new_queue_manager.failed_items == {"failed_url": 2}
 
-        # Verify items were restored to correct queues
-        assert len(new_queue_manager.urgent_queue) == 1
-        assert len(new_queue_manager.normal_queue) == 1
-
-    def test_get_queue_for_priority(self, queue_manager):
-        """Test getting the correct queue for each priority level."""
-        assert queue_manager._get_queue_for_priority(Priority.URGENT) is queue_manager.urgent_queue
-        assert queue_manager._get_queue_for_priority(Priority.HIGH) is queue_manager.high_queue
-        assert queue_manager._get_queue_for_priority(Priority.NORMAL) is queue_manager.normal_queue
-        assert queue_manager._get_queue_for_priority(Priority.LOW) is queue_manager.low_queue
-        assert (
-            queue_manager._get_queue_for_priority(Priority.DEFERRED) is queue_manager.deferred_queue
+        # Verify items were restored at their priority levels and in order
+        sizes = new_queue_manager.get_statistics()["queue_sizes"]
+        assert sizes["urgent"] == 1
+        assert sizes["normal"] == 1
+        assert (await new_queue_manager.get_next_item()).url == "urgent_url"
+
+    @pytest.mark.asyncio
+    async def test_equivalent_urls_dropped_and_counted(self, queue_manager):
+        """Test canonical duplicates are dropped, including ones being processed."""
+        added = await queue_manager.add_batch(
+            [
+                "https://example.com/post",
+                "http://example.com/post/",
+                "https://example.com/post?utm_source=feed#top",
+                "https://example.com/other",
+            ]
+        )
+
+        assert added == 2
+        assert queue_manager.get_queue_size() == 2
+
+        item = await queue_manager.get_next_item()
+        assert await queue_manager.add_item(item.url)
+        assert queue_manager.get_queue_size() == 1
+        assert queue_manager.get_statistics()["duplicates_dropped"] == 3
+
+    @pytest.mark.asyncio
+    async def test_finished_and_cancelled_urls_can_be_queued_again(self, queue_manager):
+        """Test URLs that completed, failed for good or were cancelled are not deduplicated."""
+        queue_manager.requeue_failed = False
+        await queue_manager.add_batch(["https://a.com/", "https://b.com/", "https://c.com/"])
+        done = await queue_manager.get_next_item()
+        failed = await queue_manager.get_next_item()
+        await queue_manager.mark_completed(done, ProcessingResult(success=True, url=done.url))
+        await queue_manager.mark_completed(
+            failed, ProcessingResult(success=False, url=failed.url, error="boom")
         )
+        assert queue_manager.cancel_item("https://c.com/")
+
+        added = await queue_manager.add_batch(["http://a.com", "http://b.com", "http://c.com"])
+
+        assert added == 3
+        assert queue_manager.get_queue_size() == 3
+        assert queue_manager.get_statistics()["duplicates_dropped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_item(self, queue_manager):
+        """Test cancelling removes only the named item."""
+        for url in ("a", "b", "c"):
+            await queue_manager.add_item(url, Priority.NORMAL)
+
+        assert queue_manager.cancel_item("b") is True
+        assert queue_manager.cancel_item("b") is False
+
+        assert queue_manager.get_queue_size() == 2
+        assert queue_manager.get_statistics()["queue_sizes"]["normal"] == 2
+        order = [(await queue_manager.get_next_item()).url for _ in range(2)]
+        assert order == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_reprioritize_item(self, queue_manager):
+        """Test reprioritizing moves an item ahead of or behind others."""
+        await queue_manager.add_item("a", Priority.NORMAL)
+        await queue_manager.add_item("b", Priority.NORMAL)
+        await queue_manager.add_item("c", Priority.HIGH)
+
+        assert queue_manager.reprioritize_item("b", Priority.URGENT) is True
+        assert queue_manager.reprioritize_item("c", Priority.DEFERRED) is True
+        assert queue_manager.reprioritize_item("missing", Priority.URGENT) is False
+
+        sizes = queue_manager.get_statistics()["queue_sizes"]
+        assert sizes["urgent"] == 1
+        assert sizes["high"] == 0
+        assert sizes["deferred"] == 1
+        order = [(await queue_manager.get_next_item()).url for _ in range(3)]
+        assert order == ["b", "a", "c"]
 
     def test_item_to_dict_and_dict_to_item(self, queue_manager, sample_queue_item):
         """Test serialization and deserialization of queue items."""
@@ -0,0 +1,229 @@
+"""Tests for per-domain fair batch scheduling."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.batch.scheduler import DomainScheduler
+from src.utils.url import domain_key, host_key
+
+
+def url_scheduler(urls, **kwargs):
+    """Scheduler over plain URLs."""
+    return DomainScheduler(urls, domain_key, **kwargs)
+
+
+async def drain(scheduler):
+    """Collect everything the scheduler yields, releasing each job immediately."""
+    order = []
+    async for item in scheduler:
+        order.append(item)
+        scheduler.release(item)
+    return order
+
+
+class TestDomainKey:
+    """Test domain extraction for scheduling."""
+
+    def test_host_is_lower_cased(self):
+        """Test URLs on the same host share a key regardless of case."""
+        assert domain_key("https://Example.COM/a") == domain_key("https://example.com/b")
+
+    def test_unparsable_url_is_its_own_domain(self):
+        """Test URLs without a host still get a stable key."""
+        assert domain_key("not-a-url") == "not-a-url"
+
+    def test_host_key_matches_domain_key(self):
+        """Test a URL and its bare host share a key."""
+        assert host_key("https://Example.COM/a") == domain_key("https://example.com/b")
+        assert host_key("Example.COM") == "example.com"
+        assert host_key("not-a-url") == domain_key("not-a-url")
+
+
+class TestDomainScheduler:
+    """Test DomainScheduler ordering and politeness limits."""
+
+    def test_validation(self):
+        """Test invalid limits, weights and windows are rejected."""
+        with pytest.raises(ValueError, match="per_domain_limit"):
+            url_scheduler([], per_domain_limit=-1)
+        with pytest.raises(ValueError, match="window"):
+            url_scheduler([], window=0)
+        with pytest.raises(ValueError, match="domain_share"):
+            url_scheduler([], domain_share=0)
+        with pytest.raises(ValueError, match="spill"):
+            url_scheduler([], spill=-1)
+        with pytest.raises(ValueError, match="domain limits"):
+            url_scheduler([], domain_limits={"a.com": 0})
+        with pytest.raises(ValueError, match="domain weights"):
+            url_scheduler([], domain_weights={"a.com": 0})
+
+    @pytest.mark.asyncio
+    async def test_round_robin_across_domains(self):
+        """Test a small site is interleaved with a large one instead of waiting behind it."""
+        slow = [f"https://slow.com/{i}" for i in range(6)]
+        fast = [f"https://fast.com/{i}" for i in range(2)]
+
+        order = await drain(url_scheduler(slow + fast))
+
+        assert order[:4] == [slow[0], fast[0], slow[1], fast[1]]
+        assert order[4:] == slow[2:]
+
+    @pytest.mark.asyncio
+    async def test_deficit_weights(self):
+        """Test a domain with weight 2 gets two jobs per turn."""
+        a = [f"https://a.com/{i}" for i in range(4)]
+        b = [f"https://b.com/{i}" for i in range(4)]
+
+        order = await drain(url_scheduler(a + b, domain_weights={"a.com": 2}))
+
+        assert [domain_key(url) for url in order[:6]] == [
+            "a.com",
+            "a.com",
+            "b.com",
+            "a.com",
+            "a.com",
+            "b.com",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_window_bounds_read_ahead(self):
+        """Test only window jobs are pulled from the source ahead of the running ones."""
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield f"https://example.com/{i}"
+
+        scheduler = url_scheduler(source(), window=5, spill=0)
+        iterator = aiter(scheduler)
+        await anext(iterator)
+
+        assert pulled == 5
+        assert scheduler.buffered == 4
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_fast_domain_behind_long_slow_run_is_found(self):
+        """Test 500 fast URLs after 10k slow ones are dispatched right away with defaults."""
+        slow = [f"https://slow.com/{i}" for i in range(10_000)]
+        fast = [f"https://fast.com/{i}" for i in range(500)]
+        scheduler = url_scheduler(slow + fast)
+        iterator = aiter(scheduler)
+        limit = scheduler.limit_for("slow.com")
+        assert limit > 0
+
+        # Nothing finishes, so each domain runs up to its politeness limit in turn
+        dispatched = [await anext(iterator) for _ in range(2 * limit)]
+
+        assert dispatched[:2] == [slow[0], fast[0]]
+        assert dispatched[::2] == slow[:limit]
+        assert dispatched[1::2] == fast[:limit]
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_spill_bounds_read_ahead_and_keeps_domain_order(self):
+        """Test jobs beyond a domain's share wait in a bounded spill and run in file order."""
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield f"https://a.com/{i}"
+            yield "https://b.com/0"
+
+        scheduler = url_scheduler(
+            source(), per_domain_limit=0, window=10, domain_share=0.2, spill=5
+        )
+        iterator = aiter(scheduler)
+
+        assert await anext(iterator) == "https://a.com/0"
+        assert pulled == 7  # Two queued plus five set aside
+        assert scheduler.buffered == 6
+        assert scheduler.get_statistics()["a.com"] == {"queued": 6, "in_flight": 1}
+
+        scheduler.release("https://a.com/0")
+        order = [await anext(iterator) for _ in range(5)]
+        assert order == [f"https://a.com/{i}" for i in range(1, 6)]
+        await iterator.aclose()
+
+    @pytest.mark.asyncio
+    async def test_rank_served_before_fairness(self):
+        """Test a better-ranked job on another domain jumps the round-robin turn."""
+        jobs = [("https://a.com/1", 3), ("https://a.com/2", 3), ("https://b.com/1", 1)]
+        scheduler = DomainScheduler(jobs, lambda job: domain_key(job[0]), rank=lambda job: job[1])
+
+        order = await drain(scheduler)
+
+        assert order[0] == ("https://b.com/1", 1)
+
+    @pytest.mark.asyncio
+    async def test_per_domain_limit(self):
+        """Test no domain exceeds its politeness limit while others keep running."""
+        urls = [f"https://slow.com/{i}" for i in range(6)] + [
+            f"https://fast.com/{i}" for i in range(6)
+        ]
+        scheduler = url_scheduler(urls, per_domain_limit=2, domain_limits={"fast.com": 3})
+        running: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def run(url):
+            domain = domain_key(url)
+            running[domain] = running.get(domain, 0) + 1
+            peak[domain] = max(peak.get(domain, 0), running[domain])
+            await asyncio.sleep(0.02 if domain == "slow.com" else 0.005)
+            running[domain] -= 1
+            scheduler.release(url)
+
+        tasks = [asyncio.create_task(run(url)) async for url in scheduler]
+        await asyncio.gather(*tasks)
+
+        assert len(tasks) == 12
+        assert peak == {"slow.com": 2, "fast.com": 3}
+        assert scheduler.get_statistics() == {}
+
+    @pytest.mark.asyncio
+    async def test_adaptive_limit_tightens_politeness_limit(self):
+        """Test a domain's adaptive limit caps it below or in place of its politeness limit."""
+        adaptive = {"a.com": 1, "b.com": 4}
+        scheduler = url_scheduler([], per_domain_limit=2, adaptive_limit=adaptive.get)
+
+        assert scheduler.limit_for("a.com") == 1
+        assert scheduler.limit_for("b.com") == 2
+
+        uncapped = url_scheduler([], adaptive_limit=adaptive.get)
+        assert uncapped.limit_for("b.com") == 4
+
+    @pytest.mark.asyncio
+    async def test_held_domain_deferred_then_probed_one_at_a_time(self):
+        """Test a held domain waits out its hold, then runs one job at a time."""
+        reopen_at = {"down.com": time.monotonic() + 0.05}
+
+        def hold(domain):
+            if domain not in reopen_at:
+                return None
+            return max(0.0, reopen_at[domain] - time.monotonic())
+
+        urls = [f"https://down.com/{i}" for i in range(3)] + ["https://up.com/1"]
+        scheduler = url_scheduler(urls, per_domain_limit=5, hold=hold)
+        iterator = aiter(scheduler)
+
+        assert await anext(iterator) == "https://up.com/1"
+        first_probe = await anext(iterator)
+        assert first_probe == "https://down.com/0"
+
+        # Probing - the next job waits for the probe to finish
+        pending = asyncio.ensure_future(anext(iterator))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+
+        # Probe succeeded - the domain runs normally again
+        del reopen_at["down.com"]
+        scheduler.release(first_probe)
+        assert await pending == "https://down.com/1"
+        assert await anext(iterator) == "https://down.com/2"
+        await iterator.aclose()
@@ -0,0 +1,124 @@
+"""Tests for buffered job status persistence."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from src.batch.status_writer import JobStatusWriter
+from src.core.exceptions import DatabaseError
+from src.database.models import JobStatus
+
+
+@pytest.fixture
+def database_service():
+    """Create mock database service."""
+    service = Mock()
+    service.apply_job_updates = Mock()
+    return service
+
+
+class TestJobStatusWriter:
+    """Test JobStatusWriter buffering and flushing."""
+
+    def test_invalid_settings(self, database_service):
+        """Test non-positive flush thresholds are rejected."""
+        with pytest.raises(ValueError, match="flush_every must be positive"):
+            JobStatusWriter(database_service, flush_every=0)
+        with pytest.raises(ValueError, match="flush_interval cannot be negative"):
+            JobStatusWriter(database_service, flush_interval=-1)
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_buffer_full(self, database_service):
+        """Test the buffer is written once flush_every transitions accumulate."""
+        writer = JobStatusWriter(database_service, flush_every=3, flush_interval=0)
+
+        await writer.record(1, JobStatus.RUNNING)
+        await writer.record(2, JobStatus.RUNNING)
+        database_service.apply_job_updates.assert_not_called()
+
+        await writer.record(3, JobStatus.RUNNING)
+        database_service.apply_job_updates.assert_called_once()
+        assert writer.pending_count == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesces_transitions_per_job(self, database_service):
+        """Test a job's transitions between flushes collapse into one row."""
+        writer = JobStatusWriter(database_service, flush_every=100, flush_interval=0)
+
+        await writer.record(7, JobStatus.RUNNING)
+        await writer.record(7, JobStatus.COMPLETED, batch_id=1, duration=1.5)
+        await writer.close()
+
+        updates, deltas = database_service.apply_job_updates.call_args.args
+        assert len(updates) == 1
+        row = updates[0]
+        assert row["id"] == 7
+        assert row["status"] == JobStatus.COMPLETED
+        assert row["duration_seconds"] == 1.5
+        assert "started_at" in row and "completed_at" in row
+        assert deltas == {1: {JobStatus.COMPLETED: 1}}
+
+    @pytest.mark.asyncio
+    async def test_batch_deltas_count_final_statuses(self, database_service):
+        """Test batch counters only count final statuses, per batch."""
+        writer = JobStatusWriter(database_service, flush_every=100, flush_interval=0)
+
+        await writer.record(1, JobStatus.RUNNING, batch_id=1)
+        await writer.record(1, JobStatus.COMPLETED, batch_id=1)
+        await writer.record(2, JobStatus.FAILED, batch_id=1, error_message="boom")
+        await writer.record(3, JobStatus.COMPLETED, batch_id=2)
+        await writer.close()
+
+        updates, deltas = database_service.apply_job_updates.call_args.args
+        assert deltas == {
+            1: {JobStatus.COMPLETED: 1, JobStatus.FAILED: 1},
+            2: {JobStatus.COMPLETED: 1},
+        }
+        assert next(row for row in updates if row["id"] == 2)["error_message"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_periodic_flush(self, database_service):
+        """Test buffered changes are written after flush_interval elapses."""
+        writer = JobStatusWriter(database_service, flush_every=100, flush_interval=0.01)
+        await writer.start()
+
+        await writer.record(1, JobStatus.RUNNING)
+        for _ in range(50):
+            if database_service.apply_job_updates.called:
+                break
+            await asyncio.sleep(0.01)
+
+        database_service.apply_job_updates.assert_called_once()
+        await writer.close()
+        database_service.apply_job_updates.assert_called_once()  # Nothing left to write
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, database_service):
+        """Test changes survive a failed flush and are merged with newer ones."""
+        database_service.apply_job_updates.side_effect = [DatabaseError("down"), None]
+        writer = JobStatusWriter(database_service, flush_every=100, flush_interval=0)
+
+        await writer.record(1, JobStatus.RUNNING)
+        await writer.record(2, JobStatus.COMPLETED, batch_id=1)
+        await writer.flush()
+        assert writer.pending_count == 2
+
+        await writer.record(1, JobStatus.FAILED, batch_id=1)
+        await writer.close()
+
+        updates, deltas = database_service.apply_job_updates.call_args.args
+        rows = {row["id"]: row for row in updates}
+        assert rows[1]["status"] == JobStatus.FAILED
+        assert "started_at" in rows[1]
+        assert deltas == {1: {JobStatus.COMPLETED: 1, JobStatus.FAILED: 1}}
+
+    @pytest.mark.asyncio
+    async def test_close_raises_when_flush_fails(self, database_service):
+        """Test close surfaces database errors so updates are not silently lost."""
+        database_service.apply_job_updates.side_effect = DatabaseError("down")
+        writer = JobStatusWriter(database_service, flush_interval=0)
+
+        await writer.record(1, JobStatus.RUNNING)
+        with pytest.raises(DatabaseError):
+            await writer.close()
@@ -1,9 +1,12 @@
 """Comprehensive tests for file cache implementation."""
 
 import asyncio
+import os
+import time
 from pathlib import Path
 from unittest.mock import patch
 
+import aiofiles
 import pytest
 import pytest_asyncio
 
@@ -42,7 +45,7 @@ class TestFileCacheErrorHandling:
     @pytest.mark.asyncio
     async def test_get_json_decode_error(self, file_cache):
         """Test get operation when JSON decode fails."""
-        test_key = "test_key"
+        test_key = "html:test_key"
         test_content_type = "html"
         cache_path = file_cache._get_cache_path(test_key, test_content_type)
 
@@ -113,8 +116,8 @@ class TestFileCacheErrorHandling:
     @pytest.mark.asyncio
     async def test_cleanup_general_error(self, file_cache):
         """Test cleanup handles general errors."""
-        # Mock Path.glob to raise an exception
-        with patch("pathlib.Path.glob", side_effect=Exception("Cleanup error")):
+        # Mock Path.rglob to raise an exception
+        with patch("pathlib.Path.rglob", side_effect=Exception("Cleanup error")):
             result = await file_cache.cleanup_expired()
 
             # Should return 0 due to error
@@ -153,56 +156,71 @@ class TestFileCacheSizeEnforcement:
         assert stats["total_entries"] >= 0
 
     @pytest.mark.asyncio
-    async def test_size_enforcement_error_handling(self, small_cache):
-        """Test size enforcement error handling."""
-        # Mock stats method to raise an exception
-        with patch.object(small_cache, "stats", side_effect=Exception("Stats error")):
-            # This should trigger size enforcement during set, but handle the error
-            result = await small_cache.set("test_key", "test_value")
-
-            # Set should still succeed despite enforcement error
-            assert result is True
+    async def test_writes_do_not_walk_cache(self, small_cache):
+        """Test sets and stats use the running byte count instead of the directory tree."""
+        with patch("pathlib.Path.rglob", side_effect=AssertionError("walked")):
+            for i in range(3):
+                assert await small_cache.set(f"key_{i}", f"value_{i}") is True
+            stats = await small_cache.stats()
+
+        assert stats["total_entries"] == 3
+        assert stats["total_size_bytes"] == sum(
+            p.stat().st_size for p in small_cache.generic_dir.rglob("*.cache")
+        )
 
     @pytest.mark.asyncio
-    async def test_size_enforcement_file_stat_error(self, small_cache):
-        """Test size enforcement handles file stat errors."""
-        # Add an entry first
-        await small_cache.set("test_key", "test_value")
-
-        # Mock Path.stat to raise OSError for some files
-        original_stat = Path.stat
+    async def test_eviction_is_least_recently_used(self, small_cache):
+        """Test eviction drops the entries read least recently, not the oldest written."""
+        large_data = os.urandom(300 * 1024)  # Incompressible, so sizes on disk stay large
+        for i in range(3):
+            await small_cache.set(f"html:{i}", large_data, content_type="html")
+        await small_cache.get("html:0")
 
-        def mock_stat(self):
-            if "test_key" in str(self):
-                raise OSError("Stat error")
-            return original_stat(self)
+        await small_cache.set("html:3", large_data, content_type="html")
 
-        with patch("pathlib.Path.stat", side_effect=mock_stat):
-            # Force size enforcement by mocking stats to show high size
-            with patch.object(small_cache, "stats", return_value={"total_size_mb": 10}):
-                # This should trigger size enforcement
-                await small_cache._enforce_size_limit()
+        assert await small_cache.get("html:0") is not None
+        assert await small_cache.get("html:1") is None
+        assert (await small_cache.stats())["total_size_bytes"] <= 0.8 * 1024 * 1024
 
     @pytest.mark.asyncio
     async def test_size_enforcement_file_deletion_error(self, small_cache):
-        """Test size enforcement handles file deletion errors."""
-        # Add several entries
+        """Test size enforcement carries on past files it fails to delete."""
         for i in range(3):
-            await small_cache.set(f"key_{i}", f"value_{i}")
-            await asyncio.sleep(0.1)
+            await small_cache.set(f"key_{i}", os.urandom(200 * 1024))
 
-        # Mock Path.unlink to raise OSError for some files
         original_unlink = Path.unlink
+        first_path = small_cache._get_cache_path("key_0", "generic")
 
         def mock_unlink(self, missing_ok=False):
-            if "key_1" in str(self):
+            if self == first_path:
                 raise OSError("Delete error")
             return original_unlink(self, missing_ok=missing_ok)
 
-        with patch("pathlib.Path.unlink", side_effect=mock_unlink):
-            # Force size enforcement
-            with patch.object(small_cache, "stats", return_value={"total_size_mb": 10}):
-                await small_cache._enforce_size_limit()
+        with patch("pathlib.Path.unlink", mock_unlink):
+            assert await small_cache.set("key_3", os.urandom(500 * 1024)) is True
+
+        assert first_path.exists()
+        assert first_path not in small_cache._entries
+        assert small_cache._total_size <= 0.8 * 1024 * 1024
+
+    @pytest.mark.asyncio
+    async def test_access_order_survives_restart(self, small_cache):
+        """Test a restart rebuilds sizes from disk and keeps the saved access order."""
+        for i in range(3):
+            await small_cache.set(f"html:{i}", f"value_{i}", content_type="html")
+        await small_cache.get("html:0")
+        await small_cache.shutdown()
+        # A file written by another process is reconciled too
+        await FileCache(small_cache.config).set("html:3", "value_3", content_type="html")
+
+        reopened = FileCache(small_cache.config)
+
+        order = [p.stem for p in reopened._entries]
+        hashes = [small_cache._hash_key(f"html:{i}") for i in (1, 2, 0, 3)]
+        assert order == hashes
+        assert reopened._total_size == sum(
+            p.stat().st_size for p in reopened.html_dir.rglob("*.cache")
+        )
 
 
 class TestFileCacheContentTypes:
@@ -221,7 +239,7 @@ class TestFileCacheContentTypes:
         await file_cache.set("html_key", "<html>test</html>", content_type="html")
 
         # Check that file was created in html directory
-        html_files = list(file_cache.html_dir.glob("*.cache"))
+        html_files = list(file_cache.html_dir.rglob("*.cache"))
         assert len(html_files) >= 1
 
     @pytest.mark.asyncio
@@ -230,7 +248,7 @@ class TestFileCacheContentTypes:
         await file_cache.set("image_key", b"fake image data", content_type="image")
 
         # Check that file was created in image directory
-        image_files = list(file_cache.image_dir.glob("*.cache"))
+        image_files = list(file_cache.image_dir.rglob("*.cache"))
         assert len(image_files) >= 1
 
     @pytest.mark.asyncio
@@ -239,7 +257,7 @@ class TestFileCacheContentTypes:
         await file_cache.set("meta_key", {"title": "Test"}, content_type="metadata")
 
         # Check that file was created in metadata directory
-        metadata_files = list(file_cache.metadata_dir.glob("*.cache"))
+        metadata_files = list(file_cache.metadata_dir.rglob("*.cache"))
         assert len(metadata_files) >= 1
 
     @pytest.mark.asyncio
@@ -248,7 +266,7 @@ class TestFileCacheContentTypes:
         await file_cache.set("robots_key", "User-agent: *", content_type="robots")
 
         # Check that file was created in robots directory
-        robots_files = list(file_cache.robots_dir.glob("*.cache"))
+        robots_files = list(file_cache.robots_dir.rglob("*.cache"))
         assert len(robots_files) >= 1
 
     @pytest.mark.asyncio
@@ -257,10 +275,160 @@ class TestFileCacheContentTypes:
         await file_cache.set("generic_key", "some data", content_type="generic")
 
         # Check that file was created in generic directory
-        generic_files = list(file_cache.generic_dir.glob("*.cache"))
+        generic_files = list(file_cache.generic_dir.rglob("*.cache"))
         assert len(generic_files) >= 1
 
 
+class TestFileCacheLayout:
+    """Test fanned-out paths and the content type index."""
+
+    @pytest_asyncio.fixture
+    async def file_cache(self, temp_dir):
+        """Create file cache instance."""
+        config = CacheConfig(cache_dir=temp_dir / "layout_cache")
+        cache = FileCache(config)
+        yield cache
+
+    def test_paths_fan_out_by_key_hash(self, file_cache):
+        """Test entries sit two hex levels below their content type directory."""
+        path = file_cache._get_cache_path("html:abc", "html")
+
+        assert path.parent.parent.parent == file_cache.html_dir
+        assert path.parent.parent.name == path.stem[:2]
+        assert path.parent.name == path.stem[2:4]
+
+    @pytest.mark.asyncio
+    async def test_prefixed_keys_need_no_index(self, file_cache):
+        """Test keys whose prefix names their type resolve without the index."""
+        await file_cache.set("html:abc", "<html></html>", content_type="html")
+        await file_cache.set("image:abc", b"\x89PNG", content_type="image")
+
+        assert file_cache._type_index == {}
+        assert (await file_cache.get("html:abc")).value == "<html></html>"
+        assert (await file_cache.get("image:abc")).value == b"\x89PNG"
+
+    @pytest.mark.asyncio
+    async def test_miss_opens_one_path_without_probing(self, file_cache):
+        """Test a miss costs one open and no existence checks."""
+        with (
+            patch("pathlib.Path.exists", side_effect=AssertionError("probed")),
+            patch("aiofiles.open", wraps=aiofiles.open) as opened,
+        ):
+            assert await file_cache.get("html:missing") is None
+
+        opened.assert_called_once()
+        assert file_cache._stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_index_persists_unprefixed_types(self, file_cache):
+        """Test a key stored under a type its prefix doesn't name survives a restart."""
+        await file_cache.set("robots_key", "User-agent: *", content_type="robots")
+
+        reopened = FileCache(file_cache.config)
+
+        entry = await reopened.get("robots_key")
+        assert entry.value == "User-agent: *"
+        assert entry.content_type == "robots"
+
+        assert await reopened.delete("robots_key") is True
+        assert FileCache(file_cache.config)._type_index == {}
+
+    @pytest.mark.asyncio
+    async def test_changing_type_replaces_entry(self, file_cache):
+        """Test storing a key under another type leaves a single file behind."""
+        await file_cache.set("key", "one", content_type="html")
+        await file_cache.set("key", "two")
+
+        assert (await file_cache.get("key")).value == "two"
+        assert list(file_cache.html_dir.rglob("*.cache")) == []
+        assert file_cache._type_index == {}
+
+    @pytest.mark.asyncio
+    async def test_legacy_flat_files_are_cleaned_up(self, file_cache):
+        """Test files left in the flat layout are still counted and cleared."""
+        (file_cache.html_dir / "legacy.cache").write_bytes(b"corrupted")
+        reopened = FileCache(file_cache.config)
+
+        assert (await reopened.stats())["total_entries"] == 1
+        assert await reopened.cleanup_expired() == 1
+        assert (await reopened.stats())["total_entries"] == 0
+
+
+class TestFileCacheBulkOperations:
+    """Test get_many, set_many and delete_many."""
+
+    @pytest_asyncio.fixture
+    async def file_cache(self, temp_dir):
+        """Create file cache instance."""
+        config = CacheConfig(cache_dir=temp_dir / "bulk_cache")
+        cache = FileCache(config)
+        yield cache
+
+    @pytest.mark.asyncio
+    async def test_set_many_and_get_many(self, file_cache):
+        """Test entries written in bulk are read back in bulk, hits only."""
+        images = {f"image:{i}": os.urandom(100) for i in range(20)}
+
+        assert await file_cache.set_many(images, content_type="image") is True
+        entries = await file_cache.get_many([*images, "image:missing"])
+
+        assert {key: entry.value for key, entry in entries.items()} == images
+        assert file_cache._stats["sets"] == 20
+        assert file_cache._stats["hits"] == 20
+        assert file_cache._stats["misses"] == 1
+        assert len(file_cache._entries) == 20
+
+    @pytest.mark.asyncio
+    async def test_set_many_enforces_size_limit_once(self, file_cache):
+        """Test a bulk write checks the size limit once for the whole batch."""
+        with patch.object(file_cache, "_enforce_size_limit") as mock_enforce:
+            await file_cache.set_many({f"html:{i}": "<p></p>" for i in range(5)})
+
+        mock_enforce.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_set_many_reports_partial_failure(self, file_cache):
+        """Test one failed write fails the batch without losing the others."""
+        original_write = file_cache._write
+
+        async def flaky_write(key, value, ttl, content_type):
+            if key == "html:bad":
+                raise OSError("disk full")
+            await original_write(key, value, ttl, content_type)
+
+        with patch.object(file_cache, "_write", side_effect=flaky_write):
+            result = await file_cache.set_many({"html:good": "a", "html:bad": "b"})
+
+        assert result is False
+        assert file_cache._stats["errors"] == 1
+        assert list(await file_cache.get_many(["html:good", "html:bad"])) == ["html:good"]
+
+    @pytest.mark.asyncio
+    async def test_get_many_drops_expired_and_corrupt_entries(self, file_cache):
+        """Test expired entries are removed and unreadable ones counted as errors."""
+        await file_cache.set("html:expired", "old", ttl=1)
+        await file_cache.set("html:corrupt", "value")
+        file_cache._resolve_path("html:corrupt").write_bytes(b"garbage")
+
+        with patch("time.time", return_value=time.time() + 10):
+            entries = await file_cache.get_many(["html:expired", "html:corrupt"])
+
+        assert entries == {}
+        assert not file_cache._resolve_path("html:expired").exists()
+        assert file_cache._stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, file_cache):
+        """Test bulk deletes count only entries that existed and untrack them."""
+        await file_cache.set("html:a", "a")
+        await file_cache.set("custom_key", "b", content_type="html")
+
+        assert await file_cache.delete_many(["html:a", "custom_key", "html:missing"]) == 2
+        assert file_cache._entries == {}
+        assert file_cache._type_index == {}
+        assert file_cache._stats["deletes"] == 2
+
+
 class TestFileCacheDeleteBranches:
     """Test file cache delete operation branches."""
 
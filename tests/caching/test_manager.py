@@ -1,5 +1,6 @@
 """Comprehensive tests for cache manager functionality."""
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, patch
 
@@ -834,3 +835,304 @@ class TestCacheManagerIntegration:
         assert isinstance(cache_manager, CacheManager)
         assert cache_manager.config is not None
         assert not cache_manager._initialized
+
+
+class TestCacheManagerMemoryTier:
+    """Test the in-process L1 tier in front of the backend."""
+
+    @pytest_asyncio.fixture
+    async def tiered_manager(self, temp_dir):
+        """Create a manager with a memory tier in front of a real file cache."""
+        config = CacheConfig(
+            backend=CacheBackend.FILE, cache_dir=temp_dir / "tiered", memory_tier_enabled=True
+        )
+        manager = CacheManager(config)
+        await manager.initialize()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_memory_backend_has_no_separate_tier(self):
+        """Test the memory backend works on its own without a duplicate memory tier."""
+        manager = CacheManager(CacheConfig(backend=CacheBackend.MEMORY, memory_tier_enabled=True))
+        await manager.initialize()
+
+        assert manager.memory is None
+        assert await manager.set_html("https://example.com", "<html></html>") is True
+        assert await manager.get_html("https://example.com") == "<html></html>"
+
+    @pytest.mark.asyncio
+    async def test_reads_are_served_from_memory(self, tiered_manager):
+        """Test writes reach both tiers and repeat reads never touch the backend."""
+        await tiered_manager.set_html("https://example.com", "<html></html>")
+
+        with patch.object(tiered_manager.backend, "get", side_effect=AssertionError("L2 read")):
+            assert await tiered_manager.get_html("https://example.com") == "<html></html>"
+
+        assert await tiered_manager.backend.get(
+            tiered_manager._make_html_key("https://example.com")
+        )
+
+    @pytest.mark.asyncio
+    async def test_backend_hits_are_promoted(self, tiered_manager):
+        """Test an entry only in the backend is copied into memory on first read."""
+        await tiered_manager.backend.set(
+            tiered_manager._make_robots_key("example.com"), "User-agent: *", content_type="robots"
+        )
+
+        assert await tiered_manager.get_robots_txt("example.com") == "User-agent: *"
+        assert await tiered_manager.get_robots_txt("example.com") == "User-agent: *"
+
+        stats = await tiered_manager.get_cache_stats()
+        assert stats["l1"]["hits"] == 1
+        assert stats["l1"]["misses"] == 1
+        assert stats["l2"]["hits"] == 1
+        assert stats["l2"]["misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_invalidation_reaches_memory(self, tiered_manager):
+        """Test invalidating a URL and clearing drop the memory copies too."""
+        url = "https://example.com/page"
+        await tiered_manager.set_html(url, "<html></html>")
+        await tiered_manager.set_metadata(url, {"title": "Test"})
+
+        assert await tiered_manager.invalidate_url(url) is True
+        assert await tiered_manager.get_html(url) is None
+        assert await tiered_manager.get_metadata(url) is None
+
+        await tiered_manager.set_image("https://example.com/a.png", b"\x89PNG")
+        await tiered_manager.clear_cache()
+        assert await tiered_manager.get_image("https://example.com/a.png") is None
+
+
+class TestCacheManagerBulkOperations:
+    """Test the bulk image and metadata helpers."""
+
+    @pytest_asyncio.fixture
+    async def file_manager(self, temp_dir):
+        """Create a manager with a real file cache."""
+        manager = CacheManager(
+            CacheConfig(backend=CacheBackend.FILE, cache_dir=temp_dir / "bulk_manager")
+        )
+        await manager.initialize()
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_images_round_trip_in_one_backend_call(self, file_manager):
+        """Test bulk image helpers make one backend call each and agree with single gets."""
+        images = {f"https://example.com/{i}.jpg": bytes([i]) * 100 for i in range(10)}
+
+        with patch.object(
+            file_manager.backend, "set_many", wraps=file_manager.backend.set_many
+        ) as set_many:
+            assert await file_manager.set_images(images) is True
+        set_many.assert_called_once()
+        assert set_many.call_args.args[2] == "image"
+
+        with patch.object(
+            file_manager.backend, "get_many", wraps=file_manager.backend.get_many
+        ) as get_many:
+            cached = await file_manager.get_images([*images, "https://example.com/none.jpg"])
+        get_many.assert_called_once()
+
+        assert cached == images
+        assert (
+            await file_manager.get_image("https://example.com/3.jpg")
+            == images["https://example.com/3.jpg"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_metadata_round_trip(self, file_manager):
+        """Test bulk metadata helpers use the same keys as the single-URL ones."""
+        await file_manager.set_metadata("https://example.com/a", {"title": "A"})
+        assert await file_manager.set_metadata_many({"https://example.com/b": {"title": "B"}})
+
+        assert await file_manager.get_metadata_many(
+            ["https://example.com/a", "https://example.com/b", "https://example.com/c"]
+        ) == {"https://example.com/a": {"title": "A"}, "https://example.com/b": {"title": "B"}}
+        assert await file_manager.get_metadata("https://example.com/b") == {"title": "B"}
+
+    @pytest.mark.asyncio
+    async def test_empty_bulk_calls_skip_backend(self, file_manager):
+        """Test empty bulk writes don't reach the backend."""
+        with patch.object(file_manager.backend, "set_many") as set_many:
+            assert await file_manager.set_images({}) is True
+        set_many.assert_not_called()
+        assert await file_manager.get_images([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_serves_bulk_reads(self, temp_dir):
+        """Test bulk reads only ask the backend for keys the memory tier missed."""
+        manager = CacheManager(
+            CacheConfig(
+                backend=CacheBackend.FILE,
+                cache_dir=temp_dir / "bulk_tiered",
+                memory_tier_enabled=True,
+            )
+        )
+        await manager.initialize()
+        await manager.set_images({"https://example.com/a.jpg": b"a"})
+        await manager.backend.set(
+            manager._make_image_key("https://example.com/b.jpg"), b"b", content_type="image"
+        )
+
+        with patch.object(manager.backend, "get_many", wraps=manager.backend.get_many) as get_many:
+            cached = await manager.get_images(
+                ["https://example.com/a.jpg", "https://example.com/b.jpg"]
+            )
+
+        assert cached == {"https://example.com/a.jpg": b"a", "https://example.com/b.jpg": b"b"}
+        get_many.assert_called_once_with([manager._make_image_key("https://example.com/b.jpg")])
+        # The backend hit was promoted into the memory tier
+        assert await manager.memory.get(manager._make_image_key("https://example.com/b.jpg"))
+
+
+class TestCacheManagerGetOrLoad:
+    """Test stale-while-revalidate and request coalescing."""
+
+    @pytest_asyncio.fixture
+    async def manager(self):
+        """Create a manager with a memory backend."""
+        manager = CacheManager(CacheConfig(backend=CacheBackend.MEMORY))
+        await manager.initialize()
+        return manager
+
+    @staticmethod
+    def gated_loader(value):
+        """A loader that counts its calls and blocks until its gate is set."""
+        gate = asyncio.Event()
+        loader = AsyncMock()
+
+        async def load():
+            await gate.wait()
+            return value
+
+        loader.side_effect = load
+        return loader, gate
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_and_caches(self, manager):
+        """Test a miss calls the loader once and later calls are served from the cache."""
+        loader = AsyncMock(return_value="<html></html>")
+
+        assert await manager.get_or_load("html", "https://example.com", loader) == "<html></html>"
+        assert await manager.get_or_load("html", "https://example.com", loader) == "<html></html>"
+
+        loader.assert_awaited_once()
+        assert await manager.get_html("https://example.com") == "<html></html>"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, manager):
+        """Test concurrent callers for one key await a single loader call."""
+        loader, gate = self.gated_loader({"title": "Test"})
+
+        calls = [
+            asyncio.ensure_future(manager.get_or_load("metadata", "https://example.com", loader))
+            for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*calls)
+
+        assert results == [{"title": "Test"}] * 10
+        loader.assert_awaited_once()
+        stats = await manager.get_cache_stats()
+        assert stats["loads"]["coalesced"] == 9
+        assert stats["loads"]["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self):
+        """Test each caller loads for itself when its content type doesn't coalesce."""
+        manager = CacheManager(CacheConfig(backend=CacheBackend.MEMORY, coalesce_html=False))
+        loader, gate = self.gated_loader("<html></html>")
+
+        calls = [
+            asyncio.ensure_future(manager.get_or_load("html", "https://example.com", loader))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*calls)
+
+        assert loader.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_served_and_refreshed_once(self, manager):
+        """Test entries in the stale window are returned at once and reloaded in the background."""
+        await manager.set_html("https://example.com", "old", ttl=manager.config.stale_html)
+        loader, gate = self.gated_loader("new")
+
+        first = await manager.get_or_load("html", "https://example.com", loader)
+        second = await manager.get_or_load("html", "https://example.com", loader)
+
+        assert first == second == "old"
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*manager._loads.values())
+
+        loader.assert_awaited_once()
+        assert await manager.get_html("https://example.com") == "new"
+        assert (await manager.get_cache_stats())["loads"]["stale_served"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fresh_entries_are_not_reloaded(self, manager):
+        """Test entries outside the stale window don't trigger a reload."""
+        await manager.set_html("https://example.com", "cached", ttl=manager.config.stale_html * 2)
+        loader = AsyncMock(return_value="new")
+
+        assert await manager.get_or_load("html", "https://example.com", loader) == "cached"
+        assert manager._loads == {}
+        loader.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_load_reaches_every_caller_and_is_retried(self, manager):
+        """Test a loader error is raised to all coalesced callers and not cached."""
+        loader = AsyncMock(side_effect=[ConnectionError("origin down"), "<html></html>"])
+
+        calls = [manager.get_or_load("html", "https://example.com", loader) for _ in range(2)]
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert await manager.get_or_load("html", "https://example.com", loader) == "<html></html>"
+        assert (await manager.get_cache_stats())["loads"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_value(self, manager):
+        """Test a failed background refresh is logged and the stale value kept."""
+        await manager.set_html("https://example.com", "old", ttl=manager.config.stale_html)
+        loader = AsyncMock(side_effect=ConnectionError("origin down"))
+
+        with patch("src.caching.manager.logger") as mock_logger:
+            assert await manager.get_or_load("html", "https://example.com", loader) == "old"
+            await asyncio.gather(*manager._loads.values(), return_exceptions=True)
+
+        mock_logger.warning.assert_called_once()
+        assert await manager.get_html("https://example.com") == "old"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_load(self, manager):
+        """Test one caller giving up leaves the load running for the others."""
+        loader, gate = self.gated_loader("<html></html>")
+
+        impatient = asyncio.ensure_future(manager.get_or_load("html", "https://a.com", loader))
+        patient = asyncio.ensure_future(manager.get_or_load("html", "https://a.com", loader))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        gate.set()
+
+        assert await patient == "<html></html>"
+        assert impatient.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_none_is_not_cached(self, manager):
+        """Test a loader returning None is called again next time."""
+        loader = AsyncMock(return_value=None)
+
+        assert await manager.get_or_load("robots", "example.com", loader) is None
+        assert await manager.get_or_load("robots", "example.com", loader) is None
+        assert loader.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_content_type(self, manager):
+        """Test unknown content types are rejected."""
+        with pytest.raises(ValueError, match="Unsupported cache content type"):
+            await manager.get_or_load("video", "https://example.com", AsyncMock())
@@ -0,0 +1,98 @@
+"""Tests for the in-process memory cache backend."""
+
+import time
+
+import pytest
+
+from src.caching.base import CacheConfig, CacheEntry
+from src.caching.memory_cache import MemoryCache
+
+
+@pytest.fixture
+def memory_cache():
+    """Create a memory cache of one megabyte."""
+    return MemoryCache(CacheConfig(memory_tier_max_mb=1, memory_tier_ttl=300))
+
+
+class TestMemoryCache:
+    """Test the byte-bounded LRU memory cache."""
+
+    @pytest.mark.asyncio
+    async def test_set_get_delete(self, memory_cache):
+        """Test basic operations and hit accounting."""
+        assert await memory_cache.set("key", "value") is True
+        assert (await memory_cache.get("key")).value == "value"
+        assert await memory_cache.delete("key") is True
+        assert await memory_cache.get("key") is None
+
+        stats = await memory_cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["total_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_by_bytes(self, memory_cache):
+        """Test entries are evicted by size, least recently read first."""
+        chunk = b"x" * (400 * 1024)
+        await memory_cache.set("a", chunk)
+        await memory_cache.set("b", chunk)
+        await memory_cache.get("a")
+
+        await memory_cache.set("c", chunk)
+
+        assert await memory_cache.get("b") is None
+        assert await memory_cache.get("a") is not None
+        stats = await memory_cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["total_size_bytes"] == 2 * len(chunk)
+
+    @pytest.mark.asyncio
+    async def test_oversized_entries_are_not_kept(self, memory_cache):
+        """Test a value larger than the cache replaces nothing and is not stored."""
+        await memory_cache.set("key", "small")
+
+        assert await memory_cache.set("key", b"x" * (2 * 1024 * 1024)) is False
+        assert await memory_cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_respects_entry_expiry(self, memory_cache):
+        """Test a promoted entry expires with its original TTL, not a fresh one."""
+        memory_cache.put(CacheEntry(key="old", value="v", created_at=time.time() - 100, ttl=50))
+
+        assert await memory_cache.get("old") is None
+
+    @pytest.mark.asyncio
+    async def test_memory_ttl_caps_entry_lifetime(self):
+        """Test entries are dropped after the memory TTL even if still valid."""
+        cache = MemoryCache(CacheConfig(memory_tier_ttl=1))
+        await cache.set("key", "value", ttl=3600)
+        cache._entries["key"] = (*cache._entries["key"][:1], time.time() - 1, 5)
+
+        assert await cache.cleanup_expired() == 1
+        assert await cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_mutable_values_are_copied(self, memory_cache):
+        """Test changing a returned value doesn't change the cached one."""
+        await memory_cache.set("meta", {"tags": ["a"]})
+
+        tags = ["a"]
+        await memory_cache.set("tags", tags)
+        tags.append("b")
+        (await memory_cache.get("meta")).value["tags"].append("b")
+
+        assert (await memory_cache.get("tags")).value == ["a"]
+
+        assert (await memory_cache.get("meta")).value == {"tags": ["a"]}
+
+    @pytest.mark.asyncio
+    async def test_bulk_operations(self, memory_cache):
+        """Test the default get_many, set_many and delete_many."""
+        assert await memory_cache.set_many({"a": "one", "b": "two"}, content_type="html") is True
+
+        entries = await memory_cache.get_many(["a", "b", "missing"])
+        assert {key: entry.value for key, entry in entries.items()} == {"a": "one", "b": "two"}
+        assert entries["a"].content_type == "html"
+
+        assert await memory_cache.delete_many(["a", "missing"]) == 1
+        assert list(await memory_cache.get_many(["a", "b"])) == ["b"]
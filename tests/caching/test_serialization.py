@@ -0,0 +1,126 @@
+"""Tests for the binary cache entry format."""
+
+import gzip
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from src.caching.base import CacheConfig, CacheEntry
+from src.caching.file_cache import FileCache
+from src.caching.serialization import (
+    HEADER,
+    Codec,
+    choose_codec,
+    decode_entry,
+    encode_entry,
+    is_binary_entry,
+)
+
+
+def make_entry(value, content_type="generic"):
+    return CacheEntry(
+        key=f"{content_type}:abc",
+        value=value,
+        created_at=time.time(),
+        ttl=3600,
+        content_type=content_type,
+        size_bytes=42,
+    )
+
+
+class TestEntryFormat:
+    """Test encoding and decoding entries."""
+
+    @pytest.mark.parametrize(
+        "value", [b"\x89PNG\r\n\x1a\n", "<html>café</html>", {"title": "Test", "tags": [1, 2]}]
+    )
+    @pytest.mark.parametrize("codec", [Codec.NONE, Codec.GZIP])
+    def test_round_trip(self, value, codec):
+        """Test bytes, text and JSON values survive encoding with every codec."""
+        entry = make_entry(value)
+
+        decoded = decode_entry(encode_entry(entry, codec))
+
+        assert decoded.value == value
+        assert type(decoded.value) is type(value)
+        assert decoded.key == entry.key
+        assert decoded.created_at == entry.created_at
+        assert decoded.ttl == entry.ttl
+        assert decoded.size_bytes == entry.size_bytes
+        assert decoded.compressed is (codec != Codec.NONE)
+
+    def test_raw_payload_follows_header(self):
+        """Test uncompressed bytes are stored verbatim after the header, key and type."""
+        image = bytes(range(256))
+        data = encode_entry(make_entry(image, "image"), Codec.NONE)
+
+        assert is_binary_entry(data)
+        assert data.endswith(image)
+        assert len(data) == HEADER.size + len("image") + len("image:abc") + len(image)
+
+    def test_codec_per_content_type(self):
+        """Test images are never compressed and other types use the configured codec."""
+        assert choose_codec("image", True, "gzip") == Codec.NONE
+        assert choose_codec("html", True, "gzip") == Codec.GZIP
+        assert choose_codec("html", False, "gzip") == Codec.NONE
+        with patch("src.caching.serialization.ZSTD_AVAILABLE", False):
+            assert choose_codec("html", True, "zstd") == Codec.GZIP
+
+    def test_invalid_data_is_rejected(self):
+        """Test truncated entries and unknown versions raise ValueError."""
+        data = encode_entry(make_entry("value"), Codec.NONE)
+
+        with pytest.raises(ValueError):
+            decode_entry(data[:10])
+        with pytest.raises(ValueError):
+            decode_entry(data[:3] + b"\x09" + data[4:])
+
+
+class TestBackendSerialization:
+    """Test backends write the binary format and still read legacy entries."""
+
+    @pytest.fixture
+    def file_cache(self, temp_dir):
+        return FileCache(CacheConfig(cache_dir=temp_dir / "format_cache"))
+
+    @pytest.mark.asyncio
+    async def test_images_are_stored_raw(self, file_cache):
+        """Test an image file ends with the image bytes, without base64 or gzip."""
+        image = b"\xff\xd8\xff\xe0" + bytes(1000)
+        await file_cache.set("image:abc", image, content_type="image")
+
+        path = file_cache._get_cache_path("image:abc", "image")
+        assert path.read_bytes().endswith(image)
+        assert (await file_cache.get("image:abc")).value == image
+
+    @pytest.mark.asyncio
+    async def test_html_is_compressed(self, file_cache):
+        """Test HTML payloads are gzipped."""
+        html = "<p>repeated</p>" * 1000
+        await file_cache.set("html:abc", html, content_type="html")
+
+        path = file_cache._get_cache_path("html:abc", "html")
+        assert path.stat().st_size < len(html) // 10
+        assert (await file_cache.get("html:abc")).value == html
+
+    @pytest.mark.asyncio
+    async def test_custom_json_types_round_trip(self, file_cache):
+        """Test Path and nested bytes values still round-trip through JSON."""
+        value = {"path": Path("/test/path"), "thumb": b"\x00\x01"}
+        await file_cache.set("metadata:abc", value, content_type="metadata")
+
+        assert (await file_cache.get("metadata:abc")).value == value
+
+    @pytest.mark.asyncio
+    async def test_legacy_entries_are_readable(self, file_cache):
+        """Test entries written in the old gzipped JSON format are still read."""
+        entry = make_entry("legacy value", "html")
+        path = file_cache._get_cache_path(entry.key, "html")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(file_cache._compress_data(entry.to_dict()))
+        assert not is_binary_entry(path.read_bytes())
+        assert gzip.decompress(path.read_bytes())
+
+        assert (await file_cache.get(entry.key)).value == "legacy value"
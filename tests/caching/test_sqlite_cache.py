@@ -0,0 +1,228 @@
+"""Tests for the SQLite cache backend."""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from src.caching.base import CacheBackend, CacheConfig
+from src.caching.manager import CacheManager
+from src.caching.sqlite_cache import SqliteCache
+
+
+@pytest_asyncio.fixture
+async def sqlite_cache(temp_dir):
+    """Create a SQLite cache, shut down after the test."""
+    cache = SqliteCache(CacheConfig(cache_dir=temp_dir / "sqlite_cache"))
+    yield cache
+    await cache.shutdown()
+
+
+def query(cache, sql, params=()):
+    with sqlite3.connect(cache.db_path) as connection:
+        return connection.execute(sql, params).fetchall()
+
+
+class TestSqliteCacheOperations:
+    """Test basic operations and the database layout."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("value", "content_type"),
+        [
+            (b"\x89PNG" + bytes(100), "image"),
+            ("<html>café</html>", "html"),
+            ({"a": [1]}, "metadata"),
+        ],
+    )
+    async def test_set_get_delete(self, sqlite_cache, value, content_type):
+        """Test values of every kind round-trip and can be deleted."""
+        assert await sqlite_cache.set("key", value, content_type=content_type) is True
+
+        entry = await sqlite_cache.get("key")
+        assert entry.value == value
+        assert entry.content_type == content_type
+
+        assert await sqlite_cache.delete("key") is True
+        assert await sqlite_cache.delete("key") is False
+        assert await sqlite_cache.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_database_uses_wal_and_indexes(self, sqlite_cache):
+        """Test the database is in WAL mode with expiry and access time indexes."""
+        assert query(sqlite_cache, "PRAGMA journal_mode") == [("wal",)]
+
+        indexes = {row[0] for row in query(sqlite_cache, "SELECT name FROM sqlite_master")}
+        assert {"idx_cache_entries_expires_at", "idx_cache_entries_accessed_at"} <= indexes
+
+        plan = query(
+            sqlite_cache,
+            "EXPLAIN QUERY PLAN DELETE FROM cache_entries WHERE expires_at <= ?",
+            (time.time(),),
+        )
+        assert "idx_cache_entries_expires_at" in str(plan)
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_misses_and_cleaned_up(self, sqlite_cache):
+        """Test expired rows are never returned and cleanup_expired removes only them."""
+        await sqlite_cache.set("old", "value", ttl=1)
+        await sqlite_cache.set("forever", "value", ttl=0)
+
+        with patch("time.time", return_value=time.time() + 10):
+            assert await sqlite_cache.get("old") is None
+            assert (await sqlite_cache.stats())["expired_entries"] == 1
+            assert await sqlite_cache.cleanup_expired() == 1
+
+        assert [row[0] for row in query(sqlite_cache, "SELECT key FROM cache_entries")] == [
+            "forever"
+        ]
+        assert (await sqlite_cache.get("forever")).value == "value"
+
+    @pytest.mark.asyncio
+    async def test_stats(self, sqlite_cache):
+        """Test stats report entries, sizes and hit rate."""
+        await sqlite_cache.set_many({"a": "one", "b": "two"})
+        await sqlite_cache.get("a")
+        await sqlite_cache.get("missing")
+
+        stats = await sqlite_cache.stats()
+
+        assert stats["total_entries"] == 2
+        assert stats["total_size_bytes"] == sqlite_cache._total_size > 0
+        assert stats["expired_entries"] == 0
+        assert stats["hit_rate"] == 50.0
+        assert stats["database"] == str(sqlite_cache.db_path)
+
+    @pytest.mark.asyncio
+    async def test_clear(self, sqlite_cache):
+        """Test clear removes every entry and resets stats."""
+        await sqlite_cache.set_many({"a": 1, "b": 2})
+
+        assert await sqlite_cache.clear() is True
+
+        assert (await sqlite_cache.stats())["total_entries"] == 0
+        assert sqlite_cache._total_size == 0
+        assert sqlite_cache._stats["sets"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bulk_operations(self, sqlite_cache):
+        """Test get_many, set_many and delete_many, including more keys than one statement binds."""
+        values = {f"key{i}": i for i in range(1200)}
+
+        assert await sqlite_cache.set_many(values, content_type="metadata") is True
+        entries = await sqlite_cache.get_many([*values, "missing"])
+
+        assert {key: entry.value for key, entry in entries.items()} == values
+        assert sqlite_cache._stats["misses"] == 1
+        assert await sqlite_cache.delete_many([*values, "missing"]) == 1200
+        assert sqlite_cache._total_size == 0
+
+    @pytest.mark.asyncio
+    async def test_entries_survive_restart(self, temp_dir):
+        """Test a reopened database has the entries, sizes and recorded access times."""
+        config = CacheConfig(cache_dir=temp_dir / "persistent")
+        cache = SqliteCache(config)
+        await cache.set("key", "value")
+        await cache.get("key")
+        await cache.shutdown()
+
+        reopened = SqliteCache(config)
+        try:
+            assert (await reopened.get("key")).value == "value"
+            assert reopened._total_size == cache._total_size
+        finally:
+            await reopened.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_operations_after_shutdown_fail_softly(self, sqlite_cache):
+        """Test a shut down cache reports failures instead of hanging."""
+        await sqlite_cache.shutdown()
+
+        assert await sqlite_cache.set("key", "value") is False
+        assert await sqlite_cache.get("key") is None
+        assert await sqlite_cache.cleanup_expired() == 0
+
+
+class TestSqliteCacheWriter:
+    """Test batched writes and size enforcement on the writer thread."""
+
+    @pytest.mark.asyncio
+    async def test_queued_writes_share_a_transaction(self, sqlite_cache):
+        """Test writes queued while the writer is busy are committed together."""
+        busy = threading.Event()
+        release = threading.Event()
+
+        def block(connection):
+            busy.set()
+            release.wait()
+
+        blocker = asyncio.ensure_future(sqlite_cache._write(block))
+        await asyncio.to_thread(busy.wait)
+
+        with patch.object(sqlite_cache, "_commit", wraps=sqlite_cache._commit) as commit:
+            writes = [asyncio.ensure_future(sqlite_cache.set(f"key{i}", i)) for i in range(50)]
+            await asyncio.sleep(0)
+            release.set()
+            assert all(await asyncio.gather(*writes))
+            await blocker
+
+        commit.assert_called_once()
+        assert len(commit.call_args.args[1]) == 50
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_fail_the_batch(self, sqlite_cache):
+        """Test one failing statement is reported to its caller only."""
+
+        def broken(connection):
+            connection.execute("INSERT INTO missing_table VALUES (1)")
+
+        results = await asyncio.gather(
+            sqlite_cache._write(broken), sqlite_cache.set("key", "value"), return_exceptions=True
+        )
+
+        assert isinstance(results[0], sqlite3.OperationalError)
+        assert results[1] is True
+        assert (await sqlite_cache.get("key")).value == "value"
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self, temp_dir):
+        """Test the least recently read entries are evicted once the cache is over its limit."""
+        cache = SqliteCache(CacheConfig(cache_dir=temp_dir / "lru", max_cache_size_mb=1))
+        try:
+            chunk = 300 * 1024
+            await cache.set("image:first", os.urandom(chunk), content_type="image")
+            await cache.set("image:second", os.urandom(chunk), content_type="image")
+            await cache.set("image:third", os.urandom(chunk), content_type="image")
+            assert await cache.get("image:first")
+
+            await cache.set("image:fourth", os.urandom(chunk), content_type="image")
+
+            assert await cache.get("image:first")
+            assert await cache.get("image:second") is None
+            assert cache._total_size <= cache.max_bytes
+        finally:
+            await cache.shutdown()
+
+
+class TestSqliteCacheManager:
+    """Test the SQLite backend through the cache manager."""
+
+    @pytest.mark.asyncio
+    async def test_manager_uses_sqlite_backend(self, temp_dir):
+        """Test CacheBackend.SQLITE creates a working SQLite cache that shuts down cleanly."""
+        manager = CacheManager(
+            CacheConfig(backend=CacheBackend.SQLITE, cache_dir=temp_dir / "manager")
+        )
+        await manager.initialize()
+
+        assert isinstance(manager.backend, SqliteCache)
+        assert await manager.set_html("https://example.com", "<html></html>") is True
+        assert await manager.get_html("https://example.com") == "<html></html>"
+
+        await manager.shutdown()
+        assert not manager.backend._writer.is_alive()
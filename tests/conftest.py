@@ -39,6 +39,21 @@ structlog.configure(
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_resilience_state():
+    """Give every test a fresh retry budget, circuit breakers and throttles so failures don't leak."""
+    from src.utils.retry import circuit_breakers, retry_budget
+    from src.utils.throttle import domain_throttle
+
+    retry_budget.reset()
+    circuit_breakers.clear()
+    domain_throttle.clear()
+    yield
+    retry_budget.reset()
+    circuit_breakers.clear()
+    domain_throttle.clear()
+
+
 @pytest.fixture
 def mock_sleep(monkeypatch):
     """Mock asyncio.sleep to return immediately for faster tests."""
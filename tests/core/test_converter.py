@@ -408,6 +408,56 @@ class TestMainConversionFlow:
         assert (tmp_path / "converted_content.html").exists()
         assert (tmp_path / "shopify_ready_content.html").exists()
 
+    @pytest.mark.asyncio
+    async def test_convert_returns_partial_result_at_deadline(
+        self, tmp_path, sample_html, mock_config
+    ):
+        """Test content is kept when the budget runs out during image downloads."""
+        converter = AsyncWordPressConverter(
+            base_url="https://example.com", output_dir=tmp_path, config=mock_config
+        )
+
+        async def slow_download(*_args):
+            await asyncio.sleep(10)
+
+        with patch.object(converter, "_fetch_content", return_value=sample_html):
+            with patch.object(converter.metadata_extractor, "extract", return_value={}):
+                with patch.object(converter.html_processor, "process", return_value=sample_html):
+                    with patch.object(
+                        converter.image_downloader, "_download_single", side_effect=slow_download
+                    ):
+                        result = await converter.convert(budget=0.3)
+
+        assert result.partial
+        assert result.images_total == 1
+        assert result.images_downloaded == 0
+        assert (tmp_path / "converted_content.html").exists()
+
+    @pytest.mark.asyncio
+    async def test_convert_not_partial_when_no_download_was_cancelled(
+        self, tmp_path, sample_html, mock_config
+    ):
+        """Test failed downloads that finish as the deadline passes do not mark a partial result."""
+        converter = AsyncWordPressConverter(
+            base_url="https://example.com", output_dir=tmp_path, config=mock_config
+        )
+
+        async def failing_download(*_args, **_kwargs):
+            # Every image fails on its own, ending just after the budget runs out
+            await asyncio.sleep(0.4)
+            return []
+
+        with patch.object(converter, "_fetch_content", return_value=sample_html):
+            with patch.object(converter.metadata_extractor, "extract", return_value={}):
+                with patch.object(converter.html_processor, "process", return_value=sample_html):
+                    with patch.object(
+                        converter.image_downloader, "download_all", side_effect=failing_download
+                    ):
+                        result = await converter.convert(budget=0.3)
+
+        assert not result.partial
+        assert result.images_downloaded == 0
+
     @pytest.mark.asyncio
     async def test_convert_with_progress_callback(self, tmp_path, sample_html):
         """Test conversion with progress callback."""
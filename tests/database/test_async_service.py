@@ -0,0 +1,211 @@
+"""Tests for the async database service using mocked async sessions."""
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.exceptions import DatabaseError
+from src.database import queries
+from src.database.async_service import AsyncDatabaseService, call_service
+from src.database.models import JobPriority, JobStatus, ScrapingJob
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock AsyncSession."""
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    session.flush = AsyncMock()
+    session.execute = AsyncMock()
+    session.get = AsyncMock()
+    return session
+
+
+@pytest.fixture
+def service(mock_session):
+    """Create an AsyncDatabaseService over the mock session."""
+    return AsyncDatabaseService(session_factory=Mock(return_value=mock_session))
+
+
+@pytest.mark.unit
+class TestAsyncDatabaseServiceSessions:
+    """Async session management and transaction tests."""
+
+    async def test_session_commits_on_success(self, service, mock_session):
+        """Test the session is committed and closed after a clean block."""
+        async with service.get_session() as session:
+            session.add("item")
+
+        mock_session.commit.assert_awaited_once()
+        mock_session.rollback.assert_not_awaited()
+        mock_session.close.assert_awaited_once()
+
+    async def test_session_rolls_back_on_error(self, service, mock_session):
+        """Test the session is rolled back and closed when the block raises."""
+        with pytest.raises(ValueError):
+            async with service.get_session():
+                raise ValueError("boom")
+
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_awaited()
+        mock_session.close.assert_awaited_once()
+
+    def test_defaults_to_api_session_factory(self):
+        """Test the API's asyncpg session factory is shared by default."""
+        from src.api.dependencies import async_session, engine
+
+        service = AsyncDatabaseService()
+
+        assert service.SessionLocal is async_session
+        assert service.engine is engine
+
+
+@pytest.mark.unit
+class TestAsyncDatabaseServiceOperations:
+    """Job and batch operations against a mocked session."""
+
+    async def test_create_job_derives_domain_slug_and_priority(self, service, mock_session):
+        """Test job creation fills in domain, slug and priority like the sync service."""
+        job = await service.create_job(
+            url="https://example.com/blog/post-1", output_directory="/tmp/out", priority="HIGH"
+        )
+
+        assert isinstance(job, ScrapingJob)
+        assert job.domain == "example.com"
+        assert job.slug == "post-1"
+        assert job.priority == JobPriority.HIGH
+        mock_session.add.assert_called_once_with(job)
+        mock_session.flush.assert_awaited_once()
+
+    async def test_create_jobs_bulk_returns_ids(self, service, mock_session):
+        """Test bulk creation issues one executemany and returns ordered IDs."""
+        mock_session.execute.return_value.scalars = Mock(return_value=iter([10, 11]))
+
+        job_ids = await service.create_jobs_bulk(
+            ["https://example.com/a", "https://example.com/"], output_directory="/tmp/out"
+        )
+
+        assert job_ids == [10, 11]
+        rows = mock_session.execute.await_args.args[1]
+        assert [row["slug"] for row in rows] == ["a", "homepage"]
+
+    async def test_create_jobs_bulk_empty(self, service, mock_session):
+        """Test an empty URL list does not touch the database."""
+        assert await service.create_jobs_bulk([], output_directory="/tmp/out") == []
+        mock_session.execute.assert_not_awaited()
+
+    async def test_update_job_status(self, service, mock_session):
+        """Test status updates report whether a row was changed."""
+        mock_session.execute.return_value = Mock(rowcount=1)
+        assert await service.update_job_status(1, JobStatus.RUNNING) is True
+
+        mock_session.execute.return_value = Mock(rowcount=0)
+        assert await service.update_job_status(999, JobStatus.RUNNING) is False
+
+    async def test_apply_job_updates(self, service, mock_session):
+        """Test job rows and batch counters are written in one session."""
+        await service.apply_job_updates(
+            [{"id": 1, "status": JobStatus.COMPLETED}],
+            {5: {JobStatus.COMPLETED: 1}, 6: {JobStatus.RUNNING: 2}},
+        )
+
+        # One bulk job update plus one counter update (RUNNING has no counter)
+        assert mock_session.execute.await_count == 2
+        mock_session.commit.assert_awaited_once()
+
+    def test_skipped_transition_sets_completed_at(self):
+        """Test SKIPPED is a final status and gets a completion time."""
+        now = datetime.now(UTC)
+
+        values = queries.status_update_values(JobStatus.SKIPPED, now, duration=1.5)
+
+        assert values["completed_at"] == now
+        assert values["duration_seconds"] == 1.5
+
+    async def test_get_job_status_counts_fills_missing_statuses(self, service, mock_session):
+        """Test every status is present in the counts, zero when it has no jobs."""
+        mock_session.execute.return_value = Mock(
+            all=Mock(return_value=[(JobStatus.COMPLETED, 3), (JobStatus.FAILED, 1)])
+        )
+
+        counts = await service.get_job_status_counts(batch_id=5)
+
+        assert counts[JobStatus.COMPLETED] == 3
+        assert counts[JobStatus.FAILED] == 1
+        assert counts[JobStatus.PENDING] == 0
+
+    async def test_requeue_jobs_marks_batch_running(self, service, mock_session):
+        """Test failed jobs are requeued and the batch reset in one session."""
+        mock_session.execute.return_value = Mock(rowcount=2)
+
+        assert await service.requeue_jobs(5, [1, 2]) == 2
+        assert mock_session.execute.await_count == 2
+        mock_session.commit.assert_awaited_once()
+
+    async def test_check_connection_wraps_errors(self, service, mock_session):
+        """Test an unreachable database surfaces as DatabaseError."""
+        mock_session.execute.side_effect = SQLAlchemyError("connection refused")
+
+        with pytest.raises(DatabaseError, match="connection check failed"):
+            await service.check_connection()
+
+    async def test_errors_are_wrapped(self, service, mock_session):
+        """Test SQLAlchemy errors surface as DatabaseError."""
+        mock_session.execute.side_effect = SQLAlchemyError("connection lost")
+
+        with pytest.raises(DatabaseError, match="Batch retrieval failed"):
+            await service.get_batch(1)
+        mock_session.rollback.assert_awaited_once()
+
+    async def test_add_job_log_swallows_errors(self, service, mock_session):
+        """Test log failures never break processing."""
+        mock_session.flush.side_effect = SQLAlchemyError("disk full")
+
+        assert await service.add_job_log(1, "info", "message") is None
+
+
+@pytest.mark.unit
+class TestCallService:
+    """Test call_service dispatch."""
+
+    async def test_awaits_coroutine_methods(self):
+        """Test async methods are awaited on the loop."""
+
+        async def method(value):
+            return value * 2
+
+        assert await call_service(method, 21) == 42
+
+    async def test_runs_sync_methods_in_thread(self):
+        """Test sync methods run off the event loop thread."""
+        loop_thread = threading.get_ident()
+
+        def method(value, *, suffix):
+            return value + suffix, threading.get_ident()
+
+        result, thread_id = await call_service(method, "a", suffix="b")
+
+        assert result == "ab"
+        assert thread_id != loop_thread
+
+    async def test_sync_call_does_not_block_loop(self):
+        """Test other coroutines make progress while a sync call runs."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking():
+            started.set()
+            release.wait(timeout=5)
+            return "done"
+
+        call = asyncio.create_task(call_service(blocking))
+        await asyncio.to_thread(started.wait, 5)
+        release.set()  # Only reachable if the loop was free while blocking() ran
+
+        assert await call == "done"
@@ -327,3 +327,54 @@ class TestMigrationManagerIntegration:
 
         except FileNotFoundError:
             pytest.skip("Alembic not initialized in test environment")
+
+
+class TestLeaseMigration:
+    """Test the revision adding the worker lease to existing job tables."""
+
+    @staticmethod
+    def run_revision(engine, direction: str) -> None:
+        import importlib.util
+
+        from alembic.migration import MigrationContext
+        from alembic.operations import Operations
+
+        path = next(Path("alembic/versions").glob("*_add_scraping_job_lease.py"))
+        spec = importlib.util.spec_from_file_location("lease_revision", path)
+        revision = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(revision)
+
+        with engine.begin() as connection:
+            with Operations.context(MigrationContext.configure(connection)):
+                getattr(revision, direction)()
+
+    def test_adds_column_and_index_to_existing_table(self):
+        """Test an existing scraping_jobs table gains claimed_at and its index, once."""
+        from sqlalchemy import create_engine, inspect, text
+
+        engine = create_engine("sqlite://")
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE scraping_jobs (id INTEGER PRIMARY KEY)"))
+
+        self.run_revision(engine, "upgrade")
+        self.run_revision(engine, "upgrade")
+
+        inspector = inspect(engine)
+        assert "claimed_at" in {column["name"] for column in inspector.get_columns("scraping_jobs")}
+        assert [index["column_names"] for index in inspector.get_indexes("scraping_jobs")] == [
+            ["claimed_at"]
+        ]
+
+        self.run_revision(engine, "downgrade")
+        inspector = inspect(engine)
+        assert [column["name"] for column in inspector.get_columns("scraping_jobs")] == ["id"]
+
+    def test_skips_missing_table(self):
+        """Test databases without the table yet are left for the models to create."""
+        from sqlalchemy import create_engine, inspect
+
+        engine = create_engine("sqlite://")
+
+        self.run_revision(engine, "upgrade")
+
+        assert not inspect(engine).has_table("scraping_jobs")
@@ -395,6 +395,19 @@ class TestDatabaseServiceJobStatusUpdates:
         assert updated_job.status == JobStatus.CANCELLED
         assert updated_job.completed_at is not None
 
+    def test_update_job_status_to_skipped(self, db_service_with_session):
+        """Test a skipped job is stamped as finished like other final statuses."""
+        job = db_service_with_session.create_job(
+            url="https://example.com/test-skip",
+            output_directory="/tmp/output",
+        )
+
+        assert db_service_with_session.update_job_status(job.id, JobStatus.SKIPPED) is True
+
+        updated_job = db_service_with_session.get_job(job.id)
+        assert updated_job.status == JobStatus.SKIPPED
+        assert updated_job.completed_at is not None
+
     def test_update_job_status_nonexistent(self, db_service_with_session):
         """Test updating status of non-existent job."""
         success = db_service_with_session.update_job_status(99999, JobStatus.COMPLETED)
@@ -863,6 +876,56 @@ class TestDatabaseServiceBatchOperations:
         assert updated_batch.skipped_jobs == 1
         # RUNNING, CANCELLED, and PENDING are not counted in these specific fields
 
+    def test_create_jobs_bulk(self, db_service_with_session, test_isolation_id):
+        """Test bulk job creation returns IDs in input order."""
+        batch = db_service_with_session.create_batch(name=f"Bulk Batch {test_isolation_id}")
+        urls = [f"https://example.com/bulk-{test_isolation_id}-{i}" for i in range(5)]
+
+        job_ids = db_service_with_session.create_jobs_bulk(
+            urls,
+            output_directory="/tmp/bulk",
+            batch_id=batch.id,
+            priorities=["high", "normal", "low", "bogus", "urgent"],
+        )
+
+        assert len(job_ids) == 5
+        for url, job_id in zip(urls, job_ids, strict=True):
+            job = db_service_with_session.get_job(job_id)
+            assert job.url == url
+            assert job.batch_id == batch.id
+            assert job.domain == "example.com"
+            assert job.status == JobStatus.PENDING
+        assert db_service_with_session.get_job(job_ids[3]).priority.value == "normal"
+
+    def test_apply_job_updates(self, db_service_with_session, test_isolation_id):
+        """Test buffered job updates and batch counter increments in one call."""
+        batch = db_service_with_session.create_batch(
+            name=f"Flush Batch {test_isolation_id}", total_jobs=3
+        )
+        job_ids = db_service_with_session.create_jobs_bulk(
+            [f"https://example.com/flush-{test_isolation_id}-{i}" for i in range(3)],
+            output_directory="/tmp/flush",
+            batch_id=batch.id,
+        )
+
+        db_service_with_session.apply_job_updates(
+            [
+                {"id": job_ids[0], "status": JobStatus.COMPLETED, "duration_seconds": 1.0},
+                {"id": job_ids[1], "status": JobStatus.FAILED, "error_message": "boom"},
+                {"id": job_ids[2], "status": JobStatus.RUNNING},
+            ],
+            {batch.id: {JobStatus.COMPLETED: 1, JobStatus.FAILED: 1}},
+        )
+
+        assert db_service_with_session.get_job(job_ids[0]).status == JobStatus.COMPLETED
+        assert db_service_with_session.get_job(job_ids[1]).error_message == "boom"
+        assert db_service_with_session.get_job(job_ids[2]).status == JobStatus.RUNNING
+
+        updated_batch = db_service_with_session.get_batch(batch.id)
+        assert updated_batch.completed_jobs == 1
+        assert updated_batch.failed_jobs == 1
+        assert updated_batch.skipped_jobs == 0
+
 
 @pytest.mark.integration
 class TestDatabaseServiceContentOperations:
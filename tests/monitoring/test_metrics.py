@@ -1,4 +1,5 @@
 """Tests for metrics collection system."""
+
 # pylint: disable=protected-access,too-many-public-methods,use-implicit-booleaness-not-comparison,import-outside-toplevel
 
 import asyncio
@@ -187,6 +188,30 @@ class TestMetricsCollector:
             mock_counter.labels.assert_called_with(status="completed")
             mock_histogram.observe.assert_called_with(2.5)
 
+    def test_set_batch_concurrency_limit(self, prometheus_collector):
+        """Test the adaptive concurrency limit is exported as a gauge."""
+        with patch("src.monitoring.metrics.PROMETHEUS_AVAILABLE", True):
+            mock_gauge = MagicMock()
+            prometheus_collector.metrics = {"batch_concurrency_limit": mock_gauge}
+
+            prometheus_collector.set_batch_concurrency_limit(6)
+
+            mock_gauge.set.assert_called_with(6)
+            assert prometheus_collector.application_metrics["batch_concurrency_limit"] == 6
+
+    def test_record_throttle(self, prometheus_collector):
+        """Test throttling events are counted per domain."""
+        with patch("src.monitoring.metrics.PROMETHEUS_AVAILABLE", True):
+            mock_counter = MagicMock()
+            prometheus_collector.metrics = {"throttle_events": mock_counter}
+
+            prometheus_collector.record_throttle("example.com", 429)
+            prometheus_collector.record_throttle("example.com", 503)
+
+            mock_counter.labels.assert_called_with(domain="example.com", status="503")
+            assert mock_counter.labels.return_value.inc.call_count == 2
+            assert prometheus_collector.application_metrics["throttle_events"] == {"example.com": 2}
+
     def test_record_cache_metrics(self, prometheus_collector):
         """Test recording cache metrics."""
         with patch("src.monitoring.metrics.PROMETHEUS_AVAILABLE", True):
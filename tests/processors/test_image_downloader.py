@@ -7,8 +7,12 @@ import aiohttp
 import pytest
 import pytest_asyncio
 
+from src.caching.base import CacheBackend, CacheConfig
+from src.caching.manager import CacheManager
 from src.core.exceptions import ConversionError
 from src.processors.image_downloader import AsyncImageDownloader
+from src.utils.deadline import deadline_scope
+from src.utils.hedging import RequestHedger
 
 
 # Fake implementations to replace AsyncMock and avoid coroutine warnings
@@ -247,6 +251,36 @@ class TestAsyncImageDownloader:
                     mock_file.write.assert_any_call(b"chunk1")
                     mock_file.write.assert_any_call(b"chunk2")
 
+    @pytest.mark.asyncio
+    async def test_download_image_hedges_stalled_response(self, temp_output_dir, mock_session):
+        """Test a stalled image request is hedged and the body streamed from the winner."""
+        downloader = AsyncImageDownloader(temp_output_dir, hedge_requests=True)
+        hedger = RequestHedger(min_samples=1, window=5, budget_percent=100)
+        hedger.record("example.com", 0.01)
+        hedger.budget.deposit(10)
+
+        class StallingContext(FakeAsyncContextManager):
+            async def __aenter__(self):
+                await asyncio.sleep(5)
+
+        fast_response = FakeHttpResponse(content_chunks=[b"image"])
+        mock_session.get.side_effect = [
+            StallingContext(None),
+            FakeAsyncContextManager(fast_response),
+        ]
+
+        with patch("src.processors.image_downloader.robots_checker") as mock_robots:
+            mock_robots.check_and_delay = AsyncMock()
+            with patch("src.processors.image_downloader.request_hedger", hedger):
+                result = await asyncio.wait_for(
+                    downloader._download_image(mock_session, "https://example.com/photo.jpg"),
+                    timeout=2,
+                )
+
+        assert result == "photo.jpg"
+        assert (temp_output_dir / "photo.jpg").read_bytes() == b"image"
+        assert hedger.hedge_wins == 1
+
     @pytest.mark.asyncio
     async def test_download_image_client_error(self, downloader, mock_session):
         """Test download_image with client error."""
@@ -520,6 +554,41 @@ class TestAsyncImageDownloaderEdgeCases:
             # Should only return successful downloads
             assert result == ["success.jpg"]
 
+    @pytest.mark.asyncio
+    async def test_download_all_returns_partial_results_at_deadline(self, downloader):
+        """Test downloads still running at the job deadline are cancelled, keeping finished ones."""
+        mock_session = AsyncMock()
+
+        async def mock_download_single(session, url, index, total, callback):
+            if index == 0:
+                return "fast.jpg"
+            await asyncio.sleep(10)
+            return "slow.jpg"
+
+        with patch.object(downloader, "_download_single", side_effect=mock_download_single):
+            with deadline_scope(0.2):
+                result = await downloader.download_all(
+                    mock_session, ["fast.com/a.jpg", "slow.com/b.jpg"]
+                )
+
+        assert result == ["fast.jpg"]
+        assert downloader.last_cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_downloads_are_not_counted_as_cancelled(self, downloader):
+        """Test only downloads cut off by the deadline count as cancelled."""
+        mock_session = AsyncMock()
+
+        async def mock_download_single(session, url, index, total, callback):
+            raise aiohttp.ClientError("Client error")
+
+        with patch.object(downloader, "_download_single", side_effect=mock_download_single):
+            with deadline_scope(5.0):
+                result = await downloader.download_all(mock_session, ["fail.com/a.jpg"])
+
+        assert result == []
+        assert downloader.last_cancelled == 0
+
     @pytest.mark.asyncio
     async def test_filename_generation_hash_collision_handling(self, downloader):
         """Test filename generation with potential hash collisions."""
@@ -586,3 +655,78 @@ class TestAsyncImageDownloaderEdgeCases:
 
                     # Should create timeout with correct value
                     mock_timeout.assert_called_with(total=10)
+
+
+class TestAsyncImageDownloaderCache:
+    """Test reusing cached images across posts."""
+
+    @pytest_asyncio.fixture
+    async def cache(self):
+        """Create a cache manager with a memory backend."""
+        manager = CacheManager(CacheConfig(backend=CacheBackend.MEMORY))
+        await manager.initialize()
+        return manager
+
+    @pytest.fixture(autouse=True)
+    def robots(self):
+        with patch("src.processors.image_downloader.robots_checker") as mock_robots:
+            mock_robots.check_and_delay = AsyncMock()
+            yield mock_robots
+
+    @pytest.fixture
+    def session(self):
+        session = Mock(spec=aiohttp.ClientSession)
+        session.get.side_effect = lambda url, **kwargs: FakeAsyncContextManager(
+            FakeHttpResponse(content_chunks=[url.encode(), b"-body"])
+        )
+        return session
+
+    @pytest.mark.asyncio
+    async def test_downloads_are_cached_in_one_write_per_type(self, tmp_path, cache, session):
+        """Test a post's downloaded images and filenames are cached in one call each."""
+        downloader = AsyncImageDownloader(tmp_path / "post1", cache=cache)
+        urls = ["https://example.com/a.jpg", "https://example.com/b.png"]
+
+        with (
+            patch.object(cache, "set_images", wraps=cache.set_images) as set_images,
+            patch.object(cache, "set_metadata_many", wraps=cache.set_metadata_many) as set_meta,
+        ):
+            result = await downloader.download_all(session, urls)
+
+        assert result == ["a.jpg", "b.png"]
+        set_images.assert_called_once()
+        set_meta.assert_called_once()
+        assert await cache.get_images(urls) == {url: url.encode() + b"-body" for url in urls}
+        assert downloader._fetched == {}
+
+    @pytest.mark.asyncio
+    async def test_cached_images_are_restored_without_requests(self, tmp_path, cache, session):
+        """Test a later post sharing images writes cached ones out and fetches only the rest."""
+        await AsyncImageDownloader(tmp_path / "post1", cache=cache).download_all(
+            session, ["https://example.com/a.jpg"]
+        )
+        session.get.reset_mock()
+        progress = Mock()
+
+        downloader = AsyncImageDownloader(tmp_path / "post2", cache=cache)
+        result = await downloader.download_all(
+            session, ["https://example.com/a.jpg", "https://example.com/c.gif"], progress
+        )
+
+        assert result == ["a.jpg", "c.gif"]
+        assert session.get.call_count == 1
+        assert session.get.call_args.args[0] == "https://example.com/c.gif"
+        assert (tmp_path / "post2" / "a.jpg").read_bytes() == b"https://example.com/a.jpg-body"
+        progress.assert_any_call(0.5)
+
+    @pytest.mark.asyncio
+    async def test_cache_failures_fall_back_to_downloading(self, tmp_path, cache, session):
+        """Test an unavailable cache never fails the downloads."""
+        cache.get_images = AsyncMock(side_effect=ConnectionError("cache down"))
+        cache.set_images = AsyncMock(side_effect=ConnectionError("cache down"))
+        downloader = AsyncImageDownloader(tmp_path / "post", cache=cache)
+
+        result = await downloader.download_all(session, ["https://example.com/a.jpg"])
+
+        assert result == ["a.jpg"]
+        assert session.get.call_count == 1
@@ -14,7 +14,13 @@ from src.utils.html import (
     find_multiple_selectors,
     safe_copy_attributes,
 )
-from src.utils.url import extract_filename_from_url, is_same_domain, normalize_url
+from src.utils.url import (
+    canonicalize_url,
+    extract_filename_from_url,
+    is_same_domain,
+    normalize_url,
+    url_dedup_key,
+)
 
 
 class TestMetadataExtractor:
@@ -132,6 +138,31 @@ class TestURLUtilities:
         result = normalize_url("  https://example.com/path  ")
         assert result == "https://example.com/path"
 
+    def test_canonicalize_url(self):
+        """Test canonicalization drops noise but keeps meaningful parts."""
+        result = canonicalize_url(
+            "HTTPS://Example.COM:443/post/?utm_source=x&b=2&a=1&fbclid=y#comments"
+        )
+        assert result == "https://example.com/post/?a=1&b=2"
+
+    def test_canonicalize_url_invalid(self):
+        """Test canonicalizing invalid URLs."""
+        assert canonicalize_url("not-a-url") is None
+
+    def test_url_dedup_key_equivalent_urls(self):
+        """Test scheme, trailing slash, tracking params and fragments share a key."""
+        keys = {
+            url_dedup_key(url)
+            for url in [
+                "https://example.com/post",
+                "http://example.com/post/",
+                "https://example.com/post?utm_campaign=spring",
+                "https://EXAMPLE.com:443/post#top",
+            ]
+        }
+        assert len(keys) == 1
+        assert url_dedup_key("https://example.com/post?page=2") not in keys
+
     def test_is_same_domain_true(self):
         """Test same domain detection - positive case."""
         result = is_same_domain("https://example.com/page1", "https://example.com/page2")
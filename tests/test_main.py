@@ -106,6 +106,7 @@ class CLITestRunner:
         output_dir: str = "converted_content",
         batch_size: int = 3,
         batch_config: Any = None,
+        stream: bool = False,
     ) -> None:
         """Testable batch processing using fake processor."""
         processor = self.batch_processor_factory(output_dir=Path(output_dir), config=batch_config)
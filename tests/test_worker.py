@@ -0,0 +1,258 @@
+"""Tests for the standalone conversion worker."""
+
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.database.models import JobStatus
+from src.worker import ConversionWorker, WorkerConfig, _collect_output_stats
+
+
+def make_session_factory():
+    """Create a session factory yielding a single mocked async session."""
+    session = AsyncMock()
+
+    class _SessionContext:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    return (lambda: _SessionContext()), session
+
+
+def make_job(job_id: int, batch_id: int | None = None) -> MagicMock:
+    """Create a mocked claimed job row."""
+    job = MagicMock()
+    job.id = job_id
+    job.url = f"https://example.com/post-{job_id}"
+    job.output_directory = f"/tmp/out-{job_id}"
+    job.batch_id = batch_id
+    return job
+
+
+class TestWorkerConfig:
+    """Test worker configuration validation."""
+
+    def test_defaults_are_valid(self):
+        """Test default configuration passes validation."""
+        WorkerConfig().validate()
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("concurrency", 0),
+            ("processes", -1),
+            ("poll_interval", 0),
+            ("max_tasks_per_child", 0),
+            ("memory_limit_mb", -5),
+        ],
+    )
+    def test_invalid_values_rejected(self, field, value):
+        """Test out-of-range values raise ValueError."""
+        config = WorkerConfig(**{field: value})
+        with pytest.raises(ValueError):
+            config.validate()
+
+
+class TestCollectOutputStats:
+    """Test conversion output measurement."""
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing output directory reports nothing."""
+        assert _collect_output_stats(str(tmp_path / "missing")) == (0, 0)
+
+    def test_counts_size_and_images(self, tmp_path):
+        """Test content size and image count are collected."""
+        (tmp_path / "page.html").write_text("abcd")
+        images = tmp_path / "images"
+        images.mkdir()
+        (images / "a.jpg").write_bytes(b"12")
+        (images / "b.jpg").write_bytes(b"345")
+
+        assert _collect_output_stats(str(tmp_path)) == (9, 2)
+
+
+class TestConversionWorker:
+    """Test the worker loop."""
+
+    @pytest.mark.asyncio
+    async def test_burst_mode_processes_queue_and_exits(self):
+        """Test claimed jobs are converted and outcomes recorded before exit."""
+        factory, _ = make_session_factory()
+        worker = ConversionWorker(
+            WorkerConfig(concurrency=2, poll_interval=0.01, burst=True), session_factory=factory
+        )
+        batches = [[make_job(1, batch_id=7), make_job(2)], []]
+
+        with (
+            patch("src.worker.JobCRUD") as job_crud,
+            patch("src.worker.BatchCRUD") as batch_crud,
+            patch("src.worker._convert", new_callable=AsyncMock) as convert,
+            patch("src.worker._collect_output_stats", return_value=(10, 1)),
+        ):
+            job_crud.claim_pending_jobs = AsyncMock(side_effect=lambda *_: batches.pop(0))
+            job_crud.update_job_status = AsyncMock(return_value=MagicMock())
+            batch_crud.record_job_outcome = AsyncMock()
+
+            await asyncio.wait_for(worker.run(), timeout=5)
+
+        assert convert.await_count == 2
+        assert worker.jobs_completed == 2
+        assert worker.jobs_failed == 0
+        batch_crud.record_job_outcome.assert_awaited_once()
+        assert batch_crud.record_job_outcome.await_args.args[1:] == (7, JobStatus.COMPLETED)
+
+    @pytest.mark.asyncio
+    async def test_failed_conversion_marks_job_failed(self):
+        """Test conversion errors are stored on the job."""
+        factory, _ = make_session_factory()
+        worker = ConversionWorker(
+            WorkerConfig(concurrency=1, poll_interval=0.01, burst=True), session_factory=factory
+        )
+        batches = [[make_job(3)], []]
+
+        with (
+            patch("src.worker.JobCRUD") as job_crud,
+            patch("src.worker.BatchCRUD"),
+            patch("src.worker._convert", new_callable=AsyncMock, side_effect=RuntimeError("boom")),
+        ):
+            job_crud.claim_pending_jobs = AsyncMock(side_effect=lambda *_: batches.pop(0))
+            job_crud.update_job_status = AsyncMock()
+
+            await asyncio.wait_for(worker.run(), timeout=5)
+
+        assert worker.jobs_failed == 1
+        kwargs = job_crud.update_job_status.await_args.kwargs
+        assert job_crud.update_job_status.await_args.args[2] == JobStatus.FAILED
+        assert kwargs["error_message"] == "boom"
+        assert kwargs["error_type"] == "RuntimeError"
+
+    @pytest.mark.asyncio
+    async def test_claims_never_exceed_concurrency(self):
+        """Test the worker only claims as many jobs as it has free slots."""
+        factory, _ = make_session_factory()
+        worker = ConversionWorker(
+            WorkerConfig(concurrency=3, poll_interval=0.01, burst=True), session_factory=factory
+        )
+        release = asyncio.Event()
+        limits: list[int] = []
+        remaining = [make_job(i) for i in range(5)]
+
+        def claim(_db, limit):
+            limits.append(limit)
+            claimed, remaining[:] = remaining[:limit], remaining[limit:]
+            return claimed
+
+        async def slow_convert(*_):
+            await release.wait()
+
+        with (
+            patch("src.worker.JobCRUD") as job_crud,
+            patch("src.worker.BatchCRUD"),
+            patch("src.worker._convert", side_effect=slow_convert),
+        ):
+            job_crud.claim_pending_jobs = AsyncMock(side_effect=claim)
+            job_crud.update_job_status = AsyncMock()
+
+            run = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.05)
+            assert worker.in_flight == 3
+            release.set()
+            await asyncio.wait_for(run, timeout=5)
+
+        assert limits[0] == 3
+        assert all(limit <= 3 for limit in limits)
+        assert worker.jobs_completed == 5
+
+    @pytest.mark.asyncio
+    async def test_running_jobs_keep_their_lease(self):
+        """Test the worker renews the lease of jobs it is still converting."""
+        factory, _ = make_session_factory()
+        worker = ConversionWorker(
+            WorkerConfig(poll_interval=0.01, burst=True), session_factory=factory
+        )
+        batches = [[make_job(4)], []]
+
+        async def slow_convert(*_):
+            await asyncio.sleep(0.05)
+
+        with (
+            patch("src.worker.CONSTANTS.WORKER_LEASE_SECONDS", 0.03),
+            patch("src.worker.JobCRUD") as job_crud,
+            patch("src.worker.BatchCRUD"),
+            patch("src.worker._convert", side_effect=slow_convert),
+        ):
+            job_crud.claim_pending_jobs = AsyncMock(side_effect=lambda *_: batches.pop(0))
+            job_crud.update_job_status = AsyncMock()
+            job_crud.renew_leases = AsyncMock()
+
+            await asyncio.wait_for(worker.run(), timeout=5)
+
+        job_crud.renew_leases.assert_awaited()
+        assert job_crud.renew_leases.await_args.args[1] == [4]
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_in_flight_jobs(self):
+        """Test stop() lets running conversions finish."""
+        factory, _ = make_session_factory()
+        worker = ConversionWorker(WorkerConfig(poll_interval=0.01), session_factory=factory)
+        batches = [[make_job(1)]]
+
+        async def convert(*_):
+            worker.stop()
+            await asyncio.sleep(0.01)
+
+        with (
+            patch("src.worker.JobCRUD") as job_crud,
+            patch("src.worker.BatchCRUD"),
+            patch("src.worker._convert", side_effect=convert),
+        ):
+            job_crud.claim_pending_jobs = AsyncMock(
+                side_effect=lambda *_: batches.pop(0) if batches else []
+            )
+            job_crud.update_job_status = AsyncMock()
+
+            await asyncio.wait_for(worker.run(), timeout=5)
+
+        assert worker.jobs_completed == 1
+        assert worker.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_broken_process_pool_is_replaced_and_job_requeued(self):
+        """Test a dead pool child requeues the job and the next job gets a fresh pool."""
+        factory, _ = make_session_factory()
+        worker = ConversionWorker(
+            WorkerConfig(concurrency=1, processes=1, poll_interval=0.01, burst=True),
+            session_factory=factory,
+        )
+        batches = [[make_job(3)], [make_job(3)], []]
+
+        broken = MagicMock()
+        broken.submit.side_effect = BrokenProcessPool("child terminated abruptly")
+        healthy = MagicMock()
+        done = Future()
+        done.set_result(None)
+        healthy.submit.return_value = done
+
+        with (
+            patch("src.worker.JobCRUD") as job_crud,
+            patch("src.worker.BatchCRUD"),
+            patch("src.worker.ProcessPoolExecutor", side_effect=[broken, healthy]) as pool,
+        ):
+            job_crud.claim_pending_jobs = AsyncMock(side_effect=lambda *_: batches.pop(0))
+            job_crud.requeue_job = AsyncMock(return_value=JobStatus.PENDING)
+            job_crud.update_job_status = AsyncMock()
+
+            await asyncio.wait_for(worker.run(), timeout=5)
+
+        assert pool.call_count == 2
+        broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        assert job_crud.requeue_job.await_args.args[1:] == (3, "BrokenProcessPool")
+        assert job_crud.update_job_status.await_args.args[1:] == (3, JobStatus.COMPLETED)
+        assert worker.jobs_completed == 1
+        assert worker.jobs_failed == 0
@@ -11,7 +11,7 @@ Applied the same successful dependency injection patterns:
 from datetime import UTC, datetime
 from typing import Any, Protocol
 from unittest import IsolatedAsyncioTestCase
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.api.crud import BatchCRUD, JobCRUD
 from src.api.schemas import BatchCreate, JobCreate, JobUpdate
@@ -299,6 +299,69 @@ class TestJobCRUDRefactored(IsolatedAsyncioTestCase):
             self.assertEqual(result.started_at, existing_time)
 
 
+class TestJobCRUDClaim(IsolatedAsyncioTestCase):
+    """Test claiming jobs, including jobs whose worker lease expired."""
+
+    @staticmethod
+    def make_session(jobs: list[ScrapingJob]) -> MagicMock:
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = jobs
+        db_session = MagicMock()
+        db_session.execute = AsyncMock(return_value=result)
+        db_session.flush = AsyncMock()
+        return db_session
+
+    async def test_claim_marks_jobs_running(self):
+        """Test pending jobs are claimed with a fresh lease."""
+        job = TestDataFactory.create_sample_job()
+
+        claimed = await JobCRUD.claim_pending_jobs(self.make_session([job]), 5)
+
+        self.assertEqual(claimed, [job])
+        self.assertEqual(job.status, JobStatus.RUNNING)
+        self.assertIsNotNone(job.claimed_at)
+        self.assertEqual(job.retry_count, 0)
+
+    async def test_expired_lease_is_reclaimed_as_retry(self):
+        """Test a job whose worker died is claimed again and counted as a retry."""
+        job = TestDataFactory.create_sample_job(status=JobStatus.RUNNING, retry_count=1)
+
+        claimed = await JobCRUD.claim_pending_jobs(self.make_session([job]), 5)
+
+        self.assertEqual(claimed, [job])
+        self.assertEqual(job.status, JobStatus.RUNNING)
+        self.assertEqual(job.retry_count, 2)
+
+    async def test_expired_lease_without_retries_left_fails_job(self):
+        """Test a job that keeps losing its worker is failed instead of handed out again."""
+        job = TestDataFactory.create_sample_job(
+            status=JobStatus.RUNNING, retry_count=4, max_retries=5, batch_id=7
+        )
+        db_session = self.make_session([job])
+
+        with patch.object(BatchCRUD, "record_job_outcome", new=AsyncMock()) as record:
+            claimed = await JobCRUD.claim_pending_jobs(db_session, 5)
+
+        self.assertEqual(claimed, [])
+        self.assertEqual(job.status, JobStatus.FAILED)
+        self.assertEqual(job.error_type, "LeaseExpired")
+        self.assertEqual(job.retry_count, 5)
+        self.assertIsNotNone(job.completed_at)
+        record.assert_awaited_once_with(db_session, 7, JobStatus.FAILED)
+
+    async def test_requeue_job(self):
+        """Test a job whose run was lost goes back to PENDING with the run counted."""
+        job = TestDataFactory.create_sample_job(status=JobStatus.RUNNING, retry_count=1)
+        job.claimed_at = datetime.now(UTC)
+
+        with patch.object(JobCRUD, "get_job", return_value=job):
+            status = await JobCRUD.requeue_job(FakeDatabaseSession(), 1, "BrokenProcessPool")
+
+        self.assertEqual(status, JobStatus.PENDING)
+        self.assertEqual(job.retry_count, 2)
+        self.assertIsNone(job.claimed_at)
+
+
 class TestBatchCRUDRefactored(IsolatedAsyncioTestCase):
     """Test BatchCRUD operations using dependency injection."""
 
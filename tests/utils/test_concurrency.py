@@ -0,0 +1,397 @@
+"""Tests for bounded concurrent execution helpers."""
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from src.core.exceptions import FetchError
+from src.utils.concurrency import (
+    ERROR,
+    OK,
+    THROTTLED,
+    TIMEOUT,
+    AdaptiveConcurrencyLimiter,
+    DomainConcurrencyLimiter,
+    RatioBudget,
+    bounded_as_completed,
+    classify_outcome,
+)
+
+
+class TestBoundedAsCompleted:
+    """Test bounded_as_completed producer/consumer helper."""
+
+    @pytest.mark.asyncio
+    async def test_yields_every_result(self):
+        """Test all items are processed and paired with their results."""
+
+        async def double(x: int) -> int:
+            await asyncio.sleep(0)
+            return x * 2
+
+        results = {
+            item: result async for item, result in bounded_as_completed(range(10), double, 3)
+        }
+
+        assert results == {i: i * 2 for i in range(10)}
+
+    @pytest.mark.asyncio
+    async def test_in_flight_never_exceeds_limit(self):
+        """Test at most max_in_flight tasks exist and items are pulled lazily."""
+        in_flight = 0
+        peak = 0
+        pulled = 0
+
+        def source():
+            nonlocal pulled
+            for i in range(100):
+                pulled += 1
+                yield i
+
+        async def work(_: int) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        gen = bounded_as_completed(source(), work, 4)
+        await anext(gen)
+        assert pulled <= 5  # 4 admitted + 1 refill at most before the first yield
+
+        async for _ in gen:
+            pass
+
+        assert peak <= 4
+        assert pulled == 100
+
+    @pytest.mark.asyncio
+    async def test_exceptions_are_yielded(self):
+        """Test exceptions are returned in place of results."""
+
+        async def maybe_fail(x: int) -> int:
+            if x == 2:
+                raise ValueError("bad item")
+            return x
+
+        results = dict([pair async for pair in bounded_as_completed([1, 2, 3], maybe_fail, 2)])
+
+        assert isinstance(results[2], ValueError)
+        assert results[1] == 1
+        assert results[3] == 3
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_source(self):
+        """Test async iterables are consumed lazily."""
+
+        async def source():
+            for i in range(5):
+                yield i
+
+        async def identity(x: int) -> int:
+            return x
+
+        items = sorted([item async for item, _ in bounded_as_completed(source(), identity, 2)])
+
+        assert items == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_closing_cancels_in_flight_tasks(self):
+        """Test closing the generator early cancels remaining tasks."""
+        cancelled = 0
+        registry: set[asyncio.Task] = set()
+
+        async def work(x: int) -> int:
+            nonlocal cancelled
+            if x == 0:
+                return x
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+            return x
+
+        async with aclosing(bounded_as_completed(range(3), work, 3, registry)) as gen:
+            async for item, _ in gen:
+                assert item == 0
+                break
+
+        assert cancelled == 2
+        assert not registry
+
+    @pytest.mark.asyncio
+    async def test_invalid_limit(self):
+        """Test non-positive limits are rejected."""
+
+        async def noop(_: int) -> None:
+            return None
+
+        with pytest.raises(ValueError, match="max_in_flight must be positive"):
+            async for _ in bounded_as_completed([1], noop, 0):
+                pass
+
+
+class HTTPStatusError(Exception):
+    """Stand-in for aiohttp.ClientResponseError carrying a status code."""
+
+    def __init__(self, status: int):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+
+
+class TestClassifyOutcome:
+    """Test mapping exceptions to congestion signals."""
+
+    def test_success(self):
+        """Test no exception is a healthy outcome."""
+        assert classify_outcome(None) == OK
+
+    def test_timeout(self):
+        """Test timeouts are recognised directly and when wrapped."""
+        assert classify_outcome(TimeoutError()) == TIMEOUT
+        assert classify_outcome(FetchError("timed out", cause=TimeoutError())) == TIMEOUT
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_throttled_statuses(self, status):
+        """Test 429/503 responses count as throttling even behind FetchError."""
+        assert classify_outcome(HTTPStatusError(status)) == THROTTLED
+        assert classify_outcome(FetchError("failed", cause=HTTPStatusError(status))) == THROTTLED
+
+    def test_other_errors(self):
+        """Test unrelated failures are plain errors."""
+        assert classify_outcome(HTTPStatusError(404)) == ERROR
+        assert classify_outcome(ValueError("bad html")) == ERROR
+
+
+class TestRatioBudget:
+    """Test the ratio-based token bucket."""
+
+    def test_validation(self):
+        """Test invalid ratios and caps are rejected."""
+        with pytest.raises(ValueError, match="ratio"):
+            RatioBudget(-0.1, 10)
+        with pytest.raises(ValueError, match="max_tokens"):
+            RatioBudget(0.1, 0.5)
+
+    def test_extra_work_bounded_by_ratio(self):
+        """Test withdrawals never exceed the ratio of deposits."""
+        budget = RatioBudget(0.25, 10)
+        allowed = 0
+        for _ in range(1000):
+            budget.deposit()
+            allowed += budget.withdraw()
+
+        assert allowed == 250
+
+    def test_savings_capped(self):
+        """Test an idle period cannot fund an unbounded burst."""
+        budget = RatioBudget(0.5, 3)
+        budget.deposit(100)
+
+        assert sum(budget.withdraw() for _ in range(10)) == 3
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test the AIMD concurrency limiter."""
+
+    def test_validation(self):
+        """Test invalid bounds and tuning parameters are rejected."""
+        with pytest.raises(ValueError, match="min_limit must be positive"):
+            AdaptiveConcurrencyLimiter(2, min_limit=0)
+        with pytest.raises(ValueError, match="initial_limit must be between"):
+            AdaptiveConcurrencyLimiter(5, min_limit=1, max_limit=4)
+        with pytest.raises(ValueError, match="decrease_factor"):
+            AdaptiveConcurrencyLimiter(2, min_limit=1, decrease_factor=1.0)
+
+    @pytest.mark.asyncio
+    async def test_in_flight_never_exceeds_limit(self):
+        """Test callers wait for a slot once the limit is reached."""
+        limiter = AdaptiveConcurrencyLimiter(2, min_limit=1, max_limit=2)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with limiter:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.in_flight == 0
+
+    def test_additive_increase_when_saturated(self):
+        """Test a healthy window grows the limit by one step when callers had to wait."""
+        limiter = AdaptiveConcurrencyLimiter(
+            2, min_limit=1, max_limit=4, target_p95=1.0, min_samples=4
+        )
+        limiter._saturated = True
+
+        for _ in range(4):
+            limiter.record(0.1)
+
+        assert limiter.limit == 3
+        assert limiter.increases == 1
+
+    def test_no_increase_without_saturation(self):
+        """Test the limit does not drift upwards while slots sit idle."""
+        limiter = AdaptiveConcurrencyLimiter(2, min_limit=1, max_limit=4, min_samples=4)
+
+        for _ in range(8):
+            limiter.record(0.1)
+
+        assert limiter.limit == 2
+
+    def test_increase_is_capped(self):
+        """Test the limit never exceeds max_limit."""
+        limiter = AdaptiveConcurrencyLimiter(3, min_limit=1, max_limit=3, min_samples=1)
+        limiter._saturated = True
+
+        limiter.record(0.1)
+
+        assert limiter.limit == 3
+
+    @pytest.mark.parametrize(
+        "samples",
+        [
+            [(0.1, None)] * 8 + [(0.1, TimeoutError())] * 2,
+            [(0.1, None)] * 5 + [(5.0, None)] * 5,
+        ],
+        ids=["timeouts", "latency"],
+    )
+    def test_multiplicative_decrease(self, samples):
+        """Test timeouts and a slow p95 each halve the limit."""
+        changes = []
+        limiter = AdaptiveConcurrencyLimiter(
+            8,
+            min_limit=1,
+            target_p95=1.0,
+            max_timeout_rate=0.1,
+            min_samples=10,
+            on_change=changes.append,
+        )
+
+        for latency, error in samples:
+            limiter.record(latency, error)
+
+        assert limiter.limit == 4
+        assert changes == [4]
+        assert limiter.decreases == 1
+
+    def test_tolerated_signals_keep_limit(self):
+        """Test a timeout rate within bounds does not shrink the limit."""
+        limiter = AdaptiveConcurrencyLimiter(
+            8, min_limit=1, target_p95=1.0, max_timeout_rate=0.1, min_samples=10
+        )
+
+        for _ in range(9):
+            limiter.record(0.1)
+        limiter.record(0.5, TimeoutError())
+
+        assert limiter.limit == 8
+
+    @pytest.mark.parametrize("status", [429, 503])
+    def test_throttled_responses_keep_limit(self, status):
+        """Test 429/503 responses are left to the throttle and never shrink the limit."""
+        limiter = AdaptiveConcurrencyLimiter(8, min_limit=1, min_samples=10)
+
+        for _ in range(10):
+            limiter.record(0.1, HTTPStatusError(status))
+
+        assert limiter.limit == 8
+        assert limiter.decreases == 0
+
+    def test_decrease_respects_floor(self):
+        """Test the limit never drops below min_limit."""
+        limiter = AdaptiveConcurrencyLimiter(3, min_limit=2, min_samples=1)
+
+        for _ in range(3):  # One window at limit 3
+            limiter.record(0.1, TimeoutError())
+
+        assert limiter.limit == 2
+
+    def test_fixed_limit(self):
+        """Test equal bounds keep the limit constant."""
+        limiter = AdaptiveConcurrencyLimiter(3, min_limit=3, max_limit=3, min_samples=1)
+        limiter._saturated = True
+
+        for _ in range(3):
+            limiter.record(0.1, TimeoutError())
+        for _ in range(3):
+            limiter.record(0.1)
+
+        assert limiter.adaptive is False
+        assert limiter.limit == 3
+
+    @pytest.mark.asyncio
+    async def test_increase_wakes_waiters(self):
+        """Test raising the limit lets a waiting caller through immediately."""
+        limiter = AdaptiveConcurrencyLimiter(1, min_limit=1, max_limit=2, min_samples=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        limiter.record(0.1)  # Saturated, healthy window -> limit 2
+        await asyncio.wait_for(waiter, timeout=1)
+
+        assert limiter.limit == 2
+        assert limiter.in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_passes_slot_on(self):
+        """Test a waiter cancelled after being woken does not strand the slot."""
+        limiter = AdaptiveConcurrencyLimiter(1, min_limit=1)
+        await limiter.acquire()
+        first = asyncio.create_task(limiter.acquire())
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        limiter.release()
+        first.cancel()
+        await asyncio.wait_for(second, timeout=1)
+
+        assert first.cancelled()
+        assert limiter.in_flight == 1
+
+
+class TestDomainConcurrencyLimiter:
+    """Test per-domain adaptive limits."""
+
+    def test_validation(self):
+        """Test invalid bounds are rejected up front."""
+        with pytest.raises(ValueError):
+            DomainConcurrencyLimiter(4, min_limit=5)
+
+    def test_domains_adapt_independently(self):
+        """Test congestion on one domain leaves the others at their limit."""
+        changes = []
+        limiter = DomainConcurrencyLimiter(
+            8, min_limit=1, min_samples=10, on_change=lambda *change: changes.append(change)
+        )
+
+        for _ in range(10):
+            limiter.for_domain("slow.com").record(0.1, TimeoutError())
+        limiter.for_domain("fast.com").record(0.1)
+
+        assert limiter.limit("slow.com") == 4
+        assert limiter.limit("fast.com") == 8
+        assert limiter.limit("unseen.com") == 8
+        assert changes == [("slow.com", 4)]
+        assert limiter.get_statistics()["slow.com"]["decreases"] == 1
+
+    def test_ceiling_above_initial_limit(self):
+        """Test a domain can grow past its starting limit up to max_limit."""
+        limiter = DomainConcurrencyLimiter(2, min_limit=1, max_limit=3, min_samples=1)
+        domain = limiter.for_domain("example.com")
+
+        for _ in range(5):
+            domain._saturated = True
+            domain.record(0.1)
+
+        assert limiter.limit("example.com") == 3
@@ -0,0 +1,80 @@
+"""Tests for per-job deadline propagation."""
+
+import asyncio
+
+import pytest
+
+from src.core.exceptions import DeadlineExceededError
+from src.utils.deadline import (
+    Deadline,
+    budget_allows,
+    budget_timeout,
+    current_deadline,
+    deadline_scope,
+    stage_budget,
+)
+
+
+class TestDeadline:
+    """Test the Deadline budget arithmetic."""
+
+    def test_validation(self):
+        """Test a non-positive budget is rejected."""
+        with pytest.raises(ValueError, match="budget"):
+            Deadline(0)
+
+    def test_timeout_shrinks_to_remaining_budget(self):
+        """Test stage timeouts never outlast the deadline."""
+        deadline = Deadline(2.0)
+
+        assert deadline.timeout(30) <= 2.0
+        assert deadline.timeout(0.5) == 0.5
+        assert deadline.allows(1.0)
+        assert not deadline.allows(5.0)
+
+    def test_expired_deadline_raises(self):
+        """Test an exceeded deadline fails the stage instead of returning zero."""
+        deadline = Deadline(1.0)
+        deadline.expires_at -= 2
+
+        assert deadline.expired
+        with pytest.raises(DeadlineExceededError):
+            deadline.timeout(30)
+
+    def test_stage_budget_leaves_grace(self):
+        """Test stages finish before the caller's hard timeout."""
+        assert stage_budget(300, grace=5) == 295
+        assert stage_budget(10, grace=5) == 9
+
+
+class TestDeadlineScope:
+    """Test deadline propagation through context."""
+
+    def test_no_deadline_keeps_defaults(self):
+        """Test stages keep their own timeouts outside a scope."""
+        assert current_deadline() is None
+        assert budget_timeout(30) == 30
+        assert budget_allows(3600)
+
+    def test_nested_scope_only_tightens(self):
+        """Test an inner scope cannot extend the outer deadline."""
+        with deadline_scope(1.0) as outer:
+            with deadline_scope(10.0) as inner:
+                assert inner is outer
+            with deadline_scope(0.5) as inner:
+                assert inner is not outer
+                assert budget_timeout(30) <= 0.5
+            assert current_deadline() is outer
+        assert current_deadline() is None
+
+    @pytest.mark.asyncio
+    async def test_tasks_inherit_deadline(self):
+        """Test tasks created inside a scope see the job deadline."""
+
+        async def stage():
+            return budget_timeout(30)
+
+        with deadline_scope(2.0):
+            timeout = await asyncio.create_task(stage())
+
+        assert timeout <= 2.0
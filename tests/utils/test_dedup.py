@@ -0,0 +1,80 @@
+"""Tests for URL deduplication seen-sets."""
+
+import pytest
+
+from src.utils.dedup import BloomFilter, URLDeduplicator, fingerprint
+
+
+class TestBloomFilter:
+    """Test the fixed-size Bloom filter."""
+
+    def test_validation(self):
+        """Test invalid sizing is rejected."""
+        with pytest.raises(ValueError, match="capacity"):
+            BloomFilter(0, 0.01)
+        with pytest.raises(ValueError, match="error_rate"):
+            BloomFilter(100, 1.0)
+
+    def test_no_false_negatives(self):
+        """Test every added key is reported as present."""
+        bloom = BloomFilter(1000, 0.01)
+        keys = [fingerprint(f"https://example.com/{i}") for i in range(1000)]
+
+        assert not any(bloom.add(key) for key in keys)
+        assert all(key in bloom for key in keys)
+        assert bloom.count == 1000
+
+    def test_false_positive_rate_near_target(self):
+        """Test the observed false-positive rate stays near the configured one."""
+        bloom = BloomFilter(5000, 0.01)
+        for i in range(5000):
+            bloom.add(fingerprint(f"https://example.com/seen/{i}"))
+
+        false_positives = sum(
+            fingerprint(f"https://example.com/unseen/{i}") in bloom for i in range(20000)
+        )
+
+        assert false_positives / 20000 < 0.02
+
+
+class TestURLDeduplicator:
+    """Test URL deduplication and its counters."""
+
+    def test_validation(self):
+        """Test invalid limits and rates are rejected."""
+        with pytest.raises(ValueError, match="exact_limit"):
+            URLDeduplicator(exact_limit=-1)
+        with pytest.raises(ValueError, match="expected_urls"):
+            URLDeduplicator(expected_urls=0)
+        with pytest.raises(ValueError, match="false_positive_rate"):
+            URLDeduplicator(false_positive_rate=0)
+
+    def test_equivalent_urls_are_duplicates(self):
+        """Test canonical equivalents are counted as duplicates."""
+        dedup = URLDeduplicator()
+
+        assert dedup.add("https://example.com/post")
+        assert not dedup.add("http://example.com/post/?utm_source=x")
+        assert not dedup.add("https://example.com/post#comments")
+        assert dedup.add("https://example.com/post?page=2")
+
+        assert dedup.get_statistics() == {"seen": 2, "duplicates": 2, "probabilistic": False}
+
+    def test_switches_to_bloom_after_exact_limit(self):
+        """Test URLs seen before and after the switch are still recognised."""
+        dedup = URLDeduplicator(exact_limit=10, expected_urls=1000, false_positive_rate=0.001)
+        urls = [f"https://example.com/{i}" for i in range(50)]
+
+        for url in urls:
+            assert dedup.add(url)
+
+        assert dedup.probabilistic
+        assert not any(dedup.add(url) for url in urls)
+        assert dedup.duplicates == 50
+
+    def test_invalid_urls_compared_verbatim(self):
+        """Test URLs that cannot be canonicalized are still deduplicated."""
+        dedup = URLDeduplicator()
+
+        assert dedup.add("not-a-url")
+        assert not dedup.add("not-a-url")
@@ -0,0 +1,128 @@
+"""Tests for hedged requests."""
+
+import asyncio
+
+import pytest
+
+from src.utils.hedging import RequestHedger
+
+URL = "https://slow.example.com/post"
+
+
+def warmed_hedger(latency=0.01, **kwargs):
+    """Hedger that already has enough samples to hedge slow.example.com."""
+    kwargs.setdefault("budget_percent", 100)
+    hedger = RequestHedger(min_samples=5, window=20, **kwargs)
+    for _ in range(5):
+        hedger.record("slow.example.com", latency)
+    hedger.budget.deposit(10)
+    return hedger
+
+
+class TestRequestHedger:
+    """Test hedging decisions, races and the hedge budget."""
+
+    def test_validation(self):
+        """Test invalid parameters are rejected."""
+        with pytest.raises(ValueError, match="percentile"):
+            RequestHedger(percentile=1.5)
+        with pytest.raises(ValueError, match="budget_percent"):
+            RequestHedger(budget_percent=-1)
+        with pytest.raises(ValueError, match="window"):
+            RequestHedger(min_samples=10, window=5)
+
+    def test_hedge_delay_needs_samples(self):
+        """Test hosts are not hedged until their latency is known."""
+        hedger = RequestHedger(min_samples=3, window=10)
+        hedger.record("a.com", 0.1)
+
+        assert hedger.hedge_delay("a.com") is None
+        for latency in (0.2, 0.3, 0.4):
+            hedger.record("a.com", latency)
+        assert hedger.hedge_delay("a.com") == 0.4
+
+    @pytest.mark.asyncio
+    async def test_fast_request_not_hedged(self):
+        """Test requests finishing before the host's p95 are sent once."""
+        hedger = warmed_hedger(latency=1.0)
+        calls = 0
+
+        async def attempt():
+            nonlocal calls
+            calls += 1
+            return "page"
+
+        assert await hedger.run(URL, attempt) == "page"
+        assert calls == 1
+        assert hedger.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_stalled_request_hedged_and_loser_cancelled(self):
+        """Test a stalled request is duplicated and the first copy to finish wins."""
+        hedger = warmed_hedger()
+        delays = [5.0, 0.0]
+        cancelled = []
+
+        async def attempt():
+            delay = delays.pop(0)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        assert await asyncio.wait_for(hedger.run(URL, attempt), timeout=1) == 0.0
+        assert cancelled == [5.0]
+        assert hedger.get_statistics()["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_copy_falls_back_to_other(self):
+        """Test a copy that fails does not fail the request while the other can succeed."""
+        hedger = warmed_hedger()
+        outcomes = [0.05, ConnectionError("reset")]
+
+        async def attempt():
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            await asyncio.sleep(outcome)
+            return "page"
+
+        assert await hedger.run(URL, attempt) == "page"
+
+    @pytest.mark.asyncio
+    async def test_losing_result_discarded(self):
+        """Test a copy that finishes after the winner has its result released."""
+        hedger = warmed_hedger()
+        delays = [0.05, 0.0]
+        discarded = []
+
+        async def attempt():
+            delay = delays.pop(0)
+            await asyncio.shield(asyncio.sleep(delay))
+            return delay
+
+        async def discard(result):
+            discarded.append(result)
+
+        result = await hedger.run(URL, attempt, discard=discard)
+        await asyncio.sleep(0.1)
+
+        assert result == 0.0
+        assert discarded in ([], [0.05])  # Cancelled before finishing, or released
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedges(self):
+        """Test hedges stay within the configured percentage of requests."""
+        hedger = warmed_hedger(budget_percent=10)
+        hedger.budget._tokens = 0
+
+        async def attempt():
+            await asyncio.sleep(0.02)
+            return "page"
+
+        for _ in range(30):
+            await hedger.run(URL, attempt)
+
+        assert hedger.hedges <= 3
@@ -1,6 +1,6 @@
 """Unit tests for HTTP utilities module."""
 
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, patch
 
 import aiohttp
 import pytest
@@ -11,6 +11,7 @@ from src.utils.http import (
     safe_http_get,
     safe_http_get_with_raise,
 )
+from src.utils.throttle import domain_throttle
 
 
 class TestHTTPResponse:
@@ -175,6 +176,41 @@ class TestHTTPUtilities:
         with pytest.raises(aiohttp.ClientResponseError):
             await safe_http_get_with_raise(mock_session, "https://example.com")
 
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_safe_http_get_with_raise_throttles_domain(self, mock_session, status):
+        """Test 429/503 responses hold their domain and raise with the headers kept."""
+        headers = {"Retry-After": "30"}
+        mock_response = AsyncMock()
+        mock_response.status = status
+        mock_response.headers = headers
+        mock_response.raise_for_status = Mock(
+            side_effect=aiohttp.ClientResponseError(None, (), status=status, headers=headers)
+        )
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        with patch("src.monitoring.metrics.metrics_collector") as metrics:
+            with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+                await safe_http_get_with_raise(mock_session, "https://example.com/page")
+
+        assert exc_info.value.headers["Retry-After"] == "30"
+        assert 29 < domain_throttle.hold_time("https://example.com/other") <= 30
+        metrics.record_throttle.assert_called_once_with("example.com", status)
+
+    async def test_safe_http_get_with_raise_other_errors_do_not_throttle(self, mock_session):
+        """Test other error statuses don't hold the domain."""
+        mock_response = AsyncMock()
+        mock_response.status = 500
+        mock_response.headers = {"Retry-After": "30"}
+        mock_response.raise_for_status = Mock(
+            side_effect=aiohttp.ClientResponseError(None, (), status=500)
+        )
+        mock_session.get.return_value.__aenter__.return_value = mock_response
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            await safe_http_get_with_raise(mock_session, "https://example.com/page")
+
+        assert domain_throttle.hold_time("https://example.com/") is None
+
     async def test_safe_http_get_with_raise_timeout(self, mock_session, mock_response):
         """Test safe_http_get_with_raise with custom timeout."""
         mock_session.get.return_value.__aenter__.return_value = mock_response
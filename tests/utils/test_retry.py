@@ -6,20 +6,27 @@ production-ready reliability and error handling.
 
 import asyncio
 import time
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
-from aiohttp import ClientError
+from aiohttp import ClientError, ClientResponseError
 
-from src.core.exceptions import RateLimitError
+from src.constants import CONSTANTS
+from src.core.exceptions import DeadlineExceededError, RateLimitError
+from src.utils.deadline import deadline_scope
 from src.utils.retry import (
     BulkheadPattern,
     CircuitBreaker,
+    CircuitBreakerRegistry,
     CircuitBreakerState,
     ResilienceManager,
+    RetryBudget,
     RetryConfig,
+    circuit_breakers,
+    domain_hold_time,
     with_retry,
 )
+from src.utils.throttle import domain_throttle
 
 
 class TestRetryConfig:
@@ -80,6 +87,18 @@ class TestRetryConfig:
         delays = [config.calculate_delay(2) for _ in range(10)]
         assert len(set(delays)) > 1  # Should have variance with jitter
 
+    def test_calculate_delay_honors_retry_after(self):
+        """Test Retry-After is a floor on the backoff, even beyond max_delay."""
+        config = RetryConfig(base_delay=1.0, backoff_factor=2.0, max_delay=10.0, jitter=False)
+
+        assert config.calculate_delay(2, retry_after=30.0) == 30.0
+        assert config.calculate_delay(2, retry_after=1.0) == 4.0
+        assert config.calculate_delay(2, retry_after=None) == 4.0
+
+    def test_calculate_delay_caps_retry_after(self):
+        """Test a Retry-After longer than THROTTLE_MAX_DELAY is clamped like the throttle's."""
+        assert RetryConfig().calculate_delay(0, 86400.0) == CONSTANTS.THROTTLE_MAX_DELAY
+
 
 class TestEnhancedRetryDecorator:
     """Test suite for enhanced retry decorator with jitter."""
@@ -187,6 +206,163 @@ class TestEnhancedRetryDecorator:
         # Minimum enforced delay is 0.1
         assert duration >= 0.05  # Allow some test timing variance
 
+    @pytest.mark.asyncio
+    async def test_retry_stops_when_backoff_exceeds_deadline(self):
+        """Test no retry is attempted once its backoff would outlast the job budget."""
+        mock_func = AsyncMock(side_effect=ClientError("Network error"))
+
+        retry_config = RetryConfig(max_attempts=5, base_delay=2.0, jitter=False)
+
+        @with_retry(retry_config=retry_config)
+        async def decorated_func():
+            return await mock_func()
+
+        with deadline_scope(1.0), pytest.raises(ClientError):
+            await decorated_func()
+
+        assert mock_func.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_never_retries_exceeded_deadline(self):
+        """Test an exceeded deadline fails immediately even though it is a timeout."""
+        mock_func = AsyncMock(side_effect=DeadlineExceededError("Budget spent"))
+
+        retry_config = RetryConfig(max_attempts=3, base_delay=0.01)
+
+        @with_retry(retry_config=retry_config)
+        async def decorated_func():
+            return await mock_func()
+
+        with pytest.raises(DeadlineExceededError):
+            await decorated_func()
+
+        assert mock_func.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_stops_when_domain_budget_exhausted(self):
+        """Test retries against a failing domain stop once its shared budget runs out."""
+        mock_func = AsyncMock(side_effect=ClientError("Network error"))
+        budget = RetryBudget(ratio=0.1, max_tokens=2)
+
+        retry_config = RetryConfig(max_attempts=5, base_delay=0.01, jitter=False)
+
+        @with_retry(retry_config=retry_config, budget_key=lambda url: url, budget=budget)
+        async def decorated_func(url):
+            return await mock_func()
+
+        with pytest.raises(ClientError):
+            await decorated_func("https://example.com/a")
+        with pytest.raises(ClientError):
+            await decorated_func("https://example.com/b")
+
+        # Two retries for the domain in total, then every caller fails fast
+        assert mock_func.call_count == 4
+        assert budget.get_statistics()["example.com"] == {"tokens": 0, "denied": 2}
+
+    @pytest.mark.asyncio
+    async def test_retry_waits_for_retry_after(self, monkeypatch):
+        """Test a 429's Retry-After sets the least the retry waits."""
+        delays = []
+
+        async def record_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", record_sleep)
+        throttled = ClientResponseError(
+            Mock(real_url="https://example.com/"), (), status=429, headers={"Retry-After": "20"}
+        )
+        mock_func = AsyncMock(side_effect=[throttled, "success"])
+
+        @with_retry(retry_config=RetryConfig(max_attempts=2, base_delay=0.01, jitter=False))
+        async def decorated_func():
+            return await mock_func()
+
+        assert await decorated_func() == "success"
+        assert delays == [20.0]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_deadline_is_not_retried(self):
+        """Test a Retry-After longer than the remaining job budget stops retrying."""
+        throttled = ClientResponseError(None, (), status=503, headers={"Retry-After": "120"})
+        mock_func = AsyncMock(side_effect=[throttled, "success"])
+
+        @with_retry(retry_config=RetryConfig(max_attempts=2, base_delay=0.01, jitter=False))
+        async def decorated_func():
+            return await mock_func()
+
+        with deadline_scope(5.0), pytest.raises(ClientResponseError):
+            await decorated_func()
+        assert mock_func.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_after_beyond_max_delay_is_not_retried(self):
+        """Test a Retry-After beyond THROTTLE_MAX_DELAY stops retrying without a job budget."""
+        throttled = ClientResponseError(None, (), status=429, headers={"Retry-After": "86400"})
+        mock_func = AsyncMock(side_effect=[throttled, "success"])
+
+        @with_retry(retry_config=RetryConfig(max_attempts=2, base_delay=0.01, jitter=False))
+        async def decorated_func():
+            return await mock_func()
+
+        with patch("asyncio.sleep") as sleep, pytest.raises(ClientResponseError):
+            await decorated_func()
+        assert mock_func.call_count == 1
+        sleep.assert_not_called()
+
+
+class TestRetryBudget:
+    """Test the shared per-domain retry budget."""
+
+    def test_successes_refill_budget(self):
+        """Test each success earns a fraction of a retry, up to the cap."""
+        budget = RetryBudget(ratio=0.5, max_tokens=1)
+
+        assert budget.try_retry("https://example.com/a")
+        assert not budget.try_retry("https://example.com/b")
+
+        budget.record_success("https://example.com/c")
+        assert not budget.try_retry("https://example.com/a")
+        budget.record_success("https://example.com/c")
+        assert budget.try_retry("https://example.com/a")
+
+    def test_domains_are_independent(self):
+        """Test a failing domain does not spend another domain's retries."""
+        budget = RetryBudget(ratio=0.1, max_tokens=1)
+
+        budget.exhaust("https://failing.com/")
+
+        assert not budget.try_retry("https://failing.com/page")
+        assert budget.try_retry("https://healthy.com/page")
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_exhausts_budget(self):
+        """Test opening a circuit breaker stops other callers retrying that domain."""
+        budget = RetryBudget(ratio=0.1, max_tokens=5)
+        cb = CircuitBreaker(failure_threshold=1, name="https://example.com", retry_budget=budget)
+
+        with pytest.raises(ClientError):
+            async with cb:
+                raise ClientError("Failure")
+
+        assert cb.state == CircuitBreakerState.OPEN
+        assert not budget.try_retry("https://example.com/page")
+
+    @pytest.mark.asyncio
+    async def test_success_credited_once_per_request(self):
+        """Test a request through both a breaker and with_retry refills the budget once."""
+        budget = RetryBudget(ratio=0.5, max_tokens=5)
+        budget.exhaust("https://example.com/")
+        cb = CircuitBreaker(name="example.com", retry_budget=budget)
+
+        @with_retry(budget_key=lambda url: url, budget=budget)
+        async def fetch(url):
+            async with cb:
+                return "ok"
+
+        await fetch("https://example.com/page")
+
+        assert budget.get_statistics()["example.com"]["tokens"] == 0.5
+
 
 class TestCircuitBreaker:
     """Test suite for enhanced CircuitBreaker implementation."""
@@ -312,6 +488,119 @@ class TestCircuitBreaker:
         assert metrics["success_rate"] == 0
 
 
+class TestCircuitBreakerRegistry:
+    """Test the per-host circuit breaker registry."""
+
+    @staticmethod
+    async def fail(breaker, error):
+        with pytest.raises(type(error)):
+            async with breaker:
+                raise error
+
+    def test_one_breaker_per_host(self):
+        """Test URLs on the same host share a breaker and other hosts do not."""
+        registry = CircuitBreakerRegistry()
+
+        breaker = registry.breaker_for("https://Example.com/a")
+
+        assert registry.breaker_for("https://example.com/b") is breaker
+        assert registry.breaker_for("https://other.com/a") is not breaker
+        assert registry.hold_time("https://example.com/") is None
+
+    @pytest.mark.asyncio
+    async def test_only_host_failures_open_breaker(self):
+        """Test 404s don't trip a breaker while 5xx responses do."""
+        registry = CircuitBreakerRegistry(failure_threshold=2, recovery_timeout=60)
+        breaker = registry.breaker_for("https://example.com/")
+        not_found = ClientResponseError(None, (), status=404)
+        server_error = ClientResponseError(None, (), status=503)
+
+        for _ in range(3):
+            await self.fail(breaker, not_found)
+        assert breaker.state == CircuitBreakerState.CLOSED
+
+        for _ in range(2):
+            await self.fail(breaker, server_error)
+        assert breaker.state == CircuitBreakerState.OPEN
+        assert 59 < registry.hold_time("https://example.com/page") <= 60
+
+        # Open breakers fail fast
+        with pytest.raises(RateLimitError):
+            async with breaker:
+                pass
+
+    @pytest.mark.asyncio
+    async def test_successful_probe_releases_host(self):
+        """Test a host is probed once its recovery timeout passes and released on success."""
+        registry = CircuitBreakerRegistry(failure_threshold=1, recovery_timeout=0.01)
+        breaker = registry.breaker_for("https://example.com/")
+
+        await self.fail(breaker, ClientError("Connection refused"))
+        await asyncio.sleep(0.02)
+        assert registry.hold_time("example.com") == 0.0
+
+        async with breaker:
+            assert registry.hold_time("example.com") == 0.0
+        assert breaker.state == CircuitBreakerState.CLOSED
+        assert registry.hold_time("example.com") is None
+
+    @pytest.mark.asyncio
+    async def test_statistics_list_tripped_hosts(self):
+        """Test statistics count breakers by state and detail the tripped ones."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.breaker_for("https://healthy.com/")
+        await self.fail(registry.breaker_for("https://down.com/"), TimeoutError())
+
+        stats = registry.get_statistics()
+
+        assert stats["hosts"] == 2
+        assert stats["states"] == {"closed": 1, "open": 1, "half_open": 0}
+        assert list(stats["tripped"]) == ["down.com"]
+
+
+class TestDomainHoldTime:
+    """Test the combined throttle and breaker hold used by the batch schedulers."""
+
+    @pytest.fixture(autouse=True)
+    def metrics(self):
+        with patch("src.monitoring.metrics.metrics_collector"):
+            yield
+
+    def test_unheld_domain(self):
+        """Test a domain with neither a throttle nor a tripped breaker is not held."""
+        assert domain_hold_time("https://example.com/") is None
+
+    def test_throttle_holds_domain(self):
+        """Test a Retry-After hold defers the domain's jobs."""
+        domain_throttle.throttle("https://example.com/a", 429, 30.0)
+
+        assert 29 < domain_hold_time("https://example.com/b") <= 30
+
+    @pytest.mark.asyncio
+    async def test_longer_hold_wins(self):
+        """Test a throttle outlasting a probing breaker still defers the domain."""
+        breaker = circuit_breakers.breaker_for("https://example.com/")
+        breaker.failure_threshold = 1
+        breaker.recovery_timeout = 0.0
+        with pytest.raises(ClientError):
+            async with breaker:
+                raise ClientError("Connection refused")
+        assert circuit_breakers.hold_time("example.com") == 0.0
+
+        assert domain_hold_time("example.com") == 0.0
+        domain_throttle.throttle("example.com", 503, 10.0)
+        assert domain_hold_time("example.com") > 9
+
+    def test_bare_host_is_not_logged_as_invalid_url(self):
+        """Test the scheduler's bare host keys are looked up without URL warnings."""
+        domain_throttle.throttle("https://Example.com/a", 429, 30.0)
+
+        with patch("src.utils.url.logger") as url_logger:
+            assert domain_hold_time("example.com") > 29
+
+        url_logger.warning.assert_not_called()
+
+
 class TestBulkheadPattern:
     """Test suite for BulkheadPattern resource isolation."""
 
@@ -0,0 +1,121 @@
+"""Tests for Retry-After parsing and per-domain throttling."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from aiohttp import ClientResponseError
+
+from src.core.exceptions import FetchError
+from src.utils.throttle import DomainThrottle, parse_retry_after, retry_after_from
+
+
+def throttled_error(status=429, retry_after="30"):
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return ClientResponseError(None, (), status=status, headers=headers)
+
+
+class TestParseRetryAfter:
+    """Test Retry-After header parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("120", 120.0), (" 2.5 ", 2.5), ("-3", 0.0), (None, None), ("", None), ("soon", None)],
+    )
+    def test_delay_seconds(self, value, expected):
+        """Test delay-seconds values, with negatives clamped and junk ignored."""
+        assert parse_retry_after(value) == expected
+
+    def test_http_date(self):
+        """Test HTTP dates give the seconds until then, and past dates give zero."""
+        now = datetime(2015, 10, 21, 7, 28, 0, tzinfo=UTC)
+
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:45 GMT", now=now) == 45.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:27:00 GMT", now=now) == 0.0
+
+    def test_non_finite_values_are_ignored(self):
+        """Test inf and nan are not accepted as delays."""
+        assert parse_retry_after("inf") is None
+        assert parse_retry_after("nan") is None
+
+
+class TestRetryAfterFrom:
+    """Test extracting Retry-After from request errors."""
+
+    def test_throttling_response(self):
+        """Test 429 and 503 errors carry their Retry-After."""
+        assert retry_after_from(throttled_error(429, "30")) == 30.0
+        assert retry_after_from(throttled_error(503, "5")) == 5.0
+
+    def test_other_errors(self):
+        """Test other statuses, missing headers and non-HTTP errors give None."""
+        assert retry_after_from(throttled_error(500, "30")) is None
+        assert retry_after_from(throttled_error(429, None)) is None
+        assert retry_after_from(TimeoutError()) is None
+        assert retry_after_from(None) is None
+
+    def test_wrapped_errors(self):
+        """Test errors wrapped by the converter or chained with ``from`` are unwrapped."""
+        wrapped = FetchError("Failed to fetch content", cause=throttled_error(retry_after="12"))
+        assert retry_after_from(wrapped) == 12.0
+
+        try:
+            raise RuntimeError("download failed") from throttled_error(retry_after="7")
+        except RuntimeError as chained:
+            assert retry_after_from(chained) == 7.0
+
+
+class TestDomainThrottle:
+    """Test per-domain not-before times."""
+
+    @pytest.fixture(autouse=True)
+    def metrics(self):
+        with patch("src.monitoring.metrics.metrics_collector") as collector:
+            yield collector
+
+    def test_throttle_holds_whole_domain(self, metrics):
+        """Test a throttled URL holds every URL of its domain and is counted."""
+        throttle = DomainThrottle()
+
+        hold = throttle.throttle("https://Example.com/a", 429, 30.0)
+
+        assert 29 < hold <= 30
+        assert 29 < throttle.hold_time("https://example.com/b") <= 30
+        assert throttle.hold_time("https://other.com/") is None
+        assert throttle.get_statistics()["events"] == {"example.com": 1}
+        metrics.record_throttle.assert_called_once_with("example.com", 429)
+
+    def test_default_and_max_delay(self):
+        """Test missing Retry-After uses the default delay and long ones are capped."""
+        throttle = DomainThrottle(default_delay=5.0, max_delay=60.0)
+
+        assert 4 < throttle.throttle("https://a.com/", 503) <= 5
+        assert 59 < throttle.throttle("https://b.com/", 429, 3600.0) <= 60
+
+    def test_hold_is_never_shortened(self):
+        """Test a shorter Retry-After doesn't pull an existing hold in."""
+        throttle = DomainThrottle()
+
+        throttle.throttle("https://example.com/", 429, 30.0)
+        throttle.throttle("https://example.com/", 429, 1.0)
+
+        assert throttle.hold_time("example.com") > 29
+        assert throttle.events["example.com"] == 2
+
+    def test_expired_hold_is_released(self):
+        """Test a domain is released once its not-before time passes."""
+        throttle = DomainThrottle()
+        throttle.throttle("https://example.com/", 429, 0.0)
+
+        assert throttle.hold_time("example.com") is None
+        assert throttle.get_statistics()["held"] == {}
+
+    def test_expired_holds_are_forgotten_at_capacity(self):
+        """Test expired holds are dropped once max_domains are tracked."""
+        throttle = DomainThrottle(max_domains=2)
+        throttle.throttle("https://a.com/", 429, 0.0)
+        throttle.throttle("https://b.com/", 429, 0.0)
+
+        throttle.throttle("https://c.com/", 429, 30.0)
+
+        assert list(throttle._not_before) == ["c.com"]